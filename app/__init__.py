@@ -95,6 +95,14 @@ def create_app(config_name='development'):
     # 정적 파일 MIME 타입 설정
     setup_static_files(app)
     
+    # 응답 압축 (gzip / brotli)
+    from app.utils.http_compression import init_compression
+    init_compression(app)
+    
+    # PostgreSQL 변경 알림 수신 (DB_CHANGE_FEED_ENABLED, 첫 SSE 구독 시 연결)
+    from app.services.change_feed import change_feed
+    change_feed.init_app(app)
+    
     return app
 
 def setup_logging(app):
@@ -179,8 +187,10 @@ def setup_security_headers(app):
 
 def setup_static_files(app):
     """정적 파일 MIME 타입 설정"""
-    # Flask의 정적 파일 서빙 설정
-    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+    # Flask의 정적 파일 서빙 설정 (0이면 no-cache: 매번 재검증하고 변경이 없으면 304)
+    static_max_age = app.config.get('STATIC_CACHE_MAX_AGE', 0)
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = static_max_age
+    static_cache_control = f'public, max-age={static_max_age}' if static_max_age > 0 else 'no-cache'
     
     # 명시적 정적 파일 라우트 추가 (ChatGPT 추천 방법)
     @app.route('/static/<path:filename>')
@@ -225,7 +235,7 @@ def setup_static_files(app):
                 # 파일 전송
                 response = send_from_directory(static_folder, filename)
                 response.headers['Content-Type'] = content_type
-                response.headers['Cache-Control'] = 'no-cache'
+                response.headers['Cache-Control'] = static_cache_control
                 print(f"✅ 정적 파일 서빙 성공: {filename}")
                 return response
             else:
@@ -245,12 +255,12 @@ def setup_static_files(app):
         # JavaScript 파일
         if request_path.endswith('.js'):
             response.headers['Content-Type'] = 'application/javascript; charset=utf-8'
-            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['Cache-Control'] = static_cache_control
             print(f"🔧 JavaScript MIME 타입 강제 설정: {request_path}")
         # CSS 파일
         elif request_path.endswith('.css'):
             response.headers['Content-Type'] = 'text/css; charset=utf-8'
-            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['Cache-Control'] = static_cache_control
         # JSON 파일
         elif request_path.endswith('.json'):
             response.headers['Content-Type'] = 'application/json; charset=utf-8'
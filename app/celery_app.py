@@ -1,6 +1,8 @@
 from celery import Celery
+from celery.signals import task_postrun
 import os
 from app import create_app  # 앱 팩토리 불러오기
+from app.config.redis_config import RedisConfig
 
 # .env 파일 로드
 try:
@@ -33,7 +35,7 @@ def create_celery_app():
         'proxmox_manager',
         broker=broker_url,
         backend=backend_url,  # 환경 변수 또는 브로커 URL 사용
-        include=['app.tasks.server_tasks', 'app.tasks.role_tasks', 'app.tasks.backup_tasks']
+        include=['app.tasks.server_tasks', 'app.tasks.role_tasks', 'app.tasks.backup_tasks', 'app.tasks.inventory_tasks']
     )
 
     # 간단하고 안전한 Celery 설정 (예외 직렬화 문제 방지)
@@ -53,10 +55,21 @@ def create_celery_app():
         task_ignore_result=False,
         task_store_eager_result=False,
         task_always_eager=False,
-        # Redis 연결 설정
+        # Redis 연결 설정 (앱 캐시와 같은 연결 수 상한/헬스 체크 사용)
         broker_connection_retry_on_startup=True,
         broker_connection_retry=True,
         broker_connection_max_retries=10,
+        broker_pool_limit=RedisConfig.REDIS_MAX_CONNECTIONS,
+        broker_transport_options={
+            'max_connections': RedisConfig.REDIS_MAX_CONNECTIONS,
+            'health_check_interval': RedisConfig.REDIS_HEALTH_CHECK_INTERVAL,
+            'socket_keepalive': True,
+            'socket_timeout': RedisConfig.REDIS_SOCKET_TIMEOUT
+        },
+        redis_max_connections=RedisConfig.REDIS_MAX_CONNECTIONS,
+        redis_socket_keepalive=True,
+        redis_socket_timeout=RedisConfig.REDIS_SOCKET_TIMEOUT,
+        redis_retry_on_timeout=True,
         # 태스크 추적 활성화
         task_track_started=True,
         task_send_sent_event=True,
@@ -65,6 +78,15 @@ def create_celery_app():
         task_ignore_result_on_task_failure=False
     )
 
+    # 주기 작업 (celery beat)
+    celery.conf.beat_schedule = {
+        'refresh-inventory-snapshot': {
+            'task': 'app.tasks.inventory_tasks.refresh_inventory_snapshot',
+            'schedule': float(flask_app.config.get('INVENTORY_SNAPSHOT_INTERVAL', 30)),
+            'options': {'expires': float(flask_app.config.get('INVENTORY_SNAPSHOT_INTERVAL', 30))}
+        }
+    }
+
     # Flask 컨텍스트 자동 주입
     class ContextTask(celery.Task):
         def __call__(self, *args, **kwargs):
@@ -74,4 +96,11 @@ def create_celery_app():
     celery.Task = ContextTask
     return celery
 
-celery_app = create_celery_app()
\ No newline at end of file
+celery_app = create_celery_app()
+
+
+@task_postrun.connect
+def finish_task_progress(task_id=None, state=None, retval=None, **kwargs):
+    """진행 스트림을 남긴 작업에 종료(done) 이벤트 추가"""
+    from app.utils.task_progress import finish_task
+    finish_task(task_id, state, retval)
@@ -1,4 +1,5 @@
 import os
+import threading
 import redis
 from flask import current_app
 
@@ -14,27 +15,102 @@ class RedisConfig:
     # Redis 활성화 여부
     REDIS_ENABLED = os.getenv('REDIS_ENABLED', 'false').lower() == 'true'
     
+    # 캐시 키 네임스페이스 (clear_all_cache는 이 접두사의 키만 삭제)
+    REDIS_CACHE_NAMESPACE = os.getenv('REDIS_CACHE_NAMESPACE', 'proxmox-manager:cache')
+    
+    # 프로세스 로컬 L1 캐시 (pub/sub 무효화 채널로 워커 간 일관성 유지)
+    REDIS_LOCAL_CACHE_ENABLED = os.getenv('REDIS_LOCAL_CACHE_ENABLED', 'true').lower() == 'true'
+    REDIS_LOCAL_CACHE_MAX_ENTRIES = int(os.getenv('REDIS_LOCAL_CACHE_MAX_ENTRIES', 1024))
+    REDIS_LOCAL_CACHE_MAX_MB = int(os.getenv('REDIS_LOCAL_CACHE_MAX_MB', 64))
+    
+    # 캐시 값 직렬화/압축 (auto: 설치된 라이브러리 중 가장 빠른 것, 압축은 기준 크기 이상만)
+    REDIS_CACHE_SERIALIZER = os.getenv('REDIS_CACHE_SERIALIZER', 'auto')
+    REDIS_CACHE_COMPRESSION = os.getenv('REDIS_CACHE_COMPRESSION', 'auto')
+    REDIS_CACHE_COMPRESS_MIN_BYTES = int(os.getenv('REDIS_CACHE_COMPRESS_MIN_BYTES', 16384))
+    
+    # 이벤트 채널 (알림 등 SSE로 전달할 이벤트, 웹 프로세스당 구독 스레드 하나가 연결별 큐로 분배)
+    REDIS_EVENT_CHANNEL_PREFIX = os.getenv('REDIS_EVENT_CHANNEL_PREFIX', 'proxmox-manager:events')
+    REDIS_EVENT_QUEUE_SIZE = int(os.getenv('REDIS_EVENT_QUEUE_SIZE', 256))
+    
+    # Celery 작업 진행 스트림 (작업별 Redis Stream, 길이 상한은 근사 트리밍, TTL은 Celery 결과 보관 시간과 같게)
+    REDIS_TASK_STREAM_PREFIX = os.getenv('REDIS_TASK_STREAM_PREFIX', 'proxmox-manager:task-progress')
+    REDIS_TASK_STREAM_MAXLEN = int(os.getenv('REDIS_TASK_STREAM_MAXLEN', 500))
+    REDIS_TASK_STREAM_TTL = int(os.getenv('REDIS_TASK_STREAM_TTL', 3600))
+    # 진행 스트림 XREAD BLOCK 전용 연결 수 (대기 중 연결을 점유하므로 공용 풀과 분리)
+    REDIS_TASK_STREAM_MAX_CONNECTIONS = int(os.getenv('REDIS_TASK_STREAM_MAX_CONNECTIONS', 8))
+    
+    # 연결 풀 (프로세스당 응답 디코딩 방식별로 하나씩 공유)
+    REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 32))
+    REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', 5))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', 5))
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', 30))
+    
+    _pools = {}
+    _pools_lock = threading.Lock()
+    
+    @classmethod
+    def get_connection_pool(cls, decode_responses=True):
+        """프로세스 공용 연결 풀 (풀이 가득 차면 REDIS_POOL_TIMEOUT 동안 반납을 기다림)"""
+        with cls._pools_lock:
+            pool = cls._pools.get(decode_responses)
+            if pool is None:
+                pool = redis.BlockingConnectionPool(
+                    host=cls.REDIS_HOST,
+                    port=cls.REDIS_PORT,
+                    db=cls.REDIS_DB,
+                    password=cls.REDIS_PASSWORD,
+                    decode_responses=decode_responses,
+                    max_connections=cls.REDIS_MAX_CONNECTIONS,
+                    timeout=cls.REDIS_POOL_TIMEOUT,
+                    socket_connect_timeout=5,
+                    socket_timeout=cls.REDIS_SOCKET_TIMEOUT,
+                    socket_keepalive=True,
+                    retry_on_timeout=True,
+                    health_check_interval=cls.REDIS_HEALTH_CHECK_INTERVAL
+                )
+                cls._pools[decode_responses] = pool
+            return pool
+    
     @classmethod
-    def get_redis_client(cls):
-        """Redis 클라이언트 생성"""
+    def get_stream_client(cls):
+        """작업 진행 스트림 대기 읽기(XREAD BLOCK) 전용 클라이언트 (공용 풀과 별도의 작은 풀)"""
         if not cls.REDIS_ENABLED:
             return None
-            
-        try:
-            client = redis.Redis(
-                host=cls.REDIS_HOST,
-                port=cls.REDIS_PORT,
-                db=cls.REDIS_DB,
-                password=cls.REDIS_PASSWORD,
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-            # 연결 테스트
-            client.ping()
-            return client
-        except Exception as e:
-            print(f"⚠️ Redis 연결 실패: {e}")
-            return None
\ No newline at end of file
+        with cls._pools_lock:
+            pool = cls._pools.get('stream')
+            if pool is None:
+                pool = redis.BlockingConnectionPool(
+                    host=cls.REDIS_HOST,
+                    port=cls.REDIS_PORT,
+                    db=cls.REDIS_DB,
+                    password=cls.REDIS_PASSWORD,
+                    decode_responses=True,
+                    max_connections=cls.REDIS_TASK_STREAM_MAX_CONNECTIONS,
+                    timeout=cls.REDIS_POOL_TIMEOUT,
+                    socket_connect_timeout=5,
+                    socket_timeout=cls.REDIS_SOCKET_TIMEOUT,
+                    socket_keepalive=True,
+                    retry_on_timeout=True,
+                    health_check_interval=cls.REDIS_HEALTH_CHECK_INTERVAL
+                )
+                cls._pools['stream'] = pool
+        return redis.Redis(connection_pool=pool)
+    
+    @classmethod
+    def reset_pools_after_fork(cls):
+        """fork된 자식 프로세스에서 부모의 소켓을 버리고 새로 연결하도록 풀 초기화"""
+        cls._pools_lock = threading.Lock()
+        for pool in cls._pools.values():
+            pool.reset()
+    
+    @classmethod
+    def get_redis_client(cls, decode_responses=True):
+        """공용 연결 풀을 사용하는 Redis 클라이언트 (연결은 첫 명령 실행 시 생성)"""
+        if not cls.REDIS_ENABLED:
+            return None
+        return redis.Redis(connection_pool=cls.get_connection_pool(decode_responses))
+
+
+# prefork Celery 워커/gunicorn 워커는 부모 프로세스의 연결을 공유하면 안 된다
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=RedisConfig.reset_pools_after_fork)
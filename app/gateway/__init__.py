@@ -0,0 +1,6 @@
+"""
+비동기 SSE 이벤트 게이트웨이 패키지
+"""
+from .asgi import EventGateway, create_gateway
+
+__all__ = ['EventGateway', 'create_gateway']
@@ -0,0 +1,300 @@
+"""
+비동기 SSE 이벤트 게이트웨이 (ASGI)
+
+Flask 개발 서버/동기 워커에서는 SSE 연결 하나가 워커 스레드 하나를 계속 잡고 있으므로,
+이벤트 스트림만 별도의 asyncio 프로세스(uvicorn 등 ASGI 서버)에서 처리한다.
+
+- 인증: Flask 세션 쿠키를 같은 SECRET_KEY로 검증하고 Flask-Login 사용자(_user_id)를 확인
+- 이벤트: EventHub가 이벤트 버스(Redis pub/sub, DB 변경 수신)를 받아 연결별 deque로 분배
+- 배압: 전송이 SEND_TIMEOUT 이상 막히거나 deque가 넘치면 연결을 끊고, 클라이언트는
+  Last-Event-ID(또는 last_event_id 쿼리)로 재연결하여 놓친 이벤트를 DB에서 받는다
+- 스트림은 add_stream()으로 경로/토픽/재연결 조회 함수를 등록한다
+
+실행: python run_gateway.py (또는 uvicorn app.gateway:create_gateway --factory)
+Flask 화면은 EVENT_GATEWAY_URL로 게이트웨이 주소를 받아 EventSource를 연결한다.
+"""
+import asyncio
+import json
+import logging
+import time
+from urllib.parse import parse_qs
+
+from itsdangerous import BadSignature
+from werkzeug.http import parse_cookie
+
+from app.gateway.hub import Connection, EventHub
+
+logger = logging.getLogger(__name__)
+
+# 하트비트 주기 / 전송 대기 한도 (초)
+HEARTBEAT_INTERVAL = 10
+SEND_TIMEOUT = 30
+# 재연결 시 놓친 이벤트 조회 단위
+CATCH_UP_BATCH = 20
+# 재연결 조회와 구독이 겹치는 구간의 중복 제거 유지 시간 (초)
+CATCH_UP_DEDUPE_WINDOW = 30
+
+SSE_HEADERS = [
+    (b'content-type', b'text/event-stream; charset=utf-8'),
+    (b'cache-control', b'no-cache, no-store, must-revalidate'),
+    (b'x-accel-buffering', b'no'),
+]
+
+
+def _sse_message(event):
+    event_id = event.get('id') if isinstance(event.get('id'), int) else None
+    prefix = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{prefix}data: {json.dumps(event)}\n\n"
+
+
+class StreamRoute:
+    """경로 하나의 스트림 설정"""
+
+    def __init__(self, topic, catch_up=None, poll=None):
+        self.topic = topic
+        # catch_up(last_id, limit): 재연결 시 놓친 이벤트 목록 (동기 함수, 스레드 풀에서 실행)
+        self.catch_up = catch_up
+        # poll(cursor): 이벤트 버스가 끊긴 동안 cursor 이후 이벤트 목록 (동기 함수)
+        self.poll = poll
+
+
+class EventGateway:
+    """SSE 스트림만 처리하는 ASGI 애플리케이션"""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.hub = EventHub(flask_app)
+        self.routes = {}
+        self._started = False
+        self.queue_size = flask_app.config.get('EVENT_GATEWAY_QUEUE_SIZE', 64)
+        self.allowed_origins = {
+            origin.strip().rstrip('/')
+            for origin in (flask_app.config.get('EVENT_GATEWAY_ALLOWED_ORIGINS') or '').split(',')
+            if origin.strip()
+        }
+
+    def add_stream(self, path, topic, catch_up=None, poll=None):
+        self.routes[path] = StreamRoute(topic, catch_up=catch_up, poll=poll)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        self._ensure_started()
+        headers = dict(scope.get('headers') or [])
+        cors = self._cors_headers(headers.get(b'origin'))
+        route = self.routes.get(scope['path'])
+        if route is None:
+            await self._respond(send, 404, {'error': 'not found'}, cors)
+            return
+        if scope['method'] == 'OPTIONS':
+            await self._respond(send, 204, None, cors)
+            return
+        if scope['method'] != 'GET':
+            await self._respond(send, 405, {'error': 'method not allowed'}, cors)
+            return
+
+        user_id = await self._authenticate(headers.get(b'cookie'))
+        if user_id is None:
+            await self._respond(send, 401, {'error': '로그인이 필요합니다.'}, cors)
+            return
+
+        await self._stream(route, user_id, self._last_event_id(scope, headers), receive, send, cors)
+
+    # ------------------------------------------------------------------
+    # 스트림
+    # ------------------------------------------------------------------
+    async def _stream(self, route, user_id, last_id, receive, send, cors):
+        connection = Connection(user_id, last_id, self.queue_size)
+        # 조회보다 먼저 등록해야 조회와 등록 사이의 이벤트를 놓치지 않음
+        self.hub.register(route.topic, connection)
+        watcher = asyncio.ensure_future(self._watch_disconnect(receive, connection))
+        try:
+            await send({'type': 'http.response.start', 'status': 200, 'headers': SSE_HEADERS + cors})
+            hello = json.dumps({'type': 'connected', 'connection_id': f"{user_id}_{id(connection):x}"})
+            await self._send(send, f": ping\n\ndata: {hello}\n\n")
+
+            if route.catch_up is not None:
+                while not connection.closed:
+                    events = await self.hub.run_sync(route.catch_up, connection.last_id, CATCH_UP_BATCH)
+                    await self._send_events(send, connection, events, catch_up=True)
+                    if len(events) < CATCH_UP_BATCH:
+                        break
+
+            while not connection.closed:
+                await connection.wait(HEARTBEAT_INTERVAL)
+                if connection.closed:
+                    break
+                if connection.dropped:
+                    logger.warning(f"⚠️ 게이트웨이 연결 큐 초과 ({route.topic}, 사용자 {user_id}): "
+                                   f"{connection.dropped}개 누락, 재연결 유도")
+                    break
+                events = connection.drain()
+                if events:
+                    await self._send_events(send, connection, events)
+                else:
+                    heartbeat = json.dumps({'type': 'heartbeat', 'timestamp': time.time()})
+                    await self._send(send, f": ping\n\ndata: {heartbeat}\n\n")
+        except (asyncio.TimeoutError, OSError, RuntimeError) as e:
+            # 전송 지연/연결 종료
+            logger.info(f"게이트웨이 연결 종료 ({route.topic}, 사용자 {user_id}): {type(e).__name__}")
+        finally:
+            self.hub.unregister(route.topic, connection)
+            watcher.cancel()
+        if not connection.closed:
+            try:
+                await asyncio.wait_for(send({'type': 'http.response.body', 'body': b'', 'more_body': False}),
+                                       SEND_TIMEOUT)
+            except Exception:
+                pass
+
+    async def _send_events(self, send, connection, events, catch_up=False):
+        """이벤트를 한 번의 전송으로 묶어 보냄
+
+        id는 커밋 순서와 다를 수 있으므로(알림) last_id보다 작다고 버리지 않고, 재연결 조회로 이미 보낸
+        id만 건너뛴다. last_id는 재연결/대체 조회 기준으로 지금까지 보낸 가장 큰 id를 유지한다.
+        """
+        if connection.caught_up_ids and not catch_up and time.time() >= connection.dedupe_until:
+            connection.caught_up_ids = None
+        if catch_up:
+            connection.dedupe_until = time.time() + CATCH_UP_DEDUPE_WINDOW
+        chunks = []
+        for event in events:
+            event_id = event.get('id')
+            if isinstance(event_id, int):
+                if catch_up:
+                    if connection.caught_up_ids is None:
+                        connection.caught_up_ids = set()
+                    connection.caught_up_ids.add(event_id)
+                elif connection.caught_up_ids and event_id in connection.caught_up_ids:
+                    continue
+                connection.last_id = max(connection.last_id, event_id)
+            chunks.append(_sse_message(event))
+        if chunks:
+            await self._send(send, ''.join(chunks))
+
+    @staticmethod
+    async def _send(send, text):
+        # 클라이언트가 읽지 않아 전송이 막히면 SEND_TIMEOUT 후 연결 종료
+        await asyncio.wait_for(
+            send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': True}),
+            SEND_TIMEOUT
+        )
+
+    @staticmethod
+    async def _watch_disconnect(receive, connection):
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                connection.close()
+                return
+
+    # ------------------------------------------------------------------
+    # 인증 / 요청 처리
+    # ------------------------------------------------------------------
+    async def _authenticate(self, cookie_header):
+        """Flask 세션 쿠키로 로그인 사용자 확인 (활성 사용자 id 또는 None)"""
+        user_id = self._session_user_id(cookie_header)
+        if user_id is None:
+            return None
+        try:
+            return await self.hub.run_sync(self._active_user_id, user_id)
+        except Exception as e:
+            logger.error(f"❌ 게이트웨이 사용자 확인 실패: {e}")
+            return None
+
+    def _session_user_id(self, cookie_header):
+        if not cookie_header:
+            return None
+        cookies = parse_cookie(cookie_header.decode('latin-1'))
+        value = cookies.get(self.flask_app.config.get('SESSION_COOKIE_NAME', 'session'))
+        if not value:
+            return None
+        serializer = self.flask_app.session_interface.get_signing_serializer(self.flask_app)
+        if serializer is None:
+            return None
+        try:
+            data = serializer.loads(value, max_age=int(self.flask_app.permanent_session_lifetime.total_seconds()))
+        except BadSignature:
+            return None
+        return data.get('_user_id')
+
+    @staticmethod
+    def _active_user_id(user_id):
+        from app.models import User
+        try:
+            user = User.query.get(int(user_id))
+        except (TypeError, ValueError):
+            return None
+        return user.id if user is not None and user.is_active else None
+
+    @staticmethod
+    def _last_event_id(scope, headers):
+        value = headers.get(b'last-event-id', b'').decode('latin-1')
+        if not value:
+            query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+            value = (query.get('last_event_id') or [''])[0]
+        try:
+            return max(int(value), 0)
+        except ValueError:
+            return 0
+
+    def _cors_headers(self, origin):
+        if not origin or origin.decode('latin-1').rstrip('/') not in self.allowed_origins:
+            return []
+        return [
+            (b'access-control-allow-origin', origin),
+            (b'access-control-allow-credentials', b'true'),
+            (b'access-control-allow-headers', b'Cache-Control, Last-Event-ID'),
+            (b'vary', b'Origin'),
+        ]
+
+    @staticmethod
+    async def _respond(send, status, payload, extra_headers):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b''
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers + extra_headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    def _ensure_started(self):
+        if self._started:
+            return
+        self._started = True
+        pollers = {route.topic: route.poll for route in self.routes.values() if route.poll is not None}
+        self.hub.start(sorted({route.topic for route in self.routes.values()}), pollers)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._ensure_started()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.hub.stop()
+                self._started = False
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+def _notification_poll(cursor):
+    from app.models import Notification
+    return Notification.get_events_after(cursor, CATCH_UP_BATCH)
+
+
+def create_gateway(flask_app=None):
+    """게이트웨이 생성 (flask_app을 주지 않으면 app.main의 앱 사용)"""
+    if flask_app is None:
+        from app.main import app as flask_app
+    from app.models import Notification
+    from app.models.notification import NOTIFICATION_TOPIC
+    from app.services.server_events import SERVER_TOPIC, get_inventory_events
+
+    gateway = EventGateway(flask_app)
+    gateway.add_stream('/notifications/stream', NOTIFICATION_TOPIC,
+                       catch_up=Notification.get_events_after, poll=_notification_poll)
+    # 서버 이벤트의 id는 인벤토리 세대 번호 (변경분은 한 이벤트로 묶여 오므로 catch_up도 한 번이면 충분)
+    gateway.add_stream('/events/servers', SERVER_TOPIC, catch_up=get_inventory_events, poll=get_inventory_events)
+    return gateway
@@ -0,0 +1,181 @@
+"""
+게이트웨이 이벤트 분배기 (이벤트 버스 → asyncio 연결)
+
+이벤트 버스(app/utils/event_bus.py)의 구독 하나를 스레드 하나가 받아 이벤트 루프로 넘기고,
+루프 안에서 토픽을 구독 중인 연결마다 크기 제한이 있는 deque에 넣는다.
+
+- 연결 상태는 Future 하나와 (대기 이벤트가 있을 때만) deque 정도로 연결당 수 KB 이하
+- deque가 가득 차면(클라이언트가 느려 전송이 밀림) 가장 오래된 이벤트를 버리고 dropped를 올린다
+  → 스트림은 연결을 끊고, 클라이언트가 재연결하면서 놓친 이벤트를 DB에서 다시 받는다
+- 이벤트 버스가 이벤트를 밀어 받지 못하는 동안(event_bus.live == False)에는
+  구독자가 있는 토픽만 프로세스당 하나의 작업이 주기적으로 조회한다 (연결 수와 무관)
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict, deque
+
+from app.utils.event_bus import event_bus
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 버스가 끊긴 동안의 조회 주기 (초)
+FALLBACK_POLL_INTERVAL = 1
+# 브리지 구독 큐 크기 (게이트웨이 프로세스 전체 공용)
+BRIDGE_QUEUE_SIZE = 4096
+
+
+class Connection:
+    """스트림 연결 하나의 상태 (대기 중인 이벤트가 없으면 deque도 만들지 않음)"""
+
+    __slots__ = ('user_id', 'last_id', 'maxlen', 'pending', 'waiter', 'dropped', 'closed',
+                 'caught_up_ids', 'dedupe_until')
+
+    def __init__(self, user_id, last_id, maxlen):
+        self.user_id = user_id
+        self.last_id = last_id
+        self.maxlen = maxlen
+        self.pending = None
+        self.waiter = None
+        self.dropped = 0
+        self.closed = False
+        # 재연결 조회로 보낸 이벤트 id (구독으로 다시 들어오는 같은 이벤트만 건너뜀, dedupe_until까지 유지)
+        self.caught_up_ids = None
+        self.dedupe_until = 0.0
+
+    def push(self, event):
+        if self.pending is None:
+            self.pending = deque(maxlen=self.maxlen)
+        elif len(self.pending) == self.maxlen:
+            self.dropped += 1
+        self.pending.append(event)
+        self._wake()
+
+    def drain(self):
+        events, self.pending = list(self.pending or ()), None
+        return events
+
+    def close(self):
+        self.closed = True
+        self._wake()
+
+    async def wait(self, timeout):
+        """이벤트 도착, 연결 종료, timeout 중 먼저 오는 것까지 대기"""
+        if self.pending or self.closed:
+            return
+        loop = asyncio.get_running_loop()
+        # asyncio.Event/wait_for보다 가벼운 Future 하나와 타이머 핸들만 사용
+        self.waiter = loop.create_future()
+        timer = loop.call_later(timeout, self._wake)
+        try:
+            await self.waiter
+        finally:
+            timer.cancel()
+            self.waiter = None
+
+    def _wake(self):
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+
+class EventHub:
+    """토픽별 연결 목록과 이벤트 버스 브리지"""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self._connections = defaultdict(set)
+        self._pollers = {}
+        self._cursors = {}
+        self._loop = None
+        self._subscription = None
+        self._tasks = []
+        self.stats = {'dispatched': 0, 'polled': 0}
+
+    def start(self, topics, pollers=None):
+        """이벤트 루프 안에서 호출 (브리지 스레드와 대체 조회 작업 시작)"""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._pollers = dict(pollers or {})
+        self._subscription = event_bus.subscribe(*topics, maxsize=BRIDGE_QUEUE_SIZE)
+        threading.Thread(target=self._bridge, args=(self._subscription, self._loop),
+                         name='gateway-bridge', daemon=True).start()
+        for topic, poll in self._pollers.items():
+            self._tasks.append(self._loop.create_task(self._poll(topic, poll)))
+        logger.info(f"📡 이벤트 게이트웨이 시작: {', '.join(topics)}")
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        if self._subscription is not None:
+            self._subscription.close()
+            self._subscription = None
+        for connections in self._connections.values():
+            for connection in connections:
+                connection.close()
+        self._loop = None
+
+    def register(self, topic, connection):
+        self._connections[topic].add(connection)
+
+    def unregister(self, topic, connection):
+        connections = self._connections.get(topic)
+        if connections is not None:
+            connections.discard(connection)
+            if not connections:
+                del self._connections[topic]
+
+    def connection_count(self):
+        return sum(len(connections) for connections in self._connections.values())
+
+    def dispatch(self, topic, event):
+        """이벤트 루프 스레드에서만 호출"""
+        event_id = event.get('id') if isinstance(event, dict) else None
+        if isinstance(event_id, int):
+            self._cursors[topic] = max(self._cursors.get(topic) or 0, event_id)
+        for connection in self._connections.get(topic, ()):
+            connection.push(event)
+        self.stats['dispatched'] += 1
+
+    async def run_sync(self, func, *args):
+        """DB 조회 등 동기 함수를 스레드 풀에서 Flask 앱 컨텍스트로 실행"""
+        from app import db
+
+        def call():
+            with self.flask_app.app_context():
+                try:
+                    return func(*args)
+                finally:
+                    db.session.remove()
+        return await asyncio.get_running_loop().run_in_executor(None, call)
+
+    def _bridge(self, subscription, loop):
+        while self._subscription is subscription:
+            item = subscription.get(timeout=1)
+            if item is None:
+                continue
+            try:
+                loop.call_soon_threadsafe(self.dispatch, *item)
+            except RuntimeError:
+                # 이벤트 루프 종료
+                return
+
+    async def _poll(self, topic, poll):
+        while True:
+            await asyncio.sleep(FALLBACK_POLL_INTERVAL)
+            connections = self._connections.get(topic)
+            if not connections or event_bus.live:
+                continue
+            cursor = self._cursors.get(topic)
+            if cursor is None:
+                cursor = max(connection.last_id for connection in connections)
+            try:
+                events = await self.run_sync(poll, cursor)
+            except Exception as e:
+                logger.warning(f"⚠️ 게이트웨이 대체 조회 실패 ({topic}): {e}")
+                continue
+            self._cursors.setdefault(topic, cursor)
+            self.stats['polled'] += 1
+            for event in events:
+                self.dispatch(topic, event)
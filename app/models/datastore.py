@@ -1,9 +1,12 @@
 """
 Datastore 모델
 """
+import logging
 from datetime import datetime
 from app import db
 
+logger = logging.getLogger(__name__)
+
 class Datastore(db.Model):
     """Datastore 정보 모델"""
     __tablename__ = 'datastores'
@@ -40,5 +43,63 @@ class Datastore(db.Model):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
     
+    @classmethod
+    def upsert_from_proxmox(cls, datastores, hdd_datastore=None, ssd_datastore=None, prune=True):
+        """Proxmox datastore 목록으로 테이블을 증분 갱신 (커밋은 호출자가 수행)
+
+        - 기존 행은 용량/타입 등만 갱신하고 기본 HDD/SSD 설정은 유지
+        - 새 행은 hdd_datastore/ssd_datastore와 일치하면 기본값으로 지정
+        - Proxmox에서 사라진 datastore 행은 prune=True일 때만 삭제
+          (행에 노드 정보가 없으므로 일부 노드가 오프라인/조회 실패면 호출자가 prune=False로 넘긴다)
+        - 기본 HDD/SSD로 지정된 행은 삭제하지 않고 비활성화만 한다 (다시 나타나면 활성화됨)
+        반환: {'created': n, 'updated': n, 'deleted': n, 'disabled': n, 'skipped': n}
+        """
+        existing = {d.id: d for d in cls.query.all()}
+        seen = set()
+        counts = {'created': 0, 'updated': 0, 'deleted': 0, 'disabled': 0, 'skipped': 0}
+        
+        for datastore in datastores:
+            datastore_id = datastore['id']
+            seen.add(datastore_id)
+            values = {
+                'name': datastore_id,
+                'type': datastore.get('type', 'unknown'),
+                'size': datastore.get('size', 0),
+                'used': datastore.get('used', 0),
+                'available': datastore.get('available', 0),
+                'content': datastore.get('content', ''),
+                'enabled': datastore.get('enabled', True)
+            }
+            
+            row = existing.get(datastore_id)
+            if row is None:
+                db.session.add(cls(
+                    id=datastore_id,
+                    is_default_hdd=datastore_id == hdd_datastore,
+                    is_default_ssd=datastore_id == ssd_datastore,
+                    **values
+                ))
+                counts['created'] += 1
+            elif any(getattr(row, k) != v for k, v in values.items()):
+                for key, value in values.items():
+                    setattr(row, key, value)
+                counts['updated'] += 1
+        
+        for datastore_id, row in existing.items():
+            if datastore_id in seen:
+                continue
+            if not prune:
+                counts['skipped'] += 1
+            elif row.is_default_hdd or row.is_default_ssd:
+                logger.warning(f"⚠️ 기본 datastore {datastore_id}가 Proxmox 목록에 없어 삭제하지 않고 비활성화합니다")
+                if row.enabled:
+                    row.enabled = False
+                    counts['disabled'] += 1
+            else:
+                db.session.delete(row)
+                counts['deleted'] += 1
+        
+        return counts
+    
     def __repr__(self):
         return f'<Datastore {self.id}>'
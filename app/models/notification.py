@@ -1,9 +1,18 @@
 """
 알림 모델
+
+커밋된 알림은 이벤트 버스의 notifications 토픽으로 게시되어 SSE 스트림(/notifications/stream)에 전달된다.
 """
 from datetime import datetime
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 from app import db
 
+# 이벤트 버스 토픽
+NOTIFICATION_TOPIC = 'notifications'
+# 커밋 전까지 게시를 미루는 알림 이벤트 목록 (session.info 키)
+_PENDING_KEY = 'pending_notification_events'
+
 class Notification(db.Model):
     """알림 모델"""
     __tablename__ = 'notifications'
@@ -104,4 +113,46 @@ class Notification(db.Model):
         )
         db.session.add(notification)
         db.session.commit()
-        return notification 
\ No newline at end of file
+        return notification
+    
+    @classmethod
+    def get_events_after(cls, last_id, limit=20):
+        """last_id 이후 알림 이벤트 목록 (SSE 재연결 시 놓친 알림 전송용)"""
+        notifications = cls.query.filter(cls.id > last_id).order_by(cls.id.asc()).limit(limit).all()
+        return [notification.to_event() for notification in notifications]
+    
+    def to_event(self):
+        """SSE로 전달하는 알림 이벤트"""
+        return {
+            'id': self.id,
+            'type': self.type or 'notification',
+            'severity': self.severity,
+            'title': self.title,
+            'message': self.message,
+            'details': self.details,
+            'user_id': self.user_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+
+@event.listens_for(Notification, 'after_insert')
+def _queue_notification_event(mapper, connection, target):
+    """INSERT된 알림을 세션에 모아 두었다가 커밋 후 게시 (롤백된 알림은 게시하지 않음)"""
+    session = Session.object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, []).append(target.to_event())
+
+
+@event.listens_for(Session, 'after_commit')
+def _publish_notification_events(session):
+    events = session.info.pop(_PENDING_KEY, None)
+    if not events:
+        return
+    from app.utils.event_bus import event_bus
+    for notification_event in events:
+        event_bus.publish(NOTIFICATION_TOPIC, notification_event)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_notification_events(session):
+    session.info.pop(_PENDING_KEY, None)
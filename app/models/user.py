@@ -6,6 +6,11 @@ from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 from app import db
+from app.utils.redis_utils import redis_utils
+
+# 권한 집합 캐시 (Redis + 프로세스 로컬 L1, 권한 변경 시 즉시 무효화)
+PERMISSION_CACHE_TTL = 300
+PERMISSION_LOCAL_TTL = 60
 
 class User(UserMixin, db.Model):
     """사용자 모델"""
@@ -51,9 +56,39 @@ class User(UserMixin, db.Model):
         """사용자 권한 목록 반환"""
         return [perm.permission for perm in self.permissions]
     
+    def get_permission_set(self):
+        """사용자 권한 집합 (요청마다 DB를 조회하지 않도록 캐시)
+
+        조기 갱신은 백그라운드 스레드에서 계산하므로 요청에 묶인 self 대신 user_id로 조회한다.
+        """
+        user_id = self.id
+        permissions = redis_utils.get_or_compute(
+            self.permission_cache_key(user_id), lambda: self.load_permissions(user_id),
+            ttl=PERMISSION_CACHE_TTL, stale_ttl=0, negative_ttl=0, local_ttl=PERMISSION_LOCAL_TTL
+        )
+        return frozenset(permissions or ())
+    
+    @staticmethod
+    def load_permissions(user_id):
+        """DB에서 사용자 권한 목록 조회 (정렬)"""
+        rows = db.session.query(UserPermission.permission).filter_by(user_id=user_id).all()
+        return sorted(row.permission for row in rows)
+    
     def has_permission(self, permission):
         """특정 권한 보유 여부 확인"""
-        return self.permissions.filter_by(permission=permission).first() is not None
+        return permission in self.get_permission_set()
+    
+    @staticmethod
+    def permission_cache_key(user_id):
+        return f"permissions:user:{user_id}"
+    
+    @classmethod
+    def invalidate_permission_cache(cls, user_id):
+        """권한 변경 후 모든 프로세스의 권한 캐시 폐기
+
+        변경 전 권한을 읽은 재계산이 진행 중이면 저장이 끝난 뒤 다시 삭제하여 회수한 권한이 남지 않게 한다.
+        """
+        redis_utils.delete_computed(cls.permission_cache_key(user_id))
     
     def add_permission(self, permission):
         """권한 추가"""
@@ -61,6 +96,7 @@ class User(UserMixin, db.Model):
             user_perm = UserPermission(user_id=self.id, permission=permission)
             db.session.add(user_perm)
             db.session.commit()
+            self.invalidate_permission_cache(self.id)
     
     def remove_permission(self, permission):
         """권한 제거"""
@@ -68,6 +104,7 @@ class User(UserMixin, db.Model):
         if user_perm:
             db.session.delete(user_perm)
             db.session.commit()
+            self.invalidate_permission_cache(self.id)
     
     def set_permissions(self, permissions):
         """사용자 권한을 완전히 교체"""
@@ -78,6 +115,7 @@ class User(UserMixin, db.Model):
             user_perm = UserPermission(user_id=self.id, permission=permission)
             db.session.add(user_perm)
         db.session.commit()
+        self.invalidate_permission_cache(self.id)
 
 class UserPermission(db.Model):
     """사용자 권한 모델"""
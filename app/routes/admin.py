@@ -6,6 +6,7 @@ from flask_login import login_required, current_user
 from app.models.user import User, UserPermission
 from app.services.notification_service import NotificationService
 from app.routes.auth import permission_required
+from app.utils.json_stream import stream_json
 from app import db
 import logging
 
@@ -185,6 +186,7 @@ def delete_user(username):
         from app import db
         db.session.delete(user)
         db.session.commit()
+        User.invalidate_permission_cache(user.id)
         
         return jsonify({
             'success': True,
@@ -196,6 +198,57 @@ def delete_user(username):
         return jsonify({'error': str(e)}), 500
 
 
+@bp.route('/api/proxmox/circuits', methods=['GET'])
+@login_required
+@admin_required
+def proxmox_circuit_status():
+    """Proxmox 노드별 서킷 브레이커 상태 조회"""
+    try:
+        from app.utils.circuit_breaker import get_all_breaker_states
+        circuits = get_all_breaker_states()
+        degraded = [c['name'] for c in circuits if c['state'] != 'closed']
+        return jsonify({
+            'success': True,
+            'circuits': circuits,
+            'degraded': degraded
+        })
+    except Exception as e:
+        logger.error(f"서킷 상태 조회 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/cache/stats', methods=['GET'])
+@login_required
+@admin_required
+def cache_stats():
+    """현재 프로세스의 캐시 통계 (L1 네임스페이스별 hit/miss/evict 포함)"""
+    try:
+        from app.utils.redis_utils import redis_utils
+        return jsonify({
+            'success': True,
+            'stats': redis_utils.get_cache_stats()
+        })
+    except Exception as e:
+        logger.error(f"캐시 통계 조회 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/api/proxmox/circuits/<path:name>/reset', methods=['POST'])
+@login_required
+@admin_required
+def reset_proxmox_circuit(name):
+    """Proxmox 서킷 브레이커 수동 초기화 (현재 프로세스)"""
+    try:
+        from app.utils.circuit_breaker import get_breaker
+        breaker = get_breaker(name)
+        breaker.reset()
+        return jsonify({
+            'success': True,
+            'message': f'서킷 {name}이(가) 초기화되었습니다.',
+            'circuit': breaker.snapshot()
+        })
+    except Exception as e:
+        logger.error(f"서킷 초기화 실패: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @bp.route('/users', methods=['POST'])
 @login_required
 @admin_required
@@ -267,7 +320,7 @@ def admin_iam_api():
         
         # 디버그 정보를 함께 반환하여 환경/DB 경로 불일치 문제를 진단
         from flask import current_app
-        return jsonify({
+        return stream_json({
             'success': True,
             'users': user_data,
             'users_count': len(user_data),
@@ -359,6 +412,7 @@ def admin_iam_set_permissions(username):
             db.session.add(user_permission)
         
         db.session.commit()
+        User.invalidate_permission_cache(user.id)
         
         return jsonify({
             'success': True,
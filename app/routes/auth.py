@@ -25,13 +25,8 @@ def permission_required(permission):
             if current_user.role == 'admin':
                 return f(*args, **kwargs)
             
-            # 사용자 권한 확인
-            user_permission = UserPermission.query.filter_by(
-                user_id=current_user.id,
-                permission=permission
-            ).first()
-            
-            if not user_permission:
+            # 사용자 권한 확인 (권한 집합 캐시 사용)
+            if not current_user.has_permission(permission):
                 return jsonify({'error': '권한이 없습니다.'}), 403
             
             return f(*args, **kwargs)
@@ -222,7 +217,7 @@ def get_profile_api():
             'is_active': current_user.is_active,
             'created_at': current_user.created_at.isoformat() if current_user.created_at else None,
             'last_login': current_user.last_login.isoformat() if current_user.last_login else None,
-            'permissions': [perm.permission for perm in current_user.permissions]
+            'permissions': sorted(current_user.get_permission_set())
         }
         return jsonify(user_data)
     except Exception as e:
@@ -241,7 +236,7 @@ def refresh_session():
         current_user.update_user_login()
         
         # 세션에 권한 정보 재설정
-        permissions = [perm.permission for perm in current_user.permissions]
+        permissions = sorted(current_user.get_permission_set())
         session['permissions'] = permissions
         session['user_role'] = current_user.role
         session['user_id'] = current_user.id
@@ -270,7 +265,7 @@ def check_session():
                 'user': {
                     'username': current_user.username,
                     'role': current_user.role,
-                    'permissions': [perm.permission for perm in current_user.permissions]
+                    'permissions': sorted(current_user.get_permission_set())
                 }
             })
         else:
@@ -296,7 +291,7 @@ def get_current_user():
             'is_active': current_user.is_active,
             'created_at': current_user.created_at.isoformat() if current_user.created_at else None,
             'last_login': current_user.last_login.isoformat() if current_user.last_login else None,
-            'permissions': [perm.permission for perm in current_user.permissions]
+            'permissions': sorted(current_user.get_permission_set())
         }
         return jsonify(user_data)
     except Exception as e:
@@ -317,7 +312,7 @@ def get_profile():
             'is_active': current_user.is_active,
             'created_at': current_user.created_at.isoformat() if current_user.created_at else None,
             'last_login': current_user.last_login.isoformat() if current_user.last_login else None,
-            'permissions': [perm.permission for perm in current_user.permissions]
+            'permissions': sorted(current_user.get_permission_set())
         }
         return jsonify(user_data)
     except Exception as e:
@@ -10,6 +10,7 @@ import time
 import uuid
 from datetime import datetime
 from app.routes.auth import permission_required
+from app.utils.json_stream import stream_json
 from app.models.notification import Notification
 from app import db
 
@@ -81,6 +82,10 @@ def update_backup_status(server_name, status, message=None):
         if message:
             backup_status[server_name]['message'] = message
         backup_status[server_name]['last_update'] = time.time()
+        if status == 'completed':
+            # 새 백업 파일이 생겼으므로 백업 목록 캐시 폐기
+            from app.services.proxmox_service import ProxmoxService
+            ProxmoxService.invalidate_backup_cache()
         logger.info(f"백업 상태 업데이트 성공: {server_name} - {status} - {message}")
         logger.info(f"업데이트 후 backup_status: {backup_status}")
     else:
@@ -322,7 +327,8 @@ def get_all_node_backups():
         
         result = proxmox_service.get_node_backups()
         if result['success']:
-            return jsonify(result)
+            # 백업 수에 비례해 커지는 응답이므로 백업 항목 단위로 나누어 전송
+            return stream_json(result, stream_depth=3)
         else:
             return jsonify({'error': result.get('error', '백업 목록 조회 실패')}), 500
             
@@ -340,7 +346,7 @@ def get_node_backups(node_name):
         
         result = proxmox_service.get_node_backups(node_name)
         if result['success']:
-            return jsonify(result)
+            return stream_json(result, stream_depth=3)
         else:
             return jsonify({'error': result.get('error', '백업 목록 조회 실패')}), 500
             
@@ -3,7 +3,9 @@ import logging
 from flask_login import login_required, current_user
 from app.models import User, UserPermission
 from app.services.proxmox_service import ProxmoxService
+from app.services.inventory_service import request_inventory_refresh
 from app.routes.auth import permission_required
+from app.utils.http_cache import conditional_by_content
 
 
 # 로거 설정
@@ -13,6 +15,7 @@ bp = Blueprint('firewall', __name__)
 
 @bp.route('/api/firewall/groups', methods=['GET'])
 @login_required
+@conditional_by_content
 def get_firewall_groups():
     """방화벽 그룹 목록 조회"""
     try:
@@ -20,7 +23,8 @@ def get_firewall_groups():
         proxmox_service = ProxmoxService()
         
         # Proxmox에서 방화벽 그룹 정보 가져오기
-        firewall_groups = proxmox_service.get_firewall_groups()
+        # 조회 실패(캐시된 값도 없음) 시 None이므로 빈 목록으로 응답
+        firewall_groups = proxmox_service.get_firewall_groups() or []
         
         return jsonify({
             'success': True,
@@ -57,6 +61,7 @@ def create_firewall_group():
         success = proxmox_service.create_firewall_group(group_name, description)
         
         if success:
+            proxmox_service.invalidate_firewall_groups_cache()
             logger.info(f"방화벽 그룹 '{group_name}' 생성 성공")
             return jsonify({
                 'success': True,
@@ -115,6 +120,7 @@ def assign_firewall_group(server_name):
         
         server.firewall_group = firewall_group
         db.session.commit()
+        request_inventory_refresh([server_name], reason='firewall_group')
         
         return jsonify({
             'success': True, 
@@ -134,6 +140,7 @@ def delete_firewall_group(group_name):
         proxmox_service = ProxmoxService()
         success = proxmox_service.delete_firewall_group(group_name)
         if success:
+            proxmox_service.invalidate_firewall_groups_cache()
             return jsonify({'success': True, 'message': f'방화벽 그룹 {group_name}이 삭제되었습니다.'})
         else:
             return jsonify({'success': False, 'error': f'방화벽 그룹 {group_name} 삭제 실패'}), 500
@@ -171,6 +178,7 @@ def add_firewall_group_rule(group_name):
         success = proxmox_service.add_firewall_rule(group_name, data)
         
         if success:
+            proxmox_service.invalidate_firewall_groups_cache()
             return jsonify({
                 'success': True,
                 'message': '방화벽 규칙이 Security Group에 추가되었습니다.'
@@ -197,6 +205,7 @@ def delete_firewall_group_rule(group_name, rule_id):
         success = proxmox_service.delete_firewall_rule(group_name, rule_id)
         
         if success:
+            proxmox_service.invalidate_firewall_groups_cache()
             return jsonify({
                 'success': True,
                 'message': '방화벽 규칙이 Security Group에서 삭제되었습니다. (Proxmox API 제한으로 인해 Security Group을 재생성했습니다)'
@@ -237,6 +246,7 @@ def apply_security_group_to_vm(server_name):
             if server:
                 server.firewall_group = group_name
                 db.session.commit()
+                request_inventory_refresh([server_name], reason='firewall_group')
                 logger.info(f"DB에 Security Group 정보 업데이트 완료")
             
             return jsonify({
@@ -331,6 +341,7 @@ def assign_firewall_group_bulk():
         
         # DB 커밋
         db.session.commit()
+        request_inventory_refresh(list(found_servers), reason='firewall_group')
         
         # 결과 응답
         action_text = "해제" if is_remove_operation else f"'{firewall_group}' 할당"
@@ -403,6 +414,7 @@ def remove_firewall_group(server_name):
             # DB에서 방화벽 그룹 정보 제거
             server.firewall_group = None
             db.session.commit()
+            request_inventory_refresh([server_name], reason='firewall_group')
             
             logger.info(f"서버 '{server_name}'에서 방화벽 그룹 '{old_firewall_group}' 제거 완료")
             return jsonify({
@@ -414,6 +426,7 @@ def remove_firewall_group(server_name):
             # Proxmox 제거 실패 시에도 DB는 업데이트
         server.firewall_group = None
         db.session.commit()
+        request_inventory_refresh([server_name], reason='firewall_group')
         
         return jsonify({
             'success': True, 
@@ -8,6 +8,8 @@ import logging
 from flask_login import login_required, current_user
 from app.models import User, Server, Notification
 from app.services import ProxmoxService
+from app.services.inventory_service import inventory_service
+from app.utils.http_cache import conditional, template_version, session_permissions_version
 import json
 
 
@@ -45,9 +47,17 @@ def admin():
     notifications = Notification.query.order_by(Notification.created_at.desc()).limit(5).all()
     return render_template('admin/index.html', users=users, servers=servers, notifications=notifications)
 
+def _partial_version(template_name):
+    """partial ETag 구성 요소 (스냅샷이 없으면 None → DB 폴백 렌더링은 조건부 처리하지 않음)"""
+    version = inventory_service.get_version()
+    if version is None:
+        return None
+    return version, template_name, template_version(template_name), session_permissions_version()
+
 # 기존 템플릿과 호환성을 위한 라우트들
 @bp.route('/instances/content')
 @login_required
+@conditional(lambda: _partial_version('partials/instances_content.html'))
 def instances_content():
     """인스턴스 콘텐츠 (기존 템플릿 호환)"""
     # roles 변수 준비 (기존 app.py와 동일)
@@ -63,7 +73,7 @@ def instances_content():
     try:
         logger.info("🔍 /instances/content 호출됨")
         proxmox_service = ProxmoxService()
-        result = proxmox_service.get_all_vms()
+        result = inventory_service.get_all_vms()
         
         # servers 변수 초기화
         servers = {}
@@ -122,14 +132,15 @@ def instances_content():
 
 @bp.route('/dashboard/content')
 @login_required
+@conditional(lambda: _partial_version('partials/dashboard_content.html'))
 def dashboard_content():
     """대시보드 콘텐츠 (기존 템플릿 호환)"""
     try:
         logger.info("🔍 /dashboard/content 호출됨")
         proxmox_service = ProxmoxService()
-        result = proxmox_service.get_all_vms()
+        result = inventory_service.get_all_vms()
         
-        logger.info(f"🔍 get_all_vms 결과: {result}")
+        logger.debug(f"🔍 인벤토리 스냅샷 결과: {result}")
         
         if result['success']:
             servers = result['data']['servers']
@@ -141,7 +152,7 @@ def dashboard_content():
             logger.info(f"🔍 서버 수: {len(servers)}")
             logger.info(f"🔍 통계: total={total}, running={running}, stopped={stopped}")
         else:
-            logger.error(f"get_all_vms 실패: {result.get('message', '알 수 없는 오류')}")
+            logger.error(f"인벤토리 스냅샷 조회 실패: {result.get('message', '알 수 없는 오류')}")
             # 데이터베이스에서 직접 조회
             with proxmox_service._get_db_connection() as conn:
                 cursor = conn.cursor()
@@ -4,7 +4,9 @@
 from flask import Blueprint, request, jsonify, Response
 from flask_login import login_required, current_user
 from app.models import Notification
+from app.models.notification import NOTIFICATION_TOPIC
 from app.routes.auth import permission_required
+from app.utils.event_bus import event_bus
 from app import db
 import logging
 import json
@@ -19,6 +21,14 @@ bp = Blueprint('notification', __name__)
 # SSE 연결 관리
 sse_connections = defaultdict(list)
 
+# SSE 하트비트 주기 / 이벤트 버스 구독이 끊긴 동안의 DB 조회 주기 (초) / 놓친 알림 조회 단위
+SSE_HEARTBEAT_INTERVAL = 10
+SSE_FALLBACK_POLL_INTERVAL = 1
+SSE_BATCH_SIZE = 20
+# 놓친 알림 조회와 구독이 겹치는 구간의 중복 제거 유지 시간 (초)
+# 알림 id는 커밋 순서와 다를 수 있으므로 id 크기 대신 조회로 보낸 id 집합과 비교한다
+SSE_CATCH_UP_DEDUPE_WINDOW = 30
+
 @bp.route('/notifications', methods=['GET'])
 @login_required
 def get_notifications():
@@ -119,18 +129,59 @@ def get_latest_notification():
         logger.error(f"최신 알림 조회 실패: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _fetch_notification_events(last_id, limit=SSE_BATCH_SIZE):
+    """last_id 이후의 알림 이벤트 조회 (SQLite 락 오류 시 재시도)"""
+    # 새 트랜잭션에서 읽도록 세션 갱신
+    try:
+        db.session.expire_all()
+    except Exception:
+        pass
+
+    max_retries = 3
+    retry_count = 0
+    while retry_count < max_retries:
+        try:
+            return Notification.get_events_after(last_id, limit)
+        except Exception as db_error:
+            retry_count += 1
+            if "database is locked" in str(db_error) and retry_count < max_retries:
+                logger.warning(f"⚠️ DB 락 오류, {retry_count}초 후 재시도: {db_error}")
+                time.sleep(retry_count)
+                try:
+                    db.session.rollback()
+                except Exception:
+                    pass
+            else:
+                logger.error(f"❌ DB 조회 실패: {db_error}")
+                break
+    return []
+
+def _sse_message(event_data):
+    """SSE 메시지 (id가 있으면 재연결 시 Last-Event-ID로 이어받을 수 있도록 id 필드 포함)"""
+    event_id = event_data.get('id') if isinstance(event_data.get('id'), int) else None
+    prefix = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{prefix}data: {json.dumps(event_data)}\n\n"
+
 @bp.route('/notifications/stream', methods=['GET'])
 def notification_stream():
-    """Server-Sent Events를 통한 실시간 알림 스트림"""
+    """Server-Sent Events를 통한 실시간 알림 스트림
+
+    연결 시 놓친 알림(Last-Event-ID 또는 last_event_id 쿼리 이후, 없으면 전체)을 한 번 조회해 보낸 뒤에는
+    이벤트 버스 큐를 기다리며, DB는 이벤트 버스 구독이 끊긴 동안에만 주기적으로 조회한다.
+    """
     from flask import stream_with_context
     
+    # 로그인하지 않은 경우 기본 사용자 ID 사용
+    user_id = current_user.id if current_user.is_authenticated else 0
+    last_event_id = (request.headers.get('Last-Event-ID', type=int)
+                     or request.args.get('last_event_id', type=int) or 0)
+    
     def event_stream():
-        # 로그인하지 않은 경우 기본 사용자 ID 사용
-        user_id = current_user.id if current_user.is_authenticated else 0
         connection_id = f"{user_id}_{int(time.time() * 1000)}"
-        last_id = 0
+        last_id = last_event_id
         
-        # 연결 등록
+        # 연결 등록 (조회보다 먼저 구독해야 조회와 구독 사이에 커밋된 알림을 놓치지 않음)
+        subscription = event_bus.subscribe(NOTIFICATION_TOPIC)
         sse_connections[user_id].append(connection_id)
         
         try:
@@ -140,70 +191,51 @@ def notification_stream():
             yield f"data: {json.dumps({'type': 'connected', 'connection_id': connection_id})}\n\n"
             yield ': ping\n\n'
             
-            # 하트비트 (15초마다)
+            # 놓친 알림 전송 (보낸 id는 구독으로 다시 들어올 수 있으므로 기록)
+            caught_up_ids = set()
+            while True:
+                events = _fetch_notification_events(last_id)
+                for event_data in events:
+                    yield _sse_message(event_data)
+                    caught_up_ids.add(event_data['id'])
+                    last_id = event_data['id']
+                if len(events) < SSE_BATCH_SIZE:
+                    break
+            dedupe_until = time.time() + SSE_CATCH_UP_DEDUPE_WINDOW
+            # 이후에는 이벤트 큐만 기다리므로 DB 연결을 풀에 반납
+            db.session.remove()
+            
             last_heartbeat = time.time()
+            last_poll = last_heartbeat
             while True:
                 try:
-                    current_time = time.time()
+                    item = subscription.get(timeout=1)
+                    if item is not None:
+                        _, event_data = item
+                        event_id = event_data.get('id')
+                        # 구독 직후 조회로 이미 보낸 알림만 건너뜀 (늦게 커밋된 작은 id 알림은 그대로 전송)
+                        if event_id not in caught_up_ids:
+                            logger.info(f"📤 SSE로 알림 전송: {event_data.get('title')}")
+                            yield _sse_message(event_data)
+                            if isinstance(event_id, int):
+                                last_id = max(last_id, event_id)
                     
-                    # 새로운 알림이 있는지 확인 (전체 사용자 공통 알림)
-                    # 새 트랜잭션에서 읽도록 세션을 주기적으로 갱신
-                    try:
-                        db.session.expire_all()
-                    except Exception:
-                        pass
-                    
-                    # SQLite 락 오류 방지를 위한 재시도 로직
-                    max_retries = 3
-                    retry_count = 0
-                    notifications = []
-                    
-                    while retry_count < max_retries:
-                        try:
-                            notifications = Notification.query.filter(
-                                Notification.id > last_id
-                            ).order_by(Notification.id.asc()).limit(20).all()
-                            break
-                        except Exception as db_error:
-                            retry_count += 1
-                            if "database is locked" in str(db_error) and retry_count < max_retries:
-                                logger.warning(f"⚠️ DB 락 오류, {retry_count}초 후 재시도: {db_error}")
-                                time.sleep(retry_count)
-                                # 세션 갱신
-                                try:
-                                    db.session.rollback()
-                                    db.session.close()
-                                    db.session = db.create_scoped_session()
-                                except Exception:
-                                    pass
-                            else:
-                                logger.error(f"❌ DB 조회 실패: {db_error}")
-                                break
-                    
-                    if notifications:
-                        logger.info(f"🔔 SSE에서 {len(notifications)}개 새 알림 감지 (last_id: {last_id})")
-                        for notification in notifications:
-                            event_data = {
-                                'id': notification.id,
-                                'type': notification.type or 'notification',  # DB의 type 필드 사용
-                                'severity': notification.severity,
-                                'title': notification.title,
-                                'message': notification.message,
-                                'details': notification.details,
-                                'created_at': notification.created_at.isoformat()
-                            }
-                            
-                            logger.info(f"📤 SSE로 알림 전송: {notification.title}")
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            last_id = notification.id
+                    current_time = time.time()
+                    if caught_up_ids and current_time >= dedupe_until:
+                        caught_up_ids = set()
+                    # 이벤트를 밀어 받을 수단이 없는 동안(Redis 장애 등)은 DB 조회로 보완
+                    if not event_bus.live and current_time - last_poll >= SSE_FALLBACK_POLL_INTERVAL:
+                        last_poll = current_time
+                        for event_data in _fetch_notification_events(last_id):
+                            yield _sse_message(event_data)
+                            last_id = event_data['id']
+                        db.session.remove()
                     
-                    # 주기적 하트비트 전송 (더 자주)
-                    if current_time - last_heartbeat >= 10:
+                    # 주기적 하트비트 전송
+                    if current_time - last_heartbeat >= SSE_HEARTBEAT_INTERVAL:
                         yield ': ping\n\n'
                         yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': current_time})}\n\n"
                         last_heartbeat = current_time
-                    
-                    time.sleep(1)  # 안정적인 간격으로 체크
                 except Exception as loop_error:
                     logger.exception(f"SSE 루프 오류: {loop_error}")
                     # 잠시 대기 후 루프 계속 (연결 유지)
@@ -211,12 +243,16 @@ def notification_stream():
                     time.sleep(2)
                 
         except GeneratorExit:
+            logger.info(f"SSE 연결 종료: {connection_id}")
+        finally:
             # 연결 종료 시 정리
+            subscription.close()
             if user_id in sse_connections and connection_id in sse_connections[user_id]:
                 sse_connections[user_id].remove(connection_id)
                 if not sse_connections[user_id]:
                     del sse_connections[user_id]
-            logger.info(f"SSE 연결 종료: {connection_id}")
+            if subscription.dropped:
+                logger.warning(f"⚠️ SSE 연결 {connection_id}: 큐 초과로 {subscription.dropped}개 이벤트 누락")
     
     headers = {
         'Content-Type': 'text/event-stream',
@@ -232,17 +268,14 @@ def notification_stream():
     return Response(stream_with_context(event_stream()), headers=headers)
 
 def broadcast_notification(user_id: int, notification_data: dict):
-    """특정 사용자에게 알림 브로드캐스트"""
-    if user_id in sse_connections:
-        for connection_id in sse_connections[user_id].copy():
-            try:
-                # 실제로는 연결된 클라이언트에게 전송
-                # 여기서는 로그만 출력 (실제 구현에서는 WebSocket이나 SSE 큐 사용)
-                logger.info(f"알림 브로드캐스트: {user_id} -> {connection_id}: {notification_data}")
-            except Exception as e:
-                logger.error(f"알림 브로드캐스트 실패: {e}")
-                # 연결 제거
-                sse_connections[user_id].remove(connection_id)
+    """알림 이벤트를 모든 웹 프로세스의 SSE 연결로 전달 (DB에 저장하지 않는 일회성 알림용)
+
+    Notification 모델로 저장된 알림은 커밋 시 자동으로 게시되므로 이 함수를 호출할 필요가 없다.
+    """
+    try:
+        event_bus.publish(NOTIFICATION_TOPIC, dict(notification_data, user_id=user_id))
+    except Exception as e:
+        logger.error(f"알림 브로드캐스트 실패: {e}")
 
 @bp.route('/notifications/<int:notification_id>', methods=['GET'])
 @login_required
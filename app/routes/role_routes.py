@@ -79,6 +79,9 @@ def remove_role(server_name):
         server.role = None
         db.session.commit()
         
+        from app.services.inventory_service import request_inventory_refresh
+        request_inventory_refresh([server_name], reason='role_remove')
+        
         logger.info(f"✅ 역할 제거 완료: {server_name}")
         return jsonify({
             'success': True,
@@ -8,6 +8,8 @@ from app.models import Server, User, UserPermission, Notification
 from app.services import ProxmoxService, TerraformService, AnsibleService, NotificationService
 from flask import current_app
 from app.routes.server_utils import merge_db_server_info, create_task, update_task
+from app.utils.http_cache import conditional
+from app.utils.json_stream import stream_json
 from app import db
 import json
 import os
@@ -43,6 +45,13 @@ bp = Blueprint('servers', __name__)
 # 전역 작업 상태 dict
 tasks = {}
 
+# 서버 이벤트 스트림 하트비트 / 이벤트 버스가 끊긴 동안의 세대 확인 주기 (초)
+SSE_HEARTBEAT_INTERVAL = 10
+SSE_FALLBACK_POLL_INTERVAL = 5
+# 세대 변경분 조회와 구독이 겹치는 구간의 중복 제거 유지 시간 (초)
+# 세대 번호는 Redis 초기화 후 작은 값부터 다시 시작하므로 번호 크기 대신 조회로 보낸 세대 집합과 비교한다
+SSE_CATCH_UP_DEDUPE_WINDOW = 30
+
 
 def _remove_from_known_hosts(ip_address: str) -> bool:
     """SSH known_hosts 파일에서 특정 IP 제거"""
@@ -173,34 +182,37 @@ def get_celery_status():
         logger.error(f"Celery 상태 조회 실패: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+def _inventory_version():
+    from app.services.inventory_service import inventory_service
+    return inventory_service.get_version()
+
+
 @bp.route('/api/all_server_status', methods=['GET'])
 @login_required
+@conditional(_inventory_version)
 def get_all_server_status():
-    """모든 서버 상태 조회 (Redis 캐싱 제거 - 실시간 조회)"""
+    """모든 서버 상태 조회 (인벤토리 스냅샷 사용, Proxmox 직접 호출 없음)"""
     try:
-        logger.info("🌐 서버 상태 데이터 조회 (실시간)")
-        from app.services.proxmox_service import ProxmoxService
-        proxmox_service = ProxmoxService()
+        from app.services.inventory_service import inventory_service
         
-        # get_all_vms 함수 사용 (통계 정보 포함)
-        result = proxmox_service.get_all_vms()
+        # 스냅샷에는 DB 역할/방화벽 그룹 정보가 이미 병합되어 있음
+        result = inventory_service.get_all_vms()
         
         if result['success']:
-            # 기존 구조와 호환성을 위해 데이터 변환
-            servers = result['data']['servers']
-            stats = result['data']['stats']
-            
-            # Proxmox 데이터에 DB 정보 병합
-            servers = merge_db_server_info(servers)
+            data = result['data']
             
             # 통계 정보를 포함하여 반환
             response_data = {
                 'success': True,
-                'servers': servers,
-                'stats': stats
+                'servers': data['servers'],
+                'stats': data['stats'],
+                'capacity': data.get('capacity'),
+                'generation': data['generation'],
+                'stale': data['stale']
             }
             
-            return jsonify(response_data)
+            # 서버 수에 비례해 커지는 응답이므로 서버 단위로 나누어 전송
+            return stream_json(response_data, stream_depth=2)
         else:
             # 실패 시 기본 구조로 반환
             return jsonify({
@@ -226,6 +238,120 @@ def get_all_server_status():
         return jsonify({'error': str(e)}), 500
 
 
+@bp.route('/api/servers/changes', methods=['GET'])
+@login_required
+def get_server_changes():
+    """세대 since 이후 추가/변경/삭제된 서버만 조회 (변경 로그로 메울 수 없으면 reset=True와 전체 목록)"""
+    try:
+        from app.services.inventory_service import inventory_service
+
+        since = request.args.get('since', type=int)
+        result = inventory_service.get_changes(since)
+        if not result['success']:
+            return jsonify({'success': False, 'error': result.get('message')}), 503
+
+        return jsonify(dict(result['data'], success=True))
+
+    except Exception as e:
+        logger.error(f"서버 변경 조회 실패: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def _sse_message(event):
+    event_id = event.get('id') if isinstance(event.get('id'), int) else None
+    prefix = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{prefix}data: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+
+
+@bp.route('/events/servers', methods=['GET'])
+@login_required
+def server_event_stream():
+    """서버 상태 이벤트 스트림 (SSE)
+
+    스냅샷 세대 변경분(inventory), Celery 작업 진행 상태(server), DB 변경(record)을 밀어 보낸다.
+    Last-Event-ID(또는 last_event_id 쿼리)는 클라이언트가 가진 세대 번호이며, 그 이후 변경분을 먼저 보낸다.
+    이벤트 버스 구독이 끊긴 동안에만 세대 번호를 주기적으로 확인한다.
+    """
+    from flask import Response, stream_with_context
+    from app.services.server_events import SERVER_TOPIC, get_inventory_events
+    from app.utils.event_bus import event_bus
+
+    last_event_id = (request.headers.get('Last-Event-ID', type=int)
+                     or request.args.get('last_event_id', type=int) or 0)
+
+    def event_stream():
+        generation = last_event_id
+        # 조회보다 먼저 구독해야 조회와 구독 사이에 게시된 세대를 놓치지 않음
+        subscription = event_bus.subscribe(SERVER_TOPIC)
+        try:
+            yield ': ping\n\n'
+            yield f"data: {json.dumps({'type': 'connected', 'generation': generation})}\n\n"
+            # 조회로 보낸 세대는 구독으로 다시 들어올 수 있으므로 기록
+            caught_up_ids = set()
+            for event in get_inventory_events(generation):
+                yield _sse_message(event)
+                caught_up_ids.add(event['generation'])
+                generation = event['generation']
+            dedupe_until = time.time() + SSE_CATCH_UP_DEDUPE_WINDOW
+            db.session.remove()
+
+            last_heartbeat = time.time()
+            last_poll = last_heartbeat
+            while True:
+                item = subscription.get(timeout=1)
+                if item is not None:
+                    _, event = item
+                    event_id = event.get('id')
+                    # 구독 직후 조회로 이미 보낸 세대만 건너뜀 (더 작은 세대는 초기화로 보고 그대로 전송)
+                    if event_id not in caught_up_ids:
+                        yield _sse_message(event)
+                        if isinstance(event_id, int):
+                            generation = event_id
+
+                current_time = time.time()
+                if caught_up_ids and current_time >= dedupe_until:
+                    caught_up_ids = set()
+                if not event_bus.live and current_time - last_poll >= SSE_FALLBACK_POLL_INTERVAL:
+                    last_poll = current_time
+                    for event in get_inventory_events(generation):
+                        yield _sse_message(event)
+                        generation = event['generation']
+                    db.session.remove()
+
+                if current_time - last_heartbeat >= SSE_HEARTBEAT_INTERVAL:
+                    yield ': ping\n\n'
+                    yield f"data: {json.dumps({'type': 'heartbeat', 'timestamp': current_time})}\n\n"
+                    last_heartbeat = current_time
+        except GeneratorExit:
+            pass
+        finally:
+            subscription.close()
+            if subscription.dropped:
+                logger.warning(f"⚠️ 서버 이벤트 스트림: 큐 초과로 {subscription.dropped}개 이벤트 누락")
+
+    headers = {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-store, must-revalidate',
+        'X-Accel-Buffering': 'no',  # Nginx 버퍼링 방지
+    }
+    return Response(stream_with_context(event_stream()), headers=headers)
+
+
+@bp.route('/api/proxmox/capacity', methods=['GET'])
+@login_required
+def get_proxmox_capacity():
+    """노드별/클러스터 용량 집계 조회 (짧은 TTL 캐시)"""
+    try:
+        proxmox_service = ProxmoxService()
+        result = proxmox_service.get_cluster_capacity()
+        if not result['success']:
+            return jsonify({'success': False, 'error': result.get('message')}), 502
+        return jsonify({'success': True, 'data': result['data']})
+    except Exception as e:
+        logger.error(f"용량 집계 조회 실패: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 # ========================================
 # 웹 페이지 라우트
 # ========================================
@@ -270,7 +396,8 @@ def get_datastores():
             
             # Proxmox에서 datastore 목록 가져오기
             proxmox_service = ProxmoxService()
-            proxmox_datastores = proxmox_service.get_datastores()
+            inventory = proxmox_service.get_datastore_inventory()
+            proxmox_datastores = inventory['datastores'] if inventory else []
             
             # 환경변수에서 기본 datastore 설정 가져오기 (초기 설정용)
             def load_env_file():
@@ -302,20 +429,9 @@ def get_datastores():
             ssd_datastore = env_vars.get('PROXMOX_SSD_DATASTORE', 'local')
             
             # Proxmox datastore를 DB에 저장
-            for datastore in proxmox_datastores:
-                db_datastore = Datastore(
-                    id=datastore['id'],
-                    name=datastore['id'],
-                    type=datastore.get('type', 'unknown'),
-                    size=datastore.get('size', 0),
-                    used=datastore.get('used', 0),
-                    available=datastore.get('available', 0),
-                    content=datastore.get('content', ''),
-                    enabled=datastore.get('enabled', True),
-                    is_default_hdd=datastore['id'] == hdd_datastore,
-                    is_default_ssd=datastore['id'] == ssd_datastore
-                )
-                db.session.add(db_datastore)
+            # 빠진 노드가 있으면 그 노드의 datastore가 목록에 없을 수 있으므로 기존 행은 지우지 않음
+            Datastore.upsert_from_proxmox(proxmox_datastores, hdd_datastore, ssd_datastore,
+                                          prune=bool(inventory) and not inventory['missing_nodes'])
         
         db.session.commit()
         # 최초 로드 시에만 Proxmox에서 가져온 개수를 로그로 남기고,
@@ -409,14 +525,13 @@ def refresh_datastores():
     try:
         from app.models.datastore import Datastore
         
-        # 기존 datastore 정보 삭제
-        Datastore.query.delete()
-        db.session.commit()
-        logger.info("🔧 기존 datastore 정보 삭제 완료")
-        
         # Proxmox에서 datastore 목록 가져오기
         proxmox_service = ProxmoxService()
-        proxmox_datastores = proxmox_service.get_datastores()
+        inventory = proxmox_service.get_datastore_inventory()
+        proxmox_datastores = inventory['datastores'] if inventory else []
+        if not proxmox_datastores:
+            # 조회 실패 시 기존 DB 정보를 그대로 유지
+            return jsonify({'error': 'Proxmox에서 datastore 정보를 가져올 수 없습니다.'}), 502
         
         # 환경변수에서 기본 datastore 설정 가져오기
         def load_env_file():
@@ -447,29 +562,24 @@ def refresh_datastores():
         hdd_datastore = env_vars.get('PROXMOX_HDD_DATASTORE', 'local-lvm')
         ssd_datastore = env_vars.get('PROXMOX_SSD_DATASTORE', 'local')
         
-        # Proxmox datastore를 DB에 저장
-        for datastore in proxmox_datastores:
-            db_datastore = Datastore(
-                id=datastore['id'],
-                name=datastore['id'],
-                type=datastore.get('type', 'unknown'),
-                size=datastore.get('size', 0),
-                used=datastore.get('used', 0),
-                available=datastore.get('available', 0),
-                content=datastore.get('content', ''),
-                enabled=datastore.get('enabled', True),
-                is_default_hdd=datastore['id'] == hdd_datastore,
-                is_default_ssd=datastore['id'] == ssd_datastore
-            )
-            db.session.add(db_datastore)
-        
+        # Proxmox datastore를 DB에 증분 반영 (기본 HDD/SSD 설정은 유지)
+        # 오프라인/조회 실패 노드가 있으면 목록에 없는 행을 지우지 않음 (그 노드의 datastore일 수 있음)
+        missing_nodes = inventory['missing_nodes']
+        counts = Datastore.upsert_from_proxmox(proxmox_datastores, hdd_datastore, ssd_datastore,
+                                               prune=not missing_nodes)
         db.session.commit()
-        logger.info(f"🔧 {len(proxmox_datastores)}개 datastore를 DB에 새로 저장 완료")
+        logger.info(f"🔧 datastore DB 갱신 완료: 추가 {counts['created']}, 변경 {counts['updated']}, "
+                    f"삭제 {counts['deleted']}, 비활성화 {counts['disabled']}, 삭제 보류 {counts['skipped']}")
         
+        message = f'{len(proxmox_datastores)}개 datastore 정보를 새로고침했습니다.'
+        if missing_nodes:
+            message += f" (조회되지 않은 노드: {', '.join(missing_nodes)} - 목록에 없는 datastore는 유지)"
         return jsonify({
             'success': True,
-            'message': f'{len(proxmox_datastores)}개 datastore 정보를 새로고침했습니다.',
-            'count': len(proxmox_datastores)
+            'message': message,
+            'count': len(proxmox_datastores),
+            'changes': counts,
+            'missing_nodes': missing_nodes
         })
     
     except Exception as e:
@@ -1,7 +1,9 @@
 """
 서버 비동기 작업 관련 엔드포인트
 """
+import json
 import logging
+import time
 from flask import Blueprint, request, jsonify
 from flask_login import login_required
 from app.routes.auth import permission_required
@@ -13,6 +15,9 @@ logger = logging.getLogger(__name__)
 # 비동기 작업용 별도 Blueprint 생성
 async_bp = Blueprint('servers_async', __name__)
 
+# 작업 진행 스트림 하트비트 주기 (초)
+TASK_STREAM_HEARTBEAT_INTERVAL = 10
+
 
 @async_bp.route('/api/servers/async', methods=['POST'])
 @permission_required('create_server')
@@ -271,6 +276,63 @@ def get_task_status(task_id):
         }), 500
 
 
+@async_bp.route('/api/tasks/<task_id>/progress/stream', methods=['GET'])
+@login_required
+def stream_task_progress(task_id):
+    """작업 진행 이벤트 스트림 (SSE, 작업별 Redis Stream을 XREAD로 이어 읽음)
+
+    이벤트 id는 스트림 id이므로 재연결 시 Last-Event-ID(또는 last_event_id 쿼리) 이후부터 다시 받고,
+    없으면 남아 있는 처음부터 보낸다. done 이벤트를 보낸 뒤 스트림을 닫는다.
+    진행 스트림이 없는 작업은 끝났는지 결과 백엔드로 확인해 done을 한 번 보낸다.
+    """
+    from flask import Response, stream_with_context
+    from app.utils import task_progress
+    from app.utils.redis_utils import redis_utils
+
+    if not redis_utils.is_available():
+        return jsonify({
+            'success': False,
+            'error': '작업 진행 스트림을 사용할 수 없습니다. /api/tasks/<task_id>/status로 조회하세요.'
+        }), 503
+
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or ''
+    cursor = last_event_id if task_progress.valid_stream_id(last_event_id) else '0-0'
+
+    def event_stream():
+        position = cursor
+        last_heartbeat = time.time()
+        yield ': ping\n\n'
+        while True:
+            try:
+                events = task_progress.read_events(task_id, position)
+                done = None if events else task_progress.backend_done_event(task_id)
+            except Exception as e:
+                logger.warning(f"⚠️ 작업 진행 스트림 조회 실패 ({task_id}): {e}")
+                yield f"data: {json.dumps({'type': 'error', 'message': '작업 진행 조회 실패'}, ensure_ascii=False)}\n\n"
+                return
+
+            for stream_id, event in events:
+                position = stream_id
+                yield f"id: {stream_id}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+                if event.get('type') == 'done':
+                    return
+            if done is not None:
+                yield f"data: {json.dumps(done, ensure_ascii=False, default=str)}\n\n"
+                return
+
+            now = time.time()
+            if now - last_heartbeat >= TASK_STREAM_HEARTBEAT_INTERVAL:
+                yield ': ping\n\n'
+                last_heartbeat = now
+
+    headers = {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-store, must-revalidate',
+        'X-Accel-Buffering': 'no',  # Nginx 버퍼링 방지
+    }
+    return Response(stream_with_context(event_stream()), headers=headers)
+
+
 @async_bp.route('/api/servers/<server_name>/delete', methods=['POST'])
 @permission_required('delete_server')
 def delete_server_endpoint(server_name):
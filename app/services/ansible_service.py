@@ -15,6 +15,7 @@ from flask import current_app
 from app.models.server import Server
 from app.models.notification import Notification
 from app.services.ansible_variables import AnsibleVariableManager
+from app.utils.task_progress import run_command
 from app import db
 
 # ansible-runner import
@@ -147,23 +148,14 @@ class AnsibleService:
                 logger.error(error_msg)
                 return -1, "", error_msg
             else:
-                # Linux/Mac 환경
-                result = subprocess.run(
-                command,
-                cwd=cwd,
-                env=env,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=1800
-            )
+                # Linux/Mac 환경 (Celery 작업 안에서는 출력 줄을 작업 진행 스트림으로 전달)
+                returncode, stdout, stderr = run_command(command, cwd=cwd, env=env, timeout=1800)
                 
-                print(f"🔧 Ansible 명령어 완료: returncode={result.returncode}")
-                print(f"🔧 Ansible stdout: {result.stdout[:500]}..." if len(result.stdout) > 500 else f"🔧 Ansible stdout: {result.stdout}")
-                print(f"🔧 Ansible stderr: {result.stderr[:500]}..." if len(result.stderr) > 500 else f"🔧 Ansible stderr: {result.stderr}")
+                print(f"🔧 Ansible 명령어 완료: returncode={returncode}")
+                print(f"🔧 Ansible stdout: {stdout[:500]}..." if len(stdout) > 500 else f"🔧 Ansible stdout: {stdout}")
+                print(f"🔧 Ansible stderr: {stderr[:500]}..." if len(stderr) > 500 else f"🔧 Ansible stderr: {stderr}")
                 
-            return result.returncode, result.stdout, result.stderr
+                return returncode, stdout, stderr
                 
         except subprocess.TimeoutExpired:
             logger.error("Ansible 명령어 실행 타임아웃")
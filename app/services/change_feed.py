@@ -0,0 +1,197 @@
+"""
+PostgreSQL 변경 수신 서비스 (LISTEN/NOTIFY)
+
+알림은 Celery 작업, NotificationService, AnsibleService, 백업 라우트 등 여러 곳에서 직접 INSERT되므로
+호출 지점마다 이벤트 게시를 넣는 대신 DB 트리거(scripts/change_feed_triggers.sql)가 커밋 시점에
+pg_notify로 알리고, 웹 프로세스마다 LISTEN 연결 하나가 이를 받아 이벤트 버스와 인벤토리 스냅샷에 반영한다.
+
+- notifications INSERT: 현재 프로세스에 알림 구독자가 있을 때만 id로 한 번에 조회해 notifications 토픽으로 전달
+- servers INSERT/UPDATE/DELETE: servers 토픽으로 전달하고, 스냅샷에 병합된 DB 필드(역할/방화벽 그룹/OS)가
+  바뀌었을 수 있으므로 해당 서버의 인벤토리 갱신을 요청 (같은 알림은 Redis SET NX로 한 프로세스만 요청)
+- 모든 웹 프로세스가 같은 알림을 받으므로 이벤트는 Redis로 다시 게시하지 않고 현재 프로세스 구독자에게만 전달
+- ORM 커밋 훅(app/models/notification.py)이 Redis로 게시한 알림과 겹치면 이벤트 버스가 id로 한 번만 전달
+- 수신 스레드는 첫 구독 시 시작 (Celery 워커처럼 SSE 구독자가 없는 프로세스는 연결하지 않음)
+- DB_CHANGE_FEED_ENABLED=true 이고 PostgreSQL + psycopg2 환경에서만 동작
+"""
+import hashlib
+import json
+import logging
+import os
+import select
+import threading
+import time
+
+try:
+    import psycopg2
+    from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, quote_ident
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+from sqlalchemy.engine import make_url
+
+from app.models.notification import NOTIFICATION_TOPIC
+from app.services.server_events import SERVER_TOPIC
+from app.utils.event_bus import event_bus
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+# 연결이 끊겼을 때 재연결 대기 시간 (초)
+RECONNECT_DELAY = 2
+# 같은 servers 변경 알림으로 인벤토리 갱신을 한 번만 요청하기 위한 키 (프로세스 간 중복 제거)
+REFRESH_CLAIM_PREFIX = 'change_feed:refresh:'
+REFRESH_CLAIM_TTL = 60
+
+
+class ChangeFeedListener:
+    """프로세스당 LISTEN 연결 하나로 DB 변경 알림을 받아 이벤트 버스로 전달"""
+
+    def __init__(self):
+        self.app = None
+        self.channel = None
+        self.connected = False
+        self._dsn = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stats = {'received': 0, 'notifications': 0, 'servers': 0, 'refresh_requests': 0, 'invalid': 0}
+
+    def init_app(self, app):
+        if not app.config.get('DB_CHANGE_FEED_ENABLED', False):
+            return
+        # ORM으로 INSERT한 알림은 커밋 훅이 Redis로도 게시하므로(Celery 등 LISTEN하지 않는 프로세스 포함)
+        # 두 경로로 온 같은 알림은 id로 한 번만 전달
+        event_bus.dedupe_by_id(NOTIFICATION_TOPIC)
+        url = make_url(app.config['SQLALCHEMY_DATABASE_URI'])
+        if url.get_backend_name() != 'postgresql':
+            logger.warning(f"⚠️ DB 변경 수신은 PostgreSQL에서만 사용할 수 있습니다 ({url.get_backend_name()})")
+            return
+        if not PSYCOPG2_AVAILABLE:
+            logger.warning("⚠️ psycopg2가 설치되지 않아 DB 변경 수신을 사용하지 않습니다")
+            return
+        self.app = app
+        self.channel = app.config.get('DB_CHANGE_FEED_CHANNEL', 'proxmox_manager_changes')
+        self._dsn = url.set(drivername='postgresql').render_as_string(hide_password=False)
+        event_bus.add_source(self)
+
+    def ensure_started(self):
+        if self.app is None or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self.connected = False
+                self._pid = os.getpid()
+                threading.Thread(target=self._listen, name='db-change-feed', daemon=True).start()
+
+    def get_stats(self):
+        return dict(self._stats, enabled=self.app is not None, connected=self.connected, channel=self.channel)
+
+    def _listen(self):
+        pid = os.getpid()
+        while self._pid == pid:
+            conn = None
+            try:
+                # 유휴 상태에서 끊긴 연결도 감지하도록 TCP keepalive 사용
+                conn = psycopg2.connect(self._dsn, keepalives=1, keepalives_idle=30,
+                                        keepalives_interval=10, keepalives_count=3)
+                conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {quote_ident(self.channel, conn)}")
+                self.connected = True
+                logger.info(f"📡 DB 변경 알림 수신 시작: {self.channel}")
+                while self._pid == pid:
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    payloads = []
+                    while conn.notifies:
+                        payloads.append(conn.notifies.pop(0).payload)
+                    if payloads:
+                        self._handle(payloads)
+            except Exception as e:
+                logger.warning(f"⚠️ DB 변경 알림 수신 끊김, 재연결 대기: {e}")
+            finally:
+                self.connected = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            time.sleep(RECONNECT_DELAY)
+
+    def _handle(self, payloads):
+        notification_ids = []
+        refresh_names = []
+        for payload in payloads:
+            self._stats['received'] += 1
+            try:
+                change = json.loads(payload)
+            except ValueError:
+                self._stats['invalid'] += 1
+                continue
+            table = change.get('table')
+            if table == 'notifications' and change.get('op') == 'INSERT':
+                notification_ids.append(change['id'])
+            elif table == 'servers':
+                self._handle_server(change)
+                if self._claim_refresh(payload):
+                    refresh_names.extend(name for name in (change.get('name'), change.get('old_name')) if name)
+
+        if refresh_names:
+            self._request_refresh(refresh_names)
+
+        if notification_ids and event_bus.has_subscribers(NOTIFICATION_TOPIC):
+            for event in self._load_notifications(notification_ids):
+                self._stats['notifications'] += 1
+                event_bus.dispatch_local(NOTIFICATION_TOPIC, event)
+
+    def _handle_server(self, change):
+        self._stats['servers'] += 1
+        # id는 스트림의 세대 번호(이벤트 id)와 겹치지 않도록 server_id로 보냄
+        event_bus.dispatch_local(SERVER_TOPIC, {
+            'type': 'record',
+            'op': str(change.get('op', '')).lower(),
+            'server_id': change.get('id'),
+            'name': change.get('name'),
+            'status': change.get('status'),
+        })
+
+    @staticmethod
+    def _claim_refresh(payload):
+        """모든 웹 프로세스가 같은 알림을 받으므로 처음 받은 프로세스만 갱신을 요청
+
+        페이로드에 트랜잭션 id(txid)가 있어 서로 다른 변경은 다른 키가 된다.
+        Redis를 사용할 수 없으면 중복을 감수하고 요청한다.
+        """
+        if not redis_utils.is_available():
+            return True
+        key = f"{REFRESH_CLAIM_PREFIX}{hashlib.sha1(payload.encode('utf-8')).hexdigest()}"
+        try:
+            return bool(redis_utils.client.set(key, '1', nx=True, ex=REFRESH_CLAIM_TTL))
+        except Exception:
+            return True
+
+    def _request_refresh(self, names):
+        from app.services.inventory_service import request_inventory_refresh
+        self._stats['refresh_requests'] += 1
+        # Celery를 사용할 수 없으면 이 스레드에서 직접 갱신하므로 앱 컨텍스트 필요
+        with self.app.app_context():
+            request_inventory_refresh(list(dict.fromkeys(names)), reason='db_change')
+
+    def _load_notifications(self, ids):
+        """트리거는 id만 보내므로 본문은 한 번의 조회로 가져온다"""
+        from app import db
+        from app.models import Notification
+        with self.app.app_context():
+            try:
+                rows = Notification.query.filter(Notification.id.in_(ids)).order_by(Notification.id.asc()).all()
+                return [row.to_event() for row in rows]
+            except Exception as e:
+                logger.error(f"❌ 변경 알림 조회 실패: {e}")
+                return []
+            finally:
+                db.session.remove()
+
+
+# 전역 인스턴스
+change_feed = ChangeFeedListener()
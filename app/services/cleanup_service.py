@@ -166,11 +166,7 @@ class CleanupService:
             # Terraform 확인 (간접적으로)
             # terraform.tfvars.json 파일에서 해당 서버가 있는지 확인
             try:
-                import json
-                with open('terraform/terraform.tfvars.json', 'r') as f:
-                    tfvars = json.load(f)
-                    servers = tfvars.get('servers', {})
-                    status['terraform_exists'] = server_name in servers
+                status['terraform_exists'] = self.terraform_service.tfvars.has_server(server_name)
             except:
                 status['terraform_exists'] = False
             
@@ -0,0 +1,519 @@
+"""
+인벤토리 스냅샷 서비스
+
+Celery beat가 주기적으로 전체 인벤토리(VM, 디스크, DB 역할/방화벽 그룹, 통계)를 만들어
+세대 번호(generation)와 함께 Redis에 저장하고, 조회 API는 Proxmox를 호출하지 않고 스냅샷만 읽는다.
+
+- 읽기: Redis의 세대 번호만 확인하여 바뀌지 않았으면 프로세스 메모리 사본을 그대로 사용
+  (세대 번호는 L1 캐시에 보관하고 새 세대 게시 시 pub/sub으로 무효화하므로 보통 Redis 왕복도 없음)
+- 전체 갱신: Redis 락(소유 토큰)으로 동시에 한 프로세스만 빌드
+- 대상 갱신: 시작/중지/삭제 등 변경 작업 후 해당 서버만 다시 조회하여 스냅샷에 반영
+  (같은 빌드 락을 기다려 잡으므로 진행 중인 전체 빌드 결과를 덮어쓰지 않음)
+- 세대 번호는 서버 목록/통계가 이전 스냅샷과 다를 때만 증가하고, 세대별로 바뀐 서버 이름을
+  변경 로그에 남겨 get_changes(since)가 바뀐 서버만 반환한다 (실시간 사용량 필드는 화면 표시 단위로
+  양자화하여 비교하고, 세대가 그대로여도 최신 스냅샷 본문은 항상 저장)
+- 새 세대를 게시하면 바뀐 서버 행을 servers 토픽 이벤트로도 보낸다 (app/services/server_events.py)
+"""
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+from flask import current_app
+
+from app.services.server_events import publish_inventory_event
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = 'inventory:snapshot'
+GENERATION_KEY = 'inventory:generation'
+# 빌드 락 (redis_utils의 계산 락과 같은 {이름}:lock 키, 소유 토큰 비교 후 해제)
+BUILD_LOCK_NAME = 'inventory:build'
+BUILD_LOCK_KEY = f'{BUILD_LOCK_NAME}:lock'
+BUILD_LOCK_TTL = 120
+# Redis를 사용할 수 없어 프로세스 락으로 빌드할 때의 토큰
+LOCAL_LOCK_TOKEN = 'local'
+# 세대 번호를 L1 캐시에 보관하는 최대 시간 (무효화 메시지 유실 시 지연 상한)
+LOCAL_GENERATION_TTL = 10
+# 내용이 같아 세대를 올리지 않은 마지막 빌드 시각 (stale 판단용)
+CHECKED_AT_KEY = 'inventory:checked_at'
+# 세대별 변경 로그 (get_changes가 메울 수 있는 최대 세대 수)
+CHANGES_KEY = 'inventory:changes'
+CHANGE_LOG_SIZE = 500
+# 매 조회마다 바뀌는 실시간 사용량 필드의 비교 단위 (이 단위 미만의 변동으로는 세대를 올리지 않음)
+# cpu는 1%, memory/disk는 화면 표시 단위(0.1GB)에 맞춘 100MiB
+VOLATILE_QUANTA = {'cpu': 0.01, 'memory': 100 * 1024 * 1024, 'disk': 100 * 1024 * 1024}
+
+
+class InventorySnapshotService:
+    """세대 번호가 붙은 인벤토리 스냅샷 관리"""
+
+    def __init__(self):
+        self._local: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._changes = deque(maxlen=CHANGE_LOG_SIZE)
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_snapshot(self, fresh: bool = False) -> Optional[Dict[str, Any]]:
+        """현재 스냅샷 (세대 번호가 같으면 Redis 본문을 다시 읽지 않는다)
+
+        fresh=True이면 L1 캐시의 세대 번호를 건너뛰고 Redis에서 확인한다 (빌드 락을 잡은 갱신용).
+        """
+        local = self._local
+        if not redis_utils.is_available():
+            return local
+
+        use_local = redis_utils.local_ready()
+        if use_local and not fresh and local is not None and redis_utils.local.get(GENERATION_KEY) == local['generation']:
+            return local
+
+        try:
+            generation = redis_utils.client.get(GENERATION_KEY)
+            if generation is not None and use_local:
+                redis_utils.local.set(GENERATION_KEY, int(generation), LOCAL_GENERATION_TTL, size=len(generation))
+            if local is not None and generation is not None and int(generation) == local['generation']:
+                return local
+
+            raw = redis_utils.binary_client.get(SNAPSHOT_KEY)
+            if not raw:
+                return None
+            snapshot = redis_utils.codec.decode(raw)
+            with self._lock:
+                if self._local is None or snapshot['generation'] >= self._local['generation']:
+                    self._local = snapshot
+            return snapshot
+        except Exception as e:
+            logger.warning(f"⚠️ 인벤토리 스냅샷 조회 실패, 메모리 사본 사용: {e}")
+            return local
+
+    def get_all_vms(self) -> Dict[str, Any]:
+        """ProxmoxService.get_all_vms()와 같은 형식의 응답을 스냅샷에서 반환"""
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            # 최초 기동 등 스냅샷이 아직 없는 경우에만 직접 빌드
+            snapshot = self.refresh(reason='cold_start')
+        if snapshot is None:
+            return {
+                'success': False,
+                'message': '인벤토리 스냅샷이 아직 준비되지 않았습니다',
+                'data': {
+                    'vms': [],
+                    'total': 0,
+                    'running': 0,
+                    'stopped': 0
+                }
+            }
+
+        age = self._age(snapshot)
+        return {
+            'success': True,
+            'data': {
+                'servers': snapshot['servers'],
+                'stats': snapshot['stats'],
+                'capacity': snapshot.get('capacity'),
+                'generation': snapshot['generation'],
+                'built_at': snapshot['built_at'],
+                'age': round(age, 1),
+                'stale': age > self._stale_after()
+            }
+        }
+
+    def get_version(self) -> Optional[str]:
+        """조건부 응답(ETag)용 스냅샷 버전 (세대 번호 + stale 여부, 스냅샷이 없으면 None)"""
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return None
+        stale = self._age(snapshot) > self._stale_after()
+        return f"{snapshot['generation']}:{int(stale)}"
+
+    def get_changes(self, since: Optional[int]) -> Dict[str, Any]:
+        """세대 since 이후 추가/변경/삭제된 서버만 반환
+
+        변경 로그로 since 이후 세대를 모두 메울 수 없으면(로그 만료, 재시작, since 누락 등)
+        reset=True와 함께 전체 서버 맵을 반환한다.
+        """
+        snapshot = self.get_snapshot()
+        if snapshot is None:
+            return {'success': False, 'message': '인벤토리 스냅샷이 아직 준비되지 않았습니다', 'data': None}
+
+        generation = snapshot['generation']
+        servers = snapshot['servers']
+        age = self._age(snapshot)
+        data = {
+            'generation': generation,
+            'since': since,
+            'reset': False,
+            'changed': {},
+            'removed': [],
+            'stats': snapshot['stats'],
+            'stale': age > self._stale_after()
+        }
+        if since == generation:
+            return {'success': True, 'data': data}
+
+        names = self._changed_since(since, generation)
+        if names is None:
+            data.update(reset=True, changed=servers)
+        else:
+            data['changed'] = {name: servers[name] for name in names if name in servers}
+            data['removed'] = [name for name in names if name not in servers]
+        return {'success': True, 'data': data}
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh(self, reason: str = 'scheduled') -> Optional[Dict[str, Any]]:
+        """전체 인벤토리를 다시 빌드하여 새 세대로 게시 (실패 시 기존 스냅샷 유지)"""
+        token = self._acquire_build_lock()
+        if token is None:
+            # 다른 프로세스가 빌드 중이면 결과를 기다려 사용
+            logger.info(f"⏳ 인벤토리 빌드 진행 중, 결과 대기 ({reason})")
+            if not redis_utils.is_available():
+                return self._local
+            before = (self._local or {}).get('generation')
+            deadline = time.time() + BUILD_LOCK_TTL
+            while time.time() < deadline:
+                time.sleep(0.5)
+                snapshot = self.get_snapshot()
+                if snapshot is not None and snapshot['generation'] != before:
+                    return snapshot
+                if not redis_utils.client.exists(BUILD_LOCK_KEY):
+                    break
+            return self.get_snapshot()
+
+        try:
+            return self._build(reason)
+        finally:
+            self._release_build_lock(token)
+
+    def refresh_servers(self, server_names: List[str], reason: str = 'mutation') -> Optional[Dict[str, Any]]:
+        """지정한 서버만 Proxmox에서 다시 조회하여 스냅샷에 반영
+
+        전체 빌드와 같은 빌드 락을 기다려 잡은 뒤 최신 스냅샷을 읽어 수정하므로, 진행 중이던 전체 빌드가
+        게시한 새 세대를 이전 스냅샷 기반 결과로 덮어쓰지 않는다.
+        스냅샷에 없는 서버(새로 생성된 서버 등)가 있으면 전체 빌드로 대체한다.
+        """
+        token = self._acquire_build_lock(wait=BUILD_LOCK_TTL)
+        if token is None:
+            logger.warning(f"⚠️ 인벤토리 빌드 락 대기 시간 초과, 대상 갱신 생략 ({reason}): {server_names}")
+            return None
+        try:
+            return self._refresh_servers(server_names, reason)
+        finally:
+            self._release_build_lock(token)
+
+    # ------------------------------------------------------------------
+    # 내부 구현 (빌드 락을 잡은 상태에서 호출)
+    # ------------------------------------------------------------------
+    def _build(self, reason: str) -> Optional[Dict[str, Any]]:
+        """전체 인벤토리 빌드 후 게시"""
+        from app.services.proxmox_service import ProxmoxService
+
+        started = time.perf_counter()
+        result = ProxmoxService().get_all_vms()
+        if not result.get('success') or result.get('stale'):
+            logger.warning(f"⚠️ 인벤토리 빌드 실패, 기존 스냅샷 유지 ({reason}): {result.get('message')}")
+            return None
+
+        data = result['data']
+        snapshot = {
+            'servers': self._merge_db(data['servers']),
+            'stats': data['stats'],
+            'capacity': data.get('capacity'),
+            'fetch_stats': data.get('fetch_stats'),
+            'reason': reason,
+            'build_ms': round((time.perf_counter() - started) * 1000, 1)
+        }
+        return self._publish(snapshot)
+
+    def _refresh_servers(self, server_names: List[str], reason: str) -> Optional[Dict[str, Any]]:
+        """대상 서버만 다시 조회하여 게시 (스냅샷에 없는 서버가 있으면 전체 빌드)"""
+        server_names = [name for name in dict.fromkeys(server_names or []) if name]
+        snapshot = self.get_snapshot(fresh=True)
+        if snapshot is None or not server_names:
+            return self._build(reason)
+        if any(name not in snapshot['servers'] for name in server_names):
+            return self._build(reason)
+
+        from app.services.proxmox_service import ProxmoxService
+
+        service = ProxmoxService()
+        headers, error = service.get_proxmox_auth()
+        if error:
+            logger.warning(f"⚠️ 인벤토리 대상 갱신 인증 실패: {error}")
+            return None
+
+        servers = dict(snapshot['servers'])
+        located = {}
+        # 대상 서버의 위치를 한 번에 읽어 두어 resolve_vm()이 서버마다 Redis를 조회하지 않도록 함
+        from app.services.vm_index import vm_index
+        vm_index.resolve_many(names=server_names)
+        for name in server_names:
+            entry = service.resolve_vm(name=name)
+            if entry is None:
+                # Proxmox에서 사라진 서버 (삭제 완료)
+                servers.pop(name, None)
+                continue
+            located[name] = entry
+
+        calls = []
+        for name, entry in located.items():
+            base = f"{service.endpoint}/api2/json/nodes/{entry['node']}/qemu/{entry['vmid']}"
+            calls.append({'key': f"{name}|status", 'node': entry['node'], 'url': f"{base}/status/current"})
+            calls.append({'key': f"{name}|config", 'node': entry['node'], 'url': f"{base}/config"})
+        results = service.fetcher.fetch_many(calls, headers)
+
+        relocated = []
+        for name, entry in located.items():
+            status_result = results.get(f"{name}|status")
+            if not status_result or not status_result['success']:
+                if status_result and status_result['status_code'] in (404, 500):
+                    # 인덱스의 위치가 오래됨 (마이그레이션/삭제)
+                    relocated.append(name)
+                continue
+            current = status_result['data'] or {}
+            server = dict(servers[name])
+            server.update({
+                'status': current.get('status', server.get('status')),
+                'vmid': entry['vmid'],
+                'node': entry['node'],
+                'cpu': current.get('cpu', 0),
+                'memory': current.get('mem', 0),
+                'maxmem': current.get('maxmem', server.get('maxmem', 0)),
+                'uptime': current.get('uptime', 0),
+                'disk': current.get('disk', 0),
+                'maxdisk': current.get('maxdisk', server.get('maxdisk', 0))
+            })
+            config_result = results.get(f"{name}|config")
+            if config_result and config_result['success']:
+                server['disks'], server['total_disk_gb'] = service._parse_vm_disks(config_result['data'] or {})
+            servers[name] = server
+
+        if relocated:
+            for name in relocated:
+                vm_index.invalidate(name=name)
+            return self._build(reason)
+
+        servers = self._merge_db(servers, only=server_names)
+        cluster = (snapshot.get('capacity') or {}).get('cluster') or {}
+        if cluster:
+            stats = service.build_server_stats(servers, cluster['cpu_count'], cluster['memory_total'], cluster['memory_used'])
+        else:
+            stats = dict(snapshot['stats'])
+        return self._publish(dict(snapshot, servers=servers, stats=stats, reason=reason))
+
+    def _publish(self, snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot['built_at'] = time.time()
+        snapshot['built_at_iso'] = datetime.now().isoformat()
+        ttl = current_app.config.get('INVENTORY_SNAPSHOT_TTL', 600)
+
+        previous = self.get_snapshot(fresh=True)
+        changed = self._diff(previous, snapshot)
+        if previous is not None and not changed and snapshot['stats'] == previous['stats']:
+            # 표시 단위로 같으면 세대를 올리지 않아 ETag/변경 조회가 그대로 유지되도록 하고,
+            # 본문(단위 미만의 사용량 변동)과 확인 시각만 같은 세대로 저장
+            snapshot['generation'] = previous['generation']
+            self._touch(snapshot, ttl)
+            logger.info(f"📸 인벤토리 변경 없음: 세대 {previous['generation']} 유지 ({snapshot.get('reason')})")
+            return snapshot
+
+        if redis_utils.is_available():
+            try:
+                snapshot['generation'] = int(redis_utils.client.incr(GENERATION_KEY))
+                entry = redis_utils.codec.encode({'generation': snapshot['generation'], 'names': changed})
+                pipe = redis_utils.binary_client.pipeline(transaction=False)
+                pipe.set(SNAPSHOT_KEY, redis_utils.codec.encode(snapshot), ex=ttl)
+                if previous is not None:
+                    pipe.rpush(CHANGES_KEY, entry)
+                    pipe.ltrim(CHANGES_KEY, -CHANGE_LOG_SIZE, -1)
+                    pipe.expire(CHANGES_KEY, ttl)
+                pipe.execute()
+                redis_utils.publish_invalidation(keys=[GENERATION_KEY])
+            except Exception as e:
+                logger.warning(f"⚠️ 인벤토리 스냅샷 저장 실패, 메모리에만 보관: {e}")
+                snapshot['generation'] = (self._local or {}).get('generation', 0) + 1
+        else:
+            snapshot['generation'] = (self._local or {}).get('generation', 0) + 1
+
+        with self._lock:
+            if previous is not None:
+                self._changes.append({'generation': snapshot['generation'], 'names': changed})
+            self._local = snapshot
+        # /events/servers 구독자에게 바뀐 서버 행만 전달
+        publish_inventory_event(previous, snapshot, changed)
+        logger.info(f"📸 인벤토리 스냅샷 게시: 세대 {snapshot['generation']}, 서버 {len(snapshot['servers'])}개 "
+                    f"({snapshot.get('reason')}, {snapshot.get('build_ms', '-')}ms)")
+        return snapshot
+
+    @staticmethod
+    def _merge_db(servers: Dict[str, Dict[str, Any]], only: List[str] = None) -> Dict[str, Dict[str, Any]]:
+        """DB의 역할/방화벽 그룹/OS 정보를 스냅샷 서버 항목에 병합"""
+        try:
+            from app.models.server import Server
+            query = Server.query
+            if only:
+                query = query.filter(Server.name.in_(only))
+            db_servers = {s.name: s for s in query.all()}
+        except Exception as e:
+            logger.warning(f"⚠️ 인벤토리 DB 병합 실패: {e}")
+            return servers
+
+        merged = {}
+        for name, server in servers.items():
+            db_server = db_servers.get(name)
+            if db_server is not None:
+                server = dict(server, role=db_server.role, firewall_group=db_server.firewall_group,
+                              os_type=db_server.os_type)
+            merged[name] = server
+        return merged
+
+    @staticmethod
+    def _diff(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> List[str]:
+        """추가/변경/삭제된 서버 이름
+
+        실시간 사용량 필드는 VOLATILE_QUANTA 단위로 양자화하여 비교하고, uptime은 줄어든 경우(재부팅)만
+        변경으로 본다. 변경된 서버 행은 최신 사용량 값을 그대로 담아 전달된다.
+        """
+        if previous is None:
+            return sorted(current['servers'])
+        before, after = previous['servers'], current['servers']
+
+        def comparable(server):
+            values = {key: value for key, value in server.items() if key != 'uptime'}
+            for key, quantum in VOLATILE_QUANTA.items():
+                if isinstance(values.get(key), (int, float)):
+                    values[key] = round(values[key] / quantum)
+            return values
+
+        def rebooted(server, old):
+            return (server.get('uptime') or 0) < (old.get('uptime') or 0)
+
+        removed = [name for name in before if name not in after]
+        changed = [name for name, server in after.items()
+                   if name not in before or comparable(server) != comparable(before[name])
+                   or rebooted(server, before[name])]
+        return changed + removed
+
+    def _changed_since(self, since: Optional[int], generation: int) -> Optional[List[str]]:
+        """since 다음 세대부터 generation까지의 변경 서버 이름 (로그가 끊겨 있으면 None)"""
+        if since is None or since < 0 or since > generation:
+            return None
+        entries = list(self._changes)
+        if redis_utils.is_available():
+            try:
+                entries = [redis_utils.codec.decode(raw) for raw in redis_utils.binary_client.lrange(CHANGES_KEY, 0, -1)]
+            except Exception as e:
+                logger.warning(f"⚠️ 인벤토리 변경 로그 조회 실패, 메모리 사본 사용: {e}")
+
+        names = {}
+        covered = set()
+        for entry in entries:
+            if since < entry['generation'] <= generation:
+                covered.add(entry['generation'])
+                names.update(dict.fromkeys(entry['names']))
+        if len(covered) != generation - since:
+            return None
+        return list(names)
+
+    def _touch(self, snapshot: Dict[str, Any], ttl: int):
+        """변경 없는 빌드: 같은 세대로 스냅샷 본문을 덮어쓰고 변경 로그 만료 연장, 확인 시각 게시"""
+        checked_at = snapshot['built_at']
+        self._checked_at = checked_at
+        with self._lock:
+            if self._local is None or self._local['generation'] <= snapshot['generation']:
+                self._local = snapshot
+        if not redis_utils.is_available():
+            return
+        try:
+            pipe = redis_utils.binary_client.pipeline(transaction=False)
+            pipe.set(CHECKED_AT_KEY, checked_at, ex=ttl)
+            pipe.set(SNAPSHOT_KEY, redis_utils.codec.encode(snapshot), ex=ttl)
+            pipe.expire(CHANGES_KEY, ttl)
+            pipe.execute()
+            redis_utils.publish_invalidation(keys=[CHECKED_AT_KEY])
+        except Exception as e:
+            logger.warning(f"⚠️ 인벤토리 확인 시각 저장 실패: {e}")
+
+    def _age(self, snapshot: Dict[str, Any]) -> float:
+        """마지막 빌드(변경 없음 확인 포함) 이후 경과 시간"""
+        checked_at = self._checked_at
+        if redis_utils.is_available():
+            use_local = redis_utils.local_ready()
+            cached = redis_utils.local.get(CHECKED_AT_KEY) if use_local else None
+            if isinstance(cached, float):
+                checked_at = max(checked_at, cached)
+            else:
+                try:
+                    raw = redis_utils.client.get(CHECKED_AT_KEY)
+                    value = float(raw) if raw is not None else 0.0
+                    checked_at = max(checked_at, value)
+                    if use_local:
+                        redis_utils.local.set(CHECKED_AT_KEY, value, LOCAL_GENERATION_TTL, size=16)
+                except Exception:
+                    pass
+        return time.time() - max(snapshot['built_at'], checked_at)
+
+    @staticmethod
+    def _stale_after() -> float:
+        return current_app.config.get('INVENTORY_SNAPSHOT_INTERVAL', 30) * 3
+
+    def _acquire_build_lock(self, wait: float = 0) -> Optional[str]:
+        """빌드 락을 잡고 소유 토큰 반환 (wait초 동안 재시도, 실패 시 None)
+
+        Redis를 사용할 수 없으면 프로세스 락을 잡고 LOCAL_LOCK_TOKEN을 반환한다.
+        """
+        deadline = time.time() + wait
+        while redis_utils.is_available():
+            try:
+                token = redis_utils.acquire_lock(BUILD_LOCK_NAME, BUILD_LOCK_TTL)
+                if token is not None:
+                    return token
+            except Exception as e:
+                logger.warning(f"⚠️ 인벤토리 빌드 락 획득 실패, 프로세스 락 사용: {e}")
+                break
+            if time.time() >= deadline:
+                return None
+            time.sleep(0.2)
+        if self._build_lock.acquire(timeout=max(0.0, deadline - time.time())):
+            return LOCAL_LOCK_TOKEN
+        return None
+
+    def _release_build_lock(self, token: str):
+        """자신이 잡은 락만 해제 (TTL 만료 후 다른 프로세스가 잡은 락은 지우지 않음)"""
+        if token == LOCAL_LOCK_TOKEN:
+            self._build_lock.release()
+        else:
+            redis_utils.release_lock(BUILD_LOCK_NAME, token)
+
+
+def request_inventory_refresh(server_names: List[str] = None, reason: str = 'mutation', tags: List[str] = None):
+    """스냅샷 갱신을 Celery로 요청 (브로커를 사용할 수 없으면 현재 프로세스에서 갱신)
+
+    서버별 캐시 키는 없고 서버 행은 스냅샷 갱신으로 교체되므로, 캐시는 지정한 태그에 연결된 키만 무효화한다.
+    (capacity: 클러스터 용량/노드 상태, firewall: 방화벽 그룹 목록, storage/backups: 스토리지/백업 조회)
+    """
+    if tags:
+        redis_utils.invalidate_tags(*tags)
+    try:
+        from app.tasks.inventory_tasks import refresh_inventory_snapshot
+        refresh_inventory_snapshot.delay(server_names=server_names, reason=reason)
+    except Exception as e:
+        logger.warning(f"⚠️ 인벤토리 갱신 요청 실패, 직접 갱신: {e}")
+        try:
+            if server_names:
+                inventory_service.refresh_servers(server_names, reason=reason)
+            else:
+                inventory_service.refresh(reason=reason)
+        except Exception as refresh_error:
+            logger.error(f"❌ 인벤토리 갱신 실패: {refresh_error}")
+
+
+# 전역 인스턴스
+inventory_service = InventorySnapshotService()
@@ -0,0 +1,111 @@
+"""
+Proxmox API 병렬 조회 엔진
+
+VM별 config/status 조회처럼 같은 형태의 GET 요청 다수를 스레드 풀로 병렬 실행한다.
+노드별 동시 요청 수를 제한하고, 일부 요청이 실패해도 나머지 결과는 그대로 반환한다.
+ProxmoxService는 요청마다 만들어지므로 노드별 제한은 프로세스 전역으로 (엔드포인트, 노드)마다 공유한다.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# (엔드포인트, 노드)별 전역 동시 요청 제한 (제한 값은 최초 생성 시 기준)
+_node_semaphores: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+_node_semaphores_lock = threading.Lock()
+
+
+def get_node_semaphore(endpoint: str, node: str, limit: int) -> threading.BoundedSemaphore:
+    """엔드포인트/노드별 공유 세마포어 반환 (동시에 실행 중인 모든 조회가 같은 제한을 나눠 씀)"""
+    with _node_semaphores_lock:
+        semaphore = _node_semaphores.get((endpoint, node))
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, limit))
+            _node_semaphores[(endpoint, node)] = semaphore
+        return semaphore
+
+
+class ProxmoxFetcher:
+    """노드별 동시 요청 수 제한이 있는 병렬 GET 실행기"""
+
+    def __init__(self, session, endpoint: str = '', max_workers: int = 16, per_node_limit: int = 4,
+                 timeout: int = 5):
+        self.session = session
+        self.endpoint = endpoint
+        self.max_workers = max(1, max_workers)
+        self.per_node_limit = max(1, per_node_limit)
+        self.timeout = timeout
+
+    def _node_semaphore(self, node: str) -> threading.BoundedSemaphore:
+        return get_node_semaphore(self.endpoint, node, self.per_node_limit)
+
+    def _fetch_one(self, call: Dict[str, Any], headers: Dict[str, str]) -> Dict[str, Any]:
+        node = call.get('node') or ''
+        result = {
+            'key': call['key'],
+            'node': node,
+            'url': call['url'],
+            'success': False,
+            'status_code': None,
+            'data': None,
+            'error': None,
+            'elapsed_ms': 0.0
+        }
+        with self._node_semaphore(node):
+            started = time.perf_counter()
+            try:
+                response = self.session.get(call['url'], headers=headers, params=call.get('params'),
+                                            timeout=call.get('timeout', self.timeout))
+                result['status_code'] = response.status_code
+                if response.status_code == 200:
+                    result['data'] = response.json().get('data')
+                    result['success'] = True
+                else:
+                    result['error'] = f'HTTP {response.status_code}'
+            except Exception as e:
+                result['error'] = str(e)
+            finally:
+                result['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
+
+    def fetch_many(self, calls: List[Dict[str, Any]], headers: Dict[str, str]) -> Dict[Any, Dict[str, Any]]:
+        """여러 GET 요청을 병렬 실행
+
+        calls: [{'key': ..., 'node': ..., 'url': ..., 'params': {...}}, ...]
+        반환: {key: {'success', 'status_code', 'data', 'error', 'elapsed_ms', ...}}
+        """
+        if not calls:
+            return {}
+
+        started = time.perf_counter()
+        workers = min(self.max_workers, len(calls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='proxmox-fetch') as executor:
+            results = list(executor.map(lambda call: self._fetch_one(call, headers), calls))
+
+        failed = [r for r in results if not r['success']]
+        total_ms = round((time.perf_counter() - started) * 1000, 1)
+        slowest = max(results, key=lambda r: r['elapsed_ms'])
+        logger.info(f"⚡ Proxmox 병렬 조회: {len(results)}건 ({len(failed)}건 실패), "
+                    f"총 {total_ms}ms, 최장 {slowest['elapsed_ms']}ms ({slowest['url']})")
+        for r in failed:
+            logger.warning(f"⚠️ Proxmox 조회 실패 [{r['node']}] {r['url']}: {r['error']} ({r['elapsed_ms']}ms)")
+
+        return {r['key']: r for r in results}
+
+    @staticmethod
+    def latency_summary(results: Dict[Any, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """호출별 지연 시간 요약 (응답 메타데이터용)"""
+        if not results:
+            return None
+        elapsed = sorted(r['elapsed_ms'] for r in results.values())
+        return {
+            'calls': len(elapsed),
+            'failed': sum(1 for r in results.values() if not r['success']),
+            'max_ms': elapsed[-1],
+            'p50_ms': elapsed[len(elapsed) // 2],
+            'per_call': {str(k): r['elapsed_ms'] for k, r in results.items()}
+        }
@@ -0,0 +1,298 @@
+"""
+Proxmox API HTTP 세션
+
+- 티켓 만료 등으로 401 응답을 받으면 티켓을 폐기하고 재인증 후 한 번 재시도한다.
+- 동일한 GET 요청이 동시에 여러 번 들어오면 하나의 upstream 요청 결과를 공유한다 (single-flight).
+- 노드별 서킷 브레이커로 장애 노드에 대한 요청은 즉시 실패시키고, GET 요청만 지터 백오프로 재시도한다.
+"""
+import copy
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from typing import Dict, Optional, Any
+from urllib.parse import urlencode, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.utils.redis_utils import redis_utils
+from app.utils.circuit_breaker import CircuitOpenError, get_breaker, backoff_delay
+
+logger = logging.getLogger(__name__)
+
+# 재시도/서킷 실패 대상 응답 코드 (게이트웨이/일시적 과부하,
+# 595/596: Proxmox가 요청을 다른 노드로 프록시할 때 연결 실패/시간 초과)
+RETRYABLE_STATUS = (502, 503, 504, 595, 596)
+
+_NODE_PATH = re.compile(r'/api2/json/nodes/([^/?]+)')
+
+
+def breaker_name_for(url: str) -> str:
+    """요청 URL에 해당하는 서킷 이름 (host/노드, 노드가 없으면 host/cluster)"""
+    parsed = urlparse(url)
+    match = _NODE_PATH.search(parsed.path)
+    return f"{parsed.netloc}/{match.group(1) if match else 'cluster'}"
+
+
+def auth_breaker_name(url: str) -> str:
+    """티켓 로그인(/access/ticket) 전용 서킷 이름 (host/auth, 클러스터 조회 서킷과 분리)"""
+    return f"{urlparse(url).netloc}/auth"
+
+
+class _Flight:
+    """진행 중인 upstream 요청 1건"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """동일 GET 요청 병합기
+
+    프로세스 내에서는 같은 키의 요청이 진행 중이면 그 결과를 기다려 공유한다.
+    redis_enabled가 켜져 있으면 Redis 락으로 프로세스 간에도 한 요청만 upstream으로 보내고,
+    락을 잡은 요청이 진행 중일 때 도착한 나머지 프로세스만 그 요청의 응답을 받는다.
+    응답은 요청마다 다른 키(락 값인 flight id)로 게시하므로, 요청이 끝난 뒤 도착한 조회는
+    이전 응답을 재사용하지 않고 새로 요청한다 (변경 작업 직후 이전 데이터를 받지 않도록).
+    """
+
+    def __init__(self, redis_enabled: bool = False, redis_wait: float = 5.0, result_ttl_ms: int = 1000):
+        self.redis_enabled = redis_enabled
+        self.redis_wait = redis_wait
+        self.result_ttl_ms = result_ttl_ms
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.stats = {'upstream': 0, 'shared': 0, 'shared_redis': 0}
+
+    @staticmethod
+    def make_key(url: str, params: Any = None) -> str:
+        if params:
+            items = sorted(params.items()) if isinstance(params, dict) else params
+            url = f"{url}?{urlencode(items)}"
+        return url
+
+    def do(self, key: str, fn) -> requests.Response:
+        """key에 대해 fn()을 한 번만 실행하고 결과를 공유"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.waiters += 1
+
+        if not leader:
+            flight.done.wait()
+            self._count('shared')
+            if flight.error is not None:
+                raise flight.error
+            return copy.copy(flight.response)
+
+        try:
+            flight.response = self._do_upstream(key, fn)
+            # 응답 본문을 미리 읽어 두어 여러 스레드에서 안전하게 공유
+            flight.response.content
+            return flight.response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    # ------------------------------------------------------------------
+    # 프로세스 간 병합 (Redis)
+    # ------------------------------------------------------------------
+    def _do_upstream(self, key: str, fn) -> requests.Response:
+        if not (self.redis_enabled and redis_utils.is_available()):
+            self._count('upstream')
+            return fn()
+
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        lock_name = f"proxmox:singleflight:{digest}"
+        lock_key = f"{lock_name}:lock"
+        client = redis_utils.client
+        token = None
+        try:
+            token = redis_utils.acquire_lock(lock_name, self.redis_wait)
+            if token is None:
+                # 진행 중인 요청(락 값 = flight id)의 응답만 기다림
+                flight_id = client.get(lock_key)
+                deadline = time.time() + self.redis_wait
+                while flight_id and time.time() < deadline:
+                    time.sleep(0.05)
+                    cached = client.get(f"{lock_name}:result:{flight_id}")
+                    if cached:
+                        self._count('shared_redis')
+                        return self._decode(cached)
+                    if client.get(lock_key) != flight_id:
+                        # 요청이 끝났는데 응답이 없으면(실패/200 아님) 마지막으로 한 번 더 확인 후 직접 요청
+                        cached = client.get(f"{lock_name}:result:{flight_id}")
+                        if cached:
+                            self._count('shared_redis')
+                            return self._decode(cached)
+                        break
+        except Exception as e:
+            logger.warning(f"⚠️ Redis single-flight 사용 불가, 직접 요청: {e}")
+            self._count('upstream')
+            return fn()
+
+        self._count('upstream')
+        try:
+            response = fn()
+            if token is not None and response.status_code == 200:
+                # 대기 중인 요청이 가져갈 시간만 보관 (새로 도착한 요청은 이 키를 모름)
+                try:
+                    client.set(f"{lock_name}:result:{token}", self._encode(response), px=self.result_ttl_ms)
+                except Exception as e:
+                    logger.warning(f"⚠️ Redis single-flight 응답 게시 실패: {e}")
+            return response
+        finally:
+            if token is not None:
+                redis_utils.release_lock(lock_name, token)
+
+    @staticmethod
+    def _encode(response: requests.Response) -> str:
+        return json.dumps({
+            'status_code': response.status_code,
+            'url': response.url,
+            'headers': {'Content-Type': response.headers.get('Content-Type', 'application/json')},
+            'body': response.content.decode('utf-8', errors='replace')
+        }, ensure_ascii=False)
+
+    @staticmethod
+    def _decode(raw: str) -> requests.Response:
+        payload = json.loads(raw)
+        response = requests.Response()
+        response.status_code = payload['status_code']
+        response.url = payload.get('url')
+        response.headers.update(payload.get('headers', {}))
+        response.encoding = 'utf-8'
+        response._content = payload['body'].encode('utf-8')
+        return response
+
+
+# 프로세스 전역 병합기 (ProxmoxService 인스턴스마다 세션이 새로 만들어지므로 모듈 수준에서 공유)
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight(redis_enabled: bool = False, redis_wait: float = 5.0) -> SingleFlight:
+    global _single_flight
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight(redis_enabled=redis_enabled, redis_wait=redis_wait)
+        else:
+            _single_flight.redis_enabled = redis_enabled
+            _single_flight.redis_wait = redis_wait
+        return _single_flight
+
+
+class ProxmoxSession(requests.Session):
+    """Proxmox API 전용 requests 세션 (401 자동 재인증, GET 요청 병합)"""
+
+    def __init__(self, ticket_manager=None, pool_maxsize: int = 10, single_flight: SingleFlight = None,
+                 max_retries: int = 2, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        super().__init__()
+        self.verify = False
+        self.ticket_manager = ticket_manager
+        self.single_flight = single_flight
+        self.max_retries = max_retries
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        # 병렬 조회 시 커넥션 재사용을 위해 풀 크기를 동시 요청 수에 맞춤
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, pool_maxsize))
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        if (self.single_flight is not None and method.upper() == 'GET'
+                and not args and not kwargs.get('stream')):
+            key = SingleFlight.make_key(url, kwargs.get('params'))
+            return self.single_flight.do(key, lambda: self._request_guarded(method, url, **kwargs))
+        return self._request_guarded(method, url, *args, **kwargs)
+
+    def _request_guarded(self, method, url, *args, **kwargs):
+        """서킷 브레이커 확인 후 요청 (GET만 재시도)"""
+        breaker = get_breaker(breaker_name_for(url), self.failure_threshold, self.recovery_timeout)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Proxmox 서킷 열림 ({breaker.name}), 요청 차단: {method} {url}")
+
+        # allow() 이후에는 어떤 경로로 끝나든 결과를 기록해야 half-open 시험 요청 표시가 풀린다
+        attempts = self.max_retries + 1 if method.upper() == 'GET' else 1
+        try:
+            for attempt in range(attempts):
+                try:
+                    response = self._request_with_reauth(method, url, *args, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if attempt + 1 < attempts:
+                        delay = backoff_delay(attempt)
+                        logger.info(f"🔁 Proxmox GET 재시도 {attempt + 1}/{self.max_retries} ({delay:.2f}s 후): {url} - {e}")
+                        time.sleep(delay)
+                        continue
+                    raise
+
+                if response.status_code in RETRYABLE_STATUS:
+                    if attempt + 1 < attempts:
+                        delay = backoff_delay(attempt)
+                        logger.info(f"🔁 Proxmox GET 재시도 {attempt + 1}/{self.max_retries} ({delay:.2f}s 후): {url} - HTTP {response.status_code}")
+                        time.sleep(delay)
+                        continue
+                    breaker.record_failure(f'HTTP {response.status_code}')
+                    return response
+
+                breaker.record_success()
+                return response
+        except BaseException as e:
+            # 연결 오류뿐 아니라 ChunkedEncodingError, 재인증 중 예외 등도 실패로 기록
+            breaker.record_failure(str(e) or type(e).__name__)
+            raise
+
+    def _request_with_reauth(self, method, url, *args, **kwargs):
+        response = super().request(method, url, *args, **kwargs)
+
+        if response.status_code != 401 or self.ticket_manager is None:
+            return response
+
+        headers = kwargs.get('headers') or {}
+        stale_ticket = self._extract_ticket(headers)
+        if stale_ticket is None:
+            return response
+
+        logger.info(f"🔐 Proxmox 401 응답, 재인증 후 재시도: {method} {url}")
+        self.ticket_manager.invalidate(stale_ticket)
+        new_headers, error = self.ticket_manager.get_headers()
+        if error or not new_headers:
+            logger.warning(f"⚠️ Proxmox 재인증 실패: {error}")
+            return response
+
+        retry_headers = dict(headers)
+        retry_headers.update(new_headers)
+        kwargs['headers'] = retry_headers
+        return super().request(method, url, *args, **kwargs)
+
+    @staticmethod
+    def _extract_ticket(headers) -> Optional[str]:
+        """요청 헤더의 Cookie에서 PVEAuthCookie 값 추출"""
+        cookie = headers.get('Cookie') if hasattr(headers, 'get') else None
+        if not cookie:
+            return None
+        for part in cookie.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'PVEAuthCookie':
+                return value
+        return None
@@ -14,6 +14,12 @@ from app.models.server import Server
 from app.models.notification import Notification
 from app.utils.os_classifier import classify_os_type
 from app.utils.redis_utils import redis_utils
+from app.services.proxmox_ticket import get_ticket_manager
+from app.services.proxmox_http import ProxmoxSession, get_single_flight
+from app.services.proxmox_fetch import ProxmoxFetcher
+from app.services.vm_index import vm_index
+from app.services.tfvars_repository import get_tfvars_repository
+from app.services.proxmox_tasks import get_task_tracker
 from app import db
 
 logger = logging.getLogger(__name__)
@@ -21,6 +27,18 @@ logger = logging.getLogger(__name__)
 # terraform.tfvars.json 파일 경로
 TFVARS_PATH = 'terraform/terraform.tfvars.json'
 
+# 노드 상태 / 용량 집계 캐시 키
+NODE_STATUS_CACHE_KEY = 'proxmox:node_status'
+CAPACITY_CACHE_KEY = 'proxmox:capacity'
+
+# stale-while-revalidate 캐시 키
+STORAGE_INFO_CACHE_KEY = 'proxmox:storage_info'
+FIREWALL_GROUPS_CACHE_KEY = 'proxmox:firewall_groups'
+NODE_BACKUPS_CACHE_PREFIX = 'proxmox:node_backups:'
+
+# 마지막 정상 조회 결과 (Redis를 사용할 수 없을 때의 대체 저장소)
+_last_known: Dict[str, Dict[str, Any]] = {}
+
 class ProxmoxService:
     """Proxmox API 서비스"""
     
@@ -30,9 +48,39 @@ class ProxmoxService:
         self.password = current_app.config['PROXMOX_PASSWORD']
         self.node = current_app.config['PROXMOX_NODE']
         
-        # requests session 초기화
-        self.session = requests.Session()
-        self.session.verify = False  # SSL 인증서 검증 비활성화
+        # 프로세스/워커 간 공유되는 인증 티켓 관리자
+        self.ticket_manager = get_ticket_manager(
+            self.endpoint, self.username, self.password,
+            renew_after=current_app.config.get('PROXMOX_TICKET_RENEW_AFTER', 5400),
+            expire_margin=current_app.config.get('PROXMOX_TICKET_EXPIRE_MARGIN', 300)
+        )
+        
+        # requests session 초기화 (SSL 인증서 검증 비활성화, 401 시 재인증)
+        self.session = ProxmoxSession(
+            self.ticket_manager,
+            pool_maxsize=current_app.config.get('PROXMOX_FETCH_MAX_WORKERS', 16),
+            single_flight=get_single_flight(
+                redis_enabled=current_app.config.get('PROXMOX_SINGLEFLIGHT_REDIS', False),
+                redis_wait=current_app.config.get('PROXMOX_SINGLEFLIGHT_WAIT', 5.0)
+            ) if current_app.config.get('PROXMOX_SINGLEFLIGHT_ENABLED', True) else None,
+            max_retries=current_app.config.get('PROXMOX_GET_MAX_RETRIES', 2),
+            failure_threshold=current_app.config.get('PROXMOX_CIRCUIT_FAILURE_THRESHOLD', 5),
+            recovery_timeout=current_app.config.get('PROXMOX_CIRCUIT_RECOVERY_TIMEOUT', 30)
+        )
+        
+        # Proxmox 비동기 작업(UPID) 완료 추적기 (프로세스 공유)
+        self.task_tracker = get_task_tracker(
+            self.endpoint, self.ticket_manager,
+            lambda: ProxmoxSession(self.ticket_manager)
+        )
+        
+        # VM별 config/status 병렬 조회 엔진 (노드별 동시 요청 수 제한은 프로세스 공유)
+        self.fetcher = ProxmoxFetcher(
+            self.session,
+            endpoint=self.endpoint,
+            max_workers=current_app.config.get('PROXMOX_FETCH_MAX_WORKERS', 16),
+            per_node_limit=current_app.config.get('PROXMOX_FETCH_PER_NODE', 4)
+        )
     
     def get_server_info(self, server_name: str) -> Optional[Dict[str, Any]]:
         """서버 정보 조회"""
@@ -44,7 +92,10 @@ class ProxmoxService:
             
             # Proxmox API로 VM 상태 조회
             url = f"{self.endpoint}/api2/json/nodes/{current_app.config['PROXMOX_NODE']}/qemu/{server.vmid}/status/current"
-            response = requests.get(url, auth=(self.username, self.password), verify=False)
+            headers, error = self.get_proxmox_auth()
+            if error:
+                return None
+            response = self.session.get(url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -85,72 +136,102 @@ class ProxmoxService:
             raise e
 
     def get_datastores(self) -> List[Dict[str, Any]]:
-        """사용 가능한 datastore 목록 조회"""
+        """사용 가능한 datastore 목록 조회 (조회 범위는 get_datastore_inventory 참고)"""
+        inventory = self.get_datastore_inventory()
+        return inventory['datastores'] if inventory else []
+    
+    def get_datastore_inventory(self) -> Optional[Dict[str, Any]]:
+        """datastore 목록과 조회 범위 반환
+
+        /nodes/{node}/storage 를 노드별 1회씩 병렬 호출하여 클러스터 전체 datastore 목록으로 병합한다.
+        공유 스토리지는 한 번만 집계하고, 로컬 스토리지는 노드별 용량을 합산하며 노드별 값은 'nodes'에 담는다.
+        반환: {'datastores': [...], 'fetched_nodes': [...], 'missing_nodes': [...]} (조회 실패 시 None)
+        missing_nodes는 오프라인이거나 스토리지 조회에 실패한 노드로, 그 노드의 datastore는 목록에 없을 수 있다.
+        """
         try:
-            # Proxmox API로 datastore 목록 가져오기
-            url = f"{self.endpoint}/api2/json/storage"
-            print(f"🔧 Proxmox API 요청 URL: {url}")
-            print(f"🔧 Proxmox 엔드포인트: {self.endpoint}")
-            response = self._make_request('GET', url)
+            headers, error = self.get_proxmox_auth()
+            if error:
+                logger.error(f"Proxmox 인증 실패: {error}")
+                return None
             
-            if response.status_code == 200:
-                datastores = response.json()['data']
-                logger.info(f"🔧 Proxmox에서 {len(datastores)}개 datastore 발견")
+            nodes_url = f"{self.endpoint}/api2/json/nodes"
+            nodes_response = self.session.get(nodes_url, headers=headers, timeout=5)
+            if nodes_response.status_code != 200:
+                logger.error(f"노드 목록 조회 실패: {nodes_response.status_code}")
+                return None
+            
+            nodes = nodes_response.json().get('data', [])
+            node_names = [n['node'] for n in nodes if n.get('status', 'online') == 'online']
+            missing_nodes = [n['node'] for n in nodes if n.get('status', 'online') != 'online']
+            fetched_nodes = []
+            storage_results = self.fetcher.fetch_many([
+                {
+                    'key': node,
+                    'node': node,
+                    'url': f"{self.endpoint}/api2/json/nodes/{node}/storage"
+                }
+                for node in node_names
+            ], headers)
+            
+            merged: Dict[str, Dict[str, Any]] = {}
+            for node in node_names:
+                result = storage_results.get(node)
+                if not result or not result['success']:
+                    logger.warning(f"노드 {node} 스토리지 조회 실패: {(result or {}).get('error')}")
+                    missing_nodes.append(node)
+                    continue
+                fetched_nodes.append(node)
                 
-                # 각 datastore의 상세 정보 가져오기
-                detailed_datastores = []
-                for datastore in datastores:
-                    try:
-                        # datastore 상세 정보 조회
-                        detail_url = f"{self.endpoint}/api2/json/storage/{datastore['storage']}"
-                        detail_response = self._make_request('GET', detail_url)
-                        
-                        if detail_response.status_code == 200:
-                            detail_data = detail_response.json()['data']
-                            detailed_datastores.append({
-                                'id': datastore['storage'],
-                                'type': detail_data.get('type', 'unknown'),
-                                'size': detail_data.get('size', 0),
-                                'used': detail_data.get('used', 0),
-                                'available': detail_data.get('available', 0),
-                                'content': detail_data.get('content', ''),
-                                'enabled': detail_data.get('enabled', True)
-                            })
-                            logger.info(f"🔧 Datastore {datastore['storage']} 상세 정보 조회 성공")
-                        else:
-                            logger.warning(f"Datastore {datastore['storage']} 상세 정보 조회 실패: {detail_response.status_code}")
-                            # 기본 정보만 사용
-                            detailed_datastores.append({
-                                'id': datastore['storage'],
-                                'type': 'unknown',
-                                'size': 0,
-                                'used': 0,
-                                'available': 0,
-                                'content': '',
-                                'enabled': True
-                            })
-                    except Exception as e:
-                        logger.warning(f"Datastore {datastore['storage']} 상세 정보 조회 실패: {e}")
-                        # 기본 정보만 사용
-                        detailed_datastores.append({
-                            'id': datastore['storage'],
-                            'type': 'unknown',
+                for storage in result['data'] or []:
+                    storage_id = storage.get('storage')
+                    if not storage_id:
+                        continue
+                    size = int(storage.get('total', 0) or 0)
+                    used = int(storage.get('used', 0) or 0)
+                    available = int(storage.get('avail', 0) or 0)
+                    shared = bool(storage.get('shared', 0))
+                    
+                    datastore = merged.get(storage_id)
+                    if datastore is None:
+                        datastore = {
+                            'id': storage_id,
+                            'type': storage.get('type', 'unknown'),
                             'size': 0,
                             'used': 0,
                             'available': 0,
-                            'content': '',
-                            'enabled': True
-                        })
-                
-                logger.info(f"🔧 총 {len(detailed_datastores)}개 datastore 정보 수집 완료")
-                return detailed_datastores
-            else:
-                logger.error(f"Datastore 목록 조회 실패: {response.status_code}")
-                return []
+                            'content': storage.get('content', ''),
+                            'enabled': bool(storage.get('enabled', 1)),
+                            'shared': shared,
+                            'nodes': {}
+                        }
+                        merged[storage_id] = datastore
+                    
+                    datastore['nodes'][node] = {
+                        'size': size,
+                        'used': used,
+                        'available': available,
+                        'active': bool(storage.get('active', 0))
+                    }
+                    # 공유 스토리지는 어느 노드에서 보아도 같은 용량이므로 한 번만 집계
+                    if shared and datastore['size']:
+                        continue
+                    datastore['size'] += size
+                    datastore['used'] += used
+                    datastore['available'] += available
+            
+            detailed_datastores = list(merged.values())
+            logger.info(f"🔧 {len(fetched_nodes)}개 노드에서 총 {len(detailed_datastores)}개 datastore 정보 수집 완료")
+            if missing_nodes:
+                logger.warning(f"⚠️ datastore 조회에서 빠진 노드: {', '.join(missing_nodes)}")
+            return {
+                'datastores': detailed_datastores,
+                'fetched_nodes': fetched_nodes,
+                'missing_nodes': missing_nodes
+            }
                 
         except Exception as e:
             logger.error(f"Datastore 목록 조회 실패: {str(e)}")
-            return []        
+            return None
     
     def _get_db_connection(self):
         """데이터베이스 연결 (PostgreSQL)"""
@@ -158,63 +239,34 @@ class ProxmoxService:
         return db.session
     
     def get_proxmox_auth(self) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
-        """Proxmox API 인증 정보 반환 (공통 함수)"""
+        """Proxmox API 인증 정보 반환 (공통 함수)
+
+        티켓은 프로세스 메모리와 Redis에 캐시되며, 만료가 가까워지면 백그라운드에서 갱신된다.
+        """
         try:
-            print(f"🔐 Proxmox 인증 시도: {self.endpoint}")
-            auth_url = f"{self.endpoint}/api2/json/access/ticket"
-            auth_data = {'username': self.username, 'password': self.password}
-            
-            auth_response = self.session.post(auth_url, data=auth_data, timeout=3)
-            print(f"📡 인증 응답 상태: {auth_response.status_code}")
-            
-            if auth_response.status_code != 200:
-                return None, 'Proxmox 인증 실패'
-            
-            auth_result = auth_response.json()
-            print(f"🔑 인증 결과: {auth_result}")
-            
-            if 'data' not in auth_result:
-                return None, '인증 토큰을 가져올 수 없습니다'
-            
-            ticket = auth_result['data']['ticket']
-            csrf_token = auth_result['data']['CSRFPreventionToken']
-            
-            headers = {
-                'Cookie': f'PVEAuthCookie={ticket}',
-                'CSRFPreventionToken': csrf_token
-            }
-            
-            print(f"✅ 인증 성공: {headers}")
-            return headers, None
+            return self.ticket_manager.get_headers()
         except Exception as e:
             print(f"❌ Proxmox 인증 실패: {e}")
             return None, f'인증 중 예외 발생: {str(e)}'
     
     def get_proxmox_vms(self, headers: Dict[str, str]) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
-        """Proxmox에서 모든 VM 목록 조회 (공통 함수)"""
+        """Proxmox에서 모든 VM 목록 조회 (공통 함수)
+
+        /cluster/resources?type=vm 한 번의 호출로 전체 노드의 VM을 조회하고,
+        실패 시 노드별 /nodes/{node}/qemu 조회로 대체한다.
+        """
         try:
             print(f"🔍 VM 목록 조회 시작")
             
-            # 모든 노드에서 VM 검색
-            nodes_url = f"{self.endpoint}/api2/json/nodes"
-            nodes_response = self.session.get(nodes_url, headers=headers, timeout=3)
+            all_vms = self._get_cluster_vms(headers)
+            if all_vms is None:
+                print(f"⚠️ 클러스터 리소스 조회 실패, 노드별 조회로 대체")
+                all_vms, error = self._get_node_vms(headers)
+                if error:
+                    return None, error
             
-            if nodes_response.status_code != 200:
-                return None, '노드 정보를 가져올 수 없습니다'
-            
-            nodes = nodes_response.json().get('data', [])
-            all_vms = []
-            
-            for node in nodes:
-                node_name = node['node']
-                vms_url = f"{self.endpoint}/api2/json/nodes/{node_name}/qemu"
-                vms_response = self.session.get(vms_url, headers=headers, timeout=3)
-                
-                if vms_response.status_code == 200:
-                    vms = vms_response.json().get('data', [])
-                    for vm in vms:
-                        vm['node'] = node_name
-                    all_vms.extend(vms)
+            # 이름/VMID → 노드 인덱스 갱신
+            vm_index.record_many(all_vms)
             
             print(f"📋 총 VM 수: {len(all_vms)}")
             return all_vms, None
@@ -222,24 +274,94 @@ class ProxmoxService:
             print(f"❌ VM 목록 조회 실패: {e}")
             return None, f'VM 목록 조회 중 예외 발생: {str(e)}'
     
+    def _get_cluster_vms(self, headers: Dict[str, str]) -> Optional[List[Dict[str, Any]]]:
+        """/cluster/resources?type=vm 으로 전체 QEMU VM 조회 (실패 시 None)"""
+        try:
+            url = f"{self.endpoint}/api2/json/cluster/resources"
+            response = self.session.get(url, headers=headers, params={'type': 'vm'}, timeout=5)
+            if response.status_code != 200:
+                return None
+            
+            vms = []
+            for resource in response.json().get('data', []):
+                # LXC 컨테이너 제외 (기존 /qemu 조회와 동일한 범위)
+                if resource.get('type', 'qemu') != 'qemu':
+                    continue
+                # 노드별 /qemu 응답과 같은 키를 갖도록 정규화
+                if 'cpus' not in resource and 'maxcpu' in resource:
+                    resource['cpus'] = resource['maxcpu']
+                vms.append(resource)
+            return vms
+        except Exception as e:
+            logger.warning(f"클러스터 리소스 조회 실패: {e}")
+            return None
+    
+    def _get_node_vms(self, headers: Dict[str, str]) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """노드별 /nodes/{node}/qemu 순회 조회 (대체 경로)"""
+        nodes_url = f"{self.endpoint}/api2/json/nodes"
+        nodes_response = self.session.get(nodes_url, headers=headers, timeout=3)
+        
+        if nodes_response.status_code != 200:
+            return None, '노드 정보를 가져올 수 없습니다'
+        
+        nodes = nodes_response.json().get('data', [])
+        all_vms = []
+        
+        for node in nodes:
+            node_name = node['node']
+            vms_url = f"{self.endpoint}/api2/json/nodes/{node_name}/qemu"
+            vms_response = self.session.get(vms_url, headers=headers, timeout=3)
+            
+            if vms_response.status_code == 200:
+                vms = vms_response.json().get('data', [])
+                for vm in vms:
+                    vm['node'] = node_name
+                all_vms.extend(vms)
+        
+        return all_vms, None
+    
     def read_servers_from_tfvars(self):
-        """terraform.tfvars.json에서 서버 정보 읽기"""
+        """terraform.tfvars.json에서 서버 정보 읽기 (파일이 바뀌었을 때만 다시 파싱, 읽기 전용)"""
         try:
-            with open(TFVARS_PATH, 'r', encoding='utf-8') as f:
-                obj = json.load(f)
-                return obj.get('servers', {})
-        except FileNotFoundError:
-            print(f"⚠️ terraform.tfvars.json 파일이 존재하지 않습니다: {TFVARS_PATH}")
-            return {}
-        except json.JSONDecodeError as e:
-            print(f"❌ terraform.tfvars.json 파일 파싱 오류: {e}")
-            return {}
+            return get_tfvars_repository(TFVARS_PATH).servers()
         except Exception as e:
             print(f"❌ terraform.tfvars.json 파일 읽기 오류: {e}")
             return {}
     
     def get_all_vms(self) -> Dict[str, Any]:
-        """모든 VM 정보 조회 (API 호환)"""
+        """모든 VM 정보 조회 (API 호환)
+
+        Proxmox 장애(서킷 열림, 타임아웃 등)로 조회에 실패하면 마지막 정상 결과를 stale 표시하여 반환한다.
+        """
+        result = self._fetch_all_vms()
+        if result.get('success'):
+            self._remember_last_known('all_vms', result)
+            return result
+        return self._last_known_or('all_vms', result)
+    
+    def _remember_last_known(self, name: str, result: Dict[str, Any]):
+        """마지막 정상 조회 결과 보관 (장애 시 stale 응답용)"""
+        _last_known[name] = result
+        redis_utils.set_cache(f"proxmox:last_known:{name}", result, expire=86400)
+    
+    def _last_known_or(self, name: str, failure: Dict[str, Any]) -> Dict[str, Any]:
+        """마지막 정상 결과가 있으면 stale 표시하여 반환, 없으면 실패 결과 그대로 반환"""
+        snapshot = redis_utils.get_cache(f"proxmox:last_known:{name}")
+        if not isinstance(snapshot, dict):
+            snapshot = _last_known.get(name)
+        if not snapshot:
+            return failure
+        
+        print(f"⚠️ Proxmox 조회 실패, 마지막 정상 결과 반환 (stale): {failure.get('message')}")
+        stale = dict(snapshot)
+        stale['stale'] = True
+        stale['message'] = failure.get('message')
+        if isinstance(stale.get('data'), dict):
+            stale['data'] = dict(stale['data'], stale=True)
+        return stale
+    
+    def _fetch_all_vms(self) -> Dict[str, Any]:
+        """모든 VM 정보 실시간 조회"""
         try:
             print(f"🔍 get_all_vms 시작")
             
@@ -258,12 +380,11 @@ class ProxmoxService:
                     }
                 }
             
-            # Proxmox 노드 정보 조회 (전체 리소스 확인)
-            node_url = f"{self.endpoint}/api2/json/nodes/{self.node}/status"
-            node_response = self.session.get(node_url, headers=headers, verify=False, timeout=3)
+            # 전체 노드 리소스 조회 (노드별 병렬 조회, 짧은 TTL 캐시)
+            node_statuses = self.get_node_statuses(headers)
             
-            if node_response.status_code != 200:
-                print(f"❌ 노드 정보 조회 실패: {node_response.status_code}")
+            if not node_statuses:
+                print(f"❌ 노드 정보 조회 실패")
                 return {
                     'success': False,
                     'message': '노드 정보를 가져올 수 없습니다',
@@ -275,12 +396,11 @@ class ProxmoxService:
                     }
                 }
             
-            node_data = node_response.json()['data']
-            print(f"📊 노드 데이터: {node_data}")
-            
-            node_cpu_count = node_data.get('cpuinfo', {}).get('cpus', 0)
-            node_memory_total = node_data.get('memory', {}).get('total', 0)
-            node_memory_used = node_data.get('memory', {}).get('used', 0)
+            # 클러스터 전체(온라인 노드) 리소스 합계
+            online_nodes = [n for n in node_statuses.values() if n['status'] == 'online']
+            node_cpu_count = sum(n['cpu_count'] for n in online_nodes)
+            node_memory_total = sum(n['memory_total'] for n in online_nodes)
+            node_memory_used = sum(n['memory_used'] for n in online_nodes)
             
             # Proxmox에서 VM 목록 조회
             vms, error = self.get_proxmox_vms(headers)
@@ -297,19 +417,33 @@ class ProxmoxService:
                     }
                 }
             
+            # 노드별/클러스터 용량 집계 (인벤토리 1회 순회)
+            capacity = self._aggregate_capacity(node_statuses, vms)
+            redis_utils.set_cache(CAPACITY_CACHE_KEY, capacity, expire=self._capacity_cache_ttl(), tags=['capacity'])
+            
             # terraform.tfvars.json에 있는 서버만 필터링
             servers = self.read_servers_from_tfvars()
             print(f"📋 tfvars 서버 수: {len(servers)}")
             
+            # 관리 대상 VM의 설정(디스크 정보)을 병렬 조회
+            managed_vms = [vm for vm in vms if vm['name'] in servers]
+            config_results = self.fetcher.fetch_many([
+                {
+                    'key': vm['vmid'],
+                    'node': vm['node'],
+                    'url': f"{self.endpoint}/api2/json/nodes/{vm['node']}/qemu/{vm['vmid']}/config"
+                }
+                for vm in managed_vms
+            ], headers)
+            vm_index.record_many([
+                {'name': vm['name'], 'vmid': vm['vmid'], 'node': vm['node'],
+                 'digest': (config_results[vm['vmid']]['data'] or {}).get('digest')}
+                for vm in managed_vms if config_results.get(vm['vmid'], {}).get('success')
+            ])
+            
             all_servers = {}
-            vm_total_cpu = 0
-            vm_total_memory = 0
-            vm_used_cpu = 0
-            vm_used_memory = 0
-            running_count = 0
-            stopped_count = 0
             
-            for vm in vms:
+            for vm in managed_vms:
                 if vm['name'] in servers:
                     server_data = servers[vm['name']]
                     print(f"🔍 VM 처리: {vm['name']}")
@@ -348,50 +482,12 @@ class ProxmoxService:
                     memory_usage = 0.0  # 할당된 메모리 크기만 표시
                     disk_usage = 0.0  # 할당된 디스크 크기만 표시
                     
-                    # 디스크 정보 조회
-                    disks = []
-                    total_disk_gb = 0
-                    try:
-                        # VM 설정에서 디스크 정보 가져오기
-                        vm_config_url = f"{self.endpoint}/api2/json/nodes/{vm['node']}/qemu/{vm['vmid']}/config"
-                        vm_config_response = self.session.get(vm_config_url, headers=headers, verify=False, timeout=5)
-                        
-                        if vm_config_response.status_code == 200:
-                            vm_config = vm_config_response.json().get('data', {})
-                            
-                            for key, value in vm_config.items():
-                                if key.startswith('scsi') or key.startswith('sata') or key.startswith('virtio'):
-                                    if key == 'scsihw':
-                                        continue
-                                    
-                                    size_gb = 0
-                                    storage = 'unknown'
-                                    
-                                    # 스토리지 추출
-                                    if ':' in value:
-                                        storage = value.split(':')[0]
-                                    
-                                    # 패턴 1: size= 파라미터 (예: size=10G, size=10737418240)
-                                    if 'size=' in value:
-                                        size_match = value.split('size=')[1].split(',')[0]
-                                        try:
-                                            if size_match.endswith('G'):
-                                                size_gb = int(size_match[:-1])
-                                            else:
-                                                size_bytes = int(size_match)
-                                                size_gb = size_bytes // (1024 * 1024 * 1024)
-                                        except ValueError:
-                                            pass
-                                    
-                                    disk_info = {
-                                        'device': key,
-                                        'size_gb': size_gb,
-                                        'storage': storage
-                                    }
-                                    disks.append(disk_info)
-                                    total_disk_gb += size_gb
-                    except Exception as e:
-                        print(f"⚠️ {vm['name']} 디스크 정보 조회 실패: {e}")
+                    # 디스크 정보 (병렬 조회한 VM 설정에서 추출)
+                    config_result = config_results.get(vm['vmid'])
+                    if config_result and config_result['success']:
+                        disks, total_disk_gb = self._parse_vm_disks(config_result['data'] or {})
+                    else:
+                        disks, total_disk_gb = [], 0
                     
                     status_info = {
                         'name': vm['name'],
@@ -415,49 +511,20 @@ class ProxmoxService:
                         'disks': disks  # 개별 디스크 정보
                     }
                     all_servers[vm['name']] = status_info
-                    
-                    # VM 통계 계산
-                    if vm['status'] == 'running':
-                        running_count += 1
-                        vm_total_memory += vm.get('maxmem', 0)
-                        vm_used_memory += vm.get('mem', 0)  # 현재 사용 중인 메모리
-                        vm_total_cpu += vm_cpu
-                        vm_used_cpu += vm_cpu  # 실행 중인 서버는 CPU를 모두 사용 중
-                    else:
-                        stopped_count += 1
-                        vm_total_memory += vm.get('maxmem', 0)
-                        vm_total_cpu += vm_cpu
-                        # 중지된 서버는 CPU/메모리 사용량 0
             
             # 노드 기준 통계 정보 추가
-            stats = {
-                'total_servers': len(all_servers),
-                'running_servers': running_count,
-                'stopped_servers': stopped_count,
-                # 노드 전체 리소스
-                'node_total_cpu': node_cpu_count,
-                'node_total_memory_gb': round(node_memory_total / (1024 * 1024 * 1024), 1),
-                'node_used_memory_gb': round(node_memory_used / (1024 * 1024 * 1024), 1),
-                # VM 할당된 리소스
-                'vm_total_cpu': vm_total_cpu,
-                'vm_total_memory_gb': round(vm_total_memory / (1024 * 1024 * 1024), 1),
-                'vm_used_cpu': vm_used_cpu,
-                'vm_used_memory_gb': round(vm_used_memory / (1024 * 1024 * 1024), 1),
-                # 사용률 계산
-                'cpu_usage_percent': round((vm_used_cpu / node_cpu_count * 100) if node_cpu_count > 0 else 0, 1),
-                'memory_usage_percent': round((vm_used_memory / node_memory_total * 100) if node_memory_total > 0 else 0, 1),
-                'cpu_allocation_percent': round((vm_total_cpu / node_cpu_count * 100) if node_cpu_count > 0 else 0, 1),
-                'memory_allocation_percent': round((vm_total_memory / node_memory_total * 100) if node_memory_total > 0 else 0, 1)
-            }
+            stats = self.build_server_stats(all_servers, node_cpu_count, node_memory_total, node_memory_used)
             
             result = {
                 'success': True,
                 'data': {
                     'servers': all_servers,
-                    'stats': stats
+                    'stats': stats,
+                    'capacity': capacity,
+                    'fetch_stats': ProxmoxFetcher.latency_summary(config_results)
                 }
             }
-            print(f"✅ get_all_vms 완료: {result}")
+            print(f"✅ get_all_vms 완료: {len(all_servers)}개 서버")
             return result
                 
         except Exception as e:
@@ -473,16 +540,232 @@ class ProxmoxService:
                 }
             }
 
-    def get_storage_info(self) -> Dict[str, Any]:
-        """스토리지 정보 조회 (API 호환, Redis 캐싱 적용)"""
+    @staticmethod
+    def build_server_stats(servers: Dict[str, Dict[str, Any]], node_cpu_count: int,
+                           node_memory_total: int, node_memory_used: int) -> Dict[str, Any]:
+        """관리 대상 서버 목록과 노드 전체 리소스로 대시보드 통계 계산"""
+        vm_total_cpu = 0
+        vm_total_memory = 0
+        vm_used_cpu = 0
+        vm_used_memory = 0
+        running_count = 0
+        stopped_count = 0
+        
+        for server in servers.values():
+            vm_cpu = server.get('vm_cpu', 1)
+            vm_total_memory += server.get('maxmem', 0)
+            vm_total_cpu += vm_cpu
+            if server.get('status') == 'running':
+                running_count += 1
+                vm_used_memory += server.get('memory', 0)  # 현재 사용 중인 메모리
+                vm_used_cpu += vm_cpu  # 실행 중인 서버는 CPU를 모두 사용 중
+            else:
+                # 중지된 서버는 CPU/메모리 사용량 0
+                stopped_count += 1
+        
+        return {
+            'total_servers': len(servers),
+            'running_servers': running_count,
+            'stopped_servers': stopped_count,
+            # 노드 전체 리소스
+            'node_total_cpu': node_cpu_count,
+            'node_total_memory_gb': round(node_memory_total / (1024 * 1024 * 1024), 1),
+            'node_used_memory_gb': round(node_memory_used / (1024 * 1024 * 1024), 1),
+            # VM 할당된 리소스
+            'vm_total_cpu': vm_total_cpu,
+            'vm_total_memory_gb': round(vm_total_memory / (1024 * 1024 * 1024), 1),
+            'vm_used_cpu': vm_used_cpu,
+            'vm_used_memory_gb': round(vm_used_memory / (1024 * 1024 * 1024), 1),
+            # 사용률 계산
+            'cpu_usage_percent': round((vm_used_cpu / node_cpu_count * 100) if node_cpu_count > 0 else 0, 1),
+            'memory_usage_percent': round((vm_used_memory / node_memory_total * 100) if node_memory_total > 0 else 0, 1),
+            'cpu_allocation_percent': round((vm_total_cpu / node_cpu_count * 100) if node_cpu_count > 0 else 0, 1),
+            'memory_allocation_percent': round((vm_total_memory / node_memory_total * 100) if node_memory_total > 0 else 0, 1)
+        }
+    
+    def _capacity_cache_ttl(self) -> int:
+        return current_app.config.get('PROXMOX_CAPACITY_CACHE_TTL', 15)
+    
+    def get_node_statuses(self, headers: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+        """전체 노드의 CPU/메모리 상태 조회 (노드별 /status 병렬 호출, 짧은 TTL 캐시)"""
+        cached = redis_utils.get_cache(NODE_STATUS_CACHE_KEY)
+        if isinstance(cached, dict) and cached:
+            return cached
+        
+        nodes_response = self.session.get(f"{self.endpoint}/api2/json/nodes", headers=headers, timeout=5)
+        if nodes_response.status_code != 200:
+            print(f"❌ 노드 목록 조회 실패: {nodes_response.status_code}")
+            return {}
+        node_list = nodes_response.json().get('data', [])
+        
+        online = [n['node'] for n in node_list if n.get('status', 'online') == 'online']
+        status_results = self.fetcher.fetch_many([
+            {'key': node, 'node': node, 'url': f"{self.endpoint}/api2/json/nodes/{node}/status"}
+            for node in online
+        ], headers)
+        
+        statuses = {}
+        for entry in node_list:
+            node = entry['node']
+            result = status_results.get(node)
+            detail = (result or {}).get('data') or {}
+            if result and result['success'] and detail:
+                statuses[node] = {
+                    'status': 'online',
+                    'cpu_count': detail.get('cpuinfo', {}).get('cpus', 0),
+                    'cpu_usage': detail.get('cpu', 0),
+                    'memory_total': detail.get('memory', {}).get('total', 0),
+                    'memory_used': detail.get('memory', {}).get('used', 0)
+                }
+            else:
+                # /status 실패 또는 오프라인 노드는 /nodes 목록 값 사용
+                statuses[node] = {
+                    'status': entry.get('status', 'unknown'),
+                    'cpu_count': entry.get('maxcpu', 0),
+                    'cpu_usage': entry.get('cpu', 0),
+                    'memory_total': entry.get('maxmem', 0),
+                    'memory_used': entry.get('mem', 0)
+                }
+        
+        redis_utils.set_cache(NODE_STATUS_CACHE_KEY, statuses, expire=self._capacity_cache_ttl(), tags=['capacity'])
+        return statuses
+    
+    @staticmethod
+    def _aggregate_capacity(node_statuses: Dict[str, Dict[str, Any]], vms: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """노드별/클러스터 용량 집계 (Proxmox의 모든 QEMU VM 기준, 인벤토리 1회 순회)"""
+        gb = 1024 * 1024 * 1024
+        nodes = {}
+        for name, status in node_statuses.items():
+            nodes[name] = {
+                'status': status['status'],
+                'cpu_count': status['cpu_count'],
+                'cpu_usage_percent': round(float(status.get('cpu_usage', 0) or 0) * 100, 1),
+                'memory_total': status['memory_total'],
+                'memory_used': status['memory_used'],
+                'vm_total_cpu': 0,
+                'vm_running_cpu': 0,
+                'vm_total_memory': 0,
+                'vm_running_memory': 0,
+                'running_servers': 0,
+                'stopped_servers': 0
+            }
+        
+        for vm in vms:
+            if vm.get('template'):
+                continue
+            node = nodes.get(vm.get('node'))
+            if node is None:
+                continue
+            cpus = vm.get('cpus') or vm.get('maxcpu') or 0
+            maxmem = vm.get('maxmem', 0) or 0
+            node['vm_total_cpu'] += cpus
+            node['vm_total_memory'] += maxmem
+            if vm.get('status') == 'running':
+                node['running_servers'] += 1
+                node['vm_running_cpu'] += cpus
+                node['vm_running_memory'] += maxmem
+            else:
+                node['stopped_servers'] += 1
+        
+        def ratios(entry):
+            cpu_count = entry['cpu_count']
+            memory_total = entry['memory_total']
+            return {
+                'memory_total_gb': round(memory_total / gb, 1),
+                'memory_used_gb': round(entry['memory_used'] / gb, 1),
+                'memory_usage_percent': round(entry['memory_used'] / memory_total * 100, 1) if memory_total else 0,
+                'cpu_allocation_percent': round(entry['vm_total_cpu'] / cpu_count * 100, 1) if cpu_count else 0,
+                'memory_allocation_percent': round(entry['vm_total_memory'] / memory_total * 100, 1) if memory_total else 0
+            }
+        
+        cluster = {key: 0 for key in ('cpu_count', 'memory_total', 'memory_used', 'vm_total_cpu', 'vm_running_cpu',
+                                      'vm_total_memory', 'vm_running_memory', 'running_servers', 'stopped_servers')}
+        for entry in nodes.values():
+            entry.update(ratios(entry))
+            if entry['status'] == 'online':
+                for key in cluster:
+                    cluster[key] += entry[key]
+        cluster.update(ratios(cluster))
+        cluster['node_count'] = len(nodes)
+        cluster['online_nodes'] = sum(1 for n in nodes.values() if n['status'] == 'online')
+        
+        # 메모리 사용률 또는 할당률이 높은 노드 (대시보드 표시용, 사용률 내림차순)
+        hot_nodes = sorted(
+            (name for name, n in nodes.items()
+             if n['memory_usage_percent'] >= 85 or n['memory_allocation_percent'] >= 100 or n['cpu_allocation_percent'] >= 200),
+            key=lambda name: nodes[name]['memory_usage_percent'], reverse=True
+        )
+        return {'nodes': nodes, 'cluster': cluster, 'hot_nodes': hot_nodes, 'generated_at': datetime.now().isoformat()}
+    
+    def get_cluster_capacity(self) -> Dict[str, Any]:
+        """노드별/클러스터 용량 집계 조회 (짧은 TTL 캐시, 대시보드용)"""
         try:
-            # Redis 캐시 확인
-            cache_key = "proxmox:storage_info"
-            cached_data = redis_utils.get_cache(cache_key)
-            if cached_data:
-                logger.info("📦 Redis 캐시에서 스토리지 데이터 로드")
-                return cached_data
+            cached = redis_utils.get_cache(CAPACITY_CACHE_KEY)
+            if isinstance(cached, dict) and cached.get('nodes') is not None:
+                return {'success': True, 'data': cached}
             
+            headers, error = self.get_proxmox_auth()
+            if error:
+                return {'success': False, 'message': error}
+            
+            node_statuses = self.get_node_statuses(headers)
+            vms, error = self.get_proxmox_vms(headers)
+            if error or not node_statuses:
+                return {'success': False, 'message': error or '노드 정보를 가져올 수 없습니다'}
+            
+            capacity = self._aggregate_capacity(node_statuses, vms)
+            redis_utils.set_cache(CAPACITY_CACHE_KEY, capacity, expire=self._capacity_cache_ttl(), tags=['capacity'])
+            return {'success': True, 'data': capacity}
+        except Exception as e:
+            print(f"❌ 용량 집계 조회 실패: {e}")
+            return {'success': False, 'message': str(e)}
+    
+    def _parse_vm_disks(self, vm_config: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """VM 설정(config)에서 디스크 목록과 총 용량(GB) 추출"""
+        disks = []
+        total_disk_gb = 0
+        for key, value in vm_config.items():
+            if key.startswith('scsi') or key.startswith('sata') or key.startswith('virtio'):
+                if key == 'scsihw' or not isinstance(value, str):
+                    continue
+                
+                size_gb = 0
+                storage = 'unknown'
+                
+                # 스토리지 추출
+                if ':' in value:
+                    storage = value.split(':')[0]
+                
+                # 패턴 1: size= 파라미터 (예: size=10G, size=10737418240)
+                if 'size=' in value:
+                    size_match = value.split('size=')[1].split(',')[0]
+                    try:
+                        if size_match.endswith('G'):
+                            size_gb = int(size_match[:-1])
+                        else:
+                            size_bytes = int(size_match)
+                            size_gb = size_bytes // (1024 * 1024 * 1024)
+                    except ValueError:
+                        pass
+                
+                disks.append({
+                    'device': key,
+                    'size_gb': size_gb,
+                    'storage': storage
+                })
+                total_disk_gb += size_gb
+        return disks, total_disk_gb
+    
+    def get_storage_info(self) -> Dict[str, Any]:
+        """스토리지 정보 조회 (API 호환, stale-while-revalidate 캐시)"""
+        return redis_utils.get_or_compute(
+            STORAGE_INFO_CACHE_KEY, self._fetch_storage_info,
+            ttl=120, stale_ttl=600, is_error=lambda result: not result.get('success'), tags=['storage']
+        )
+    
+    def _fetch_storage_info(self) -> Dict[str, Any]:
+        """Proxmox에서 스토리지 정보 조회"""
+        try:
             logger.info("🌐 Proxmox API에서 스토리지 데이터 조회")
             print(f"🔍 get_storage_info 시작")
             headers, error = self.get_proxmox_auth()
@@ -527,10 +810,6 @@ class ProxmoxService:
                 'data': processed_storage
             }
             
-            # Redis에 캐시 저장 (10분)
-            redis_utils.set_cache(cache_key, result, expire=600)
-            logger.info("💾 스토리지 데이터를 Redis에 캐시 저장")
-            
             print(f"✅ get_storage_info 완료: {result}")
             return result
                 
@@ -545,14 +824,8 @@ class ProxmoxService:
     def start_vm(self, server_name: str) -> Dict[str, Any]:
         """VM 시작 (API 호환)"""
         try:
-            # 서버명으로 VM ID 찾기
-            vm_list = self.get_vm_list()
-            target_vm = None
-            
-            for vm in vm_list:
-                if vm.get('name') == server_name:
-                    target_vm = vm
-                    break
+            # 서버명으로 VM 위치 찾기 (인덱스 우선)
+            target_vm = self.resolve_vm(name=server_name)
             
             if not target_vm:
                 return {
@@ -561,10 +834,12 @@ class ProxmoxService:
                 }
             
             vmid = target_vm['vmid']
-            if self.vm_action(vmid, 'start'):
+            upid = self.vm_action_task(vmid, 'start', node=target_vm.get('node'))
+            if upid is not None:
                 return {
                     'success': True,
-                    'message': f'서버 {server_name}이(가) 시작되었습니다.'
+                    'message': f'서버 {server_name}이(가) 시작되었습니다.',
+                    'data': {'vmid': vmid, 'node': target_vm.get('node'), 'upid': upid or None}
                 }
             else:
                 return {
@@ -582,14 +857,8 @@ class ProxmoxService:
     def stop_vm(self, server_name: str) -> Dict[str, Any]:
         """VM 중지 (API 호환)"""
         try:
-            # 서버명으로 VM ID 찾기
-            vm_list = self.get_vm_list()
-            target_vm = None
-            
-            for vm in vm_list:
-                if vm.get('name') == server_name:
-                    target_vm = vm
-                    break
+            # 서버명으로 VM 위치 찾기 (인덱스 우선)
+            target_vm = self.resolve_vm(name=server_name)
             
             if not target_vm:
                 return {
@@ -598,10 +867,12 @@ class ProxmoxService:
                 }
             
             vmid = target_vm['vmid']
-            if self.vm_action(vmid, 'stop'):
+            upid = self.vm_action_task(vmid, 'stop', node=target_vm.get('node'))
+            if upid is not None:
                 return {
                     'success': True,
-                    'message': f'서버 {server_name}이(가) 중지되었습니다.'
+                    'message': f'서버 {server_name}이(가) 중지되었습니다.',
+                    'data': {'vmid': vmid, 'node': target_vm.get('node'), 'upid': upid or None}
                 }
             else:
                 return {
@@ -620,14 +891,8 @@ class ProxmoxService:
         """VM 재부팅 (API 호환)"""
         try:
             print(f"🔧 VM 재부팅 시작: {server_name}")
-            # 서버명으로 VM ID 찾기
-            vm_list = self.get_vm_list()
-            target_vm = None
-            
-            for vm in vm_list:
-                if vm.get('name') == server_name:
-                    target_vm = vm
-                    break
+            # 서버명으로 VM 위치 찾기 (인덱스 우선)
+            target_vm = self.resolve_vm(name=server_name)
             
             if not target_vm:
                 print(f"❌ VM을 찾을 수 없음: {server_name}")
@@ -638,11 +903,13 @@ class ProxmoxService:
             
             vmid = target_vm['vmid']
             print(f"🔧 VM 액션 호출: {vmid} - reset")
-            if self.vm_action(vmid, 'reset'):
+            upid = self.vm_action_task(vmid, 'reset', node=target_vm.get('node'))
+            if upid is not None:
                 print(f"✅ VM 재부팅 성공: {server_name}")
                 return {
                     'success': True,
-                    'message': f'서버 {server_name}이(가) 재부팅되었습니다.'
+                    'message': f'서버 {server_name}이(가) 재부팅되었습니다.',
+                    'data': {'vmid': vmid, 'node': target_vm.get('node'), 'upid': upid or None}
                 }
             else:
                 print(f"❌ VM 재부팅 실패: {server_name}")
@@ -744,34 +1011,34 @@ class ProxmoxService:
                 print(f"❌ VM 목록 조회 실패: {error}")
                 return []
             
-            # 각 VM의 상세 정보 가져오기
+            # 각 VM의 상세 정보 병렬 조회 (실패한 VM은 기본 정보만 포함)
+            detail_results = self.fetcher.fetch_many([
+                {
+                    'key': vm.get('vmid'),
+                    'node': vm.get('node', self.node),
+                    'url': f"{self.endpoint}/api2/json/nodes/{vm.get('node', self.node)}/qemu/{vm.get('vmid')}/status/current",
+                    'timeout': 3
+                }
+                for vm in vms
+            ], headers)
+            
             detailed_vms = []
             for vm in vms:
-                try:
-                    node = vm.get('node', self.node)
-                    vmid = vm.get('vmid')
-                    
-                    # VM 상세 정보 조회
-                    vm_detail_url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vmid}/status/current"
-                    detail_response = self.session.get(vm_detail_url, headers=headers, timeout=3)
+                detail_result = detail_results.get(vm.get('vmid'))
+                if detail_result and detail_result['success']:
+                    detail_data = detail_result['data'] or {}
                     
-                    if detail_response.status_code == 200:
-                        detail_data = detail_response.json().get('data', {})
-                        
-                        # 상세 정보와 기본 정보 병합
-                        vm.update({
-                            'cpu': detail_data.get('cpu', 0),
-                            'memory': detail_data.get('memory', 0),
-                            'maxmem': detail_data.get('maxmem', 0),
-                            'cpus': detail_data.get('cpus', 0),
-                            'network_devices': detail_data.get('netin', []),  # 네트워크 정보
-                            'ip_addresses': self._extract_ip_addresses(detail_data)
-                        })
-                    
-                    detailed_vms.append(vm)
-                except Exception as e:
-                    print(f"⚠️ VM 상세 정보 조회 실패 ({vm.get('name', 'unknown')}): {e}")
-                    detailed_vms.append(vm)  # 기본 정보라도 포함
+                    # 상세 정보와 기본 정보 병합
+                    vm.update({
+                        'cpu': detail_data.get('cpu', 0),
+                        'memory': detail_data.get('memory', 0),
+                        'maxmem': detail_data.get('maxmem', 0),
+                        'cpus': detail_data.get('cpus', 0),
+                        'network_devices': detail_data.get('netin', []),  # 네트워크 정보
+                        'ip_addresses': self._extract_ip_addresses(detail_data)
+                    })
+                
+                detailed_vms.append(vm)
             
             print(f"✅ VM 목록 조회 완료: {len(detailed_vms)}개")
             return detailed_vms
@@ -798,32 +1065,60 @@ class ProxmoxService:
         
         return ip_addresses
 
-    def vm_action(self, vmid: int, action: str) -> bool:
+    def resolve_vm(self, name: str = None, vmid: int = None) -> Optional[Dict[str, Any]]:
+        """VM 이름 또는 VMID로 노드/VMID 조회
+
+        인덱스에 없으면 /cluster/resources 한 번으로 전체 VM의 실제 노드를 받아 인덱스를 채운 뒤 찾는다.
+        (servers 테이블에는 노드 정보가 없어 인덱스 초기화에 사용하지 않음)
+        """
+        entry = vm_index.resolve(name=name, vmid=vmid)
+        if entry and entry.get('node'):
+            return entry
+        
+        return self._resolve_vm_from_inventory(name=name, vmid=vmid)
+    
+    def _resolve_vm_from_inventory(self, name: str = None, vmid: int = None) -> Optional[Dict[str, Any]]:
+        """클러스터 인벤토리(/cluster/resources, 실패 시 노드별 조회)로 인덱스를 갱신하고 VM 위치 반환"""
+        headers, error = self.get_proxmox_auth()
+        if error:
+            print(f"❌ 인증 실패: {error}")
+            return None
+        
+        vms, error = self.get_proxmox_vms(headers)
+        if error:
+            print(f"❌ VM 목록 조회 실패: {error}")
+            return None
+        
+        return vm_index.resolve(name=name, vmid=vmid)
+    
+    @staticmethod
+    def _is_missing_vm_response(response: requests.Response) -> bool:
+        """Proxmox가 해당 노드에 VM이 없다고 응답했는지 여부"""
+        return response.status_code in (404, 500) and 'does not exist' in response.text
+    
+    def vm_action(self, vmid: int, action: str, node: str = None) -> bool:
         """VM 액션 수행 (시작/중지/재부팅)"""
+        return self.vm_action_task(vmid, action, node=node) is not None
+    
+    def vm_action_task(self, vmid: int, action: str, node: str = None) -> Optional[str]:
+        """VM 액션 수행 후 Proxmox 작업 UPID 반환 (실패 시 None, UPID가 없으면 빈 문자열)
+
+        node를 알고 있으면(인덱스 조회 결과) Proxmox POST 한 번으로 끝난다.
+        VM이 없다는 응답을 받으면 인덱스를 폐기하고 인벤토리로 위치를 다시 찾아 한 번 재시도한다.
+        """
         try:
             print(f"🔧 VM 액션 수행: {vmid} - {action}")
             headers, error = self.get_proxmox_auth()
             if error:
                 print(f"❌ 인증 실패: {error}")
-                return False
-            
-            # VM 정보 조회로 노드 확인
-            vms, error = self.get_proxmox_vms(headers)
-            if error:
-                print(f"❌ VM 목록 조회 실패: {error}")
-                return False
-            
-            target_vm = None
-            for vm in vms:
-                if vm.get('vmid') == vmid:
-                    target_vm = vm
-                    break
-            
-            if not target_vm:
-                print(f"❌ VM을 찾을 수 없음: {vmid}")
-                return False
+                return None
             
-            node = target_vm.get('node', self.node)
+            if not node:
+                target_vm = self.resolve_vm(vmid=vmid)
+                if not target_vm:
+                    print(f"❌ VM을 찾을 수 없음: {vmid}")
+                    return None
+                node = target_vm.get('node', self.node)
             
             # 액션 URL 구성
             action_url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vmid}/status/{action}"
@@ -831,16 +1126,27 @@ class ProxmoxService:
             # 액션 수행
             response = self.session.post(action_url, headers=headers, timeout=30)
             
+            if self._is_missing_vm_response(response):
+                # 마이그레이션/삭제 등으로 인덱스가 오래된 경우
+                print(f"⚠️ VM {vmid}이(가) 노드 {node}에 없음, 위치 재조회")
+                vm_index.invalidate(vmid=vmid)
+                target_vm = self._resolve_vm_from_inventory(vmid=vmid)
+                if target_vm and target_vm.get('node') and target_vm['node'] != node:
+                    node = target_vm['node']
+                    action_url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vmid}/status/{action}"
+                    response = self.session.post(action_url, headers=headers, timeout=30)
+            
             if response.status_code == 200:
-                print(f"✅ VM 액션 성공: {vmid} - {action}")
-                return True
+                upid = response.json().get('data') or ''
+                print(f"✅ VM 액션 성공: {vmid} - {action} ({upid})")
+                return upid
             else:
                 print(f"❌ VM 액션 실패: {vmid} - {action} - {response.text}")
-                return False
+                return None
                 
         except Exception as e:
             print(f"❌ VM 액션 실패: {e}")
-            return False
+            return None
 
     def start_server(self, server_name: str) -> Dict[str, Any]:
         """서버 시작 (API 호환)"""
@@ -878,27 +1184,56 @@ class ProxmoxService:
                 'message': str(e)
             }
 
-    def wait_for_vm_status(self, vmid: int, target_status: str, timeout: int = 300) -> bool:
-        """VM 상태 대기"""
+    def wait_for_vm_status(self, vmid: int, target_status: str, timeout: int = 300,
+                           upid: str = None, node: str = None) -> bool:
+        """VM 상태 대기
+
+        upid가 주어지면 작업 추적기로 작업 종료를 기다린 뒤 상태를 한 번 확인하고,
+        없으면 /status/current 를 점진적으로 간격을 늘려가며 조회한다.
+        """
         import time
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            vm_info = self.get_vm_info(vmid)
-            if vm_info and vm_info.get('status') == target_status:
-                return True
-            time.sleep(5)
+        deadline = time.time() + timeout
+        if upid:
+            self.task_tracker.wait(upid, timeout=timeout)
         
-        return False
+        if not node:
+            entry = self.resolve_vm(vmid=vmid)
+            node = (entry or {}).get('node', self.node)
+        
+        interval = 0.5
+        while True:
+            headers, error = self.get_proxmox_auth()
+            if not error:
+                try:
+                    url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vmid}/status/current"
+                    response = self.session.get(url, headers=headers, timeout=10)
+                    if response.status_code == 200 and response.json().get('data', {}).get('status') == target_status:
+                        return True
+                except Exception as e:
+                    print(f"⚠️ VM 상태 조회 실패: {e}")
+            
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, 5)
     
     def get_firewall_groups(self) -> List[Dict[str, Any]]:
-        """Proxmox Datacenter Security Group 목록 조회"""
+        """Proxmox Datacenter Security Group 목록 조회 (stale-while-revalidate 캐시)"""
+        return redis_utils.get_or_compute(
+            FIREWALL_GROUPS_CACHE_KEY, self._fetch_firewall_groups,
+            ttl=60, stale_ttl=600, is_error=lambda groups: groups is None, tags=['firewall']
+        )
+    
+    def _fetch_firewall_groups(self) -> Optional[List[Dict[str, Any]]]:
+        """Proxmox에서 Security Group 목록 조회 (실패 시 None)"""
         try:
             print("🔍 Proxmox Datacenter Security Group 목록 조회")
             headers, error = self.get_proxmox_auth()
             if error:
                 print(f"❌ 인증 실패: {error}")
-                return []
+                return None
             
             # Proxmox Datacenter Security Group API 호출
             firewall_url = f"{self.endpoint}/api2/json/cluster/firewall/groups"
@@ -2714,7 +3049,28 @@ VM ID: {target_vm['vmid']}
             }
 
     def get_node_backups(self, node_name: str = None) -> Dict[str, Any]:
-        """노드별 백업 목록 조회"""
+        """노드별 백업 목록 조회 (stale-while-revalidate 캐시)"""
+        return redis_utils.get_or_compute(
+            f"{NODE_BACKUPS_CACHE_PREFIX}{node_name or 'all'}", lambda: self._fetch_node_backups(node_name),
+            ttl=60, stale_ttl=600, is_error=lambda result: not result.get('success'),
+            tags=['backups', f"backups:{node_name or 'all'}"]
+        )
+    
+    @staticmethod
+    def invalidate_backup_cache(node_name: str = None):
+        """백업 생성/삭제 후 백업 목록 캐시 폐기 (노드를 모르면 모든 노드의 캐시 폐기)"""
+        if node_name:
+            redis_utils.invalidate_tags(f"backups:{node_name}", 'backups:all')
+        else:
+            redis_utils.invalidate_tags('backups')
+    
+    @staticmethod
+    def invalidate_firewall_groups_cache():
+        """방화벽 그룹/규칙 변경 후 그룹 목록 캐시 폐기"""
+        redis_utils.invalidate_tags('firewall')
+    
+    def _fetch_node_backups(self, node_name: str = None) -> Dict[str, Any]:
+        """Proxmox에서 노드별 백업 목록 조회"""
         try:
             print(f"🔍 get_node_backups 시작: node_name={node_name}")
             
@@ -2727,7 +3083,7 @@ VM ID: {target_vm['vmid']}
             print("✅ 인증 성공")
             
             # 모든 노드 조회
-            nodes_response = requests.get(f"{self.endpoint}/api2/json/nodes", headers=headers, verify=False)
+            nodes_response = self.session.get(f"{self.endpoint}/api2/json/nodes", headers=headers)
             if nodes_response.status_code != 200:
                 print(f"❌ 노드 조회 실패: {nodes_response.status_code}")
                 return {'success': False, 'message': f'노드 조회 실패: {nodes_response.status_code}'}
@@ -2757,7 +3113,7 @@ VM ID: {target_vm['vmid']}
                 
                 for storage in storages:
                     # 백업 파일만 조회 (성능 최적화)
-                    content_response = requests.get(f"{self.endpoint}/api2/json/nodes/{node}/storage/{storage}/content?content=backup", headers=headers, verify=False)
+                    content_response = self.session.get(f"{self.endpoint}/api2/json/nodes/{node}/storage/{storage}/content?content=backup", headers=headers)
                     if content_response.status_code != 200:
                         continue
                     
@@ -2885,7 +3241,7 @@ VM ID: {target_vm['vmid']}
             
             # VM이 실행 중인지 확인하고 중지
             vm_status_url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vm_id}/status/current"
-            status_response = requests.get(vm_status_url, headers=headers, verify=False, timeout=10)
+            status_response = self.session.get(vm_status_url, headers=headers, timeout=10)
             
             if status_response.status_code == 200:
                 vm_status = status_response.json().get('data', {})
@@ -2894,21 +3250,14 @@ VM ID: {target_vm['vmid']}
                     
                     # VM 중지
                     stop_url = f"{self.endpoint}/api2/json/nodes/{node}/qemu/{vm_id}/status/stop"
-                    stop_response = requests.post(stop_url, headers=headers, verify=False, timeout=30)
+                    stop_response = self.session.post(stop_url, headers=headers, timeout=30)
                     
                     if stop_response.status_code != 200:
                         return {'success': False, 'message': f'VM 중지 실패: {stop_response.text}'}
                     
-                    # VM이 완전히 중지될 때까지 대기
-                    import time
-                    for i in range(30):  # 최대 30초 대기
-                        time.sleep(1)
-                        status_response = requests.get(vm_status_url, headers=headers, verify=False, timeout=10)
-                        if status_response.status_code == 200:
-                            vm_status = status_response.json().get('data', {})
-                            if vm_status.get('status') == 'stopped':
-                                break
-                    else:
+                    # VM이 완전히 중지될 때까지 대기 (중지 작업 UPID 추적)
+                    stop_upid = stop_response.json().get('data')
+                    if not self.wait_for_vm_status(int(vm_id), 'stopped', timeout=30, upid=stop_upid, node=node):
                         return {'success': False, 'message': 'VM 중지 대기 시간 초과'}
             
             # 기존 VM이 있는지 확인
@@ -2941,7 +3290,7 @@ VM ID: {target_vm['vmid']}
             print(f"🔧 백업 복원 API 호출: {restore_url}")
             print(f"🔧 복원 데이터: {restore_data}")
             
-            response = requests.post(restore_url, headers=headers, data=restore_data, verify=False, timeout=300)
+            response = self.session.post(restore_url, headers=headers, data=restore_data, timeout=300)
             
             print(f"📊 복원 응답 상태: {response.status_code}")
             print(f"📊 복원 응답 내용: {response.text}")
@@ -2954,6 +3303,7 @@ VM ID: {target_vm['vmid']}
                         'vm_id': vm_id,
                         'filename': filename,
                         'node': node,
+                        'upid': response.json().get('data'),
                         'timestamp': datetime.now().isoformat()
                     }
                 }
@@ -2992,12 +3342,13 @@ VM ID: {target_vm['vmid']}
             
             print(f"🔧 백업 삭제 API 호출: {delete_url}")
             
-            response = requests.delete(delete_url, headers=headers, verify=False, timeout=60)
+            response = self.session.delete(delete_url, headers=headers, timeout=60)
             
             print(f"📊 삭제 응답 상태: {response.status_code}")
             print(f"📊 삭제 응답 내용: {response.text}")
             
             if response.status_code in [200, 204]:
+                self.invalidate_backup_cache(node)
                 return {
                     'success': True,
                     'message': f'백업 파일이 삭제되었습니다.',
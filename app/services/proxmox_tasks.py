@@ -0,0 +1,281 @@
+"""
+Proxmox 비동기 작업(UPID) 추적기
+
+start/stop/reboot/vzdump/restore 등 Proxmox 비동기 작업이 반환하는 UPID를 등록하면
+백그라운드 스레드 하나가 노드별로 묶어 상태를 조회하고, 작업이 끝나는 즉시 Future를 완료시킨다.
+
+- 노드에 추적 중인 UPID가 1개면 /nodes/{node}/tasks/{upid}/status 로 조회
+- 여러 개면 /nodes/{node}/tasks 목록 한 번으로 일괄 확인
+- 완료가 없으면 조회 간격을 점진적으로 늘리고(최대 max_interval), 새 작업이 등록되면 다시 줄인다
+- wait()가 타임아웃되어 기다리는 쪽이 없어진 작업과 max_age를 넘긴 작업은 추적에서 제외한다 (Future 취소)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional, Any, Callable
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+
+def parse_upid(upid: str) -> Optional[Dict[str, Any]]:
+    """UPID 문자열 파싱
+
+    형식: UPID:{node}:{pid}:{pstart}:{starttime}:{type}:{id}:{user}:
+    """
+    if not upid or not isinstance(upid, str) or not upid.startswith('UPID:'):
+        return None
+    parts = upid.split(':')
+    if len(parts) < 8:
+        return None
+    try:
+        starttime = int(parts[4], 16)
+    except ValueError:
+        starttime = 0
+    return {
+        'upid': upid,
+        'node': parts[1],
+        'starttime': starttime,
+        'type': parts[5],
+        'id': parts[6],
+        'user': parts[7]
+    }
+
+
+class _TrackedTask:
+    def __init__(self, upid: str, info: Dict[str, Any]):
+        self.upid = upid
+        self.node = info['node']
+        self.starttime = info['starttime']
+        self.type = info['type']
+        self.id = info['id']
+        self.future: Future = Future()
+        self.registered_at = time.time()
+        self.missing_polls = 0
+        # track()으로 등록한 횟수 (release()로 모두 놓으면 추적 중단)
+        self.refs = 0
+
+
+class ProxmoxTaskTracker:
+    """UPID 완료 추적기 (프로세스당 1개, 폴링 스레드 1개)"""
+
+    def __init__(self, endpoint: str, ticket_manager, session,
+                 min_interval: float = 0.5, max_interval: float = 5.0, batch_limit: int = 500,
+                 max_age: float = 7200):
+        self.endpoint = endpoint
+        self.ticket_manager = ticket_manager
+        self.session = session
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.batch_limit = batch_limit
+        self.max_age = max_age
+
+        self._tasks: Dict[str, _TrackedTask] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._interval = min_interval
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def track(self, upid: str, callback: Callable[[Dict[str, Any]], None] = None) -> Optional[Future]:
+        """UPID 추적 등록 (작업 종료 시 결과 dict로 완료되는 Future 반환)"""
+        info = parse_upid(upid)
+        if info is None:
+            logger.warning(f"⚠️ 잘못된 UPID, 추적하지 않음: {upid}")
+            return None
+
+        with self._lock:
+            task = self._tasks.get(upid)
+            if task is None:
+                task = _TrackedTask(upid, info)
+                self._tasks[upid] = task
+            task.refs += 1
+            # 새 작업이 들어오면 빠르게 확인
+            self._interval = self.min_interval
+        if callback is not None:
+            task.future.add_done_callback(lambda f: self._run_callback(callback, f))
+
+        self._ensure_thread()
+        self._wakeup.set()
+        return task.future
+
+    def wait(self, upid: str, timeout: float = 300) -> Optional[Dict[str, Any]]:
+        """작업 종료까지 대기 (타임아웃 시 None)"""
+        future = self.track(upid)
+        if future is None:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning(f"⏰ Proxmox 작업 대기 타임아웃 ({timeout}s): {upid}")
+            self.release(upid)
+            return None
+        except CancelledError:
+            return None
+
+    def release(self, upid: str):
+        """track()으로 등록한 작업을 더 기다리지 않음 (등록한 쪽이 모두 놓으면 추적 중단)"""
+        with self._lock:
+            task = self._tasks.get(upid)
+            if task is None:
+                return
+            task.refs -= 1
+            if task.refs > 0:
+                return
+            self._tasks.pop(upid, None)
+        task.future.cancel()
+
+    def pending(self) -> List[str]:
+        with self._lock:
+            return list(self._tasks.keys())
+
+    # ------------------------------------------------------------------
+    # 폴링 스레드
+    # ------------------------------------------------------------------
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='proxmox-task-tracker')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._expire()
+            with self._lock:
+                if not self._tasks:
+                    self._thread = None
+                    return
+                by_node: Dict[str, List[_TrackedTask]] = {}
+                for task in self._tasks.values():
+                    by_node.setdefault(task.node, []).append(task)
+
+            completed = 0
+            headers, error = self.ticket_manager.get_headers()
+            if error:
+                logger.warning(f"⚠️ 작업 추적 인증 실패: {error}")
+            else:
+                for node, tasks in by_node.items():
+                    try:
+                        completed += self._poll_node(node, tasks, headers)
+                    except Exception as e:
+                        logger.warning(f"⚠️ 작업 상태 조회 실패 ({node}): {e}")
+
+            with self._lock:
+                if completed:
+                    self._interval = self.min_interval
+                else:
+                    self._interval = min(self.max_interval, self._interval * 1.5)
+                interval = self._interval
+
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+
+    def _expire(self):
+        """max_age를 넘긴 작업 추적 중단 (노드 장애 등으로 종료를 확인할 수 없는 작업이 남지 않도록)"""
+        now = time.time()
+        with self._lock:
+            expired = [task for task in self._tasks.values() if now - task.registered_at > self.max_age]
+            for task in expired:
+                self._tasks.pop(task.upid, None)
+        for task in expired:
+            logger.warning(f"⏰ Proxmox 작업 추적 만료 ({self.max_age}s): {task.upid}")
+            task.future.cancel()
+
+    def _poll_node(self, node: str, tasks: List[_TrackedTask], headers: Dict[str, str]) -> int:
+        """노드의 추적 작업 상태 확인, 완료된 작업 수 반환"""
+        if len(tasks) == 1:
+            task = tasks[0]
+            status = self._get_task_status(node, task.upid, headers)
+            if status is not None and status.get('status') == 'stopped':
+                self._complete(task, status)
+                return 1
+            return 0
+
+        # 여러 작업은 노드 작업 목록 한 번으로 확인
+        since = min(t.starttime for t in tasks) - 1
+        url = f"{self.endpoint}/api2/json/nodes/{node}/tasks"
+        response = self.session.get(url, headers=headers, timeout=10,
+                                    params={'source': 'all', 'since': since, 'limit': self.batch_limit})
+        if response.status_code != 200:
+            return 0
+
+        listed = {entry.get('upid'): entry for entry in response.json().get('data', [])}
+        completed = 0
+        for task in tasks:
+            entry = listed.get(task.upid)
+            if entry is None:
+                # 목록에서 빠진 작업은 개별 조회로 확인
+                task.missing_polls += 1
+                if task.missing_polls >= 3:
+                    status = self._get_task_status(node, task.upid, headers)
+                    if status is not None and status.get('status') == 'stopped':
+                        self._complete(task, status)
+                        completed += 1
+                continue
+            if entry.get('endtime'):
+                self._complete(task, {
+                    'status': 'stopped',
+                    'exitstatus': entry.get('status'),
+                    'type': entry.get('type'),
+                    'id': entry.get('id'),
+                    'starttime': entry.get('starttime'),
+                    'endtime': entry.get('endtime')
+                })
+                completed += 1
+        return completed
+
+    def _get_task_status(self, node: str, upid: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        url = f"{self.endpoint}/api2/json/nodes/{node}/tasks/{quote(upid, safe='')}/status"
+        response = self.session.get(url, headers=headers, timeout=10)
+        if response.status_code != 200:
+            return None
+        return response.json().get('data') or None
+
+    def _complete(self, task: _TrackedTask, status: Dict[str, Any]):
+        exitstatus = status.get('exitstatus')
+        result = {
+            'upid': task.upid,
+            'node': task.node,
+            'type': status.get('type') or task.type,
+            'id': status.get('id') or task.id,
+            'exitstatus': exitstatus,
+            'success': exitstatus == 'OK',
+            'starttime': status.get('starttime') or task.starttime,
+            'endtime': status.get('endtime'),
+            'waited': round(time.time() - task.registered_at, 1)
+        }
+        with self._lock:
+            self._tasks.pop(task.upid, None)
+        if not task.future.done():
+            task.future.set_result(result)
+        icon = '✅' if result['success'] else '❌'
+        logger.info(f"{icon} Proxmox 작업 종료: {task.upid} ({exitstatus}, {result['waited']}s 대기)")
+
+    @staticmethod
+    def _run_callback(callback, future: Future):
+        if future.cancelled():
+            return
+        try:
+            callback(future.result())
+        except Exception as e:
+            logger.error(f"❌ 작업 완료 콜백 실패: {e}")
+
+
+# 엔드포인트별 전역 추적기
+_trackers: Dict[str, ProxmoxTaskTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_task_tracker(endpoint: str, ticket_manager, session_factory: Callable[[], Any]) -> ProxmoxTaskTracker:
+    """엔드포인트별 공유 작업 추적기 반환 (세션은 최초 생성 시에만 만든다)"""
+    with _trackers_lock:
+        tracker = _trackers.get(endpoint)
+        if tracker is None:
+            tracker = ProxmoxTaskTracker(endpoint, ticket_manager, session_factory())
+            _trackers[endpoint] = tracker
+        return tracker
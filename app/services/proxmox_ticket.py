@@ -0,0 +1,227 @@
+"""
+Proxmox 인증 티켓 관리자
+
+PVEAuthCookie/CSRFPreventionToken 쌍을 프로세스 메모리와 Redis에 캐시하여
+gunicorn 워커와 Celery 프로세스가 같은 티켓을 공유하도록 한다.
+"""
+import hashlib
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple, Any
+
+import requests
+
+from app.utils.redis_utils import redis_utils
+from app.utils.circuit_breaker import get_breaker
+from app.services.proxmox_http import RETRYABLE_STATUS, auth_breaker_name
+
+logger = logging.getLogger(__name__)
+
+# Proxmox 티켓 유효기간 (서버 고정값 2시간)
+TICKET_LIFETIME = 7200
+
+
+class ProxmoxTicketManager:
+    """Proxmox 인증 티켓 캐시 및 갱신 관리"""
+
+    def __init__(self, endpoint: str, username: str, password: str,
+                 renew_after: int = 5400, expire_margin: int = 300, timeout: int = 3):
+        self.endpoint = endpoint
+        self.username = username
+        self.password = password
+        self.renew_after = renew_after        # 발급 후 이 시간이 지나면 백그라운드 갱신
+        self.expire_margin = expire_margin    # 만료 직전 여유 시간 (이 구간은 사용하지 않음)
+        self.timeout = timeout
+
+        key_source = f"{endpoint}|{username}".encode('utf-8')
+        self.cache_key = f"proxmox:ticket:{hashlib.sha1(key_source).hexdigest()[:16]}"
+        self.lock_key = f"{self.cache_key}:lock"
+
+        self._ticket: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._renewing = False
+        self.login_count = 0
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def get_headers(self) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+        """유효한 티켓으로 요청 헤더 반환 (필요 시에만 로그인)"""
+        ticket = self._get_cached_ticket()
+        if ticket is None:
+            with self._lock:
+                ticket = self._get_cached_ticket()
+                if ticket is None:
+                    ticket, error = self._login()
+                    if error:
+                        return None, error
+        elif self._needs_renewal(ticket):
+            self._renew_in_background()
+
+        return self._to_headers(ticket), None
+
+    def invalidate(self, ticket_value: Optional[str] = None):
+        """티켓 폐기 (401 응답 수신 시)
+
+        ticket_value가 주어지면 현재 캐시된 티켓과 같을 때만 폐기하여
+        다른 요청이 이미 갱신한 티켓을 다시 버리지 않도록 한다.
+        """
+        with self._lock:
+            current = self._ticket
+            if ticket_value and current and current.get('ticket') != ticket_value:
+                return
+            self._ticket = None
+
+        shared = redis_utils.get_cache(self.cache_key)
+        if isinstance(shared, dict) and (not ticket_value or shared.get('ticket') == ticket_value):
+            redis_utils.delete_cache(self.cache_key)
+        logger.info("🔐 Proxmox 티켓 폐기 (401 응답)")
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _is_usable(self, ticket: Optional[Dict[str, Any]]) -> bool:
+        if not ticket or not ticket.get('ticket') or not ticket.get('csrf'):
+            return False
+        age = time.time() - float(ticket.get('issued_at', 0))
+        return age < TICKET_LIFETIME - self.expire_margin
+
+    def _needs_renewal(self, ticket: Dict[str, Any]) -> bool:
+        return time.time() - float(ticket.get('issued_at', 0)) >= self.renew_after
+
+    def _get_cached_ticket(self) -> Optional[Dict[str, Any]]:
+        """메모리 → Redis 순으로 사용 가능한 티켓 조회"""
+        ticket = self._ticket
+        if self._is_usable(ticket):
+            return ticket
+
+        shared = redis_utils.get_cache(self.cache_key)
+        if isinstance(shared, dict) and self._is_usable(shared):
+            self._ticket = shared
+            return shared
+        return None
+
+    def _login(self) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """/access/ticket 로그인 (여러 프로세스가 동시에 로그인하지 않도록 Redis 락 사용)"""
+        acquired = self._acquire_shared_lock()
+        try:
+            if not acquired:
+                # 다른 프로세스가 로그인 중이면 결과를 잠시 기다린다
+                deadline = time.time() + self.timeout
+                while time.time() < deadline:
+                    shared = redis_utils.get_cache(self.cache_key)
+                    if isinstance(shared, dict) and self._is_usable(shared):
+                        self._ticket = shared
+                        return shared, None
+                    time.sleep(0.1)
+
+            auth_url = f"{self.endpoint}/api2/json/access/ticket"
+            auth_data = {'username': self.username, 'password': self.password}
+            
+            # 엔드포인트 장애 시 인증 타임아웃을 기다리지 않고 즉시 실패
+            # (로그인 전용 서킷을 사용하여 클러스터 조회 서킷의 half-open 시험 요청과 섞이지 않도록 함)
+            breaker = get_breaker(auth_breaker_name(auth_url))
+            if not breaker.allow():
+                return None, f'Proxmox 연결 차단 중 (서킷 열림: {breaker.name})'
+            
+            print(f"🔐 Proxmox 인증 시도: {self.endpoint}")
+            try:
+                auth_response = requests.post(auth_url, data=auth_data, verify=False, timeout=self.timeout)
+            except BaseException as e:
+                breaker.record_failure(str(e) or type(e).__name__)
+                raise
+            if auth_response.status_code in RETRYABLE_STATUS:
+                breaker.record_failure(f'HTTP {auth_response.status_code}')
+            else:
+                breaker.record_success()
+            self.login_count += 1
+            print(f"📡 인증 응답 상태: {auth_response.status_code}")
+
+            if auth_response.status_code != 200:
+                return None, 'Proxmox 인증 실패'
+
+            auth_result = auth_response.json()
+            data = auth_result.get('data') if isinstance(auth_result, dict) else None
+            if not data:
+                return None, '인증 토큰을 가져올 수 없습니다'
+
+            ticket = {
+                'ticket': data['ticket'],
+                'csrf': data['CSRFPreventionToken'],
+                'issued_at': time.time()
+            }
+            self._ticket = ticket
+            redis_utils.set_cache(self.cache_key, ticket, expire=TICKET_LIFETIME - self.expire_margin)
+            print("✅ 인증 성공 (티켓 캐시 저장)")
+            return ticket, None
+        except Exception as e:
+            print(f"❌ Proxmox 인증 실패: {e}")
+            return None, f'인증 중 예외 발생: {str(e)}'
+        finally:
+            if acquired:
+                self._release_shared_lock()
+
+    def _renew_in_background(self):
+        """만료 전 티켓을 백그라운드 스레드에서 갱신 (현재 티켓은 계속 사용)"""
+        with self._lock:
+            if self._renewing:
+                return
+            self._renewing = True
+
+        def renew():
+            try:
+                # 다른 프로세스가 이미 갱신했으면 그 티켓을 사용
+                shared = redis_utils.get_cache(self.cache_key)
+                if isinstance(shared, dict) and self._is_usable(shared) and not self._needs_renewal(shared):
+                    self._ticket = shared
+                    return
+                ticket, error = self._login()
+                if error:
+                    logger.warning(f"⚠️ Proxmox 티켓 백그라운드 갱신 실패: {error}")
+            finally:
+                self._renewing = False
+
+        thread = threading.Thread(target=renew, name='proxmox-ticket-renew')
+        thread.daemon = True
+        thread.start()
+
+    def _acquire_shared_lock(self) -> bool:
+        if not redis_utils.is_available():
+            return True
+        try:
+            return bool(redis_utils.client.set(self.lock_key, '1', nx=True, ex=max(self.timeout * 2, 5)))
+        except Exception as e:
+            logger.warning(f"⚠️ Proxmox 티켓 락 획득 실패: {e}")
+            return True
+
+    def _release_shared_lock(self):
+        if not redis_utils.is_available():
+            return
+        try:
+            redis_utils.client.delete(self.lock_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Proxmox 티켓 락 해제 실패: {e}")
+
+    @staticmethod
+    def _to_headers(ticket: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            'Cookie': f"PVEAuthCookie={ticket['ticket']}",
+            'CSRFPreventionToken': ticket['csrf']
+        }
+
+
+# 프로세스 전역 티켓 관리자 (엔드포인트/사용자별 1개)
+_managers: Dict[Tuple[str, str], ProxmoxTicketManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_ticket_manager(endpoint: str, username: str, password: str, **kwargs) -> ProxmoxTicketManager:
+    """엔드포인트/사용자별 공유 티켓 관리자 반환"""
+    key = (endpoint, username)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None or manager.password != password:
+            manager = ProxmoxTicketManager(endpoint, username, password, **kwargs)
+            _managers[key] = manager
+        return manager
@@ -0,0 +1,96 @@
+"""
+서버 상태 이벤트 (servers 토픽)
+
+/events/servers 스트림(Flask 라우트, 이벤트 게이트웨이)으로 나가는 서버 이벤트를 만든다.
+
+- inventory: 인벤토리 스냅샷 세대가 올라갈 때 바뀐 서버 행, 삭제된 서버 이름, 통계 (id = 세대 번호)
+  클라이언트는 since가 자신이 가진 세대와 같을 때만 그대로 적용하고, 아니면 /api/servers/changes로 맞춘다
+- server: 시작/중지/재부팅/삭제/생성 Celery 작업의 진행 상태 (전이 상태, 작업 id/단계/진행률)
+  작업이 끝난 뒤의 실제 상태는 작업이 요청한 스냅샷 갱신의 inventory 이벤트로 전달된다
+- record: DB 변경 수신(change_feed)이 전달하는 servers 테이블 변경
+"""
+import logging
+from typing import Any, Dict, List, Optional
+
+from app.utils.event_bus import event_bus
+
+logger = logging.getLogger(__name__)
+
+# 서버 이벤트 토픽
+SERVER_TOPIC = 'servers'
+# inventory 이벤트 하나에 싣는 최대 서버 행 수 (넘으면 행 없이 보내고 클라이언트가 변경 조회로 받음)
+MAX_EVENT_SERVERS = 50
+# 작업 진행 중 화면에 표시할 전이 상태
+TRANSITION_STATUS = {
+    'start': 'starting',
+    'stop': 'stopping',
+    'reboot': 'rebooting',
+    'delete': 'deleting',
+    'create': 'creating',
+}
+
+
+def inventory_event(generation: int, since: Optional[int], servers: Dict[str, Any],
+                    names: Optional[List[str]], stats: Dict[str, Any]) -> Dict[str, Any]:
+    """세대 since → generation 변경분 이벤트 (names가 None이면 reset)"""
+    event = {'type': 'inventory', 'id': generation, 'generation': generation, 'since': since, 'stats': stats}
+    if names is None:
+        event['reset'] = True
+    elif len(names) > MAX_EVENT_SERVERS:
+        event['truncated'] = True
+    else:
+        event['changed'] = {name: servers[name] for name in names if name in servers}
+        event['removed'] = [name for name in names if name not in servers]
+    return event
+
+
+def publish_inventory_event(previous: Optional[Dict[str, Any]], snapshot: Dict[str, Any], changed: List[str]):
+    """새 스냅샷 세대 게시 (이전 스냅샷이 없으면 reset)"""
+    since = previous['generation'] if previous is not None else None
+    names = changed if previous is not None else None
+    try:
+        event_bus.publish(SERVER_TOPIC, inventory_event(snapshot['generation'], since, snapshot['servers'],
+                                                        names, snapshot['stats']))
+    except Exception as e:
+        logger.warning(f"⚠️ 인벤토리 이벤트 게시 실패: {e}")
+
+
+def publish_server_event(name: str, action: str, state: str = 'PROGRESS', task_id: str = None,
+                         progress: int = None, message: str = None):
+    """서버 작업 진행 상태 게시 (진행 중에는 전이 상태를 함께 보냄)
+
+    작업 결과에 영향을 주지 않도록 게시 실패는 로그만 남긴다.
+    """
+    task = {'id': task_id, 'action': action, 'state': state}
+    if progress is not None:
+        task['progress'] = progress
+    if message:
+        task['message'] = message
+    event = {'type': 'server', 'name': name, 'task': task}
+    if state == 'PROGRESS' and action in TRANSITION_STATUS:
+        event['status'] = TRANSITION_STATUS[action]
+    try:
+        event_bus.publish(SERVER_TOPIC, event)
+    except Exception as e:
+        logger.warning(f"⚠️ 서버 이벤트 게시 실패 ({name}): {e}")
+
+
+def get_inventory_events(last_id: int, limit: int = None) -> List[Dict[str, Any]]:
+    """재연결/대체 조회용: 세대 last_id 이후 변경분을 inventory 이벤트 하나로 반환
+
+    last_id가 없으면(처음 연결) 화면이 이미 현재 목록을 가지고 있으므로 보내지 않는다.
+    """
+    from app.services.inventory_service import inventory_service
+
+    if not last_id:
+        return []
+    result = inventory_service.get_changes(last_id)
+    if not result['success'] or result['data']['generation'] == last_id:
+        return []
+    data = result['data']
+    names = None if data['reset'] else list(data['changed']) + data['removed']
+    event = inventory_event(data['generation'], last_id, data['changed'], names, data['stats'])
+    if data['generation'] < last_id:
+        # Redis 초기화 등으로 세대가 되돌아간 경우: id를 빼야 이전 id 이후만 받는 필터에 걸리지 않음
+        event.pop('id')
+    return [event]
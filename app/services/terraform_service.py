@@ -10,6 +10,8 @@ from typing import Tuple, Dict, List, Any, Optional
 from flask import current_app
 from app.models.server import Server
 from app.models.notification import Notification
+from app.services.tfvars_repository import get_tfvars_repository
+from app.utils.task_progress import run_command
 
 logger = logging.getLogger(__name__)
 
@@ -151,19 +153,11 @@ class TerraformService:
             print(f"   TF_VAR_proxmox_hdd_datastore: {env.get('TF_VAR_proxmox_hdd_datastore', '없음')}")
             print(f"   TF_VAR_proxmox_ssd_datastore: {env.get('TF_VAR_proxmox_ssd_datastore', '없음')}")
             
-            # Windows 환경에서 인코딩 문제 해결을 위해 UTF-8 명시적 지정
-            result = subprocess.run(
-                command,
-                cwd=cwd,
-                env=env,  # 환경변수 전달
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',  # 디코딩 에러 시 대체 문자 사용
-                timeout=300  # 5분 타임아웃
-            )
-            print(f"🔧 Terraform 명령어 완료: returncode={result.returncode}")
-            return result.returncode, result.stdout, result.stderr
+            # UTF-8로 읽고 디코딩 에러는 대체 문자 사용, 5분 타임아웃
+            # (Celery 작업 안에서는 출력 줄을 작업 진행 스트림으로 전달)
+            returncode, stdout, stderr = run_command(command, cwd=cwd, env=env, timeout=300)
+            print(f"🔧 Terraform 명령어 완료: returncode={returncode}")
+            return returncode, stdout, stderr
         except subprocess.TimeoutExpired:
             logger.error("Terraform 명령어 실행 타임아웃")
             print("❌ Terraform 명령어 실행 타임아웃")
@@ -302,15 +296,15 @@ class TerraformService:
             logger.error(f"Terraform 출력값 조회 실패: {error_msg}")
             return {}
     
+    @property
+    def tfvars(self):
+        """tfvars 저장소 (파싱 결과를 파일 변경 시까지 재사용)"""
+        return get_tfvars_repository(self.tfvars_file)
+
     def load_tfvars(self) -> Dict[str, Any]:
-        """terraform.tfvars.json 파일 로드"""
+        """terraform.tfvars.json 파일 로드 (수정 가능한 복사본)"""
         try:
-            if os.path.exists(self.tfvars_file):
-                with open(self.tfvars_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            else:
-                logger.warning(f"terraform.tfvars.json 파일이 존재하지 않습니다: {self.tfvars_file}")
-                return {}
+            return self.tfvars.load()
         except Exception as e:
             logger.error(f"terraform.tfvars.json 파일 로드 실패: {e}")
             return {}
@@ -400,7 +394,7 @@ class TerraformService:
                 return f"VM 목록 조회 실패: {error}"
 
             # tfvars 로드
-            tfvars = self.load_tfvars()
+            tfvars = self.tfvars.document()
             servers = tfvars.get('servers', {})
 
             # 실행 중인 VM만 필터링
@@ -439,14 +433,10 @@ class TerraformService:
     
     def save_tfvars(self, data: Dict[str, Any]) -> bool:
         """terraform.tfvars.json 파일 저장"""
-        try:
-            with open(self.tfvars_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        if self.tfvars.save(data):
             logger.info("terraform.tfvars.json 파일 저장 성공")
             return True
-        except Exception as e:
-            logger.error(f"terraform.tfvars.json 파일 저장 실패: {e}")
-            return False
+        return False
     
     def delete_server_config(self, server_name: str) -> bool:
         """terraform.tfvars.json에서 서버 설정 삭제"""
@@ -673,7 +663,7 @@ class TerraformService:
             
             # tfvars 파일 내용 확인
             try:
-                tfvars = self.load_tfvars()
+                tfvars = self.tfvars.document()
                 if not tfvars or 'servers' not in tfvars:
                     error_msg = "terraform.tfvars.json 파일에 서버 설정이 없습니다."
                     print(f"❌ {error_msg}")
@@ -0,0 +1,166 @@
+"""
+terraform.tfvars.json 저장소
+
+대시보드 새로고침마다 tfvars 파일을 열어 JSON을 다시 파싱하지 않도록 파싱 결과를 메모리에 두고,
+파일의 (inode, mtime, size)가 바뀌었을 때만 다시 읽는다. 확인 비용은 호출당 os.stat() 1회.
+
+- servers()/document()/get_server()가 반환하는 값은 여러 요청이 공유하므로 수정하면 안 된다
+  (수정 후 저장하려면 load()로 복사본을 받아 save()로 저장)
+- 서버 이름 / 역할 / IP 색인은 파싱할 때 함께 만든다
+- save()는 임시 파일에 쓴 뒤 os.replace()로 교체하므로 다른 프로세스가 쓰다 만 파일을 읽지 않는다
+"""
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 기준 기본 경로
+DEFAULT_TFVARS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'terraform', 'terraform.tfvars.json'
+)
+
+
+def _server_ips(server: Dict[str, Any]) -> List[str]:
+    """서버 설정의 IP 목록 (network_devices 우선, 없으면 ip_addresses)"""
+    ips = [nd.get('ip_address') for nd in server.get('network_devices') or [] if isinstance(nd, dict)]
+    ips = [ip for ip in ips if ip] or list(server.get('ip_addresses') or [])
+    return [str(ip).split('/', 1)[0] for ip in ips]
+
+
+class TfvarsRepository:
+    """파일 변경 시에만 다시 파싱하는 tfvars 읽기/쓰기 저장소"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._document: Dict[str, Any] = {}
+        self._by_role: Dict[str, List[str]] = {}
+        self._by_ip: Dict[str, str] = {}
+        self._stats = {'reads': 0, 'parses': 0, 'errors': 0}
+
+    def _stat_signature(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _current(self) -> Dict[str, Any]:
+        """파일이 바뀌었으면 다시 파싱하고 현재 문서 반환"""
+        signature = self._stat_signature()
+        with self._lock:
+            self._stats['reads'] += 1
+            if signature == self._signature:
+                return self._document
+            if signature is None:
+                logger.warning(f"terraform.tfvars.json 파일이 존재하지 않습니다: {self.path}")
+                self._replace({}, None)
+                return self._document
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    document = json.load(f)
+            except (OSError, ValueError) as e:
+                # 다음 호출에서 다시 시도하도록 signature는 갱신하지 않고 마지막 정상 문서 유지
+                self._stats['errors'] += 1
+                logger.error(f"terraform.tfvars.json 파일 파싱 오류: {e}")
+                return self._document
+            self._stats['parses'] += 1
+            self._replace(document if isinstance(document, dict) else {}, signature)
+            return self._document
+
+    def _replace(self, document: Dict[str, Any], signature):
+        by_role: Dict[str, List[str]] = {}
+        by_ip: Dict[str, str] = {}
+        for name, server in (document.get('servers') or {}).items():
+            if not isinstance(server, dict):
+                continue
+            role = server.get('role')
+            if role:
+                by_role.setdefault(role, []).append(name)
+            for ip in _server_ips(server):
+                by_ip.setdefault(ip, name)
+        self._document = document
+        self._by_role = by_role
+        self._by_ip = by_ip
+        self._signature = signature
+
+    def exists(self) -> bool:
+        return self._stat_signature() is not None
+
+    def document(self) -> Dict[str, Any]:
+        """전체 tfvars 문서 (읽기 전용)"""
+        return self._current()
+
+    def servers(self) -> Dict[str, Any]:
+        """servers 맵 (읽기 전용)"""
+        return self._current().get('servers') or {}
+
+    def get_server(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.servers().get(name)
+
+    def has_server(self, name: str) -> bool:
+        return name in self.servers()
+
+    def find_by_role(self, role: str) -> List[str]:
+        """역할이 role인 서버 이름 목록"""
+        self._current()
+        return list(self._by_role.get(role, ()))
+
+    def find_by_ip(self, ip: str) -> Optional[str]:
+        """IP(접두사 길이 무시)를 가진 서버 이름"""
+        self._current()
+        return self._by_ip.get(str(ip).split('/', 1)[0])
+
+    def load(self) -> Dict[str, Any]:
+        """수정용 문서 복사본"""
+        return copy.deepcopy(self._current())
+
+    def save(self, data: Dict[str, Any]) -> bool:
+        """원자적으로 저장하고 캐시를 저장한 내용으로 교체"""
+        directory = os.path.dirname(self.path) or '.'
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, prefix='.tfvars-',
+                                             suffix='.tmp', delete=False) as f:
+                tmp_path = f.name
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            if os.path.exists(self.path):
+                os.chmod(tmp_path, os.stat(self.path).st_mode & 0o777)
+            os.replace(tmp_path, self.path)
+            tmp_path = None
+        except Exception as e:
+            logger.error(f"terraform.tfvars.json 파일 저장 실패: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return False
+
+        with self._lock:
+            # 호출자가 data를 계속 수정할 수 있으므로 공유 문서는 복사본으로 둔다
+            self._replace(copy.deepcopy(data), self._stat_signature())
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._stats, path=self.path, servers=len(self._document.get('servers') or {}))
+
+
+_repositories: Dict[str, TfvarsRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def get_tfvars_repository(path: Optional[str] = None) -> TfvarsRepository:
+    """경로별 공용 저장소 (상대 경로는 현재 작업 디렉터리 기준)"""
+    key = os.path.abspath(path or DEFAULT_TFVARS_PATH)
+    repository = _repositories.get(key)
+    if repository is None:
+        with _repositories_lock:
+            repository = _repositories.setdefault(key, TfvarsRepository(key))
+    return repository
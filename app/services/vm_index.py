@@ -0,0 +1,183 @@
+"""
+VM 위치 인덱스 (이름/VMID → 노드, VMID, 설정 digest)
+
+시작/중지/재부팅처럼 VM 하나를 대상으로 하는 작업이 전체 VM 목록을 다시 조회하지 않도록
+Redis 해시(+ 프로세스 메모리)에 VM 위치를 보관한다.
+"""
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Any
+
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+INDEX_KEY = 'proxmox:vm_index'
+INDEX_TTL = 3600
+
+
+class VMResolutionIndex:
+    """VM 이름/VMID로 노드와 VMID를 찾는 인덱스"""
+
+    def __init__(self):
+        self._local: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def resolve(self, name: str = None, vmid: int = None) -> Optional[Dict[str, Any]]:
+        """이름 또는 VMID로 인덱스 항목 조회 (없으면 None)"""
+        field = self._field(name=name, vmid=vmid)
+        if field is None:
+            return None
+
+        with self._lock:
+            entry = self._local.get(field)
+        if entry:
+            return entry
+
+        if redis_utils.is_available():
+            try:
+                raw = redis_utils.client.hget(INDEX_KEY, field)
+                if raw:
+                    entry = json.loads(raw)
+                    with self._lock:
+                        self._local[field] = entry
+                    return entry
+            except Exception as e:
+                logger.warning(f"⚠️ VM 인덱스 조회 실패: {e}")
+        return None
+
+    def resolve_many(self, names: List[str] = None, vmids: List[int] = None) -> Dict[str, Dict[str, Any]]:
+        """여러 VM을 한 번의 HMGET으로 조회 (인덱스 필드 이름 → 항목, 없는 항목은 제외)"""
+        fields = [self._field(name=name) for name in names or []]
+        fields += [self._field(vmid=vmid) for vmid in vmids or [] if str(vmid).isdigit()]
+        fields = list(dict.fromkeys(field for field in fields if field))
+
+        found = {}
+        with self._lock:
+            for field in fields:
+                if field in self._local:
+                    found[field] = self._local[field]
+        missing = [field for field in fields if field not in found]
+
+        if missing and redis_utils.is_available():
+            try:
+                values = redis_utils.client.hmget(INDEX_KEY, missing)
+                loaded = {field: json.loads(raw) for field, raw in zip(missing, values) if raw}
+                with self._lock:
+                    self._local.update(loaded)
+                found.update(loaded)
+            except Exception as e:
+                logger.warning(f"⚠️ VM 인덱스 일괄 조회 실패: {e}")
+        return found
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def record_many(self, vms: List[Dict[str, Any]], source: str = 'inventory'):
+        """VM 목록으로 인덱스 갱신 (노드가 바뀐 VM은 마이그레이션으로 기록)"""
+        entries = {}
+        now = time.time()
+        # 기존 항목은 VM마다 조회하지 않고 한 번에 읽어 둔다
+        known = self.resolve_many(vmids=[vm.get('vmid') for vm in vms if vm.get('vmid') is not None])
+        for vm in vms:
+            name = vm.get('name')
+            vmid = vm.get('vmid')
+            if vmid is None:
+                continue
+            try:
+                vmid = int(vmid)
+            except (TypeError, ValueError):
+                continue
+
+            previous = known.get(self._field(vmid=vmid))
+            node = vm.get('node')
+            if previous and node and previous.get('node') and previous['node'] != node:
+                logger.info(f"🔀 VM 마이그레이션 감지: {name} ({vmid}) {previous['node']} → {node}")
+
+            entry = {
+                'name': name,
+                'vmid': vmid,
+                'node': node or (previous or {}).get('node'),
+                'digest': vm.get('digest') or (previous or {}).get('digest'),
+                'source': source,
+                'updated_at': now
+            }
+            if previous and previous.get('name') and previous['name'] != name:
+                # 이름이 바뀐 VM은 이전 이름 항목 제거
+                self._delete_fields([self._field(name=previous['name'])])
+            entries[self._field(vmid=vmid)] = entry
+            if name:
+                entries[self._field(name=name)] = entry
+
+        if not entries:
+            return
+
+        with self._lock:
+            self._local.update(entries)
+
+        if redis_utils.is_available():
+            try:
+                pipe = redis_utils.client.pipeline()
+                pipe.hset(INDEX_KEY, mapping={k: json.dumps(v, ensure_ascii=False) for k, v in entries.items()})
+                pipe.expire(INDEX_KEY, INDEX_TTL)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"⚠️ VM 인덱스 저장 실패: {e}")
+
+    def record(self, name: str, vmid: int, node: str = None, digest: str = None, source: str = 'inventory'):
+        """단일 VM 항목 갱신"""
+        self.record_many([{'name': name, 'vmid': vmid, 'node': node, 'digest': digest}], source=source)
+
+    def invalidate(self, name: str = None, vmid: int = None):
+        """항목 폐기 (Proxmox가 'does not exist'를 반환했거나 위치가 바뀐 경우)"""
+        fields = []
+        entry = self.resolve(name=name, vmid=vmid)
+        if entry:
+            fields.append(self._field(vmid=entry.get('vmid')))
+            fields.append(self._field(name=entry.get('name')))
+        fields.append(self._field(name=name))
+        fields.append(self._field(vmid=vmid))
+        self._delete_fields(fields)
+        logger.info(f"🗑️ VM 인덱스 항목 폐기: name={name}, vmid={vmid}")
+
+    def clear(self):
+        with self._lock:
+            self._local.clear()
+        if redis_utils.is_available():
+            try:
+                redis_utils.client.delete(INDEX_KEY)
+            except Exception as e:
+                logger.warning(f"⚠️ VM 인덱스 삭제 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _delete_fields(self, fields: List[Optional[str]]):
+        fields = [f for f in fields if f]
+        if not fields:
+            return
+        with self._lock:
+            for field in fields:
+                self._local.pop(field, None)
+        if redis_utils.is_available():
+            try:
+                redis_utils.client.hdel(INDEX_KEY, *fields)
+            except Exception as e:
+                logger.warning(f"⚠️ VM 인덱스 삭제 실패: {e}")
+
+    @staticmethod
+    def _field(name: str = None, vmid: int = None) -> Optional[str]:
+        if vmid is not None:
+            return f"vmid:{int(vmid)}"
+        if name:
+            return f"name:{name}"
+        return None
+
+
+# 전역 인스턴스
+vm_index = VMResolutionIndex()
@@ -62,69 +62,76 @@ $(function() {
     $(`#${type}-progress`).css('stroke', color);
   }
   
+  // 서버 요약 항목 HTML
+  function renderDashboardServer(s) {
+    const statusBadge = s => {
+      switch(s.status) {
+        case 'running': return '<span class="badge bg-success">실행 중</span>';
+        case 'stopped': return '<span class="badge bg-secondary">중지됨</span>';
+        case 'paused': return '<span class="badge bg-warning">일시정지</span>';
+        case 'suspended': return '<span class="badge bg-info">일시중단</span>';
+        default: return `<span class="badge bg-dark">${s.status}</span>`;
+      }
+    };
+    
+    const roleName = s => window.dashboardRoleMap && window.dashboardRoleMap[s.role] ? window.dashboardRoleMap[s.role] : (s.role || '-');
+    const ipList = s => {
+      if (s.ip_addresses && s.ip_addresses.length > 0) {
+        return s.ip_addresses.join(', ');
+      } else if (s.network_devices && s.network_devices.length > 0) {
+        return s.network_devices.map(nd=>nd.ip_address).join(', ');
+      }
+      return '-';
+    };
+    
+    return `<div class="server-list-item" data-server="${s.name}">
+          <div class="server-icon">
+            <i class="fas fa-server"></i>
+          </div>
+          <div class="server-info">
+            <div class="server-name">${s.name}</div>
+            <div class="server-role">
+              <span class="badge bg-primary">${roleName(s)}</span>
+            </div>
+            <div class="server-resources">
+              <span class="resource-badge">
+                <i class="fas fa-microchip"></i>
+                ${parseInt(s.cpu || 0)}코어
+              </span>
+              <span class="resource-badge">
+                <i class="fas fa-memory"></i>
+                ${format2f((s.memory || 0) / 1024 / 1024 / 1024)}GB
+              </span>
+            </div>
+            <div class="server-ip">
+              <i class="fas fa-network-wired me-1"></i>
+              ${ipList(s)}
+            </div>
+            <div class="server-status">
+              ${statusBadge(s)}
+            </div>
+          </div>
+        </div>`;
+  }
+  
   // 대시보드 서버 요약 패널 렌더링
   window.loadDashboardServers = function() {
     console.log('[dashboard.js] loadDashboardServers 호출');
     $('#server-summary-container').html('<div class="text-center text-muted py-4">서버 정보를 불러오는 중...</div>');
     
-    $.get('/api/all_server_status', function(res) {
+    conditionalGet('/api/all_server_status').done(function(res) {
       console.log('[dashboard.js] /all_server_status 응답:', res);
       const servers = res.servers || {};
-      let html = '';
-      
-      const statusBadge = s => {
-        switch(s.status) {
-          case 'running': return '<span class="badge bg-success">실행 중</span>';
-          case 'stopped': return '<span class="badge bg-secondary">중지됨</span>';
-          case 'paused': return '<span class="badge bg-warning">일시정지</span>';
-          case 'suspended': return '<span class="badge bg-info">일시중단</span>';
-          default: return `<span class="badge bg-dark">${s.status}</span>`;
-        }
-      };
-      
-      const roleName = s => window.dashboardRoleMap && window.dashboardRoleMap[s.role] ? window.dashboardRoleMap[s.role] : (s.role || '-');
-      const ipList = s => {
-        if (s.ip_addresses && s.ip_addresses.length > 0) {
-          return s.ip_addresses.join(', ');
-        } else if (s.network_devices && s.network_devices.length > 0) {
-          return s.network_devices.map(nd=>nd.ip_address).join(', ');
-        }
-        return '-';
-      };
-      const serverArr = Object.entries(servers);
+      const serverArr = Object.values(servers);
+      window.dashboardServers = Object.assign({}, servers);
+      window.inventoryGeneration = res.generation;
       
+      let html = '';
       if (serverArr.length === 0) {
         html = '<div class="text-center text-muted py-4">등록된 서버가 없습니다.</div>';
       } else {
-        serverArr.forEach(([name, s]) => {
-          html += `<div class="server-list-item">
-            <div class="server-icon">
-              <i class="fas fa-server"></i>
-            </div>
-            <div class="server-info">
-              <div class="server-name">${s.name}</div>
-              <div class="server-role">
-                <span class="badge bg-primary">${roleName(s)}</span>
-              </div>
-              <div class="server-resources">
-                <span class="resource-badge">
-                  <i class="fas fa-microchip"></i>
-                  ${parseInt(s.cpu || 0)}코어
-                </span>
-                <span class="resource-badge">
-                  <i class="fas fa-memory"></i>
-                  ${format2f((s.memory || 0) / 1024 / 1024 / 1024)}GB
-                </span>
-              </div>
-              <div class="server-ip">
-                <i class="fas fa-network-wired me-1"></i>
-                ${ipList(s)}
-              </div>
-              <div class="server-status">
-                ${statusBadge(s)}
-              </div>
-            </div>
-          </div>`;
+        serverArr.forEach(s => {
+          html += renderDashboardServer(s);
         });
       }
       
@@ -140,6 +147,41 @@ $(function() {
     });
   };
   
+  // 변경 조회(/api/servers/changes) 결과를 바뀐 서버 항목과 통계에만 반영
+  window.applyDashboardChanges = function(delta) {
+    const $container = $('#server-summary-container');
+    if (!$container.length || !window.dashboardServers) {
+      return false;
+    }
+    if (Object.keys(window.dashboardServers).length === 0) {
+      $container.empty();
+    }
+    
+    (delta.removed || []).forEach(function(name) {
+      $container.find(`.server-list-item[data-server="${name}"]`).remove();
+      delete window.dashboardServers[name];
+    });
+    
+    for (const [name, s] of Object.entries(delta.changed || {})) {
+      const $item = $container.find(`.server-list-item[data-server="${name}"]`);
+      const itemHtml = renderDashboardServer(s);
+      if ($item.length) {
+        $item.replaceWith(itemHtml);
+      } else {
+        $container.append(itemHtml);
+      }
+      window.dashboardServers[name] = s;
+    }
+    
+    if (Object.keys(window.dashboardServers).length === 0) {
+      $container.html('<div class="text-center text-muted py-4">등록된 서버가 없습니다.</div>');
+    }
+    if (delta.stats) {
+      updateDashboardStats(delta.stats);
+    }
+    return true;
+  };
+  
   // 대시보드 스토리지 요약 패널 렌더링
   window.loadDashboardStorage = function() {
     console.log('[dashboard.js] loadDashboardStorage 호출');
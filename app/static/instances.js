@@ -1032,7 +1032,13 @@ $(function() {
     
     // 폴링 인터벌 정리
     if (backupPollingIntervals[serverName]) {
-      clearInterval(backupPollingIntervals[serverName]);
+      const handle = backupPollingIntervals[serverName];
+      // 백업 태스크 진행 구독은 해제 함수, 상태 폴링은 인터벌 id
+      if (typeof handle === 'function') {
+        handle();
+      } else {
+        clearInterval(handle);
+      }
       delete backupPollingIntervals[serverName];
     }
     
@@ -1048,9 +1054,9 @@ $(function() {
   
   // 백업 알림 처리는 navigation.js에서 중앙 관리됨
   
-  // 비동기 백업 태스크 상태 폴링 (사용하지 않음 - SSE로 대체)
+  // 비동기 백업 태스크 진행 구독 (작업 진행 스트림, 사용할 수 없으면 상태 조회로 대체)
   function startBackupTaskPolling(serverName, taskId) {
-    console.log(`[instances.js] 백업 태스크 폴링 시작: ${serverName}, task_id: ${taskId}`);
+    console.log(`[instances.js] 백업 태스크 진행 구독 시작: ${serverName}, task_id: ${taskId}`);
     
     // 백업 중인 서버 목록에 추가
     if (window.backingUpServers.indexOf(serverName) === -1) {
@@ -1060,65 +1066,40 @@ $(function() {
     // 서버 작업 버튼 비활성화
     updateBackupActionButtons(serverName, true);
     
-    // 태스크 상태 폴링
-    const pollInterval = setInterval(() => {
-      $.ajax({
-        url: `/api/tasks/${taskId}/status`,
-        method: 'GET',
-        success: function(res) {
-          console.log(`[instances.js] 백업 태스크 상태:`, res);
+    const stopWatching = window.watchTaskProgress(taskId, {
+      onProgress: function(event) {
+        console.log(`[instances.js] 백업 태스크 진행 중: ${event.progress}% - ${event.message}`);
+        // 진행 상태는 로그만 출력 (UI 업데이트는 SSE 알림으로 처리)
+      },
+      onDone: function(event) {
+        delete backupPollingIntervals[serverName];
+        
+        // 백업 중인 서버 목록에서 제거
+        const index = window.backingUpServers.indexOf(serverName);
+        if (index > -1) {
+          window.backingUpServers.splice(index, 1);
+        }
+        
+        // 서버 작업 버튼 활성화
+        updateBackupActionButtons(serverName, false);
+        
+        if (event.success) {
+          console.log(`[instances.js] 백업 태스크 완료: ${serverName}`);
+          addSystemNotification('success', '백업 완료', `서버 ${serverName} 백업이 완료되었습니다.`);
           
-          if (res.state === 'SUCCESS') {
-            console.log(`[instances.js] 백업 태스크 완료: ${serverName}`);
-            clearInterval(pollInterval);
-            delete backupPollingIntervals[serverName];
-            
-            // 백업 중인 서버 목록에서 제거
-            const index = window.backingUpServers.indexOf(serverName);
-            if (index > -1) {
-              window.backingUpServers.splice(index, 1);
-            }
-            
-            // 서버 작업 버튼 활성화
-            updateBackupActionButtons(serverName, false);
-            
-            // 성공 알림
-            addSystemNotification('success', '백업 완료', `서버 ${serverName} 백업이 완료되었습니다.`);
-            
-            // 백업 목록 새로고침
-            if (typeof loadBackupList === 'function') {
-              loadBackupList(serverName);
-            }
-          } else if (res.state === 'FAILURE') {
-            console.log(`[instances.js] 백업 태스크 실패: ${serverName}`);
-            clearInterval(pollInterval);
-            delete backupPollingIntervals[serverName];
-            
-            // 백업 중인 서버 목록에서 제거
-            const index = window.backingUpServers.indexOf(serverName);
-            if (index > -1) {
-              window.backingUpServers.splice(index, 1);
-            }
-            
-            // 서버 작업 버튼 활성화
-            updateBackupActionButtons(serverName, false);
-            
-            // 실패 알림
-            addSystemNotification('error', '백업 실패', `서버 ${serverName} 백업이 실패했습니다.`);
-          } else if (res.state === 'PROGRESS') {
-            console.log(`[instances.js] 백업 태스크 진행 중: ${res.progress}% - ${res.message}`);
-            // 진행 상태는 로그만 출력 (UI 업데이트는 SSE로 처리)
+          // 백업 목록 새로고침
+          if (typeof loadBackupList === 'function') {
+            loadBackupList(serverName);
           }
-        },
-        error: function(xhr) {
-          console.error(`[instances.js] 백업 태스크 상태 조회 실패:`, xhr);
+        } else {
+          console.log(`[instances.js] 백업 태스크 실패: ${serverName}`);
+          addSystemNotification('error', '백업 실패', `서버 ${serverName} 백업이 실패했습니다.`);
         }
-      });
-    }, 5000); // 5초마다 확인
+      }
+    });
     
-    // 폴링 인터벌 저장
-    backupPollingIntervals[serverName] = pollInterval;
-    console.log(`[instances.js] 백업 태스크 폴링 인터벌 저장: ${serverName}`, pollInterval);
+    // 구독 해제 함수 저장 (stopBackupStatusPolling에서 정리)
+    backupPollingIntervals[serverName] = stopWatching;
   }
   
   // 백업 생성 실행
@@ -1286,8 +1267,9 @@ $(function() {
         const serverCount = Object.keys(res.servers || {}).length;
         $('#server-count').text(`${serverCount}개`);
         
-        // 서버 데이터 저장 (검색/필터링용)
+        // 서버 데이터 저장 (검색/필터링용) 및 변경 조회 기준 세대
         window.serversData = res.servers || {};
+        window.inventoryGeneration = res.generation;
         window.firewallGroups = firewallGroups;
         
         if (serverCount === 0) {
@@ -1324,6 +1306,48 @@ $(function() {
     });
   };
   
+  // 변경 조회(/api/servers/changes) 결과를 바뀐 행에만 반영
+  window.applyServerChanges = function(delta) {
+    const $tbody = $('#servers-table tbody');
+    if (!$tbody.length || !window.serversData) {
+      return false;
+    }
+    const selectedServers = getSelectedServerNames();
+    
+    (delta.removed || []).forEach(function(name) {
+      $(`.server-row[data-server="${name}"], .server-detail-row[data-server="${name}"]`).remove();
+      delete window.serversData[name];
+    });
+    
+    for (const [name, s] of Object.entries(delta.changed || {})) {
+      const $row = $(`.server-row[data-server="${name}"]`);
+      const $detail = $(`.server-detail-row[data-server="${name}"]`);
+      const $new = $($.parseHTML(renderServerRow(s, selectedServers).trim())).filter('tr');
+      if ($row.length) {
+        // 펼쳐 둔 상세 행은 그대로 펼친 상태 유지
+        if ($detail.is(':visible')) {
+          $new.filter('.server-detail-row').show();
+          $new.find('.expand-icon').css('transform', 'rotate(90deg)');
+        }
+        $detail.remove();
+        $row.replaceWith($new);
+      } else {
+        $tbody.append($new);
+      }
+      window.serversData[name] = s;
+    }
+    
+    const serverCount = Object.keys(window.serversData).length;
+    $('#server-count').text(`${serverCount}개`);
+    if (serverCount === 0) {
+      showEmptyState();
+    }
+    updateSelectAllState();
+    updateBulkActionsToolbar();
+    bindServerNameCells();
+    return true;
+  };
+  
   // 현재 뷰 타입 가져오기 (리스트 뷰 전용)
   function getCurrentViewType() {
     return 'table'; // 항상 테이블 뷰
@@ -1378,167 +1402,181 @@ $(function() {
     console.log('[instances.js] 현재 선택된 서버들:', selectedServers);
     
     let html = '';
-    for (const [name, s] of Object.entries(servers)) {
-      // 상태 배지
-      let statusBadge = '';
-      switch(s.status) {
-        case 'running': 
-          statusBadge = '<span class="status-badge status-success">실행 중</span>';
-          break;
-        case 'stopped':
-          statusBadge = '<span class="status-badge status-stopped">중지됨</span>';
-          break;
-        case 'paused':
-          statusBadge = '<span class="status-badge status-warning">일시정지</span>';
-          break;
-        default:
-          statusBadge = '<span class="status-badge status-unknown">' + s.status + '</span>';
-      }
-      
-      // 역할 상태 표시 (개선된 버전)
-      const roleDisplay = (() => {
-        if (!s.role || s.role === '' || s.role === null || s.role === undefined) {
-          return '<span class="text-muted">(설정 안 함)</span>';
-      } else {
-          return window.dashboardRoleMap[s.role] || s.role;
-      }
-      })();   
-      
-      // Security Group 상태 표시
-      const securityGroupDisplay = s.firewall_group ? s.firewall_group : '<span class="text-muted">(설정 안 함)</span>';
-      
-      // IP 주소 표시
-      const ipAddresses = (s.ip_addresses && s.ip_addresses.length > 0) 
-        ? s.ip_addresses.join(', ') 
-        : '미할당';
-      
-      // 메모리 포맷팅 (GB)
-      const memoryGB = ((s.memory || 0) / 1024 / 1024 / 1024).toFixed(1);
-      
-      // 체크박스 상태 복원
-      const isChecked = selectedServers.includes(s.name) ? 'checked' : '';
-      
-      const serverRow = `
-        <tr class="server-row" data-server="${s.name}" data-status="${s.status}" data-role="${s.role || ''}" data-memory="${s.memory || 0}" data-cpu="${s.vm_cpu || 0}">
-          <td class="select-column">
-            <input type="checkbox" class="form-check-input server-checkbox" value="${s.name}" ${isChecked}>
-          </td>
-          <td class="server-name-cell" style="cursor: pointer;">
-            <div class="d-flex align-items-center">
-              <i class="fas fa-chevron-right expand-icon me-2" style="transition: transform 0.2s;"></i>
-              <strong>${s.name}</strong>
-            </div>
-          </td>
-          <td>${statusBadge}</td>
-          <td class="role-column">
-            <div class="role-display">
-              <i class="fas fa-tag me-1 text-muted"></i>
-              ${roleDisplay}
-            </div>
-          </td>
-          <td>${s.vm_cpu || 0}코어</td>
-          <td>${memoryGB}GB</td>
-          <td>${ipAddresses}</td>
-          <td class="security-column">
-            <div class="security-group-display">
-              <i class="fas fa-shield-alt me-1 text-muted"></i>
-              ${securityGroupDisplay}
-            </div>
-          </td>
-          <td>
-            <div class="table-actions">
-              <button class="btn btn-success btn-sm start-btn" title="시작" ${s.status === 'running' ? 'disabled' : ''}>
-                <i class="fas fa-play"></i>
-              </button>
-              <button class="btn btn-warning btn-sm stop-btn" title="중지" ${s.status === 'stopped' ? 'disabled' : ''}>
-                <i class="fas fa-pause"></i>
-              </button>
-              <button class="btn btn-info btn-sm reboot-btn" title="재시작" ${s.status === 'stopped' ? 'disabled' : ''}>
-                <i class="fas fa-redo"></i>
-              </button>
-              <button class="btn btn-danger btn-sm delete-btn" title="삭제">
-                <i class="fas fa-trash"></i>
-              </button>
-            </div>
-          </td>
-        </tr>
-        <tr class="server-detail-row" data-server="${s.name}" style="display: none;">
-          <td colspan="9">
-            <div class="server-detail-content p-3 bg-light border-top">
-              <div class="row">
-                <div class="col-md-6">
-                  <h6 class="mb-3"><i class="fas fa-info-circle text-primary"></i> 서버 상세 정보</h6>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>VM ID:</strong></div>
-                    <div class="col-8">${s.vmid || 'N/A'}</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>노드:</strong></div>
-                    <div class="col-8">${s.node || 'N/A'}</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>CPU 할당:</strong></div>
-                    <div class="col-8">${s.vm_cpu || s.cpu || 0} 코어</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>메모리 할당:</strong></div>
-                    <div class="col-8">${Math.round((s.maxmem || s.memory || 0) / (1024 * 1024 * 1024))} GB</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>디스크 할당:</strong></div>
-                    <div class="col-8">
-                      ${s.total_disk_gb || Math.round((s.maxdisk || s.disk || 0) / (1024 * 1024 * 1024))} GB (총합)
-                      ${s.disks && s.disks.length > 0 ? 
-                        '<br><small class="text-muted">' + 
-                        s.disks.map(disk => `${disk.device}: ${disk.size_gb}GB (${disk.storage})`).join(', ') + 
-                        '</small>' : 
-                        ''
-                      }
-                    </div>
-                  </div>
+    for (const s of Object.values(servers)) {
+      html += renderServerRow(s, selectedServers);
+    }
+    
+    $('#servers-table tbody').html(html);
+    
+    updateSelectAllState();
+    
+    // 일괄 작업 도구모음 상태 업데이트
+    updateBulkActionsToolbar();
+    
+    bindServerNameCells();
+  }
+  
+  // 서버 한 대의 목록 행 + 상세 행 HTML
+  function renderServerRow(s, selectedServers) {
+    // 상태 배지
+    let statusBadge = '';
+    switch(s.status) {
+      case 'running': 
+        statusBadge = '<span class="status-badge status-success">실행 중</span>';
+        break;
+      case 'stopped':
+        statusBadge = '<span class="status-badge status-stopped">중지됨</span>';
+        break;
+      case 'paused':
+        statusBadge = '<span class="status-badge status-warning">일시정지</span>';
+        break;
+      default:
+        statusBadge = '<span class="status-badge status-unknown">' + s.status + '</span>';
+    }
+    
+    // 역할 상태 표시 (개선된 버전)
+    const roleDisplay = (() => {
+      if (!s.role || s.role === '' || s.role === null || s.role === undefined) {
+        return '<span class="text-muted">(설정 안 함)</span>';
+    } else {
+        return window.dashboardRoleMap[s.role] || s.role;
+    }
+    })();   
+    
+    // Security Group 상태 표시
+    const securityGroupDisplay = s.firewall_group ? s.firewall_group : '<span class="text-muted">(설정 안 함)</span>';
+    
+    // IP 주소 표시
+    const ipAddresses = (s.ip_addresses && s.ip_addresses.length > 0) 
+      ? s.ip_addresses.join(', ') 
+      : '미할당';
+    
+    // 메모리 포맷팅 (GB)
+    const memoryGB = ((s.memory || 0) / 1024 / 1024 / 1024).toFixed(1);
+    
+    // 체크박스 상태 복원
+    const isChecked = selectedServers.includes(s.name) ? 'checked' : '';
+    
+    const serverRow = `
+      <tr class="server-row" data-server="${s.name}" data-status="${s.status}" data-role="${s.role || ''}" data-memory="${s.memory || 0}" data-cpu="${s.vm_cpu || 0}">
+        <td class="select-column">
+          <input type="checkbox" class="form-check-input server-checkbox" value="${s.name}" ${isChecked}>
+        </td>
+        <td class="server-name-cell" style="cursor: pointer;">
+          <div class="d-flex align-items-center">
+            <i class="fas fa-chevron-right expand-icon me-2" style="transition: transform 0.2s;"></i>
+            <strong>${s.name}</strong>
+          </div>
+        </td>
+        <td>${statusBadge}</td>
+        <td class="role-column">
+          <div class="role-display">
+            <i class="fas fa-tag me-1 text-muted"></i>
+            ${roleDisplay}
+          </div>
+        </td>
+        <td>${s.vm_cpu || 0}코어</td>
+        <td>${memoryGB}GB</td>
+        <td>${ipAddresses}</td>
+        <td class="security-column">
+          <div class="security-group-display">
+            <i class="fas fa-shield-alt me-1 text-muted"></i>
+            ${securityGroupDisplay}
+          </div>
+        </td>
+        <td>
+          <div class="table-actions">
+            <button class="btn btn-success btn-sm start-btn" title="시작" ${s.status === 'running' ? 'disabled' : ''}>
+              <i class="fas fa-play"></i>
+            </button>
+            <button class="btn btn-warning btn-sm stop-btn" title="중지" ${s.status === 'stopped' ? 'disabled' : ''}>
+              <i class="fas fa-pause"></i>
+            </button>
+            <button class="btn btn-info btn-sm reboot-btn" title="재시작" ${s.status === 'stopped' ? 'disabled' : ''}>
+              <i class="fas fa-redo"></i>
+            </button>
+            <button class="btn btn-danger btn-sm delete-btn" title="삭제">
+              <i class="fas fa-trash"></i>
+            </button>
+          </div>
+        </td>
+      </tr>
+      <tr class="server-detail-row" data-server="${s.name}" style="display: none;">
+        <td colspan="9">
+          <div class="server-detail-content p-3 bg-light border-top">
+            <div class="row">
+              <div class="col-md-6">
+                <h6 class="mb-3"><i class="fas fa-info-circle text-primary"></i> 서버 상세 정보</h6>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>VM ID:</strong></div>
+                  <div class="col-8">${s.vmid || 'N/A'}</div>
                 </div>
-                <div class="col-md-6">
-                  <h6 class="mb-3"><i class="fas fa-network-wired text-success"></i> 네트워크 정보</h6>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>IP 주소:</strong></div>
-                    <div class="col-8">${ipAddresses}</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>방화벽 그룹:</strong></div>
-                    <div class="col-8">${s.firewall_group || '미설정'}</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>역할:</strong></div>
-                    <div class="col-8">${s.role ? window.dashboardRoleMap[s.role] || s.role : '미설정'}</div>
-                  </div>
-                  <div class="row mb-2">
-                    <div class="col-4"><strong>상태:</strong></div>
-                    <div class="col-8">${s.status}</div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>노드:</strong></div>
+                  <div class="col-8">${s.node || 'N/A'}</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>CPU 할당:</strong></div>
+                  <div class="col-8">${s.vm_cpu || s.cpu || 0} 코어</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>메모리 할당:</strong></div>
+                  <div class="col-8">${Math.round((s.maxmem || s.memory || 0) / (1024 * 1024 * 1024))} GB</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>디스크 할당:</strong></div>
+                  <div class="col-8">
+                    ${s.total_disk_gb || Math.round((s.maxdisk || s.disk || 0) / (1024 * 1024 * 1024))} GB (총합)
+                    ${s.disks && s.disks.length > 0 ? 
+                      '<br><small class="text-muted">' + 
+                      s.disks.map(disk => `${disk.device}: ${disk.size_gb}GB (${disk.storage})`).join(', ') + 
+                      '</small>' : 
+                      ''
+                    }
                   </div>
                 </div>
               </div>
-              <div class="mt-3">
-                <button class="btn btn-outline-primary btn-sm me-2" onclick="openServerConfig('${s.name}')">
-                  <i class="fas fa-cog"></i> 서버 설정
-                </button>
-                <button class="btn btn-outline-info btn-sm me-2" onclick="viewServerLogs('${s.name}')">
-                  <i class="fas fa-file-alt"></i> 로그 보기
-                </button>
-                <button class="btn btn-outline-warning btn-sm" onclick="backupServer('${s.name}')">
-                  <i class="fas fa-download"></i> 백업
-                </button>
+              <div class="col-md-6">
+                <h6 class="mb-3"><i class="fas fa-network-wired text-success"></i> 네트워크 정보</h6>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>IP 주소:</strong></div>
+                  <div class="col-8">${ipAddresses}</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>방화벽 그룹:</strong></div>
+                  <div class="col-8">${s.firewall_group || '미설정'}</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>역할:</strong></div>
+                  <div class="col-8">${s.role ? window.dashboardRoleMap[s.role] || s.role : '미설정'}</div>
+                </div>
+                <div class="row mb-2">
+                  <div class="col-4"><strong>상태:</strong></div>
+                  <div class="col-8">${s.status}</div>
+                </div>
               </div>
             </div>
-          </td>
-        </tr>
-      `;
-      
-      html += serverRow;
-    }
-    
-    $('#servers-table tbody').html(html);
+            <div class="mt-3">
+              <button class="btn btn-outline-primary btn-sm me-2" onclick="openServerConfig('${s.name}')">
+                <i class="fas fa-cog"></i> 서버 설정
+              </button>
+              <button class="btn btn-outline-info btn-sm me-2" onclick="viewServerLogs('${s.name}')">
+                <i class="fas fa-file-alt"></i> 로그 보기
+              </button>
+              <button class="btn btn-outline-warning btn-sm" onclick="backupServer('${s.name}')">
+                <i class="fas fa-download"></i> 백업
+              </button>
+            </div>
+          </div>
+        </td>
+      </tr>
+    `;
     
-    // 전체 선택 체크박스 상태 복원
+    return serverRow;
+  }
+  
+  // 전체 선택 체크박스 상태 복원
+  function updateSelectAllState() {
     const totalCheckboxes = $('.server-checkbox').length;
     const checkedCheckboxes = $('.server-checkbox:checked').length;
     
@@ -1549,11 +1587,10 @@ $(function() {
     } else {
       $('#select-all-servers').prop('indeterminate', true);
     }
-    
-    // 일괄 작업 도구모음 상태 업데이트
-    updateBulkActionsToolbar();
-    
-    // 서버 이름 클릭 이벤트 바인딩
+  }
+  
+  // 서버 이름 클릭 시 상세 행 펼치기/접기
+  function bindServerNameCells() {
     $('.server-name-cell').off('click').on('click', function(e) {
       e.stopPropagation();
       const serverName = $(this).closest('tr').data('server');
@@ -1590,9 +1627,101 @@ $(function() {
     loadActiveServers();
   });
 
-  // 작업 상태 폴링 제거: SSE만 사용
-  // pollTaskStatus는 더 이상 사용하지 않지만, 기존 호출부를 안전하게 무시하기 위해 no-op으로 유지
-  function pollTaskStatus() { /* SSE 전환으로 미사용 */ }
+  // 작업 진행 스트림 구독 (/api/tasks/<task_id>/progress/stream)
+  // handlers: onProgress(event), onLog(lines), onDone(event) / 반환값: 구독 해제 함수
+  // EventSource를 쓸 수 없거나 스트림이 닫히면(503, 세션 만료 등) 작업 상태 조회(5초 주기)로 대체
+  window.watchTaskProgress = function(taskId, handlers) {
+    handlers = handlers || {};
+    let source = null;
+    let pollTimer = null;
+    let finished = false;
+    
+    function stop() {
+      if (source) {
+        source.close();
+        source = null;
+      }
+      if (pollTimer) {
+        clearInterval(pollTimer);
+        pollTimer = null;
+      }
+    }
+    
+    function finish(event) {
+      if (finished) return;
+      finished = true;
+      stop();
+      if (handlers.onDone) handlers.onDone(event);
+    }
+    
+    function startPolling() {
+      if (pollTimer || finished) return;
+      pollTimer = setInterval(function() {
+        $.get(`/api/tasks/${taskId}/status`, function(res) {
+          if (res.status === 'running' || res.state === 'PROGRESS') {
+            if (handlers.onProgress) handlers.onProgress({ type: 'progress', progress: res.progress, message: res.message });
+          } else if (res.status === 'completed' || res.state === 'SUCCESS') {
+            const result = res.result || {};
+            finish({ type: 'done', state: 'SUCCESS', success: result.success !== false, message: result.message || result.error });
+          } else if (res.status === 'failed' || res.state === 'FAILURE') {
+            finish({ type: 'done', state: 'FAILURE', success: false, message: res.error });
+          }
+        });
+      }, 5000);
+    }
+    
+    if (!window.EventSource) {
+      startPolling();
+      return stop;
+    }
+    
+    source = new EventSource(`/api/tasks/${taskId}/progress/stream`);
+    source.onmessage = function(e) {
+      let event;
+      try {
+        event = JSON.parse(e.data);
+      } catch (err) {
+        return;
+      }
+      if (event.type === 'progress') {
+        if (handlers.onProgress) handlers.onProgress(event);
+      } else if (event.type === 'log') {
+        if (handlers.onLog) handlers.onLog(event.lines || []);
+      } else if (event.type === 'done') {
+        finish(event);
+      } else if (event.type === 'error') {
+        stop();
+        startPolling();
+      }
+    };
+    source.onerror = function() {
+      // 일시적인 끊김은 브라우저가 Last-Event-ID로 이어서 재연결
+      if (source && source.readyState === EventSource.CLOSED) {
+        source = null;
+        startPolling();
+      }
+    };
+    return stop;
+  };
+  
+  // 완료/실패 알림은 SSE 알림으로 표시되므로 여기서는 진행 상황만 구독해 document 이벤트로 알림
+  // ($(document).on('task:progress task:log task:done', function(e, taskId, data, type, label) { ... }))
+  function pollTaskStatus(taskId, type, label) {
+    if (!taskId) return;
+    window.watchTaskProgress(taskId, {
+      onProgress: function(event) {
+        console.log(`[instances.js] 작업 진행 (${label || type}): ${event.progress}% - ${event.message}`);
+        $(document).trigger('task:progress', [taskId, event, type, label]);
+      },
+      onLog: function(lines) {
+        $(document).trigger('task:log', [taskId, lines, type, label]);
+      },
+      onDone: function(event) {
+        console.log(`[instances.js] 작업 종료 (${label || type}): ${event.state}`);
+        $(document).trigger('task:done', [taskId, event, type, label]);
+      }
+    });
+  }
 
 
   // AJAX 전역 설정 - 세션 만료 처리
@@ -8,6 +8,8 @@ console.log('[navigation.js] 상단 네비게이션 관리 모듈 로드됨');
 // 전역 알림 관리
 window.systemNotifications = window.systemNotifications || [];
 window.notificationEventSource = window.notificationEventSource || null;
+// 마지막으로 받은 알림 id (재연결 시 이후 알림만 받도록 전달)
+window.lastNotificationEventId = window.lastNotificationEventId || 0;
 
 /**
  * SSE 연결 초기화
@@ -17,10 +19,22 @@ function initNotificationStream() {
     window.notificationEventSource.close();
   }
   
-  window.notificationEventSource = new EventSource('/notifications/stream');
+  // EVENT_GATEWAY_URL이 설정되어 있으면 비동기 이벤트 게이트웨이로 연결 (세션 쿠키 포함)
+  const gatewayUrl = window.EVENT_GATEWAY_URL || '';
+  let streamUrl = gatewayUrl + '/notifications/stream';
+  if (window.lastNotificationEventId) {
+    streamUrl += '?last_event_id=' + encodeURIComponent(window.lastNotificationEventId);
+  }
+  window.notificationEventSource = gatewayUrl
+    ? new EventSource(streamUrl, { withCredentials: true })
+    : new EventSource(streamUrl);
   
   window.notificationEventSource.onmessage = function(event) {
     console.log(`🔔 SSE 이벤트 수신:`, event.data);
+    const eventId = parseInt(event.lastEventId, 10);
+    if (eventId > window.lastNotificationEventId) {
+      window.lastNotificationEventId = eventId;
+    }
     try {
       const data = JSON.parse(event.data);
       console.log(`🔔 SSE 파싱된 데이터:`, data);
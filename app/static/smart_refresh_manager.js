@@ -1,8 +1,46 @@
 /**
  * 스마트 실시간 갱신 관리자
  * 사용자 작업 중에는 갱신을 중단하고, 작업 완료 시 자동으로 재개하는 시스템
+ * 서버 이벤트 스트림(/events/servers)이 연결되어 있으면 밀려 오는 변경분만 반영하고,
+ * 끊긴 동안에만 10초 주기로 변경 조회한다.
  */
 
+/**
+ * 조건부 GET (ETag / If-None-Match)
+ * 서버가 304를 반환하면 마지막으로 받은 응답을 재사용하고 modified=false로 알린다.
+ * 사용: conditionalGet(url).done(function(data, modified) { ... })
+ */
+(function() {
+  const responseCache = {};
+
+  window.conditionalGet = function(url) {
+    const deferred = $.Deferred();
+    const cached = responseCache[url];
+
+    $.ajax({
+      url: url,
+      method: 'GET',
+      headers: cached ? { 'If-None-Match': cached.etag } : {}
+    }).done(function(data, textStatus, xhr) {
+      if (xhr.status === 304 && cached) {
+        deferred.resolve(cached.data, false);
+        return;
+      }
+      const etag = xhr.getResponseHeader('ETag');
+      if (etag) {
+        responseCache[url] = { etag: etag, data: data };
+      } else {
+        delete responseCache[url];
+      }
+      deferred.resolve(data, true);
+    }).fail(function(xhr, textStatus, error) {
+      deferred.reject(xhr, textStatus, error);
+    });
+
+    return deferred.promise();
+  };
+})();
+
 $(function() {
 
   // 스마트 갱신 관리자 상태
@@ -120,23 +158,265 @@ $(function() {
    * 실제 갱신 실행
    */
   function executeRefresh() {
-    // 대시보드에서만 리소스 상태 갱신 (인스턴스 페이지 제외)
     const currentHash = window.location.hash;
     
-    if (currentHash === '#dashboard' || currentHash === '') {
-      if (typeof window.loadActiveServers === 'function') {
+    if (currentHash === '#dashboard' || currentHash === '' || currentHash === '#instances') {
+      if (window.inventoryGeneration !== undefined && window.inventoryGeneration !== null) {
+        // 마지막으로 받은 세대 이후 바뀐 서버만 받아 해당 행만 갱신
+        syncServerChanges();
+      } else if (currentHash !== '#instances' && typeof window.loadActiveServers === 'function') {
         // 상태 변경 확인 후 새로고침
         checkServerStatusChanges();
       }
     }
     
-    // 인스턴스 페이지에서는 자동 새로고침 하지 않음
-    // 사용자가 작업을 수행할 때만 상태 업데이트
-    
     // 알림은 페이지 로드 시에만 로드하고, 이후에는 자동 갱신하지 않음
     // (알림이 새로 생성될 때만 표시)
   }
 
+  /**
+   * 세대 번호 기준 변경분 동기화 (/api/servers/changes)
+   */
+  function syncServerChanges() {
+    const since = window.inventoryGeneration;
+    
+    $.get('/api/servers/changes', { since: since }, function(res) {
+      if (!res.success || res.generation === since) {
+        return;
+      }
+      
+      if (res.reset) {
+        // 변경 로그로 메울 수 없는 간격 - 현재 화면 전체 다시 로드
+        console.log(`[smart_refresh] 변경 로그 없음 (세대 ${since} → ${res.generation}) - 전체 새로고침`);
+        reloadCurrentServerView();
+        return;
+      }
+      
+      applyInventoryDelta(res);
+    }).fail(function(xhr) {
+      console.error('[smart_refresh] 서버 변경 조회 실패:', xhr);
+    });
+  }
+
+  /**
+   * 세대 변경분(변경 조회 응답 또는 inventory 이벤트)을 현재 화면에 반영
+   */
+  function applyInventoryDelta(delta) {
+    const changedCount = Object.keys(delta.changed || {}).length;
+    const removedCount = (delta.removed || []).length;
+    console.log(`[smart_refresh] 세대 ${delta.since} → ${delta.generation}: 변경 ${changedCount}개, 삭제 ${removedCount}개`);
+    
+    // 실제 상태가 도착한 서버는 작업 중 전이 상태 표시 종료
+    Object.keys(delta.changed || {}).concat(delta.removed || []).forEach(function(name) {
+      delete serverStream.transitions[name];
+    });
+    
+    if (applyToServerViews(delta)) {
+      window.inventoryGeneration = delta.generation;
+    } else {
+      reloadCurrentServerView();
+    }
+  }
+
+  function applyToServerViews(delta) {
+    let applied = false;
+    if (typeof window.applyServerChanges === 'function') {
+      applied = window.applyServerChanges(delta) || applied;
+    }
+    if (typeof window.applyDashboardChanges === 'function') {
+      applied = window.applyDashboardChanges(delta) || applied;
+    }
+    return applied;
+  }
+
+  /**
+   * 현재 화면의 서버 목록 전체 다시 로드
+   */
+  function reloadCurrentServerView() {
+    if (window.location.hash === '#instances') {
+      if (typeof window.loadActiveServers === 'function') {
+        window.loadActiveServers();
+      }
+    } else if (typeof window.loadDashboardServers === 'function') {
+      window.loadDashboardServers();
+    }
+  }
+
+  // ------------------------------------------------------------------
+  // 서버 이벤트 스트림 (/events/servers)
+  // 연결되어 있는 동안에는 밀려 오는 변경분만 반영하고 주기 조회는 하지 않는다.
+  // 연결이 끊기면 다시 연결될 때까지 기존 10초 주기 조회로 동작한다.
+  // ------------------------------------------------------------------
+  const serverStream = {
+    eventSource: null,
+    connected: false,
+    reconnectTimer: null,
+    syncTimer: null,
+    reconnectDelay: 5000,
+    // 작업 진행 중 표시한 전이 상태: { 서버명: { status, previousStatus } }
+    transitions: {}
+  };
+
+  function connectServerEventStream() {
+    if (!window.EventSource || serverStream.eventSource) {
+      return;
+    }
+    const gatewayUrl = window.EVENT_GATEWAY_URL || '';
+    let url = gatewayUrl + '/events/servers';
+    if (window.inventoryGeneration !== undefined && window.inventoryGeneration !== null) {
+      url += '?last_event_id=' + encodeURIComponent(window.inventoryGeneration);
+    }
+    
+    const eventSource = gatewayUrl ? new EventSource(url, { withCredentials: true }) : new EventSource(url);
+    serverStream.eventSource = eventSource;
+    
+    eventSource.onopen = function() {
+      serverStream.connected = true;
+      console.log('[smart_refresh] 서버 이벤트 스트림 연결 - 주기 조회 중지');
+    };
+    
+    eventSource.onmessage = function(event) {
+      let data;
+      try {
+        data = JSON.parse(event.data);
+      } catch (e) {
+        return;
+      }
+      handleServerStreamEvent(data);
+    };
+    
+    eventSource.onerror = function() {
+      if (serverStream.connected) {
+        console.warn('[smart_refresh] 서버 이벤트 스트림 끊김 - 주기 조회로 전환');
+      }
+      serverStream.connected = false;
+      if (eventSource.readyState === EventSource.CLOSED) {
+        // 브라우저가 재연결을 포기한 경우(401 등) 직접 다시 연결
+        serverStream.eventSource = null;
+        clearTimeout(serverStream.reconnectTimer);
+        serverStream.reconnectTimer = setTimeout(connectServerEventStream, serverStream.reconnectDelay);
+      }
+    };
+  }
+
+  function handleServerStreamEvent(data) {
+    switch (data.type) {
+      case 'inventory':
+        handleInventoryEvent(data);
+        break;
+      case 'server':
+        handleServerTaskEvent(data);
+        break;
+      case 'record':
+        // DB만 바뀐 경우(역할/방화벽 그룹 등) 스냅샷 반영 후 변경분 조회
+        scheduleServerSync(2000);
+        break;
+      default:
+        // connected / heartbeat
+        break;
+    }
+  }
+
+  function handleInventoryEvent(event) {
+    const current = window.inventoryGeneration;
+    if (current === undefined || current === null || event.generation === current) {
+      // 화면이 아직 목록을 불러오는 중이면 불러온 세대를 그대로 사용
+      return;
+    }
+    if (!canApplyPushedChanges()) {
+      return;
+    }
+    if (event.since !== current || !event.changed) {
+      // 중간 세대를 놓쳤거나(재연결, 큐 초과) 변경이 많아 행이 생략된 경우 변경 조회로 맞춤
+      syncServerChanges();
+      return;
+    }
+    applyInventoryDelta(event);
+  }
+
+  function handleServerTaskEvent(event) {
+    const task = event.task || {};
+    const name = event.name;
+    
+    if (event.status) {
+      // 작업 진행 중: 현재 화면에 있는 서버만 전이 상태로 표시 (생성 중인 서버는 목록에 없음)
+      const previous = serverStream.transitions[name];
+      const currentStatus = getDisplayedStatus(name);
+      if (currentStatus === undefined) {
+        return;
+      }
+      serverStream.transitions[name] = {
+        status: event.status,
+        previousStatus: previous ? previous.previousStatus : currentStatus
+      };
+      if (currentStatus !== event.status) {
+        patchServerStatus(name, event.status);
+      }
+      return;
+    }
+    
+    if (task.state === 'SUCCESS' || task.state === 'FAILURE') {
+      // 성공 시 실제 상태는 스냅샷 갱신(inventory 이벤트)으로 오므로 잠시 기다렸다가 정리
+      const waitForInventory = task.state === 'SUCCESS' && task.action !== 'reboot';
+      setTimeout(function() { settleTransition(name); }, waitForInventory ? 10000 : 0);
+    }
+  }
+
+  /**
+   * 전이 상태가 그대로 남아 있으면(스냅샷에 변화가 없거나 작업 실패) 작업 전 상태로 되돌림
+   */
+  function settleTransition(name) {
+    const transition = serverStream.transitions[name];
+    if (!transition) {
+      return;
+    }
+    delete serverStream.transitions[name];
+    if (getDisplayedStatus(name) === transition.status) {
+      patchServerStatus(name, transition.previousStatus);
+    }
+    scheduleServerSync(0);
+  }
+
+  function getDisplayedStatus(name) {
+    const server = (window.serversData && window.serversData[name]) ||
+      (window.dashboardServers && window.dashboardServers[name]);
+    return server ? server.status : undefined;
+  }
+
+  /**
+   * 서버 한 대의 상태만 바꿔 행을 다시 그림 (세대 번호는 그대로 유지)
+   */
+  function patchServerStatus(name, status) {
+    if (window.serversData && window.serversData[name] && typeof window.applyServerChanges === 'function') {
+      window.applyServerChanges({ changed: { [name]: Object.assign({}, window.serversData[name], { status: status }) } });
+    }
+    if (window.dashboardServers && window.dashboardServers[name] && typeof window.applyDashboardChanges === 'function') {
+      window.applyDashboardChanges({ changed: { [name]: Object.assign({}, window.dashboardServers[name], { status: status }) } });
+    }
+  }
+
+  function scheduleServerSync(delay) {
+    clearTimeout(serverStream.syncTimer);
+    serverStream.syncTimer = setTimeout(function() {
+      if (canApplyPushedChanges() && window.inventoryGeneration !== undefined && window.inventoryGeneration !== null) {
+        syncServerChanges();
+      }
+    }, delay);
+  }
+
+  /**
+   * 사용자가 작업 중이면 화면을 바꾸지 않고 작업이 끝난 뒤 변경 조회로 한 번에 반영
+   */
+  function canApplyPushedChanges() {
+    updateRefreshStatus();
+    if (smartRefreshManager.isRefreshPaused) {
+      smartRefreshManager.pendingRefresh = true;
+      return false;
+    }
+    const currentHash = window.location.hash;
+    return currentHash === '#dashboard' || currentHash === '' || currentHash === '#instances';
+  }
+
   /**
    * 서버 상태 및 설정 변경 확인
    */
@@ -153,8 +433,12 @@ $(function() {
       };
     });
 
-    // 서버 상태만 조회 (전체 새로고침 대신)
-    $.get('/api/all_server_status', function(res) {
+    // 서버 상태만 조회 (전체 새로고침 대신, 스냅샷 세대가 같으면 304)
+    conditionalGet('/api/all_server_status').done(function(res, modified) {
+      if (!modified) {
+        console.log('[smart_refresh] 변경 없음 (304) - 새로고침 건너뜀');
+        return;
+      }
       let hasChange = false;
       
       // 상태 및 설정 변경 확인
@@ -227,6 +511,11 @@ $(function() {
     smartRefreshManager.refreshInterval = setInterval(function() {
       updateRefreshStatus();
       
+      if (serverStream.connected) {
+        // 이벤트 스트림으로 변경분을 받는 중이므로 주기 조회 불필요
+        return;
+      }
+      
       if (!smartRefreshManager.isRefreshPaused) {
         executeRefresh();
       } else {
@@ -318,16 +607,20 @@ $(function() {
     // 초기 상태 표시
     showRefreshStatus('active');
     
-    // 스마트 갱신 타이머 시작
+    // 스마트 갱신 타이머 시작 (이벤트 스트림이 끊긴 동안의 대체 수단)
     startSmartRefreshTimer();
     
+    // 서버 이벤트 스트림 연결
+    connectServerEventStream();
+    
     // 전역 함수로 노출
     window.smartRefreshManager = {
       pause: pauseAutoRefresh,
       resume: resumeAutoRefresh,
       refresh: executeRefresh,
       isWorking: () => smartRefreshManager.isUserWorking,
-      isPaused: () => smartRefreshManager.isRefreshPaused
+      isPaused: () => smartRefreshManager.isRefreshPaused,
+      isStreaming: () => serverStream.connected
     };
   }
 
@@ -5,6 +5,7 @@ import logging
 import time
 import uuid
 from app.celery_app import celery_app
+from app.utils.task_progress import report_progress
 from app import db
 
 logger = logging.getLogger(__name__)
@@ -61,31 +62,23 @@ def create_server_backup_async(self, server_name: str, backup_config: dict):
     try:
         logger.info(f"💾 비동기 서버 백업 시작: {server_name}")
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 10, 'message': f'서버 {server_name} 백업 준비 중...'}
-        )
+        report_progress(self, 10, f'서버 {server_name} 백업 준비 중...')
         
         # ProxmoxService를 사용하여 백업 생성
         from app.services.proxmox_service import ProxmoxService
         proxmox_service = ProxmoxService()
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 30, 'message': f'Proxmox 백업 API 호출 중...'}
-        )
+        report_progress(self, 30, f'Proxmox 백업 API 호출 중...')
         
         result = proxmox_service.create_server_backup(server_name, backup_config)
         
         if result['success']:
-            self.update_state(
-                state='PROGRESS',
-                meta={'progress': 60, 'message': f'백업 작업 시작됨, 파일 감지 중...'}
-            )
+            report_progress(self, 60, f'백업 작업 시작됨, 파일 감지 중...')
             
             # 백업 파일 감지 시작
             backup_id = str(uuid.uuid4())
-            start_file_monitoring_async.delay(server_name, backup_id)
+            upid = (result.get('data') or {}).get('task_id')
+            start_file_monitoring_async.delay(server_name, backup_id, upid)
             
             # 성공 알림
             from app.models.notification import Notification
@@ -144,15 +137,16 @@ def create_server_backup_async(self, server_name: str, backup_config: dict):
         }
 
 @celery_app.task(bind=True)
-def start_file_monitoring_async(self, server_name: str, backup_id: str):
-    """비동기 백업 파일 감지"""
+def start_file_monitoring_async(self, server_name: str, backup_id: str, upid: str = None):
+    """비동기 백업 완료 감지
+
+    vzdump 작업 UPID가 있으면 작업 추적기로 종료 시점을 바로 감지하고,
+    없으면 기존처럼 백업 파일 목록을 주기적으로 확인한다.
+    """
     try:
         logger.info(f"🔍 백업 파일 감지 시작: {server_name} (ID: {backup_id})")
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 10, 'message': f'백업 파일 감지 중...'}
-        )
+        report_progress(self, 10, f'백업 파일 감지 중...')
         
         # 백업 상태 관리 (기존 로직 활용)
         from app.routes.backup import backup_status, update_backup_status
@@ -166,6 +160,9 @@ def start_file_monitoring_async(self, server_name: str, backup_id: str):
             'last_check': time.time()
         }
         
+        if upid:
+            return _wait_backup_task(self, server_name, upid)
+        
         # 파일 감지 로직 (기존 코드 활용)
         max_wait_time = 300  # 5분
         check_interval = 10  # 10초마다 체크
@@ -214,10 +211,7 @@ def start_file_monitoring_async(self, server_name: str, backup_id: str):
                 
                 # 진행 상태 업데이트
                 progress = min(90, 10 + (elapsed_time / max_wait_time) * 80)
-                self.update_state(
-                    state='PROGRESS',
-                    meta={'progress': progress, 'message': f'백업 파일 감지 중... ({elapsed_time}초 경과)'}
-                )
+                report_progress(self, progress, f'백업 파일 감지 중... ({elapsed_time}초 경과)')
                 
                 time.sleep(check_interval)
                 elapsed_time += check_interval
@@ -268,3 +262,96 @@ def start_file_monitoring_async(self, server_name: str, backup_id: str):
             'error': f'백업 파일 감지 실패: {str(e)}',
             'message': f'서버 {server_name} 백업 감지 실패'
         }
+
+
+def _wait_backup_task(task, server_name: str, upid: str, max_wait_time: int = 1800):
+    """vzdump UPID 종료까지 대기 후 백업 상태/알림 갱신"""
+    from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
+    from app.routes.backup import update_backup_status
+    from app.services.proxmox_service import ProxmoxService
+    from app.models.notification import Notification
+    
+    proxmox_service = ProxmoxService()
+    future = proxmox_service.task_tracker.track(upid)
+    started = time.time()
+    task_result = None
+    
+    # 작업 종료 시 즉시 깨어나며, 대기 중에는 진행 상태만 갱신
+    while future is not None and time.time() - started < max_wait_time:
+        try:
+            task_result = future.result(timeout=10)
+            break
+        except FutureTimeoutError:
+            elapsed = int(time.time() - started)
+            progress = min(90, 10 + (elapsed / max_wait_time) * 80)
+            report_progress(task, progress, f'백업 진행 중... ({elapsed}초 경과)')
+        except CancelledError:
+            # 추적기가 max_age로 추적을 중단한 경우
+            break
+    
+    if task_result is None:
+        if future is not None:
+            proxmox_service.task_tracker.release(upid)
+        update_backup_status(server_name, 'timeout', '백업 작업 대기 타임아웃')
+        notification = Notification(
+            type='backup',
+            title=f'서버 {server_name} 백업 타임아웃',
+            message=f'백업 작업 완료 대기가 타임아웃되었습니다.',
+            severity='warning',
+            details=f'UPID: {upid}'
+        )
+        if safe_db_add(notification):
+            safe_db_commit()
+        logger.warning(f"⚠️ 백업 작업 대기 타임아웃: {server_name} ({upid})")
+        return {
+            'success': False,
+            'message': f'서버 {server_name} 백업 작업 대기 타임아웃',
+            'server_name': server_name
+        }
+    
+    if not task_result['success']:
+        update_backup_status(server_name, 'failed', f'백업 실패: {task_result["exitstatus"]}')
+        notification = Notification(
+            type='backup',
+            title=f'서버 {server_name} 백업 실패',
+            message=f'백업 작업이 실패했습니다: {task_result["exitstatus"]}',
+            severity='error',
+            details=f'UPID: {upid}'
+        )
+        if safe_db_add(notification):
+            safe_db_commit()
+        logger.error(f"❌ 백업 작업 실패: {server_name} ({task_result['exitstatus']})")
+        return {
+            'success': False,
+            'message': f'서버 {server_name} 백업 실패: {task_result["exitstatus"]}',
+            'server_name': server_name
+        }
+    
+    # 완료된 백업 파일명 확인 (1회 조회)
+    backup_name = '알 수 없음'
+    try:
+        backup_result = proxmox_service.get_server_backups(server_name)
+        backups = (backup_result.get('data') or {}).get('backups') or []
+        if backups:
+            backup_name = backups[0].get('name', backup_name)
+    except Exception as e:
+        logger.warning(f"⚠️ 백업 파일 조회 실패: {e}")
+    
+    update_backup_status(server_name, 'completed', f'백업 완료: {backup_name}')
+    notification = Notification(
+        type='backup',
+        title=f'서버 {server_name} 백업 완료',
+        message=f'백업이 성공적으로 완료되었습니다.',
+        severity='success',
+        details=f'파일: {backup_name}'
+    )
+    if safe_db_add(notification):
+        safe_db_commit()
+    
+    logger.info(f"✅ 백업 작업 완료: {server_name} ({task_result['waited']}s)")
+    return {
+        'success': True,
+        'message': f'서버 {server_name} 백업 완료',
+        'server_name': server_name,
+        'backup_file': backup_name
+    }
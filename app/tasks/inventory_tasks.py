@@ -0,0 +1,25 @@
+"""
+인벤토리 스냅샷 관련 Celery 작업
+"""
+import logging
+
+from app.celery_app import celery_app
+from app.services.inventory_service import inventory_service
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def refresh_inventory_snapshot(self, server_names=None, reason='scheduled'):
+    """인벤토리 스냅샷 갱신 (beat 주기 실행 또는 변경 작업 후 대상 서버만 갱신)"""
+    try:
+        if server_names:
+            snapshot = inventory_service.refresh_servers(server_names, reason=reason)
+        else:
+            snapshot = inventory_service.refresh(reason=reason)
+        if snapshot is None:
+            return {'success': False, 'reason': reason}
+        return {'success': True, 'generation': snapshot['generation'], 'reason': reason}
+    except Exception as e:
+        logger.error(f"❌ 인벤토리 스냅샷 갱신 실패 ({reason}): {e}")
+        return {'success': False, 'reason': reason, 'error': str(e)}
@@ -4,6 +4,7 @@
 import logging
 import time
 from app.celery_app import celery_app
+from app.utils.task_progress import report_progress
 from app import db
 
 logger = logging.getLogger(__name__)
@@ -61,10 +62,7 @@ def assign_role_async(self, server_name: str, role: str):
         logger.info(f"🔧 비동기 역할 할당 시작: {server_name} → {role}")
         
         # 상태 업데이트
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 10, 'message': f'서버 {server_name}에 역할 {role} 할당 중...'}
-        )
+        report_progress(self, 10, f'서버 {server_name}에 역할 {role} 할당 중...')
         
         from app.services import AnsibleService
         from app.models import Server
@@ -84,10 +82,7 @@ def assign_role_async(self, server_name: str, role: str):
         if not first_ip:
             raise Exception(f'서버 {server_name}의 유효한 IP 주소가 없습니다.')
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 30, 'message': f'Ansible 실행 중...'}
-        )
+        report_progress(self, 30, f'Ansible 실행 중...')
         
         # Ansible 실행
         ansible_service = AnsibleService()
@@ -112,7 +107,9 @@ def assign_role_async(self, server_name: str, role: str):
             db.session.commit()
             logger.info(f"📢 서버 역할 할당 완료 알림 생성: {server_name} → {role}")
             
-            # Redis 캐시 제거됨 - 실시간 조회로 변경
+            # 인벤토리 스냅샷의 역할 정보 갱신
+            from app.services.inventory_service import request_inventory_refresh
+            request_inventory_refresh([server_name], reason='role_assign')
             
             logger.info(f"✅ 비동기 역할 할당 완료: {server_name} → {role}")
             return {
@@ -167,14 +164,12 @@ def assign_role_bulk_async(self, server_names: list, role: str):
         logger.info(f"🔧 비동기 일괄 역할 할당 시작: {len(server_names)}개 서버 → {role}")
         
         # 상태 업데이트
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 10, 'message': f'{len(server_names)}개 서버에 역할 {role} 할당 중...'}
-        )
+        report_progress(self, 10, f'{len(server_names)}개 서버에 역할 {role} 할당 중...')
         
         from app.services import AnsibleService
         from app.models import Server
         from app.models.notification import Notification
+        from app.services.inventory_service import request_inventory_refresh
         
         # 서버 정보 조회 및 IP 주소 수집
         db_servers = Server.query.filter(Server.name.in_(server_names)).all()
@@ -194,10 +189,7 @@ def assign_role_bulk_async(self, server_names: list, role: str):
         if not target_servers:
             raise Exception('선택된 서버들에 유효한 IP가 없습니다.')
         
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 30, 'message': f'Ansible 일괄 실행 중...'}
-        )
+        report_progress(self, 30, f'Ansible 일괄 실행 중...')
         
         # 역할 해제인 경우
         if not role or role == 'none':
@@ -220,16 +212,8 @@ def assign_role_bulk_async(self, server_names: list, role: str):
             if safe_db_add(notification):
                 safe_db_commit()
             
-            # Redis 캐시 무효화 (서버 상태 즉시 반영)
-            try:
-                from app.utils import redis_utils
-                # 모든 서버 관련 캐시 무효화
-                redis_utils.delete_cache("servers:all_status")
-                redis_utils.delete_cache("servers:status")
-                redis_utils.delete_cache("servers:list")
-                logger.info("🧹 Redis 서버 상태 캐시 삭제: servers:all_status, servers:status, servers:list")
-            except Exception as cache_err:
-                logger.warning(f"⚠️ 서버 상태 캐시 삭제 실패: {cache_err}")
+            # 역할이 바뀐 서버의 캐시만 무효화하고 인벤토리 스냅샷에 반영
+            request_inventory_refresh([server.name for server in db_servers], reason='role_bulk_remove')
             
             return {
                 'success': True,
@@ -269,16 +253,8 @@ def assign_role_bulk_async(self, server_names: list, role: str):
             db.session.commit()
             logger.info(f"📢 일괄 역할 할당 완료 알림 생성: {updated_count}개 서버 → {role}")
             
-            # Redis 캐시 무효화 (서버 상태 즉시 반영)
-            try:
-                from app.utils import redis_utils
-                # 모든 서버 관련 캐시 무효화
-                redis_utils.delete_cache("servers:all_status")
-                redis_utils.delete_cache("servers:status")
-                redis_utils.delete_cache("servers:list")
-                logger.info("🧹 Redis 서버 상태 캐시 삭제: servers:all_status, servers:status, servers:list")
-            except Exception as cache_err:
-                logger.warning(f"⚠️ 서버 상태 캐시 삭제 실패: {cache_err}")
+            # 역할이 바뀐 서버의 캐시만 무효화하고 인벤토리 스냅샷에 반영
+            request_inventory_refresh([server.name for server in db_servers], reason='role_bulk_assign')
             
             logger.info(f"✅ 비동기 일괄 역할 할당 완료: {updated_count}개 서버 → {role}")
             return {
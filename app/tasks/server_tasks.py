@@ -4,8 +4,10 @@
 from celery import current_task
 from app.celery_app import celery_app
 from app.services import ProxmoxService, AnsibleService, TerraformService, NotificationService
-# Redis 캐시 제거됨 - 실시간 조회로 변경
 from app.services.cleanup_service import CleanupService
+from app.services.inventory_service import request_inventory_refresh
+from app.services.server_events import publish_server_event
+from app.utils.task_progress import report_progress
 from app.models import Server, Notification
 from app import db
 import logging
@@ -27,10 +29,8 @@ def create_server_async(self, server_config):
         logger.info(f"🚀 비동기 서버 생성 시작: {server_config['name']} (Task ID: {task_id})")
         
         # 작업 상태 업데이트
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 0, 'total': 100, 'status': '서버 생성 준비 중...'}
-        )
+        report_progress(self, 0, '서버 생성 준비 중...')
+        publish_server_event(server_config['name'], 'create', task_id=task_id, progress=0, message='서버 생성 준비 중...')
         
         # 시작 알림은 생성하지 않음 (완료 시에만 알림)
         
@@ -50,20 +50,16 @@ def create_server_async(self, server_config):
             terraform_service = TerraformService()  # 기본 terraform 디렉토리 사용
         
         # 1단계: Terraform 파일 생성
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 20, 'total': 100, 'status': 'Terraform 파일 생성 중...'}
-        )
+        report_progress(self, 20, 'Terraform 파일 생성 중...')
+        publish_server_event(server_config['name'], 'create', task_id=task_id, progress=20, message='Terraform 파일 생성 중...')
         
         terraform_result = terraform_service.create_server_config(server_config)
         if not terraform_result:
             raise Exception("Terraform 파일 생성 실패")
         
         # 2단계: Terraform 실행
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 40, 'total': 100, 'status': 'Terraform 실행 중...'}
-        )
+        report_progress(self, 40, 'Terraform 실행 중...')
+        publish_server_event(server_config['name'], 'create', task_id=task_id, progress=40, message='Terraform 실행 중...')
         
         # Terraform 타겟 형식으로 변환 (module.server["서버명"])
         target = f'module.server["{server_config["name"]}"]'
@@ -72,10 +68,8 @@ def create_server_async(self, server_config):
             raise Exception(f"Terraform 실행 실패: {apply_result[1]}")
         
         # 3단계: 서버 정보 DB 저장
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 60, 'total': 100, 'status': '서버 정보 저장 중...'}
-        )
+        report_progress(self, 60, '서버 정보 저장 중...')
+        publish_server_event(server_config['name'], 'create', task_id=task_id, progress=60, message='서버 정보 저장 중...')
         
         # Server 객체 생성 (안전성 강화)
         print(f"🔍 Server 객체 생성 시작:")  # print로 강제 출력
@@ -134,10 +128,8 @@ def create_server_async(self, server_config):
                 logger.warning(f"⚠️ 서버 생성 확인 실패: {server_config['name']}")
         
         # 4단계: 서버 상태 확인 (간단한 확인만)
-        self.update_state(
-            state='PROGRESS',
-            meta={'current': 80, 'total': 100, 'status': '서버 상태 확인 중...'}
-        )
+        report_progress(self, 80, '서버 상태 확인 중...')
+        publish_server_event(server_config['name'], 'create', task_id=task_id, progress=80, message='서버 상태 확인 중...')
         
         # Terraform으로 생성된 서버는 자동으로 시작되므로 간단한 확인만 수행
         try:
@@ -235,6 +227,9 @@ def create_server_async(self, server_config):
         
         # 최종 결과 처리
         if success:
+            # 새 서버는 스냅샷에 없으므로 전체 재빌드가 수행된다
+            publish_server_event(server_config['name'], 'create', 'SUCCESS', task_id=task_id)
+            request_inventory_refresh([server_config['name']], reason='server_create', tags=['capacity'])
             return {
                 'success': True,
                 'message': f'서버 {server_config["name"]} 생성 완료',
@@ -294,6 +289,7 @@ def create_server_async(self, server_config):
         )
         
         logger.info(f"🧹 예외 발생 시 자동 정리 결과: {cleanup_results}")
+        publish_server_event(server_config['name'], 'create', 'FAILURE', task_id=self.request.id, message=error_msg)
         
         # 예외를 발생시키지 않고 결과만 반환
         return {
@@ -318,29 +314,24 @@ def bulk_server_action_async(self, server_names, action):
             try:
                 # 작업 상태 업데이트
                 progress = int((i / total_servers) * 100)
-                self.update_state(
-                    state='PROGRESS',
-                    meta={
-                        'current': progress,
-                        'total': 100,
-                        'status': f'{server_name} {action} 처리 중... ({i+1}/{total_servers})'
-                    }
-                )
+                report_progress(self, progress, f'{server_name} {action} 처리 중... ({i+1}/{total_servers})')
+                publish_server_event(server_name, action, task_id=task_id, progress=progress,
+                                     message=f'{server_name} {action} 처리 중... ({i+1}/{total_servers})')
                 
                 proxmox_service = ProxmoxService()
                 
                 if action == 'start':
-                    if proxmox_service.start_server(server_name):
+                    if proxmox_service.start_server(server_name).get('success'):
                         success_servers.append(server_name)
                     else:
                         failed_servers.append(server_name)
                 elif action == 'stop':
-                    if proxmox_service.stop_server(server_name):
+                    if proxmox_service.stop_server(server_name).get('success'):
                         success_servers.append(server_name)
                     else:
                         failed_servers.append(server_name)
                 elif action == 'reboot':
-                    if proxmox_service.reboot_server(server_name):
+                    if proxmox_service.reboot_server(server_name).get('success'):
                         success_servers.append(server_name)
                     else:
                         failed_servers.append(server_name)
@@ -385,6 +376,16 @@ def bulk_server_action_async(self, server_names, action):
                 logger.error(f"❌ Prometheus 설정 업데이트 실패: {prometheus_error}")
                 # Prometheus 업데이트 실패는 전체 작업을 실패시키지 않음
         
+        for server_name in success_servers:
+            publish_server_event(server_name, action, 'SUCCESS', task_id=task_id)
+        for server_name in failed_servers:
+            publish_server_event(server_name, action, 'FAILURE', task_id=task_id)
+        
+        # 인벤토리 스냅샷에 변경된 서버 상태 반영
+        if success_servers:
+            request_inventory_refresh(success_servers, reason=f'bulk_{action}',
+                                      tags=['capacity'] if action != 'reboot' else None)
+        
         # 결과에 따른 알림 생성
         if success_servers and not failed_servers:
             # 모든 서버 성공
@@ -447,7 +448,7 @@ def create_servers_bulk_async(self, servers_data):
         logger.info(f"🚀 비동기 다중 서버 생성 시작: {len(servers_data)}개 (Task ID: {task_id})")
 
         # 0. 진행 상태
-        self.update_state(state='PROGRESS', meta={'current': 0, 'total': 100, 'status': '설정 준비 중...'})
+        report_progress(self, 0, '설정 준비 중...')
 
         terraform_service = TerraformService()
 
@@ -510,7 +511,7 @@ def create_servers_bulk_async(self, servers_data):
         if not terraform_service.save_tfvars(tfvars):
             raise Exception('tfvars 파일 저장 실패')
 
-        self.update_state(state='PROGRESS', meta={'current': 20, 'total': 100, 'status': 'Terraform 적용 중...'})
+        report_progress(self, 20, 'Terraform 적용 중...')
 
         # 4. Targeted apply
         new_server_targets = []
@@ -523,7 +524,7 @@ def create_servers_bulk_async(self, servers_data):
             raise Exception(f'Terraform apply 실패: {apply_message}')
 
         # 5. Proxmox에서 VM 확인 및 DB 저장
-        self.update_state(state='PROGRESS', meta={'current': 60, 'total': 100, 'status': 'VM 확인 및 DB 저장...'})
+        report_progress(self, 60, 'VM 확인 및 DB 저장...')
         proxmox_service = ProxmoxService()
         created_servers = []
         failed_servers = []
@@ -702,8 +703,11 @@ def create_servers_bulk_async(self, servers_data):
         except Exception as nerr:
             logger.warning(f"알림 생성 중 오류: {nerr}")
 
+        if created_servers:
+            request_inventory_refresh(created_servers, reason='server_create', tags=['capacity'])
+        
         # 완료
-        self.update_state(state='PROGRESS', meta={'current': 100, 'total': 100, 'status': '완료'})
+        report_progress(self, 100, '완료')
         return {
             'success': True,
             'created': created_servers,
@@ -723,28 +727,21 @@ def delete_server_async(self, server_name: str):
         logger.info(f"🗑️ 비동기 서버 삭제 시작: {server_name}")
         
         # 작업 상태 업데이트
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 10, 'message': f'서버 {server_name} 중지 중...'}
-        )
+        report_progress(self, 10, f'서버 {server_name} 중지 중...')
+        publish_server_event(server_name, 'delete', task_id=self.request.id, progress=10, message=f'서버 {server_name} 중지 중...')
         
         # 0단계: 먼저 서버를 중지
         proxmox_service = ProxmoxService()
         try:
-            stop_ok = proxmox_service.stop_server(server_name)
-            if not stop_ok:
+            stop_result = proxmox_service.stop_server(server_name)
+            if not stop_result.get('success'):
                 logger.warning(f"⚠️ 서버 중지 실패(계속 진행): {server_name}")
             else:
-                # 최대 15초 동안 중지 상태 대기
-                wait_seconds = 0
-                while wait_seconds < 15:
-                    info = proxmox_service.get_server_info(server_name)
-                    status = (info or {}).get('status')
-                    if status and status != 'running':
-                        logger.info(f"✅ 서버 중지 확인: {server_name} (status={status})")
-                        break
-                    time.sleep(3)
-                    wait_seconds += 3
+                # 최대 15초 동안 중지 작업(UPID) 종료 대기
+                stop_data = stop_result.get('data') or {}
+                if proxmox_service.wait_for_vm_status(stop_data.get('vmid'), 'stopped', timeout=15,
+                                                      upid=stop_data.get('upid'), node=stop_data.get('node')):
+                    logger.info(f"✅ 서버 중지 확인: {server_name}")
         except Exception as stop_err:
             logger.warning(f"⚠️ 서버 중지 중 예외(계속 진행): {stop_err}")
         
@@ -752,10 +749,8 @@ def delete_server_async(self, server_name: str):
         terraform_service = TerraformService()
         
         # terraform.tfvars.json에서 해당 서버 제거
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 30, 'message': f'서버 {server_name} 설정 삭제 중...'}
-        )
+        report_progress(self, 30, f'서버 {server_name} 설정 삭제 중...')
+        publish_server_event(server_name, 'delete', task_id=self.request.id, progress=30, message=f'서버 {server_name} 설정 삭제 중...')
         
         success = terraform_service.delete_server_config(server_name)
         
@@ -763,10 +758,8 @@ def delete_server_async(self, server_name: str):
             raise Exception(f'서버 {server_name} 설정 삭제 실패')
         
         # Terraform apply로 실제 삭제 실행 (타겟 지정 없이 단일 apply)
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 60, 'message': f'서버 {server_name} Terraform 적용 중...'}
-        )
+        report_progress(self, 60, f'서버 {server_name} Terraform 적용 중...')
+        publish_server_event(server_name, 'delete', task_id=self.request.id, progress=60, message=f'서버 {server_name} Terraform 적용 중...')
         # tfvars에서 제거가 반영되었으므로 전체 apply로 정합성 보장
         # state lock 충돌을 피하기 위해 재시도(최대 3회, 지수 백오프)
         retries = 3
@@ -811,14 +804,16 @@ def delete_server_async(self, server_name: str):
             # 세션 롤백
             db.session.rollback()
         
+        # 삭제된 VM의 위치 인덱스 제거
+        from app.services.vm_index import vm_index
+        vm_index.invalidate(name=server_name)
+        
         # 작업 완료
-        self.update_state(
-            state='PROGRESS',
-            meta={'progress': 100, 'message': f'서버 {server_name} 삭제 완료'}
-        )
+        report_progress(self, 100, f'서버 {server_name} 삭제 완료')
         
         logger.info(f"✅ 서버 삭제 성공: {server_name}")
-        # Redis 캐시 제거됨 - 실시간 조회로 변경
+        publish_server_event(server_name, 'delete', 'SUCCESS', task_id=self.request.id)
+        request_inventory_refresh([server_name], reason='server_delete', tags=['capacity'])
         
         # 성공 알림 생성 (SSE로 전달되어 UI에 즉시 표시)
         try:
@@ -843,6 +838,7 @@ def delete_server_async(self, server_name: str):
         
     except Exception as e:
         logger.error(f"❌ 비동기 서버 삭제 실패: {server_name} - {str(e)}")
+        publish_server_event(server_name, 'delete', 'FAILURE', task_id=self.request.id, message=str(e))
         
         # 실패 알림 생성
         try:
@@ -864,13 +860,23 @@ def start_server_async(self, server_name: str):
     """비동기 서버 시작"""
     try:
         logger.info(f"🚀 비동기 서버 시작 작업 시작: {server_name}")
+        publish_server_event(server_name, 'start', task_id=self.request.id)
         
         # ProxmoxService를 사용하여 서버 시작
         from app.services.proxmox_service import ProxmoxService
         proxmox_service = ProxmoxService()
         
         # 서버 시작 실행
-        success = proxmox_service.start_server(server_name)
+        result = proxmox_service.start_server(server_name)
+        success = result.get('success', False)
+        
+        # Proxmox 작업(UPID) 종료 시점까지 대기하여 실제 결과 반영
+        upid = (result.get('data') or {}).get('upid')
+        if success and upid:
+            task_result = proxmox_service.task_tracker.wait(upid, timeout=120)
+            if task_result is not None and not task_result['success']:
+                logger.error(f"❌ Proxmox 작업 실패: {upid} ({task_result['exitstatus']})")
+                success = False
         
         if success:
             # DB 상태 업데이트
@@ -898,8 +904,10 @@ def start_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
-            # Redis 캐시 제거됨 - 실시간 조회로 변경
+            # 인벤토리 스냅샷에 변경된 서버 상태 즉시 반영
+            request_inventory_refresh([server_name], reason='server_action', tags=['capacity'])
             
+            publish_server_event(server_name, 'start', 'SUCCESS', task_id=self.request.id)
             logger.info(f"✅ 비동기 서버 시작 완료: {server_name}")
             return {
                 'success': True,
@@ -918,6 +926,7 @@ def start_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
+            publish_server_event(server_name, 'start', 'FAILURE', task_id=self.request.id)
             logger.error(f"❌ 비동기 서버 시작 실패: {server_name}")
             return {
                 'success': False,
@@ -927,6 +936,7 @@ def start_server_async(self, server_name: str):
             
     except Exception as e:
         logger.error(f"❌ 비동기 서버 시작 실패: {server_name} - {str(e)}")
+        publish_server_event(server_name, 'start', 'FAILURE', task_id=self.request.id, message=str(e))
         try:
             # 예외 상황에서도 실패 알림을 반드시 생성
             from app.models.notification import Notification
@@ -953,13 +963,23 @@ def stop_server_async(self, server_name: str):
     """비동기 서버 중지"""
     try:
         logger.info(f"🚀 비동기 서버 중지 작업 시작: {server_name}")
+        publish_server_event(server_name, 'stop', task_id=self.request.id)
         
         # ProxmoxService를 사용하여 서버 중지
         from app.services.proxmox_service import ProxmoxService
         proxmox_service = ProxmoxService()
         
         # 서버 중지 실행
-        success = proxmox_service.stop_server(server_name)
+        result = proxmox_service.stop_server(server_name)
+        success = result.get('success', False)
+        
+        # Proxmox 작업(UPID) 종료 시점까지 대기하여 실제 결과 반영
+        upid = (result.get('data') or {}).get('upid')
+        if success and upid:
+            task_result = proxmox_service.task_tracker.wait(upid, timeout=120)
+            if task_result is not None and not task_result['success']:
+                logger.error(f"❌ Proxmox 작업 실패: {upid} ({task_result['exitstatus']})")
+                success = False
         
         if success:
             # DB 상태 업데이트
@@ -987,8 +1007,10 @@ def stop_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
-            # Redis 캐시 제거됨 - 실시간 조회로 변경
+            # 인벤토리 스냅샷에 변경된 서버 상태 즉시 반영
+            request_inventory_refresh([server_name], reason='server_action', tags=['capacity'])
             
+            publish_server_event(server_name, 'stop', 'SUCCESS', task_id=self.request.id)
             logger.info(f"✅ 비동기 서버 중지 완료: {server_name}")
             return {
                 'success': True,
@@ -1007,6 +1029,7 @@ def stop_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
+            publish_server_event(server_name, 'stop', 'FAILURE', task_id=self.request.id)
             logger.error(f"❌ 비동기 서버 중지 실패: {server_name}")
             return {
                 'success': False,
@@ -1016,6 +1039,7 @@ def stop_server_async(self, server_name: str):
             
     except Exception as e:
         logger.error(f"❌ 비동기 서버 중지 실패: {server_name} - {str(e)}")
+        publish_server_event(server_name, 'stop', 'FAILURE', task_id=self.request.id, message=str(e))
         try:
             # 예외 상황에서도 실패 알림을 반드시 생성
             from app.models.notification import Notification
@@ -1042,13 +1066,23 @@ def reboot_server_async(self, server_name: str):
     """비동기 서버 재시작"""
     try:
         logger.info(f"🚀 비동기 서버 재시작 작업 시작: {server_name}")
+        publish_server_event(server_name, 'reboot', task_id=self.request.id)
         
         # ProxmoxService를 사용하여 서버 재시작
         from app.services.proxmox_service import ProxmoxService
         proxmox_service = ProxmoxService()
         
         # 서버 재시작 실행
-        success = proxmox_service.reboot_server(server_name)
+        result = proxmox_service.reboot_server(server_name)
+        success = result.get('success', False)
+        
+        # Proxmox 작업(UPID) 종료 시점까지 대기하여 실제 결과 반영
+        upid = (result.get('data') or {}).get('upid')
+        if success and upid:
+            task_result = proxmox_service.task_tracker.wait(upid, timeout=120)
+            if task_result is not None and not task_result['success']:
+                logger.error(f"❌ Proxmox 작업 실패: {upid} ({task_result['exitstatus']})")
+                success = False
         
         if success:
             # 성공 알림 생성
@@ -1065,8 +1099,10 @@ def reboot_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
-            # Redis 캐시 제거됨 - 실시간 조회로 변경
+            # 인벤토리 스냅샷에 변경된 서버 상태 즉시 반영
+            request_inventory_refresh([server_name], reason='server_action')
             
+            publish_server_event(server_name, 'reboot', 'SUCCESS', task_id=self.request.id)
             logger.info(f"✅ 비동기 서버 재시작 완료: {server_name}")
             return {
                 'success': True,
@@ -1087,6 +1123,7 @@ def reboot_server_async(self, server_name: str):
             db.session.add(notification)
             db.session.commit()
             
+            publish_server_event(server_name, 'reboot', 'FAILURE', task_id=self.request.id)
             logger.error(f"❌ 비동기 서버 재시작 실패: {server_name}")
             return {
                 'success': False,
@@ -1096,6 +1133,7 @@ def reboot_server_async(self, server_name: str):
             
     except Exception as e:
         logger.error(f"❌ 비동기 서버 재시작 실패: {server_name} - {str(e)}")
+        publish_server_event(server_name, 'reboot', 'FAILURE', task_id=self.request.id, message=str(e))
         try:
             # 예외 상황에서도 실패 알림을 반드시 생성
             from app.models.notification import Notification
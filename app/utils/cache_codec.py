@@ -0,0 +1,198 @@
+"""
+캐시 값 코덱
+
+Redis에 저장하는 캐시 값의 직렬화/압축 계층. 전체 서버 맵이나 백업 목록처럼 수백 KB인 값을
+더 작고 빠르게 저장하기 위해 직렬화 방식(json/orjson/msgpack)과 압축(zlib/zstd/lz4)을 선택한다.
+
+저장 형식: 헤더(b'\\x00PC' + 버전 + 직렬화 ID + 압축 ID) + 본문
+- 헤더에 사용한 방식이 기록되므로 설정을 바꿔도 기존 항목을 그대로 읽을 수 있다
+- 헤더가 없는 값은 이전 형식(JSON 문자열 또는 일반 문자열)으로 읽는다
+- 압축은 직렬화 결과가 compress_min_bytes 이상일 때만 적용
+"""
+import json
+import zlib
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+MAGIC = b'\x00PC'
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+# 헤더에 기록하는 ID (값을 바꾸면 기존 캐시 항목을 읽을 수 없으므로 추가만 할 것)
+SERIALIZER_IDS = {'json': 1, 'orjson': 2, 'msgpack': 3}
+COMPRESSION_IDS = {'none': 0, 'zlib': 1, 'zstd': 2, 'lz4': 3}
+
+
+class CacheCodecError(ValueError):
+    """캐시 값을 해석할 수 없음 (손상되었거나 필요한 라이브러리가 없음)"""
+
+
+def available_serializers():
+    return ['json'] + (['orjson'] if ORJSON_AVAILABLE else []) + (['msgpack'] if MSGPACK_AVAILABLE else [])
+
+
+def available_compressions():
+    return ['none', 'zlib'] + (['zstd'] if ZSTD_AVAILABLE else []) + (['lz4'] if LZ4_AVAILABLE else [])
+
+
+def _dumps_json(value):
+    return json.dumps(value, ensure_ascii=False, default=str, separators=(',', ':')).encode('utf-8')
+
+
+def _dumps_orjson(value):
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _dumps_msgpack(value):
+    return msgpack.packb(value, default=str, use_bin_type=True)
+
+
+def _loads_msgpack(data):
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+
+_SERIALIZERS = {
+    'json': (_dumps_json, json.loads),
+    'orjson': (_dumps_orjson, lambda data: orjson.loads(data)),
+    'msgpack': (_dumps_msgpack, _loads_msgpack),
+}
+
+
+def _compressor(name, level):
+    if name == 'zlib':
+        return lambda data: zlib.compress(data, level or 3)
+    if name == 'zstd':
+        compressor = zstandard.ZstdCompressor(level=level or 3)
+        return compressor.compress
+    if name == 'lz4':
+        return lambda data: lz4.frame.compress(data, compression_level=level or 0)
+    return None
+
+
+def _decompress(name, data):
+    if name == 'zlib':
+        return zlib.decompress(data)
+    if name == 'zstd':
+        if not ZSTD_AVAILABLE:
+            raise CacheCodecError('zstandard가 설치되지 않아 캐시 값을 해제할 수 없습니다')
+        return zstandard.ZstdDecompressor().decompress(data)
+    if name == 'lz4':
+        if not LZ4_AVAILABLE:
+            raise CacheCodecError('lz4가 설치되지 않아 캐시 값을 해제할 수 없습니다')
+        return lz4.frame.decompress(data)
+    return data
+
+
+class CacheCodec:
+    """캐시 값 인코더/디코더
+
+    serializer/compression에 'auto'를 주면 설치된 라이브러리 중 가장 빠른 것을 사용한다
+    (직렬화: orjson > msgpack > json, 압축: zstd > lz4 > zlib).
+    """
+
+    def __init__(self, serializer='auto', compression='auto', compress_min_bytes=16384, level=None):
+        self.serializer = self._resolve(serializer, available_serializers(), ['orjson', 'msgpack', 'json'], 'json')
+        self.compression = self._resolve(compression, available_compressions(), ['zstd', 'lz4', 'zlib'], 'zlib')
+        self.compress_min_bytes = compress_min_bytes
+        self._dumps = _SERIALIZERS[self.serializer][0]
+        self._compress = _compressor(self.compression, level)
+        self._header = MAGIC + bytes([VERSION, SERIALIZER_IDS[self.serializer]])
+
+    @staticmethod
+    def _resolve(name, available, preferred, fallback):
+        name = (name or 'auto').lower()
+        if name == 'auto':
+            return next(candidate for candidate in preferred + [fallback] if candidate in available)
+        if name not in available:
+            print(f"⚠️ 캐시 코덱 '{name}'을(를) 사용할 수 없어 {fallback}을(를) 사용합니다")
+            return fallback
+        return name
+
+    def encode(self, value):
+        """값을 헤더가 붙은 bytes로 변환"""
+        body = self._dumps(value)
+        compression = 'none'
+        if self._compress is not None and len(body) >= self.compress_min_bytes:
+            compressed = self._compress(body)
+            # 압축 효과가 없으면 원본 저장
+            if len(compressed) < len(body):
+                body, compression = compressed, self.compression
+        return self._header + bytes([COMPRESSION_IDS[compression]]) + body
+
+    def decode(self, data):
+        """encode() 결과 또는 이전 형식(JSON/일반 문자열) 값을 복원"""
+        return self.decode_sized(data)[0]
+
+    def decode_sized(self, data):
+        """값과 압축 해제 후 본문 크기 반환 (L1 캐시 메모리 계산용)"""
+        if data is None:
+            return None, 0
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if not data.startswith(MAGIC):
+            return self._decode_legacy(data), len(data)
+
+        if len(data) < HEADER_SIZE:
+            raise CacheCodecError('캐시 값 헤더가 손상되었습니다')
+        version, serializer_id, compression_id = data[len(MAGIC):HEADER_SIZE]
+        if version != VERSION:
+            raise CacheCodecError(f'지원하지 않는 캐시 값 버전: {version}')
+        serializer = _lookup(SERIALIZER_IDS, serializer_id)
+        compression = _lookup(COMPRESSION_IDS, compression_id)
+        if serializer == 'orjson' and not ORJSON_AVAILABLE:
+            # orjson 결과는 표준 JSON이므로 json으로 읽을 수 있다
+            serializer = 'json'
+        if serializer == 'msgpack' and not MSGPACK_AVAILABLE:
+            raise CacheCodecError('msgpack이 설치되지 않아 캐시 값을 읽을 수 없습니다')
+
+        try:
+            body = _decompress(compression, data[HEADER_SIZE:])
+            return _SERIALIZERS[serializer][1](body), len(body)
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f'캐시 값 해석 실패 ({serializer}/{compression}): {e}') from e
+
+    @staticmethod
+    def _decode_legacy(data):
+        text = data.decode('utf-8', errors='replace')
+        try:
+            return json.loads(text)
+        except ValueError:
+            return text
+
+    def describe(self):
+        return {
+            'serializer': self.serializer,
+            'compression': self.compression,
+            'compress_min_bytes': self.compress_min_bytes
+        }
+
+
+def _lookup(ids, value):
+    for name, known in ids.items():
+        if known == value:
+            return name
+    raise CacheCodecError(f'알 수 없는 캐시 코덱 ID: {value}')
@@ -0,0 +1,164 @@
+"""
+서킷 브레이커 유틸리티
+
+Proxmox 노드별로 연속 실패를 감지하여 일정 시간 요청을 즉시 실패시키고(open),
+복구 대기 시간이 지나면 한 건만 시험 요청(half-open)을 보내 복구 여부를 판단한다.
+"""
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Any
+
+import requests
+
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+# 다른 프로세스에서도 상태를 볼 수 있도록 Redis에 게시하는 키
+STATE_KEY_PREFIX = 'proxmox:circuit:'
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """서킷이 열려 있어 요청을 보내지 않고 즉시 실패"""
+
+
+class CircuitBreaker:
+    """단일 대상(노드)에 대한 서킷 브레이커"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.last_error = None
+        self.last_failure_at = None
+        self.last_success_at = None
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """요청을 보내도 되는지 여부 (half-open 상태에서는 시험 요청 1건만 허용)"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN:
+                if time.time() - self.opened_at < self.recovery_timeout:
+                    self.rejected += 1
+                    return False
+                self._transition(STATE_HALF_OPEN)
+            # half-open
+            if self._probe_in_flight:
+                self.rejected += 1
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.last_success_at = time.time()
+            self._probe_in_flight = False
+            if self.state != STATE_CLOSED:
+                self._transition(STATE_CLOSED)
+
+    def record_failure(self, error: str = None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self.last_failure_at = time.time()
+            self._probe_in_flight = False
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = time.time()
+                if self.state != STATE_OPEN:
+                    self._transition(STATE_OPEN)
+
+    def reset(self):
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            self._transition(STATE_CLOSED)
+
+    def snapshot(self) -> Dict[str, Any]:
+        retry_in = 0
+        if self.state == STATE_OPEN:
+            retry_in = max(0, round(self.recovery_timeout - (time.time() - self.opened_at), 1))
+        return {
+            'name': self.name,
+            'state': self.state,
+            'failures': self.failures,
+            'failure_threshold': self.failure_threshold,
+            'recovery_timeout': self.recovery_timeout,
+            'retry_in': retry_in,
+            'rejected': self.rejected,
+            'last_error': self.last_error,
+            'last_failure_at': self.last_failure_at,
+            'last_success_at': self.last_success_at
+        }
+
+    def _transition(self, state: str):
+        previous = self.state
+        self.state = state
+        if previous == state:
+            return
+        if state == STATE_OPEN:
+            logger.warning(f"🔴 서킷 OPEN: {self.name} (연속 실패 {self.failures}회, 마지막 오류: {self.last_error})")
+        elif state == STATE_HALF_OPEN:
+            logger.info(f"🟡 서킷 HALF-OPEN: {self.name} (시험 요청 허용)")
+        else:
+            logger.info(f"🟢 서킷 CLOSED: {self.name} (정상 복구)")
+        redis_utils.set_cache(f"{STATE_KEY_PREFIX}{self.name}", self.snapshot(), expire=86400)
+
+
+# 프로세스 전역 브레이커 레지스트리
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, failure_threshold: int = None, recovery_timeout: float = None) -> CircuitBreaker:
+    """이름별 서킷 브레이커 반환 (없으면 생성, 설정값이 주어지면 갱신)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        if failure_threshold is not None:
+            breaker.failure_threshold = failure_threshold
+        if recovery_timeout is not None:
+            breaker.recovery_timeout = recovery_timeout
+        return breaker
+
+
+def get_all_breaker_states() -> List[Dict[str, Any]]:
+    """현재 프로세스와 Redis에 게시된 모든 서킷 상태"""
+    states = {}
+    if redis_utils.is_available():
+        try:
+            keys = list(redis_utils.scan_cache_keys(f"{STATE_KEY_PREFIX}*"))
+            for key, shared in redis_utils.get_many(keys).items():
+                if isinstance(shared, dict):
+                    shared['source'] = 'redis'
+                    states[shared.get('name', key[len(STATE_KEY_PREFIX):])] = shared
+        except Exception as e:
+            logger.warning(f"⚠️ 서킷 상태 조회 실패: {e}")
+
+    with _breakers_lock:
+        local = list(_breakers.values())
+    for breaker in local:
+        snapshot = breaker.snapshot()
+        snapshot['source'] = 'local'
+        states[breaker.name] = snapshot
+    return sorted(states.values(), key=lambda s: s['name'])
+
+
+def backoff_delay(attempt: int, base: float = 0.2, cap: float = 2.0) -> float:
+    """지터가 적용된 지수 백오프 대기 시간 (full jitter)"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
@@ -0,0 +1,213 @@
+"""
+프로세스 간 이벤트 버스 (Redis pub/sub → 연결별 메모리 큐)
+
+SSE 스트림마다 DB를 주기적으로 조회하지 않도록, 변경을 만든 프로세스(웹/Celery)가 토픽 채널에
+이벤트를 게시하고 각 웹 프로세스는 구독 스레드 하나로 받아 해당 토픽을 구독 중인 연결의 큐에 나눠 넣는다.
+
+- 채널: {REDIS_EVENT_CHANNEL_PREFIX}:{topic} (구독은 패턴 하나로 모든 토픽 수신)
+- 구독 스레드는 첫 구독 시 시작하고 fork 이후(gunicorn 워커) 다시 시작한다
+- 연결별 큐는 크기 제한이 있으며 가득 차면 가장 오래된 이벤트를 버린다 (느린 클라이언트가 메모리를 잡지 않도록)
+- Redis를 사용할 수 없으면 같은 프로세스의 구독자에게만 전달하며, live가 False인 동안
+  구독자는 필요하면 직접 조회로 보완해야 한다
+- DB 변경 수신(app/services/change_feed.py)처럼 프로세스마다 이벤트를 직접 받는 공급원은
+  add_source()로 등록하고 dispatch_local()로 전달한다
+- 같은 이벤트가 Redis 게시와 공급원 양쪽으로 올 수 있는 토픽은 dedupe_by_id()로 등록하면
+  이벤트 id 기준으로 프로세스에서 한 번만 전달한다 (최근 DEDUPE_HISTORY개 id 보관)
+"""
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+from app.config.redis_config import RedisConfig
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+# 구독이 끊겼을 때 재연결 대기 시간 (초)
+RECONNECT_DELAY = 2
+# 연결별 큐 크기 기본값
+DEFAULT_QUEUE_SIZE = RedisConfig.REDIS_EVENT_QUEUE_SIZE
+# id 중복 제거 토픽별로 기억하는 최근 전달 id 수
+DEDUPE_HISTORY = 1000
+
+
+class Subscription:
+    """연결 하나의 이벤트 큐"""
+
+    def __init__(self, bus, topics, maxsize):
+        self.bus = bus
+        self.topics = tuple(topics)
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, topic, event):
+        try:
+            self._queue.put_nowait((topic, event))
+        except queue.Full:
+            # 가장 오래된 이벤트를 버리고 새 이벤트 보관
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self._queue.put_nowait((topic, event))
+            except queue.Full:
+                pass
+
+    def get(self, timeout=None):
+        """(topic, event) 반환, timeout 동안 없으면 None"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class EventBus:
+    """토픽별 이벤트 게시/구독"""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+        self.connected = False
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+        self._pid = None
+        self._thread = None
+        # 버스 밖에서 이벤트를 넣어 주는 공급원 (DB 변경 수신 등, ensure_started()/connected 제공)
+        self._sources = []
+        # id 중복 제거 토픽 → 최근 전달한 이벤트 id
+        self._delivered = {}
+
+    def channel(self, topic):
+        return f"{self.prefix}:{topic}"
+
+    def publish(self, topic, event):
+        """이벤트 게시 (Redis가 없으면 현재 프로세스의 구독자에게만 전달)"""
+        if redis_utils.is_available():
+            try:
+                redis_utils.client.publish(self.channel(topic), json.dumps(event, ensure_ascii=False, default=str))
+                return
+            except Exception as e:
+                logger.warning(f"⚠️ 이벤트 게시 실패, 로컬 구독자에게만 전달 ({topic}): {e}")
+        self._dispatch(topic, event)
+
+    def dispatch_local(self, topic, event):
+        """현재 프로세스의 구독자에게만 전달 (프로세스마다 같은 이벤트를 받는 공급원용)"""
+        self._dispatch(topic, event)
+
+    def add_source(self, source):
+        if source not in self._sources:
+            self._sources.append(source)
+
+    def dedupe_by_id(self, topic):
+        """topic 이벤트를 id 기준으로 한 번만 전달 (게시 프로세스와 DB 변경 수신이 같은 이벤트를 보내는 경우)"""
+        with self._lock:
+            self._delivered.setdefault(topic, OrderedDict())
+
+    @property
+    def live(self):
+        """Redis 구독 또는 다른 공급원 중 하나라도 연결되어 있어 이벤트를 밀어 받을 수 있는지 여부"""
+        return self.connected or any(source.connected for source in self._sources)
+
+    def subscribe(self, *topics, maxsize=DEFAULT_QUEUE_SIZE):
+        subscription = Subscription(self, topics, maxsize)
+        with self._lock:
+            for topic in subscription.topics:
+                self._subscribers[topic].add(subscription)
+        self._ensure_started()
+        for source in self._sources:
+            source.ensure_started()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for topic in subscription.topics:
+                subscribers = self._subscribers.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[topic]
+
+    def has_subscribers(self, topic):
+        with self._lock:
+            return bool(self._subscribers.get(topic))
+
+    def subscriber_count(self):
+        with self._lock:
+            return len({subscription for subscribers in self._subscribers.values() for subscription in subscribers})
+
+    def _dispatch(self, topic, event):
+        with self._lock:
+            delivered = self._delivered.get(topic)
+            event_id = event.get('id') if delivered is not None and isinstance(event, dict) else None
+            if isinstance(event_id, int):
+                if event_id in delivered:
+                    return
+                delivered[event_id] = None
+                if len(delivered) > DEDUPE_HISTORY:
+                    delivered.popitem(last=False)
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            subscription.put(topic, event)
+
+    def _ensure_started(self):
+        if not redis_utils.is_available() or self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork 이후에는 부모의 구독 스레드가 없으므로 연결 상태부터 초기화
+                self.connected = False
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._listen, name='event-bus', daemon=True)
+                self._thread.start()
+
+    def _listen(self):
+        pid = os.getpid()
+        pattern = f"{self.prefix}:*"
+        while self._pid == pid:
+            pubsub = None
+            try:
+                pubsub = redis_utils.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(pattern)
+                self.connected = True
+                logger.info(f"📡 이벤트 채널 구독 시작: {pattern}")
+                # listen()은 클라이언트의 socket_timeout에 걸리므로 짧은 대기로 반복 조회
+                while self._pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'pmessage':
+                        self._handle(message['channel'], message['data'])
+            except Exception as e:
+                logger.warning(f"⚠️ 이벤트 채널 구독 끊김, 재연결 대기: {e}")
+            finally:
+                self.connected = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(RECONNECT_DELAY)
+
+    def _handle(self, channel, data):
+        topic = channel[len(self.prefix) + 1:]
+        try:
+            event = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        self._dispatch(topic, event)
+
+
+# 전역 인스턴스
+event_bus = EventBus(RedisConfig.REDIS_EVENT_CHANNEL_PREFIX)
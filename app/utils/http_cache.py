@@ -0,0 +1,85 @@
+"""
+HTTP 조건부 응답 (ETag / 304 Not Modified)
+
+자동 갱신 화면은 같은 JSON/partial을 수 초마다 다시 요청하므로, 데이터 버전(인벤토리 세대 번호 등)으로
+ETag를 만들어 If-None-Match가 일치하면 템플릿 렌더링/JSON 직렬화 없이 304를 반환한다.
+
+- conditional(validator): 뷰 실행 전에 validator()로 ETag를 계산 (None이면 조건부 처리 없이 뷰 실행)
+- conditional_by_content: 값싼 버전 정보가 없는 응답은 본문 해시로 ETag를 붙인다 (렌더링은 하지만 전송량 절감)
+- 브라우저가 저장해 두고 매번 재검증하도록 Cache-Control: private, no-cache
+"""
+import hashlib
+import logging
+import os
+from functools import wraps
+
+from flask import current_app, make_response, request, session
+
+logger = logging.getLogger(__name__)
+
+CACHE_CONTROL = 'private, no-cache'
+
+
+def make_etag(*parts) -> str:
+    """버전 구성 요소로 ETag 값 생성 (따옴표 제외)"""
+    raw = '|'.join(str(part) for part in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:24]
+
+
+def template_version(name: str) -> int:
+    """템플릿 파일 수정 시각 (배포로 템플릿이 바뀌면 ETag도 바뀌도록)"""
+    try:
+        return os.stat(os.path.join(current_app.root_path, current_app.template_folder, name)).st_mtime_ns
+    except (OSError, TypeError):
+        return 0
+
+
+def session_permissions_version() -> str:
+    """세션 권한 목록 해시 (권한에 따라 partial 내용이 달라지는 경우 ETag에 포함)"""
+    return make_etag(*sorted(session.get('permissions') or []))
+
+
+def not_modified(etag: str):
+    response = current_app.response_class(status=304)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = CACHE_CONTROL
+    return response
+
+
+def conditional(validator):
+    """validator()의 반환값(문자열 또는 튜플)으로 ETag를 만들어 변경이 없으면 뷰를 실행하지 않고 304 반환"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                parts = validator()
+            except Exception as e:
+                logger.warning(f"⚠️ ETag 계산 실패, 조건부 응답 생략: {e}")
+                parts = None
+            if parts is None:
+                return view(*args, **kwargs)
+
+            etag = make_etag(*parts) if isinstance(parts, (list, tuple)) else make_etag(parts)
+            if request.if_none_match.contains_weak(etag):
+                return not_modified(etag)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag, weak=True)
+                response.headers['Cache-Control'] = CACHE_CONTROL
+            return response
+        return wrapper
+    return decorator
+
+
+def conditional_by_content(view):
+    """본문 해시로 ETag를 붙이고 If-None-Match가 일치하면 304로 바꿔 반환"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.direct_passthrough or response.is_streamed:
+            return response
+        response.add_etag(weak=True)
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response.make_conditional(request)
+    return wrapper
@@ -0,0 +1,99 @@
+"""
+HTTP 응답 압축 (gzip / brotli)
+
+after_request에서 Accept-Encoding을 보고 기준 크기 이상인 텍스트 응답(JSON, HTML partial 등)을 압축한다.
+스트리밍 응답(stream_json 등)은 본문을 모으지 않고 청크 단위로 압축하여 그대로 흘려보낸다.
+
+- brotli 패키지가 설치되어 있고 클라이언트가 br을 받으면 brotli, 아니면 gzip
+- 304/오류 응답, 파일 전송(direct_passthrough), SSE(text/event-stream), 이미 인코딩된 응답은 건드리지 않음
+"""
+import gzip
+import zlib
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+from flask import request
+
+COMPRESSIBLE_MIMETYPES = frozenset((
+    'application/json',
+    'application/javascript',
+    'text/html',
+    'text/css',
+    'text/plain',
+    'text/javascript',
+    'image/svg+xml',
+))
+
+
+def _choose_encoding():
+    encodings = ['br', 'gzip'] if BROTLI_AVAILABLE else ['gzip']
+    return request.accept_encodings.best_match(encodings)
+
+
+class _StreamCompressor:
+    """청크 단위 압축기 (gzip 헤더 포함 zlib 스트림 또는 brotli)"""
+
+    def __init__(self, encoding, gzip_level, brotli_quality):
+        if encoding == 'br':
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            # wbits=31: gzip 컨테이너 형식
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def wrap(self, chunks):
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            data = self._compress(chunk)
+            if data:
+                yield data
+        tail = self._finish()
+        if tail:
+            yield tail
+
+
+def init_compression(app):
+    """응답 압축 after_request 등록 (RESPONSE_COMPRESSION_* 설정 사용)"""
+    if not app.config.get('RESPONSE_COMPRESSION_ENABLED', True):
+        return
+
+    min_bytes = app.config.get('RESPONSE_COMPRESSION_MIN_BYTES', 1024)
+    gzip_level = app.config.get('RESPONSE_COMPRESSION_GZIP_LEVEL', 6)
+    brotli_quality = app.config.get('RESPONSE_COMPRESSION_BROTLI_QUALITY', 4)
+
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+            return response
+
+        encoding = _choose_encoding()
+        response.vary.add('Accept-Encoding')
+        if encoding is None:
+            return response
+
+        if response.is_streamed:
+            compressor = _StreamCompressor(encoding, gzip_level, brotli_quality)
+            response.response = compressor.wrap(response.response)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < min_bytes:
+                return response
+            if encoding == 'br':
+                response.set_data(brotli.compress(body, quality=brotli_quality))
+            else:
+                response.set_data(gzip.compress(body, compresslevel=gzip_level))
+
+        response.headers['Content-Encoding'] = encoding
+        return response
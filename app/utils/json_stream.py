@@ -0,0 +1,69 @@
+"""
+스트리밍 JSON 응답
+
+큰 목록(전체 서버 맵, 백업 목록, IAM 사용자 목록)을 jsonify처럼 한 번에 문자열로 만들지 않고
+항목 단위로 직렬화하여 청크로 내보낸다. 요청당 추가 메모리는 청크 크기 정도로 일정하다.
+
+- 지정한 깊이(stream_depth)까지의 dict/list는 항목별로 나누어 쓰고, 그 아래 값은 한 번에 직렬화
+- orjson이 설치되어 있으면 사용 (없으면 표준 json)
+- 키 정렬은 Flask JSON 설정(app.json.sort_keys)을 따라 jsonify와 같은 순서를 유지
+"""
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from flask import Response, current_app
+
+# 청크 하나에 모으는 최대 크기 (bytes)
+CHUNK_SIZE = 64 * 1024
+
+
+def _encoder(sort_keys):
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return lambda value: orjson.dumps(value, default=str, option=option)
+    return lambda value: json.dumps(value, ensure_ascii=False, default=str, sort_keys=sort_keys,
+                                    separators=(',', ':')).encode('utf-8')
+
+
+def iter_json(value, stream_depth=3, sort_keys=True, chunk_size=CHUNK_SIZE):
+    """value를 JSON bytes 청크로 직렬화하는 제너레이터"""
+    dumps = _encoder(sort_keys)
+    buffer = bytearray()
+
+    def walk(node, depth):
+        if depth > 0 and isinstance(node, dict) and node:
+            yield b'{'
+            items = sorted(node.items(), key=lambda item: str(item[0])) if sort_keys else node.items()
+            for index, (key, item) in enumerate(items):
+                yield (b',' if index else b'') + dumps(str(key)) + b':'
+                yield from walk(item, depth - 1)
+            yield b'}'
+        elif depth > 0 and isinstance(node, (list, tuple)) and node:
+            yield b'['
+            for index, item in enumerate(node):
+                if index:
+                    yield b','
+                yield from walk(item, depth - 1)
+            yield b']'
+        else:
+            yield dumps(node)
+
+    for piece in walk(value, stream_depth):
+        buffer += piece
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def stream_json(value, status=200, stream_depth=3):
+    """jsonify 대신 사용하는 청크 전송 JSON 응답"""
+    sort_keys = getattr(current_app.json, 'sort_keys', True)
+    return Response(iter_json(value, stream_depth=stream_depth, sort_keys=sort_keys),
+                    status=status, mimetype='application/json')
@@ -0,0 +1,218 @@
+"""
+프로세스 로컬 L1 캐시
+
+Redis 캐시 앞에 두는 프로세스 메모리 LRU 캐시. 네트워크 왕복과 큰 JSON 디코딩 없이
+자주 읽는 값(인벤토리 세대 번호, 사용자 권한 등)을 바로 반환한다.
+
+- 항목 수와 바이트 크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 항목별 TTL과 태그 (RedisUtils.invalidate_tags()와 같은 태그 체계)
+- 일관성: 모든 gunicorn 워커/Celery 프로세스가 Redis pub/sub 무효화 채널을 구독하고,
+  구독이 끊긴 동안에는 L1을 사용하지 않는다 (항상 Redis로 조회)
+- 네임스페이스(키의 첫 ':' 앞부분)별 hit/miss/evict 카운터
+
+L1에서 반환한 값은 여러 요청이 공유하므로 호출자가 수정하면 안 된다.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+
+# 캐시에 값이 없음을 나타내는 표식 (None도 유효한 캐시 값)
+MISSING = object()
+
+# pub/sub 연결이 끊겼을 때 재연결 대기 시간 (초)
+RECONNECT_DELAY = 2
+
+
+class LocalCache:
+    """TTL과 크기 상한이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size, tags)
+        self._entries = OrderedDict()
+        self._tags = defaultdict(set)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'hit': 0, 'miss': 0, 'evict': 0, 'expired': 0, 'invalidated': 0})
+
+    @staticmethod
+    def namespace_of(key):
+        return key.split(':', 1)[0]
+
+    def get(self, key):
+        """캐시 값 반환 (없거나 만료되었으면 MISSING)"""
+        stats = self._stats[self.namespace_of(key)]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                stats['miss'] += 1
+                return MISSING
+            if entry[1] <= time.time():
+                self._remove(key)
+                stats['expired'] += 1
+                stats['miss'] += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            stats['hit'] += 1
+            return entry[0]
+
+    def set(self, key, value, ttl, size=None, tags=None):
+        """값 저장 (size를 모르면 JSON 직렬화 길이로 추정)"""
+        if ttl <= 0:
+            return
+        if size is None:
+            try:
+                size = len(json.dumps(value, ensure_ascii=False, default=str))
+            except (TypeError, ValueError):
+                size = 0
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.time() + ttl, size, tuple(tags or ()))
+            self._bytes += size
+            for tag in tags or ():
+                self._tags[tag].add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats[self.namespace_of(oldest)]['evict'] += 1
+
+    def invalidate(self, keys=(), tags=()):
+        """키 또는 태그에 해당하는 항목 제거"""
+        with self._lock:
+            targets = set(keys)
+            for tag in tags:
+                targets.update(self._tags.pop(tag, ()))
+            for key in targets:
+                if key in self._entries:
+                    self._remove(key)
+                    self._stats[self.namespace_of(key)]['invalidated'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def get_stats(self):
+        """네임스페이스별 카운터와 현재 사용량"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'namespaces': {namespace: dict(counters) for namespace, counters in self._stats.items()}
+            }
+
+    def _remove(self, key):
+        value, expires_at, size, tags = self._entries.pop(key)
+        self._bytes -= size
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class InvalidationBus:
+    """Redis pub/sub 무효화 채널
+
+    변경한 프로세스는 자신의 L1을 먼저 비우고 키/태그를 게시하며, 다른 프로세스는 구독 스레드에서
+    같은 항목을 제거한다. fork 이후(gunicorn 워커, Celery prefork)에는 구독 스레드를 다시 시작한다.
+    """
+
+    def __init__(self, local_cache, channel):
+        self.local = local_cache
+        self.channel = channel
+        self.client = None
+        self.connected = False
+        self._pid = None
+        self._origin = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self, client):
+        """구독 스레드가 현재 프로세스에서 실행 중인지 확인하고 필요하면 시작 (L1 사용 가능 여부 반환)"""
+        if client is None:
+            return False
+        if self._pid == os.getpid():
+            return self.connected
+        with self._lock:
+            if self._pid != os.getpid():
+                # fork로 복사된 L1 항목은 부모 프로세스의 구독 상태를 보장받지 못하므로 비운다
+                self.local.clear()
+                self.client = client
+                self.connected = False
+                self._pid = os.getpid()
+                self._origin = f"{self._pid}:{uuid.uuid4().hex}"
+                self._thread = threading.Thread(target=self._listen, name='cache-invalidation', daemon=True)
+                self._thread.start()
+        return self.connected
+
+    def publish(self, client, keys=(), tags=(), clear=False, pipe=None):
+        """로컬 L1에서 제거하고 다른 프로세스에 무효화 메시지 게시 (pipe를 주면 파이프라인에 추가)"""
+        if clear:
+            self.local.clear()
+        else:
+            self.local.invalidate(keys, tags)
+        if client is None:
+            return
+        message = json.dumps({
+            'origin': self._origin,
+            'keys': list(keys),
+            'tags': list(tags),
+            'clear': clear
+        }, ensure_ascii=False)
+        target = pipe if pipe is not None else client
+        try:
+            target.publish(self.channel, message)
+        except Exception as e:
+            print(f"⚠️ 캐시 무효화 메시지 게시 실패: {e}")
+
+    def _listen(self):
+        pid = os.getpid()
+        while self._pid == pid:
+            pubsub = None
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # 구독 전에 놓친 무효화가 있을 수 있으므로 비운 뒤 사용 시작
+                self.local.clear()
+                self.connected = True
+                # listen()은 클라이언트의 socket_timeout에 걸리므로 짧은 대기로 반복 조회
+                while self._pid == pid:
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'message':
+                        self._apply(message['data'])
+            except Exception as e:
+                print(f"⚠️ 캐시 무효화 채널 구독 끊김, 재연결 대기: {e}")
+            finally:
+                self.connected = False
+                self.local.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            time.sleep(RECONNECT_DELAY)
+
+    def _apply(self, data):
+        try:
+            message = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if message.get('origin') == self._origin:
+            return
+        if message.get('clear'):
+            self.local.clear()
+        else:
+            self.local.invalidate(message.get('keys') or (), message.get('tags') or ())
@@ -1,73 +1,517 @@
-import json
+import math
+import os
+import random
+import threading
+import time
+import uuid
 import redis
+from flask import current_app, has_app_context
 from app.config.redis_config import RedisConfig
+from app.utils.cache_codec import CacheCodec, CacheCodecError
+from app.utils.local_cache import MISSING, InvalidationBus, LocalCache
+
+# 락 소유자만 해제하도록 토큰 비교 후 삭제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# 태그 집합은 연결된 키보다 오래 유지 (남은 멤버는 무효화 시 UNLINK 대상일 뿐)
+TAG_SET_TTL = 86400
+# SCAN/SSCAN 한 번에 읽고 UNLINK 할 키 수
+SCAN_BATCH_SIZE = 500
+# Redis 연결 실패 후 다시 확인하기까지의 시간 (그동안은 Redis 없이 동작)
+HEALTH_RETRY_INTERVAL = 30
 
 class RedisUtils:
     """Redis 유틸리티 클래스"""
     
     def __init__(self):
+        # 두 클라이언트 모두 프로세스 공용 연결 풀을 사용 (생성 시 연결하지 않음)
         self.client = RedisConfig.get_redis_client()
+        # 캐시 값은 코덱으로 인코딩한 bytes이므로 응답을 디코딩하지 않는 클라이언트로 읽고 쓴다
+        self.binary_client = RedisConfig.get_redis_client(decode_responses=False)
         self.enabled = RedisConfig.REDIS_ENABLED
+        # 연결 상태 (프로세스별로 처음 사용할 때 확인, 실패하면 HEALTH_RETRY_INTERVAL 후 재확인)
+        self._healthy = False
+        self._health_pid = None
+        self._health_checked_at = 0.0
+        self.codec = CacheCodec(serializer=RedisConfig.REDIS_CACHE_SERIALIZER,
+                                compression=RedisConfig.REDIS_CACHE_COMPRESSION,
+                                compress_min_bytes=RedisConfig.REDIS_CACHE_COMPRESS_MIN_BYTES)
+        # 캐시 키 네임스페이스 (Celery 브로커/결과 키와 같은 DB를 써도 캐시 키만 다루도록)
+        self.namespace = RedisConfig.REDIS_CACHE_NAMESPACE
+        # get_or_compute 결과 통계 (hit/stale/miss/early_refresh/negative/wait)
+        self.compute_stats = {'hit': 0, 'stale': 0, 'miss': 0, 'early_refresh': 0, 'negative': 0, 'wait': 0}
+        # 프로세스 로컬 L1 캐시 (local_ttl을 지정한 조회만 사용, pub/sub으로 프로세스 간 무효화)
+        self.local_enabled = RedisConfig.REDIS_LOCAL_CACHE_ENABLED
+        self.local = LocalCache(max_entries=RedisConfig.REDIS_LOCAL_CACHE_MAX_ENTRIES,
+                                max_bytes=RedisConfig.REDIS_LOCAL_CACHE_MAX_MB * 1024 * 1024)
+        self.bus = InvalidationBus(self.local, f"{self.namespace}:invalidate")
     
     def is_available(self):
         """Redis 사용 가능 여부 확인"""
-        return self.enabled and self.client is not None
+        if not (self.enabled and self.client is not None and self.binary_client is not None):
+            return False
+        if self._health_pid == os.getpid() and (
+                self._healthy or time.time() - self._health_checked_at < HEALTH_RETRY_INTERVAL):
+            return self._healthy
+        return self._check_health()
+    
+    def _check_health(self):
+        healthy = False
+        try:
+            healthy = bool(self.client.ping())
+        except Exception as e:
+            print(f"⚠️ Redis 연결 실패 ({HEALTH_RETRY_INTERVAL}초 후 재시도): {e}")
+        if healthy and not self._healthy:
+            print(f"✅ Redis 연결 확인 (pid {os.getpid()})")
+        self._healthy = healthy
+        self._health_pid = os.getpid()
+        self._health_checked_at = time.time()
+        return healthy
     
-    def set_cache(self, key, value, expire=300):
-        """캐시 설정"""
+    def local_ready(self):
+        """L1 캐시 사용 가능 여부 (무효화 채널을 구독 중일 때만 사용)"""
+        return self.local_enabled and self.is_available() and self.bus.ensure_started(self.client)
+    
+    def cache_key(self, key):
+        """네임스페이스가 붙은 실제 Redis 키"""
+        return f"{self.namespace}:{key}"
+    
+    def tag_key(self, tag):
+        """태그 집합 Redis 키"""
+        return f"{self.namespace}:tag:{tag}"
+    
+    def _logical_key(self, key):
+        """실제 Redis 키에서 네임스페이스 제거 (L1 캐시와 무효화 메시지는 네임스페이스 없는 키 사용)"""
+        return key[len(self.namespace) + 1:]
+    
+    def set_cache(self, key, value, expire=300, tags=None):
+        """캐시 설정 (tags를 주면 invalidate_tags()로 함께 삭제할 수 있도록 태그 집합에 등록)"""
         if not self.is_available():
             return False
             
         try:
-            if isinstance(value, dict):
-                value = json.dumps(value, ensure_ascii=False)
-            self.client.setex(key, expire, value)
+            self._store(self.cache_key(key), expire, self.codec.encode(value), tags)
             return True
         except Exception as e:
             print(f"⚠️ Redis 캐시 설정 실패: {e}")
             return False
     
-    def get_cache(self, key):
-        """캐시 조회"""
+    def get_cache(self, key, local_ttl=None):
+        """캐시 조회 (local_ttl을 주면 L1 캐시를 먼저 확인하고, Redis 조회 결과를 local_ttl초 동안 L1에 보관)"""
         if not self.is_available():
             return None
+        
+        use_local = bool(local_ttl) and self.local_ready()
+        if use_local:
+            cached = self.local.get(key)
+            if cached is not MISSING:
+                return cached
             
         try:
-            value = self.client.get(key)
+            value = self.binary_client.get(self.cache_key(key))
             if value:
-                # JSON 파싱 시도
-                try:
-                    return json.loads(value)
-                except:
-                    return value
+                parsed, size = self.codec.decode_sized(value)
+                if use_local:
+                    self.local.set(key, parsed, local_ttl, size=size)
+                return parsed
             return None
         except Exception as e:
             print(f"⚠️ Redis 캐시 조회 실패: {e}")
             return None
     
+    def get_many(self, keys, local_ttl=None):
+        """여러 캐시 키를 한 번의 MGET으로 조회 (없는 키는 결과에서 제외)"""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        if not keys or not self.is_available():
+            return found
+        
+        use_local = bool(local_ttl) and self.local_ready()
+        remaining = []
+        for key in keys:
+            cached = self.local.get(key) if use_local else MISSING
+            if cached is MISSING:
+                remaining.append(key)
+            else:
+                found[key] = cached
+        if not remaining:
+            return found
+        
+        try:
+            values = self.binary_client.mget([self.cache_key(key) for key in remaining])
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 일괄 조회 실패: {e}")
+            return found
+        for key, raw in zip(remaining, values):
+            if not raw:
+                continue
+            try:
+                value, size = self.codec.decode_sized(raw)
+            except CacheCodecError as e:
+                print(f"⚠️ Redis 캐시 값 해석 실패 ({key}): {e}")
+                continue
+            found[key] = value
+            if use_local:
+                self.local.set(key, value, local_ttl, size=size)
+        return found
+    
+    def set_many(self, mapping, expire=300, tags=None):
+        """여러 캐시 값을 한 번의 파이프라인으로 저장"""
+        if not mapping or not self.is_available():
+            return False
+        
+        try:
+            pipe = self.binary_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                self._queue_store(pipe, self.cache_key(key), expire, self.codec.encode(value), tags)
+            self.publish_invalidation(keys=list(mapping), pipe=pipe)
+            pipe.execute()
+            return True
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 일괄 설정 실패: {e}")
+            return False
+    
+    def delete_many(self, keys):
+        """여러 캐시 키를 UNLINK 파이프라인으로 삭제하고 삭제한 키 수를 반환"""
+        keys = list(dict.fromkeys(keys))
+        if not keys or not self.is_available():
+            return 0
+        
+        try:
+            return self._unlink([self.cache_key(key) for key in keys])
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 일괄 삭제 실패: {e}")
+            return 0
+    
     def delete_cache(self, key):
         """캐시 삭제"""
         if not self.is_available():
             return False
             
         try:
-            self.client.delete(key)
+            pipe = self.client.pipeline(transaction=False)
+            pipe.delete(self.cache_key(key))
+            self.publish_invalidation(keys=[key], pipe=pipe)
+            pipe.execute()
             return True
         except Exception as e:
             print(f"⚠️ Redis 캐시 삭제 실패: {e}")
             return False
-    
+
+    def delete_computed(self, key, wait_timeout=5.0):
+        """get_or_compute 캐시 삭제 (진행 중인 계산이 있으면 락 해제를 기다렸다가 한 번 더 삭제)
+
+        원본을 바꾸기 전에 읽은 계산이 삭제 뒤에 저장되면 이전 값이 TTL 동안 남으므로,
+        권한처럼 바로 반영되어야 하는 값은 delete_cache 대신 이 메서드로 무효화한다.
+        """
+        if not self.delete_cache(key):
+            return False
+
+        lock_key = f"{self.cache_key(key)}:lock"
+        try:
+            if not self.client.exists(lock_key):
+                return True
+            deadline = time.time() + wait_timeout
+            while time.time() < deadline and self.client.exists(lock_key):
+                time.sleep(0.05)
+        except Exception as e:
+            print(f"⚠️ Redis 락 확인 실패: {e}")
+        return self.delete_cache(key)
+
+    def get_or_compute(self, key, compute, ttl=60, stale_ttl=600, negative_ttl=10,
+                       is_error=None, lock_timeout=30, wait_timeout=5.0, beta=1.0, tags=None, local_ttl=None):
+        """캐시 조회, 없으면 compute()로 계산하여 저장 (stale-while-revalidate)
+
+        - ttl: 신선한 값으로 취급하는 시간 (soft TTL)
+        - stale_ttl: soft TTL 이후에도 stale 값을 제공하는 추가 시간 (hard TTL = ttl + stale_ttl)
+        - stale 값이나 조기 갱신 대상 값은 즉시 반환하고, 락을 얻은 한 요청만 백그라운드에서 다시 계산
+        - soft TTL 전이라도 계산 시간에 비례한 확률로 미리 갱신 (probabilistic early refresh)
+        - compute()가 예외를 내거나 is_error(값)가 참이면 negative_ttl 동안 실패 결과를 캐시
+        - tags: 저장된 값과 실패 결과를 invalidate_tags()로 함께 삭제할 태그 목록
+        - local_ttl: 신선한 값을 L1 캐시에 보관할 최대 시간 (soft TTL을 넘지 않음)
+        """
+        if not self.is_available():
+            return self._compute_safely(compute, is_error)[0]
+
+        use_local = bool(local_ttl) and self.local_ready()
+        if use_local:
+            cached = self.local.get(key)
+            if cached is not MISSING:
+                return cached
+
+        logical_key, key = key, self.cache_key(key)
+        refresh = (key, compute, ttl, stale_ttl, negative_ttl, is_error, lock_timeout, tags)
+
+        try:
+            raw = self.binary_client.get(key)
+            entry, size = self.codec.decode_sized(raw)
+        except CacheCodecError as e:
+            print(f"⚠️ Redis 캐시 값 해석 실패, 다시 계산: {e}")
+            entry = None
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 조회 실패: {e}")
+            return self._compute_safely(compute, is_error)[0]
+
+        now = time.time()
+        if entry is not None:
+            expires_at = entry['expires_at']
+            if now < expires_at:
+                # 계산이 오래 걸리는 값일수록 만료 전에 미리 갱신될 확률이 높다 (XFetch)
+                if now - entry.get('delta', 0) * beta * math.log(random.random() or 1e-12) >= expires_at:
+                    self.compute_stats['early_refresh'] += 1
+                    self._refresh_in_background(*refresh, seen_expires_at=expires_at)
+                else:
+                    self.compute_stats['hit'] += 1
+                    if use_local:
+                        self.local.set(logical_key, entry['value'], min(local_ttl, expires_at - now),
+                                       size=size, tags=tags)
+                return entry['value']
+
+            self.compute_stats['stale'] += 1
+            self._refresh_in_background(*refresh, seen_expires_at=expires_at)
+            return entry['value']
+
+        # 최근 실패한 계산이면 upstream을 다시 호출하지 않는다
+        try:
+            negative = self.codec.decode(self.binary_client.get(f"{key}:negative"))
+        except Exception:
+            negative = None
+        if isinstance(negative, dict) and 'value' in negative:
+            self.compute_stats['negative'] += 1
+            return negative['value']
+
+        self.compute_stats['miss'] += 1
+        token = self._acquire_compute_lock(key, lock_timeout)
+        if token is None:
+            # 다른 요청이 계산 중이면 결과가 저장될 때까지 대기
+            self.compute_stats['wait'] += 1
+            deadline = time.time() + wait_timeout
+            while time.time() < deadline:
+                time.sleep(0.05)
+                try:
+                    raw, negative_raw = self.binary_client.mget(key, f"{key}:negative")
+                    if raw or negative_raw:
+                        return self.codec.decode(raw or negative_raw)['value']
+                except Exception:
+                    break
+            token = self._acquire_compute_lock(key, lock_timeout)
+
+        try:
+            return self._compute_and_store(key, compute, ttl, stale_ttl, negative_ttl, is_error, tags)
+        finally:
+            if token is not None:
+                self.release_lock(key, token)
+
+    def _compute_safely(self, compute, is_error):
+        """compute() 실행 결과와 실패 여부 반환"""
+        try:
+            value = compute()
+        except Exception as e:
+            print(f"⚠️ 캐시 값 계산 실패: {e}")
+            return None, True
+        return value, bool(is_error and is_error(value))
+
+    def _compute_and_store(self, key, compute, ttl, stale_ttl, negative_ttl, is_error, tags=None):
+        started = time.time()
+        value, failed = self._compute_safely(compute, is_error)
+        delta = time.time() - started
+        try:
+            if failed:
+                if negative_ttl:
+                    self._store(f"{key}:negative", negative_ttl, self.codec.encode({'value': value}), tags)
+            else:
+                entry = {'value': value, 'expires_at': time.time() + ttl, 'delta': round(delta, 3)}
+                self._store(key, ttl + stale_ttl, self.codec.encode(entry), tags)
+                self.client.delete(f"{key}:negative")
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 설정 실패: {e}")
+        return value
+
+    def _refresh_in_background(self, key, compute, ttl, stale_ttl, negative_ttl, is_error, lock_timeout, tags=None,
+                               seen_expires_at=None):
+        """락을 얻은 경우에만 백그라운드 스레드에서 다시 계산 (실패 시 기존 stale 값 유지)
+
+        값을 읽은 뒤 락을 얻기 전에 다른 요청의 재계산이 끝났으면(저장된 만료 시각이 바뀜) 다시 계산하지 않는다.
+        """
+        token = self._acquire_compute_lock(key, lock_timeout)
+        if token is None:
+            return
+        if seen_expires_at is not None and self._stored_expires_at(key, seen_expires_at) != seen_expires_at:
+            self.release_lock(key, token)
+            return
+        app = current_app._get_current_object() if has_app_context() else None
+
+        def run():
+            try:
+                if app is not None:
+                    with app.app_context():
+                        self._compute_and_store(key, compute, ttl, stale_ttl, 0, is_error, tags)
+                else:
+                    self._compute_and_store(key, compute, ttl, stale_ttl, 0, is_error, tags)
+            finally:
+                self.release_lock(key, token)
+
+        threading.Thread(target=run, name=f'cache-refresh:{key}', daemon=True).start()
+
+    def _stored_expires_at(self, key, default=None):
+        """저장된 get_or_compute 항목의 soft 만료 시각 (없으면 None, 조회 실패 시 default)"""
+        try:
+            entry = self.codec.decode(self.binary_client.get(key))
+        except Exception:
+            return default
+        return entry.get('expires_at') if isinstance(entry, dict) else None
+
+    def _store(self, key, expire, value, tags=None):
+        """값 저장, 태그 집합 등록, L1 무효화 게시를 한 번의 파이프라인으로 실행"""
+        if not tags and not self.local_enabled:
+            self.binary_client.setex(key, expire, value)
+            return
+        pipe = self.binary_client.pipeline(transaction=False)
+        self._queue_store(pipe, key, expire, value, tags)
+        self.publish_invalidation(keys=[self._logical_key(key)], pipe=pipe)
+        pipe.execute()
+
+    def _queue_store(self, pipe, key, expire, value, tags=None):
+        pipe.setex(key, expire, value)
+        for tag in tags or ():
+            pipe.sadd(self.tag_key(tag), key)
+            pipe.expire(self.tag_key(tag), max(expire, TAG_SET_TTL))
+
+    def publish_invalidation(self, keys=(), tags=(), clear=False, pipe=None):
+        """현재 프로세스의 L1에서 제거하고 다른 프로세스에 무효화 메시지 게시"""
+        if not self.local_enabled:
+            return
+        self.bus.publish(self.client, keys=keys, tags=tags, clear=clear, pipe=pipe)
+
+    def acquire_lock(self, name, timeout):
+        """분산 락 획득 ({name}:lock 키에 소유자 토큰을 NX로 저장, timeout초 후 자동 만료)
+
+        성공하면 release_lock()에 넘길 토큰, 다른 소유자가 있으면 None을 반환한다.
+        Redis 오류는 호출자가 대체 경로를 고를 수 있도록 그대로 발생시킨다.
+        """
+        token = uuid.uuid4().hex
+        if self.client.set(f"{name}:lock", token, nx=True, px=max(1, int(timeout * 1000))):
+            return token
+        return None
+
+    def release_lock(self, name, token):
+        """토큰이 일치할 때만 락 해제 (만료 후 다른 소유자가 잡은 락은 지우지 않음)"""
+        try:
+            self.client.eval(_RELEASE_LOCK_SCRIPT, 1, f"{name}:lock", token)
+        except Exception as e:
+            print(f"⚠️ Redis 락 해제 실패: {e}")
+
+    def _acquire_compute_lock(self, key, lock_timeout):
+        try:
+            return self.acquire_lock(key, lock_timeout)
+        except Exception as e:
+            print(f"⚠️ Redis 락 획득 실패: {e}")
+        return None
+
+    def invalidate_tags(self, *tags):
+        """태그에 연결된 캐시 키만 삭제하고 삭제한 키 수를 반환
+
+        태그 집합을 임시 키로 RENAME 하여 떼어낸 뒤 SSCAN으로 읽으면서 UNLINK 파이프라인으로 삭제하므로,
+        무효화 도중 새로 저장된 키는 새 태그 집합에 등록되어 다음 무효화 대상이 된다.
+        """
+        if not self.is_available():
+            return 0
+
+        removed = 0
+        for tag in dict.fromkeys(tag for tag in tags if tag):
+            detached = f"{self.tag_key(tag)}:purge:{uuid.uuid4().hex}"
+            try:
+                self.client.rename(self.tag_key(tag), detached)
+            except redis.ResponseError:
+                # 태그 집합이 없음 (연결된 키가 없거나 이미 무효화됨)
+                continue
+            except Exception as e:
+                print(f"⚠️ Redis 태그 무효화 실패 ({tag}): {e}")
+                continue
+
+            try:
+                self.publish_invalidation(tags=[tag])
+                batch = []
+                for key in self.client.sscan_iter(detached, count=SCAN_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        removed += self._unlink(batch)
+                        batch = []
+                removed += self._unlink(batch)
+            except Exception as e:
+                print(f"⚠️ Redis 태그 무효화 실패 ({tag}): {e}")
+            finally:
+                try:
+                    self.client.unlink(detached)
+                except Exception:
+                    pass
+        return removed
+
+    def scan_cache_keys(self, match='*'):
+        """네임스페이스 안에서 패턴과 일치하는 캐시 키(네임스페이스 제외)를 순회"""
+        if not self.is_available():
+            return
+        prefix_length = len(self.namespace) + 1
+        for key in self.client.scan_iter(match=self.cache_key(match), count=SCAN_BATCH_SIZE):
+            yield key[prefix_length:]
+
+    def invalidate_prefix(self, prefix=''):
+        """네임스페이스 안에서 prefix로 시작하는 캐시 키를 SCAN/UNLINK로 삭제하고 삭제한 키 수를 반환"""
+        if not self.is_available():
+            return 0
+
+        removed = 0
+        try:
+            batch = []
+            for key in self.client.scan_iter(match=f"{self.cache_key(prefix)}*", count=SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= SCAN_BATCH_SIZE:
+                    removed += self._unlink(batch)
+                    batch = []
+            removed += self._unlink(batch)
+        except Exception as e:
+            print(f"⚠️ Redis 캐시 삭제 실패 ({prefix}*): {e}")
+        return removed
+
+    def _unlink(self, keys):
+        """키와 get_or_compute 실패 결과 키를 UNLINK 파이프라인으로 삭제 (다른 프로세스의 L1에서도 제거)"""
+        if not keys:
+            return 0
+        pipe = self.client.pipeline(transaction=False)
+        chunks = range(0, len(keys), 100)
+        for start in chunks:
+            chunk = keys[start:start + 100]
+            pipe.unlink(*chunk, *(f"{key}:negative" for key in chunk if not key.endswith(':negative')))
+        self.publish_invalidation(keys=[self._logical_key(key) for key in keys], pipe=pipe)
+        return sum(pipe.execute()[:len(chunks)])
+
     def clear_all_cache(self):
-        """모든 캐시 삭제"""
+        """모든 캐시 삭제 (캐시 네임스페이스의 키만 삭제하며 Celery 큐/결과 등 다른 키는 유지)"""
         if not self.is_available():
             return False
             
         try:
-            self.client.flushdb()
+            removed = self.invalidate_prefix('')
+            self.publish_invalidation(clear=True)
+            print(f"🧹 Redis 캐시 {removed}개 키 삭제 ({self.namespace}:*)")
             return True
         except Exception as e:
             print(f"⚠️ Redis 전체 캐시 삭제 실패: {e}")
             return False
 
+    def get_cache_stats(self):
+        """현재 프로세스의 캐시 통계 (get_or_compute 결과, L1 네임스페이스별 hit/miss/evict)"""
+        return {
+            'namespace': self.namespace,
+            'compute': dict(self.compute_stats),
+            'codec': self.codec.describe(),
+            'local': dict(self.local.get_stats(), enabled=self.local_enabled, subscribed=self.bus.connected)
+        }
+
 # 전역 인스턴스
 redis_utils = RedisUtils()
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Celery 작업 진행 스트림 (Redis Stream)
+
+작업마다 Redis Stream 하나({REDIS_TASK_STREAM_PREFIX}:{task_id})에 진행 이벤트를 추가하고,
+/api/tasks/<task_id>/progress/stream 이 XREAD로 이어 읽어 SSE로 보낸다.
+결과 백엔드는 단계가 바뀔 때만 갱신하므로 Terraform/Ansible 출력처럼 자주 나오는 진행 정보도
+백엔드 조회 없이 전달된다.
+
+- progress: 단계/진행률 (report_progress, update_state와 함께 기록)
+- log: Celery 작업 안에서 실행한 명령(run_command)의 출력 줄 (LOG_FLUSH_INTERVAL 단위로 묶어 기록)
+- done: 작업 종료 (Celery task_postrun 신호에서 진행 스트림이 있는 작업에만 기록)
+- 스트림 길이는 REDIS_TASK_STREAM_MAXLEN으로 근사 트리밍, REDIS_TASK_STREAM_TTL 후 만료
+- SSE 이벤트 id가 스트림 id이므로 Last-Event-ID로 끊긴 지점부터 다시 받을 수 있다
+- XREAD BLOCK은 대기 동안 연결을 점유하므로 공용 캐시 풀이 아닌 스트림 전용 풀
+  (REDIS_TASK_STREAM_MAX_CONNECTIONS)에서 읽고, 전용 연결이 모두 사용 중이면 공용 풀에서
+  대기 없이 읽은 뒤 POLL_INTERVAL만큼 쉰다
+"""
+import json
+import logging
+import re
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from celery import current_task
+
+from app.config.redis_config import RedisConfig
+from app.utils.redis_utils import redis_utils
+
+logger = logging.getLogger(__name__)
+
+# 명령 출력 줄을 스트림에 기록하는 최소 간격 (초) / 한 줄 최대 길이
+LOG_FLUSH_INTERVAL = 0.5
+MAX_LINE_LENGTH = 500
+# XREAD 대기 시간 (Redis 소켓 타임아웃보다 짧아야 함, ms)
+READ_BLOCK_MS = int(max(0.5, min(RedisConfig.REDIS_SOCKET_TIMEOUT - 1, 10)) * 1000)
+READ_COUNT = 100
+# 스트림 전용 연결이 모두 사용 중일 때 대기 없는 조회 간격 (초)
+POLL_INTERVAL = 1.0
+
+# 스트림 전용 풀의 연결 수만큼만 대기 읽기를 허용 (풀 반납 대기로 요청 스레드가 막히지 않도록)
+_blocking_slots = threading.BoundedSemaphore(RedisConfig.REDIS_TASK_STREAM_MAX_CONNECTIONS)
+
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+STREAM_ID = re.compile(r'\d+(-\d+)?')
+
+
+def stream_key(task_id: str) -> str:
+    return f"{RedisConfig.REDIS_TASK_STREAM_PREFIX}:{task_id}"
+
+
+def valid_stream_id(value: str) -> bool:
+    return bool(value) and STREAM_ID.fullmatch(value) is not None
+
+
+def append_events(task_id: str, events: List[Dict[str, Any]]) -> Optional[str]:
+    """이벤트를 작업 스트림에 추가하고 마지막 스트림 id 반환 (Redis가 없으면 None)"""
+    if not task_id or not events or not redis_utils.is_available():
+        return None
+    key = stream_key(task_id)
+    try:
+        pipe = redis_utils.client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(key, {'data': json.dumps(event, ensure_ascii=False, default=str)},
+                      maxlen=RedisConfig.REDIS_TASK_STREAM_MAXLEN, approximate=True)
+        pipe.expire(key, RedisConfig.REDIS_TASK_STREAM_TTL)
+        return pipe.execute()[-2]
+    except Exception as e:
+        logger.warning(f"⚠️ 작업 진행 이벤트 기록 실패 ({task_id}): {e}")
+        return None
+
+
+def report_progress(task, progress: int, message: str, **details):
+    """self.update_state(state='PROGRESS', ...) 대체
+
+    결과 백엔드(/api/tasks/<task_id>/status)와 진행 스트림에 같은 내용을 기록한다.
+    meta에는 기존 두 가지 형식(progress/message, current/total/status)을 모두 넣는다.
+    """
+    meta = dict(details, progress=progress, message=message, current=progress, total=100, status=message)
+    task.update_state(state='PROGRESS', meta=meta)
+    append_events(task.request.id, [dict(details, type='progress', progress=progress, message=message,
+                                         timestamp=time.time())])
+
+
+def current_task_id() -> Optional[str]:
+    """실행 중인 Celery 작업 id (작업 밖이거나 함수로 직접 호출한 경우 None)"""
+    if not current_task:
+        return None
+    request = current_task.request
+    return None if getattr(request, 'called_directly', True) else request.id
+
+
+def run_command(command: List[str], cwd: str = None, env: Dict[str, str] = None,
+                timeout: float = None) -> Tuple[int, str, str]:
+    """subprocess.run(capture_output=True, text=True)과 같은 (returncode, stdout, stderr)
+
+    Celery 작업 안에서 Redis를 사용할 수 있으면 stdout을 줄 단위로 읽으면서 작업 진행 스트림에
+    log 이벤트로 남긴다. 시간 초과 시 subprocess.TimeoutExpired를 발생시킨다.
+    """
+    task_id = current_task_id()
+    if task_id is None or not redis_utils.is_available():
+        result = subprocess.run(command, cwd=cwd, env=env, capture_output=True, text=True,
+                                encoding='utf-8', errors='replace', timeout=timeout)
+        return result.returncode, result.stdout, result.stderr
+
+    process = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               text=True, encoding='utf-8', errors='replace')
+    stderr_chunks = []
+    reader = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    reader.start()
+
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+    timer = threading.Timer(timeout, kill) if timeout else None
+    if timer is not None:
+        timer.daemon = True
+        timer.start()
+
+    stdout_lines = []
+    pending = []
+    last_flush = 0.0
+    try:
+        for line in process.stdout:
+            stdout_lines.append(line)
+            text = ANSI_ESCAPE.sub('', line).rstrip()
+            if text.strip():
+                pending.append(text[:MAX_LINE_LENGTH])
+            now = time.time()
+            if pending and now - last_flush >= LOG_FLUSH_INTERVAL:
+                append_events(task_id, [{'type': 'log', 'lines': pending, 'timestamp': now}])
+                pending, last_flush = [], now
+        if pending:
+            append_events(task_id, [{'type': 'log', 'lines': pending, 'timestamp': time.time()}])
+        returncode = process.wait()
+        reader.join()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(command, timeout, output=''.join(stdout_lines))
+    return returncode, ''.join(stdout_lines), ''.join(stderr_chunks)
+
+
+def finish_task(task_id: str, state: str, retval: Any = None):
+    """종료 이벤트 기록 (Celery task_postrun, 진행 스트림이 있는 작업만)"""
+    if not task_id or not redis_utils.is_available():
+        return
+    try:
+        if not redis_utils.client.exists(stream_key(task_id)):
+            return
+    except Exception:
+        return
+    append_events(task_id, [done_event(state, retval)])
+
+
+def done_event(state: str, retval: Any = None) -> Dict[str, Any]:
+    """작업 결과로 done 이벤트 생성 (예외를 잡아 success=False를 반환하는 작업도 실패로 표시)"""
+    event = {'type': 'done', 'state': state, 'success': state == 'SUCCESS', 'timestamp': time.time()}
+    if isinstance(retval, dict):
+        event['success'] = event['success'] and bool(retval.get('success', True))
+        message = retval.get('message') or retval.get('error')
+        if message:
+            event['message'] = message
+    elif isinstance(retval, BaseException):
+        event['message'] = str(retval)
+    return event
+
+
+def read_events(task_id: str, last_id: str = '0-0', block_ms: int = READ_BLOCK_MS) -> List[Tuple[str, Dict[str, Any]]]:
+    """last_id 이후 이벤트 [(스트림 id, 이벤트)] (없으면 block_ms 동안 대기)"""
+    streams = {stream_key(task_id): last_id}
+    if _blocking_slots.acquire(blocking=False):
+        try:
+            result = RedisConfig.get_stream_client().xread(streams, count=READ_COUNT, block=block_ms)
+        finally:
+            _blocking_slots.release()
+    else:
+        result = redis_utils.client.xread(streams, count=READ_COUNT)
+        if not result:
+            time.sleep(min(POLL_INTERVAL, block_ms / 1000))
+    events = []
+    for _key, entries in result or []:
+        for stream_id, fields in entries:
+            try:
+                events.append((stream_id, json.loads(fields.get('data') or '{}')))
+            except ValueError:
+                continue
+    return events
+
+
+def backend_done_event(task_id: str) -> Optional[Dict[str, Any]]:
+    """진행 스트림이 없는 작업(진행 보고 없음, 만료)이 이미 끝났으면 결과 백엔드 상태로 done 이벤트 생성"""
+    if redis_utils.client.exists(stream_key(task_id)):
+        return None
+    from celery import states
+    from app.celery_app import celery_app
+
+    result = celery_app.AsyncResult(task_id)
+    if result.state not in states.READY_STATES:
+        return None
+    return done_event(result.state, result.result)
@@ -1,2 +1,4 @@
 pkill -f "celery.*worker"
+pkill -f "celery.*beat"
 nohup celery -A app.celery_app worker --loglevel=info --concurrency=2 > celery_worker.log 2>&1 &
+nohup celery -A app.celery_app beat --loglevel=info --schedule=instance/celerybeat-schedule > celery_beat.log 2>&1 &
\ No newline at end of file
@@ -3015,6 +3015,32 @@ RestartSec=10
 StandardOutput=journal
 StandardError=journal
 
+[Install]
+WantedBy=multi-user.target
+EOF
+
+    # 주기 작업 스케줄러 (인벤토리 스냅샷 갱신)
+    sudo tee /etc/systemd/system/celery-beat.service > /dev/null << EOF
+[Unit]
+Description=Celery Beat for Proxmox Manager
+After=network.target docker.service celery-worker.service
+Wants=docker.service
+
+[Service]
+Type=simple
+User=$USER
+Group=$USER
+WorkingDirectory=$APP_DIR
+EnvironmentFile=$APP_DIR/.env
+Environment=PATH=$APP_DIR/venv/bin:/usr/local/bin:/usr/bin:/bin
+Environment=VIRTUAL_ENV=$APP_DIR/venv
+Environment=PYTHONPATH=$APP_DIR
+ExecStart=$VENV_CELERY -A app.celery_app beat --loglevel=info --schedule=$APP_DIR/instance/celerybeat-schedule
+Restart=always
+RestartSec=10
+StandardOutput=journal
+StandardError=journal
+
 [Install]
 WantedBy=multi-user.target
 EOF
@@ -3026,6 +3052,13 @@ EOF
     else
         log_warning "Celery Worker 시작 실패. 로그를 확인하세요: sudo journalctl -u celery-worker -n 50"
     fi
+
+    sudo systemctl enable celery-beat
+    if sudo systemctl restart celery-beat; then
+        log_success "Celery Beat 시작 완료"
+    else
+        log_warning "Celery Beat 시작 실패. 로그를 확인하세요: sudo journalctl -u celery-beat -n 50"
+    fi
 }
 
 # ========================================
@@ -0,0 +1,37 @@
+"""
+Proxmox Manager 비동기 SSE 이벤트 게이트웨이 실행 파일
+
+알림 스트림(/notifications/stream)과 서버 이벤트 스트림(/events/servers)을 asyncio로 처리하여 연결 수가 많아도 Flask 워커를 잡지 않는다.
+.env 에 EVENT_GATEWAY_URL(브라우저가 접속할 주소)과 필요하면 EVENT_GATEWAY_ALLOWED_ORIGINS를 설정한 뒤 실행한다.
+"""
+import os
+import sys
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+try:
+    import uvicorn
+except ImportError:
+    print("❌ uvicorn이 설치되지 않았습니다: pip install uvicorn")
+    sys.exit(1)
+
+from app.gateway import create_gateway
+
+if __name__ == '__main__':
+    gateway = create_gateway()
+    host = gateway.flask_app.config.get('EVENT_GATEWAY_HOST', '0.0.0.0')
+    port = gateway.flask_app.config.get('EVENT_GATEWAY_PORT', 5001)
+
+    print("🚀 이벤트 게이트웨이 시작 중...")
+    print(f"📡 알림 스트림: http://{host}:{port}/notifications/stream")
+    print(f"📡 서버 이벤트 스트림: http://{host}:{port}/events/servers")
+
+    # 연결은 이벤트 루프 하나에서 처리하므로 단일 프로세스로 실행 (연결당 스레드 없음)
+    uvicorn.run(gateway, host=host, port=port, log_level='info', timeout_keep_alive=75)
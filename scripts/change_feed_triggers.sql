@@ -0,0 +1,67 @@
+-- PostgreSQL 변경 알림 트리거 (LISTEN/NOTIFY)
+-- notifications / servers 테이블이 바뀌면 커밋 시점에 proxmox_manager_changes 채널로 짧은 JSON을 보낸다.
+-- 웹 프로세스의 변경 수신 서비스(app/services/change_feed.py)가 이를 받아 SSE 스트림과 인벤토리 스냅샷에 반영한다.
+--
+-- 적용: psql "$DATABASE_URL" -f scripts/change_feed_triggers.sql
+-- 적용 후 .env 에 DB_CHANGE_FEED_ENABLED=true 설정 (채널명을 바꿨다면 DB_CHANGE_FEED_CHANNEL도 함께 변경)
+-- 여러 번 실행해도 안전하다.
+
+-- 알림 본문(message/details)은 NOTIFY 페이로드 한도(8000 bytes)를 넘을 수 있으므로 id만 보내고
+-- 수신 측에서 한 번에 조회한다. 서버는 인벤토리 갱신에 필요한 이름/상태와 트랜잭션 id만 보낸다.
+-- (txid: 모든 웹 프로세스가 같은 알림을 받으므로 수신 측이 변경 단위로 갱신 요청 중복을 제거하는 데 사용)
+CREATE OR REPLACE FUNCTION proxmox_manager_notify_change() RETURNS trigger AS $$
+DECLARE
+    row_data RECORD;
+    payload JSONB;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_data := OLD;
+    ELSE
+        row_data := NEW;
+    END IF;
+
+    IF TG_TABLE_NAME = 'notifications' THEN
+        payload := jsonb_build_object(
+            'table', TG_TABLE_NAME,
+            'op', TG_OP,
+            'id', row_data.id
+        );
+    ELSE
+        payload := jsonb_build_object(
+            'table', TG_TABLE_NAME,
+            'op', TG_OP,
+            'id', row_data.id,
+            'name', row_data.name,
+            'status', row_data.status,
+            'txid', txid_current()
+        );
+        -- 이름이 바뀐 경우 이전 이름의 스냅샷 항목도 갱신하도록 함께 전달
+        IF TG_OP = 'UPDATE' AND OLD.name IS DISTINCT FROM NEW.name THEN
+            payload := payload || jsonb_build_object('old_name', OLD.name);
+        END IF;
+    END IF;
+
+    PERFORM pg_notify(TG_ARGV[0], payload::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 알림은 새로 추가된 것만 전달 (읽음 표시/삭제는 각 사용자 화면에서 처리)
+DROP TRIGGER IF EXISTS notifications_change_feed ON notifications;
+CREATE TRIGGER notifications_change_feed
+    AFTER INSERT ON notifications
+    FOR EACH ROW EXECUTE FUNCTION proxmox_manager_notify_change('proxmox_manager_changes');
+
+DROP TRIGGER IF EXISTS servers_change_feed ON servers;
+CREATE TRIGGER servers_change_feed
+    AFTER INSERT OR DELETE ON servers
+    FOR EACH ROW EXECUTE FUNCTION proxmox_manager_notify_change('proxmox_manager_changes');
+
+-- updated_at만 바뀐 UPDATE는 알리지 않음
+DROP TRIGGER IF EXISTS servers_change_feed_update ON servers;
+CREATE TRIGGER servers_change_feed_update
+    AFTER UPDATE ON servers
+    FOR EACH ROW
+    WHEN ((OLD.name, OLD.vmid, OLD.status, OLD.ip_address, OLD.role, OLD.firewall_group, OLD.os_type, OLD.cpu, OLD.memory)
+          IS DISTINCT FROM (NEW.name, NEW.vmid, NEW.status, NEW.ip_address, NEW.role, NEW.firewall_group, NEW.os_type, NEW.cpu, NEW.memory))
+    EXECUTE FUNCTION proxmox_manager_notify_change('proxmox_manager_changes');
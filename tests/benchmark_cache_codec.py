@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+캐시 코덱 벤치마크
+
+VM 1000개 규모의 인벤토리 스냅샷(전체 서버 맵)과 백업 목록을 설치된 직렬화/압축 조합으로
+인코딩/디코딩하여 소요 시간과 저장 크기를 비교한다. --redis-url을 주면 실제 Redis에 저장하여
+MEMORY USAGE로 측정한 메모리 사용량도 함께 출력한다.
+
+사용 방법:
+    python tests/benchmark_cache_codec.py
+    python tests/benchmark_cache_codec.py --vms 1000 --repeat 20
+    python tests/benchmark_cache_codec.py --redis-url redis://localhost:6379/0 --json results.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_proxmox_api import FakeFleet, GB
+
+from app.utils.cache_codec import CacheCodec, available_compressions, available_serializers
+
+
+def build_snapshot(fleet: FakeFleet) -> Dict[str, Any]:
+    """인벤토리 스냅샷과 같은 모양의 전체 서버 맵"""
+    servers = {}
+    for vm in fleet.vms.values():
+        disks = [{'device': 'scsi0', 'size_gb': vm['disk_gb'], 'storage': 'local-lvm'}]
+        servers[vm['name']] = {
+            'name': vm['name'],
+            'status': vm['status'],
+            'vmid': vm['vmid'],
+            'node': vm['node'],
+            'cpu': vm['cpu'],
+            'memory': vm['mem'],
+            'maxmem': vm['memory_mb'] * 1024 * 1024,
+            'uptime': vm['uptime'],
+            'disk': 0,
+            'maxdisk': vm['disk_gb'] * GB,
+            'role': 'web' if vm['vmid'] % 3 == 0 else None,
+            'firewall_group': 'default-web' if vm['vmid'] % 4 == 0 else None,
+            'os_type': 'rocky',
+            'ip_addresses': [vm['ip']],
+            'vm_cpu': vm['cores'],
+            'cpu_usage_percent': round(vm['cpu'] * 100, 2),
+            'memory_usage_percent': 0.0,
+            'disk_usage_percent': 0.0,
+            'total_disk_gb': vm['disk_gb'],
+            'disks': disks
+        }
+    running = sum(1 for server in servers.values() if server['status'] == 'running')
+    return {
+        'servers': servers,
+        'stats': {'total_servers': len(servers), 'running_servers': running, 'stopped_servers': len(servers) - running},
+        'generation': 1,
+        'built_at': time.time(),
+        'reason': 'benchmark'
+    }
+
+
+def build_backup_catalog(fleet: FakeFleet) -> Dict[str, Any]:
+    """get_node_backups() 응답과 같은 모양의 백업 목록"""
+    backups = []
+    for node, items in fleet.backups.items():
+        for item in items:
+            backups.append(dict(item, node=node, name=item['volid'].split('/')[-1],
+                                size_gb=round(item['size'] / GB, 2)))
+    return {'success': True, 'data': {'backups': backups, 'total': len(backups)}}
+
+
+def measure(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def run(payloads: Dict[str, Any], args) -> List[Dict[str, Any]]:
+    redis_client = None
+    if args.redis_url:
+        import redis
+        redis_client = redis.Redis.from_url(args.redis_url)
+
+    # 이전 형식 (json.dumps 문자열) 기준값
+    results = []
+    for payload_name, payload in payloads.items():
+        legacy = json.dumps(payload, ensure_ascii=False)
+        results.append(measure_case(payload_name, 'legacy-json', 'none', payload,
+                                    lambda value: json.dumps(value, ensure_ascii=False).encode('utf-8'),
+                                    lambda data: json.loads(data), legacy.encode('utf-8'), redis_client, args))
+
+        for serializer in available_serializers():
+            for compression in available_compressions():
+                codec = CacheCodec(serializer=serializer, compression=compression,
+                                   compress_min_bytes=0 if compression != 'none' else 1 << 62)
+                encoded = codec.encode(payload)
+                results.append(measure_case(payload_name, serializer, compression, payload, codec.encode,
+                                            codec.decode, encoded, redis_client, args))
+    return results
+
+
+def measure_case(payload_name, serializer, compression, payload, encode, decode, encoded, redis_client, args):
+    result = {
+        'payload': payload_name,
+        'serializer': serializer,
+        'compression': compression,
+        'bytes': len(encoded),
+        'encode_ms': measure(lambda: encode(payload), args.repeat),
+        'decode_ms': measure(lambda: decode(encoded), args.repeat),
+        'redis_bytes': None
+    }
+    if redis_client is not None:
+        key = f"benchmark:cache_codec:{payload_name}:{serializer}:{compression}"
+        redis_client.set(key, encoded, ex=60)
+        result['redis_bytes'] = redis_client.memory_usage(key)
+        redis_client.delete(key)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캐시 코덱 벤치마크 (인벤토리 스냅샷 / 백업 목록)')
+    parser.add_argument('--vms', type=int, default=1000, help='전체 VM 수')
+    parser.add_argument('--nodes', type=int, default=5, help='노드 수')
+    parser.add_argument('--backups', type=int, default=3, help='VM당 백업 파일 수')
+    parser.add_argument('--repeat', type=int, default=10, help='측정 반복 횟수')
+    parser.add_argument('--redis-url', help='Redis 메모리 사용량 측정용 URL (예: redis://localhost:6379/0)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    fleet = FakeFleet(nodes=args.nodes, vms_per_node=max(1, args.vms // args.nodes), backups_per_vm=args.backups)
+    payloads = {
+        'snapshot': build_snapshot(fleet),
+        'backups': build_backup_catalog(fleet)
+    }
+    results = run(payloads, args)
+
+    print(f"📊 캐시 코덱 벤치마크 (VM {len(fleet.vms)}개, 반복 {args.repeat}회, median)")
+    print(f"   직렬화: {', '.join(available_serializers())} / 압축: {', '.join(available_compressions())}")
+    print(f"{'데이터':<10} {'직렬화':<12} {'압축':<6} {'크기(KB)':>10} {'Redis(KB)':>10} {'encode(ms)':>11} {'decode(ms)':>11}")
+    for result in results:
+        redis_kb = f"{result['redis_bytes'] / 1024:.1f}" if result['redis_bytes'] else '-'
+        print(f"{result['payload']:<10} {result['serializer']:<12} {result['compression']:<6} "
+              f"{result['bytes'] / 1024:>10.1f} {redis_kb:>10} {result['encode_ms']:>11} {result['decode_ms']:>11}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+ProxmoxService 벤치마크 (가짜 Proxmox API 사용)
+
+get_all_vms, 일괄 시작/중지, 노드 백업 목록 조회를 VM 수별(기본 10/100/1000)로 반복 측정한다.
+
+사용 방법:
+    python tests/benchmark_proxmox_service.py
+    python tests/benchmark_proxmox_service.py --sizes 100,1000 --nodes 5 --latency 0.02 --jitter 0.01
+    python tests/benchmark_proxmox_service.py --error-rate 0.05 --json results.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_proxmox_api import (DEFAULT_ENDPOINT, FakeFleet, FakeProxmoxAPI, create_service_app,
+                              serve_in_process)
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        'min_ms': round(min(timings), 1),
+        'median_ms': round(statistics.median(timings), 1),
+        'max_ms': round(max(timings), 1)
+    }
+
+
+def run_size(total_vms: int, args) -> Dict[str, Any]:
+    from app.services import proxmox_service as proxmox_module
+    from app.services.proxmox_service import ProxmoxService
+    from app.services.vm_index import vm_index
+
+    vms_per_node = max(1, total_vms // args.nodes)
+    fleet = FakeFleet(nodes=args.nodes, vms_per_node=vms_per_node, backups_per_vm=args.backups)
+    api = FakeProxmoxAPI(fleet, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                         task_duration=args.task_duration)
+    app = create_service_app(DEFAULT_ENDPOINT, fleet)
+
+    # 관리 대상 서버 목록 (tfvars) 을 합성 클러스터 기준으로 생성
+    tfvars = tempfile.NamedTemporaryFile('w', suffix='.tfvars.json', delete=False, encoding='utf-8')
+    json.dump(fleet.tfvars(), tfvars)
+    tfvars.close()
+    original_tfvars = proxmox_module.TFVARS_PATH
+    proxmox_module.TFVARS_PATH = tfvars.name
+    vm_index.clear()
+
+    result = {'vms': len(fleet.vms), 'nodes': args.nodes}
+    try:
+        with serve_in_process(api), app.app_context():
+            service = ProxmoxService()
+            bulk_names = [vm['name'] for vm in list(fleet.vms.values())[:args.bulk]]
+
+            def bulk(action: str):
+                upids = []
+                for name in bulk_names:
+                    outcome = getattr(service, f"{action}_vm")(name)
+                    upid = (outcome.get('data') or {}).get('upid')
+                    if upid:
+                        upids.append(upid)
+                for upid in upids:
+                    service.task_tracker.wait(upid, timeout=60)
+
+            for name, fn in (
+                ('get_all_vms', service.get_all_vms),
+                ('bulk_start', lambda: bulk('start')),
+                ('bulk_stop', lambda: bulk('stop')),
+                ('get_node_backups', service.get_node_backups),
+            ):
+                api.stats.clear()
+                timing = measure(fn, args.repeat)
+                timing['requests'] = api.request_count() // args.repeat
+                result[name] = timing
+    finally:
+        proxmox_module.TFVARS_PATH = original_tfvars
+        os.unlink(tfvars.name)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ProxmoxService 벤치마크 (가짜 Proxmox API)')
+    parser.add_argument('--sizes', default='10,100,1000', help='전체 VM 수 목록 (쉼표 구분)')
+    parser.add_argument('--nodes', type=int, default=3, help='노드 수')
+    parser.add_argument('--backups', type=int, default=1, help='VM당 백업 파일 수')
+    parser.add_argument('--latency', type=float, default=0.01, help='요청당 기본 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 상한 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--task-duration', type=float, default=0.2, help='비동기 작업 완료 시간 (초)')
+    parser.add_argument('--bulk', type=int, default=10, help='일괄 작업 대상 VM 수')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--verbose', action='store_true', help='서비스 로그 출력')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        if args.verbose:
+            results.append(run_size(size, args))
+            continue
+        # 서비스의 진행 로그(print)는 측정 결과만 보이도록 숨김
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                results.append(run_size(size, args))
+            finally:
+                sys.stdout = stdout
+
+    print(f"📊 ProxmoxService 벤치마크 (노드 {args.nodes}개, 지연 {args.latency}s+{args.jitter}s, "
+          f"오류율 {args.error_rate}, 반복 {args.repeat}회)")
+    print(f"{'VM 수':>8} {'작업':<18} {'min(ms)':>10} {'median(ms)':>12} {'max(ms)':>10} {'요청 수':>8}")
+    for result in results:
+        for name in ('get_all_vms', 'bulk_start', 'bulk_stop', 'get_node_backups'):
+            timing = result[name]
+            print(f"{result['vms']:>8} {name:<18} {timing['min_ms']:>10} {timing['median_ms']:>12} "
+                  f"{timing['max_ms']:>10} {timing['requests']:>8}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
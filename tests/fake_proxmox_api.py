@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+가짜 Proxmox VE API (벤치마크/테스트용)
+
+실제 클러스터 없이 ProxmoxService를 실행할 수 있도록 PVE API의 주요 엔드포인트를 흉내 낸다.
+
+- 합성 클러스터: N개 노드 × 노드당 M개 VM (config/status/스토리지/백업/방화벽 그룹 포함)
+- 지연 시간(latency + jitter)과 오류율(error_rate, 기본 503) 주입
+- start/stop/reboot/shutdown/vzdump 는 UPID를 반환하고 task_duration 후 완료된다
+
+사용 방법:
+    # 1) 프로세스 내 사용 (requests 전송 어댑터, 네트워크 없음)
+    api = FakeProxmoxAPI(FakeFleet(nodes=3, vms_per_node=100), latency=0.01)
+    with serve_in_process(api, endpoint='https://fake-pve:8006'):
+        ...  # PROXMOX_ENDPOINT='https://fake-pve:8006' 인 ProxmoxService 사용
+
+    # 2) 실제 HTTP 서버로 실행
+    python tests/fake_proxmox_api.py --nodes 3 --vms 100 --latency 0.02 --port 18006
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+DEFAULT_ENDPOINT = 'https://fake-pve:8006'
+DEFAULT_USERNAME = 'root@pam'
+DEFAULT_PASSWORD = 'fake-password'
+
+GB = 1024 * 1024 * 1024
+MB = 1024 * 1024
+
+
+class FakeFleet:
+    """합성 클러스터 상태 (노드, VM, 스토리지, 백업, 방화벽 그룹)"""
+
+    def __init__(self, nodes: int = 3, vms_per_node: int = 10, backups_per_vm: int = 1,
+                 running_ratio: float = 0.7, name_prefix: str = 'bench', seed: int = 0,
+                 username: str = DEFAULT_USERNAME, password: str = DEFAULT_PASSWORD):
+        self.username = username
+        self.password = password
+        rng = random.Random(seed)
+
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        for index in range(1, nodes + 1):
+            name = f"pve{index}"
+            self.nodes[name] = {
+                'node': name,
+                'status': 'online',
+                'maxcpu': 32,
+                'maxmem': 128 * GB,
+                'mem': rng.randint(16, 96) * GB,
+                'cpu': round(rng.uniform(0.05, 0.6), 3),
+                'maxdisk': 500 * GB,
+                'disk': rng.randint(50, 300) * GB,
+                'uptime': rng.randint(3600, 90 * 86400)
+            }
+
+        self.vms: Dict[int, Dict[str, Any]] = {}
+        self.backups: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.nodes}
+        vmid = 100
+        node_names = list(self.nodes)
+        for index in range(nodes * vms_per_node):
+            node = node_names[index % len(node_names)]
+            running = rng.random() < running_ratio
+            cores = rng.choice([1, 2, 4, 8])
+            memory_mb = rng.choice([1024, 2048, 4096, 8192])
+            disk_gb = rng.choice([20, 40, 80])
+            self.vms[vmid] = {
+                'vmid': vmid,
+                'name': f"{name_prefix}-{index + 1:04d}",
+                'node': node,
+                'status': 'running' if running else 'stopped',
+                'template': 0,
+                'cores': cores,
+                'memory_mb': memory_mb,
+                'disk_gb': disk_gb,
+                'mem': int(memory_mb * MB * rng.uniform(0.2, 0.9)) if running else 0,
+                'cpu': round(rng.uniform(0.0, 0.5), 4) if running else 0,
+                'uptime': rng.randint(60, 30 * 86400) if running else 0,
+                'ip': f"192.168.{100 + index // 250}.{index % 250 + 2}"
+            }
+            for backup_index in range(backups_per_vm):
+                ctime = 1755600000 + backup_index * 86400 + vmid
+                stamp = time.strftime('%Y_%m_%d-%H_%M_%S', time.gmtime(ctime))
+                self.backups[node].append({
+                    'volid': f"local:backup/vzdump-qemu-{vmid}-{stamp}.vma.zst",
+                    'content': 'backup',
+                    'format': 'vma.zst',
+                    'size': rng.randint(1, 8) * GB,
+                    'ctime': ctime,
+                    'vmid': vmid
+                })
+            vmid += 1
+
+        self.storages = [
+            {'storage': 'local', 'type': 'dir', 'content': 'backup,iso,vztmpl', 'shared': 0, 'total': 100 * GB},
+            {'storage': 'local-lvm', 'type': 'lvmthin', 'content': 'images,rootdir', 'shared': 0, 'total': 400 * GB},
+            {'storage': 'nfs-shared', 'type': 'nfs', 'content': 'images,backup', 'shared': 1, 'total': 4096 * GB}
+        ]
+
+        self.firewall_groups: Dict[str, Dict[str, Any]] = {
+            'web': {'comment': '웹 서버', 'rules': [
+                {'pos': 0, 'type': 'in', 'action': 'ACCEPT', 'proto': 'tcp', 'dport': '80', 'enable': 1},
+                {'pos': 1, 'type': 'in', 'action': 'ACCEPT', 'proto': 'tcp', 'dport': '443', 'enable': 1}
+            ]},
+            'ssh': {'comment': 'SSH 허용', 'rules': [
+                {'pos': 0, 'type': 'in', 'action': 'ACCEPT', 'proto': 'tcp', 'dport': '22', 'enable': 1}
+            ]}
+        }
+
+    def vm_by_id(self, node: str, vmid: int) -> Optional[Dict[str, Any]]:
+        vm = self.vms.get(vmid)
+        if vm is None or vm['node'] != node:
+            return None
+        return vm
+
+    def tfvars(self) -> Dict[str, Any]:
+        """관리 대상 서버 목록 (terraform.tfvars.json 형식)"""
+        return {'servers': {
+            vm['name']: {
+                'cpu': vm['cores'],
+                'memory': vm['memory_mb'],
+                'role': 'web',
+                'network_devices': [{'ip_address': vm['ip']}]
+            }
+            for vm in self.vms.values()
+        }}
+
+
+class FakeProxmoxAPI:
+    """PVE API 요청 처리기 (전송 계층과 무관하게 method/path/params → (status, payload))"""
+
+    def __init__(self, fleet: FakeFleet = None, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, task_duration: float = 0.5,
+                 seed: int = 0):
+        self.fleet = fleet or FakeFleet()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.task_duration = task_duration
+
+        self.tickets: Dict[str, float] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.stats: Counter = Counter()       # 'GET /nodes/{node}/status' 형식 라우트별 요청 수
+        self.injected_errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+        self._pid = 1000
+
+        self._routes: List[Tuple[str, str, re.Pattern, Any]] = []
+        for method, route, handler in (
+            ('POST', '/access/ticket', self._login),
+            ('GET', '/version', self._version),
+            ('GET', '/nodes', self._nodes),
+            ('GET', '/cluster/resources', self._cluster_resources),
+            ('GET', '/cluster/firewall/groups', self._firewall_groups),
+            ('GET', '/cluster/firewall/groups/{group}', self._firewall_group_rules),
+            ('GET', '/nodes/{node}/status', self._node_status),
+            ('GET', '/nodes/{node}/qemu', self._node_qemu),
+            ('GET', '/nodes/{node}/qemu/{vmid}/config', self._vm_config),
+            ('GET', '/nodes/{node}/qemu/{vmid}/status/current', self._vm_status),
+            ('POST', '/nodes/{node}/qemu/{vmid}/status/{action}', self._vm_action),
+            ('POST', '/nodes/{node}/vzdump', self._vzdump),
+            ('GET', '/nodes/{node}/storage', self._node_storage),
+            ('GET', '/nodes/{node}/storage/{storage}/content', self._storage_content),
+            ('GET', '/nodes/{node}/tasks', self._node_tasks),
+            ('GET', '/nodes/{node}/tasks/{upid}/status', self._task_status),
+        ):
+            pattern = re.compile('^' + re.sub(r'\{(\w+)\}', r'(?P<\1>[^/]+)', route) + '$')
+            self._routes.append((method, route, pattern, handler))
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+    def handle(self, method: str, path: str, params: Dict[str, Any] = None, data: Dict[str, Any] = None,
+               headers: Dict[str, str] = None) -> Tuple[int, Dict[str, Any]]:
+        """요청 1건 처리 (지연/오류 주입 포함)"""
+        method = method.upper()
+        path = unquote(path)
+        if path.startswith('/api2/json'):
+            path = path[len('/api2/json'):]
+        path = path.rstrip('/') or '/'
+
+        for route_method, route, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                break
+        else:
+            return 501, {'data': None, 'errors': f"fake api: {method} {path} not implemented"}
+
+        with self._lock:
+            self.stats[f"{method} {route}"] += 1
+        delay = self.delay()
+        if delay:
+            time.sleep(delay)
+
+        if handler != self._login:
+            if not self._authorized(headers or {}):
+                return 401, {'data': None, 'message': 'authentication failure'}
+            with self._lock:
+                inject_error = self.error_rate and self._rng.random() < self.error_rate
+            if inject_error:
+                with self._lock:
+                    self.injected_errors += 1
+                return self.error_status, {'data': None, 'message': 'injected error'}
+
+        with self._lock:
+            self._settle_tasks()
+            return handler(params or {}, data or {}, **match.groupdict())
+
+    def delay(self) -> float:
+        with self._lock:
+            return self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+
+    def request_count(self, route: str = None) -> int:
+        """라우트('GET /nodes/{node}/storage' 형식)별 요청 수 (생략 시 전체 합계)"""
+        if route is None:
+            return sum(self.stats.values())
+        return self.stats[route]
+
+    def expire_tickets(self):
+        """발급된 티켓을 모두 무효화 (401 재인증 경로 테스트용)"""
+        with self._lock:
+            self.tickets.clear()
+
+    def _authorized(self, headers: Dict[str, str]) -> bool:
+        cookie = headers.get('Cookie') or headers.get('cookie') or ''
+        for part in cookie.split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'PVEAuthCookie':
+                with self._lock:
+                    issued = self.tickets.get(unquote(value))
+                return issued is not None and time.time() - issued < 7200
+        return False
+
+    # ------------------------------------------------------------------
+    # 작업(UPID)
+    # ------------------------------------------------------------------
+    def _new_task(self, node: str, task_type: str, vmid: int, on_finish=None) -> str:
+        self._pid += 1
+        starttime = int(time.time())
+        upid = f"UPID:{node}:{self._pid:08X}:00000000:{starttime:08X}:{task_type}:{vmid}:{self.fleet.username}:"
+        self.tasks[upid] = {
+            'upid': upid,
+            'node': node,
+            'type': task_type,
+            'id': str(vmid),
+            'user': self.fleet.username,
+            'pid': self._pid,
+            'starttime': starttime,
+            'due': time.time() + self.task_duration,
+            'endtime': None,
+            'exitstatus': None,
+            'on_finish': on_finish
+        }
+        return upid
+
+    def _settle_tasks(self):
+        now = time.time()
+        for task in self.tasks.values():
+            if task['endtime'] is None and now >= task['due']:
+                task['endtime'] = int(now)
+                task['exitstatus'] = 'OK'
+                if task['on_finish'] is not None:
+                    task['on_finish']()
+
+    @staticmethod
+    def _task_entry(task: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {k: task[k] for k in ('upid', 'node', 'type', 'id', 'user', 'pid', 'starttime')}
+        if task['endtime'] is not None:
+            entry['endtime'] = task['endtime']
+            entry['status'] = task['exitstatus']
+        return entry
+
+    # ------------------------------------------------------------------
+    # 라우트 핸들러
+    # ------------------------------------------------------------------
+    def _login(self, params, data):
+        if data.get('username') != self.fleet.username or data.get('password') != self.fleet.password:
+            return 401, {'data': None, 'message': 'authentication failure'}
+        ticket = f"PVE:{self.fleet.username}:{int(time.time()):08X}::{hashlib.sha1(str(random.random()).encode()).hexdigest()}"
+        self.tickets[ticket] = time.time()
+        return 200, {'data': {
+            'ticket': ticket,
+            'CSRFPreventionToken': f"{int(time.time()):08X}:fakecsrf",
+            'username': self.fleet.username
+        }}
+
+    def _version(self, params, data):
+        return 200, {'data': {'version': '8.2.4', 'release': '8.2', 'repoid': 'fake'}}
+
+    def _nodes(self, params, data):
+        return 200, {'data': [dict(node, type='node', id=f"node/{node['node']}") for node in self.fleet.nodes.values()]}
+
+    def _vm_resource(self, vm: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'id': f"qemu/{vm['vmid']}",
+            'type': 'qemu',
+            'vmid': vm['vmid'],
+            'name': vm['name'],
+            'node': vm['node'],
+            'status': vm['status'],
+            'template': vm['template'],
+            'maxcpu': vm['cores'],
+            'cpu': vm['cpu'],
+            'maxmem': vm['memory_mb'] * MB,
+            'mem': vm['mem'],
+            'maxdisk': vm['disk_gb'] * GB,
+            'disk': 0,
+            'uptime': vm['uptime']
+        }
+
+    def _cluster_resources(self, params, data):
+        resource_type = params.get('type')
+        resources = []
+        if resource_type in (None, 'vm'):
+            resources.extend(self._vm_resource(vm) for vm in self.fleet.vms.values())
+        if resource_type in (None, 'node'):
+            resources.extend(dict(node, type='node', id=f"node/{node['node']}") for node in self.fleet.nodes.values())
+        return 200, {'data': resources}
+
+    def _node_status(self, params, data, node):
+        info = self.fleet.nodes.get(node)
+        if info is None:
+            return 500, {'data': None, 'message': f"hostname lookup '{node}' failed"}
+        return 200, {'data': {
+            'cpu': info['cpu'],
+            'cpuinfo': {'cpus': info['maxcpu'], 'cores': info['maxcpu'] // 2, 'sockets': 2, 'model': 'Fake CPU'},
+            'memory': {'total': info['maxmem'], 'used': info['mem'], 'free': info['maxmem'] - info['mem']},
+            'uptime': info['uptime'],
+            'pveversion': 'pve-manager/8.2.4/fake'
+        }}
+
+    def _node_qemu(self, params, data, node):
+        vms = []
+        for vm in self.fleet.vms.values():
+            if vm['node'] == node:
+                resource = self._vm_resource(vm)
+                resource.pop('node')
+                resource['cpus'] = resource.pop('maxcpu')
+                vms.append(resource)
+        return 200, {'data': vms}
+
+    def _missing_vm(self, vmid):
+        return 500, {'data': None, 'message': f"Configuration file 'nodes/pve/qemu-server/{vmid}.conf' does not exist"}
+
+    def _vm_config(self, params, data, node, vmid):
+        vm = self.fleet.vm_by_id(node, int(vmid))
+        if vm is None:
+            return self._missing_vm(vmid)
+        config = {
+            'name': vm['name'],
+            'cores': vm['cores'],
+            'sockets': 1,
+            'memory': str(vm['memory_mb']),
+            'scsi0': f"local-lvm:vm-{vm['vmid']}-disk-0,size={vm['disk_gb']}G",
+            'net0': f"virtio=BC:24:11:00:{vm['vmid'] // 256 % 256:02X}:{vm['vmid'] % 256:02X},bridge=vmbr0,firewall=1",
+            'ipconfig0': f"ip={vm['ip']}/24,gw=192.168.0.1",
+            'ostype': 'l26',
+            'boot': 'order=scsi0'
+        }
+        config['digest'] = hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()
+        return 200, {'data': config}
+
+    def _vm_status(self, params, data, node, vmid):
+        vm = self.fleet.vm_by_id(node, int(vmid))
+        if vm is None:
+            return self._missing_vm(vmid)
+        status = self._vm_resource(vm)
+        status['cpus'] = status.pop('maxcpu')
+        status['qmpstatus'] = vm['status']
+        return 200, {'data': status}
+
+    def _vm_action(self, params, data, node, vmid, action):
+        if action not in ('start', 'stop', 'shutdown', 'reboot'):
+            return 501, {'data': None, 'errors': f"fake api: action '{action}' not implemented"}
+        vm = self.fleet.vm_by_id(node, int(vmid))
+        if vm is None:
+            return self._missing_vm(vmid)
+
+        def finish():
+            vm['status'] = 'stopped' if action in ('stop', 'shutdown') else 'running'
+            vm['uptime'] = 0 if vm['status'] == 'stopped' else 1
+
+        return 200, {'data': self._new_task(node, f"qm{action}", vm['vmid'], finish)}
+
+    def _vzdump(self, params, data, node):
+        vmid = int(data.get('vmid') or params.get('vmid') or 0)
+        vm = self.fleet.vm_by_id(node, vmid)
+        if vm is None:
+            return self._missing_vm(vmid)
+
+        def finish():
+            ctime = int(time.time())
+            stamp = time.strftime('%Y_%m_%d-%H_%M_%S', time.gmtime(ctime))
+            self.fleet.backups[node].append({
+                'volid': f"local:backup/vzdump-qemu-{vmid}-{stamp}.vma.zst",
+                'content': 'backup', 'format': 'vma.zst', 'size': 2 * GB, 'ctime': ctime, 'vmid': vmid
+            })
+
+        return 200, {'data': self._new_task(node, 'vzdump', vmid, finish)}
+
+    def _node_storage(self, params, data, node):
+        if node not in self.fleet.nodes:
+            return 500, {'data': None, 'message': f"hostname lookup '{node}' failed"}
+        storages = []
+        for storage in self.fleet.storages:
+            used = storage['total'] // 4
+            storages.append({
+                'storage': storage['storage'],
+                'type': storage['type'],
+                'content': storage['content'],
+                'shared': storage['shared'],
+                'active': 1,
+                'enabled': 1,
+                'total': storage['total'],
+                'used': used,
+                'avail': storage['total'] - used
+            })
+        return 200, {'data': storages}
+
+    def _storage_content(self, params, data, node, storage):
+        if node not in self.fleet.nodes:
+            return 500, {'data': None, 'message': f"hostname lookup '{node}' failed"}
+        content = params.get('content')
+        items = []
+        if storage == 'local' and content in (None, 'backup'):
+            items.extend(dict(item) for item in self.fleet.backups.get(node, []))
+        if storage == 'local-lvm' and content in (None, 'images'):
+            items.extend({
+                'volid': f"local-lvm:vm-{vm['vmid']}-disk-0",
+                'content': 'images', 'format': 'raw', 'size': vm['disk_gb'] * GB, 'vmid': vm['vmid']
+            } for vm in self.fleet.vms.values() if vm['node'] == node)
+        return 200, {'data': items}
+
+    def _node_tasks(self, params, data, node):
+        since = int(params.get('since', 0) or 0)
+        limit = int(params.get('limit', 50) or 50)
+        tasks = [self._task_entry(task) for task in self.tasks.values()
+                 if task['node'] == node and task['starttime'] >= since]
+        tasks.sort(key=lambda t: t['starttime'], reverse=True)
+        return 200, {'data': tasks[:limit]}
+
+    def _task_status(self, params, data, node, upid):
+        task = self.tasks.get(upid)
+        if task is None or task['node'] != node:
+            return 500, {'data': None, 'message': f"no such task '{upid}'"}
+        entry = self._task_entry(task)
+        entry['status'] = 'stopped' if task['endtime'] is not None else 'running'
+        if task['endtime'] is not None:
+            entry['exitstatus'] = task['exitstatus']
+        return 200, {'data': entry}
+
+    def _firewall_groups(self, params, data):
+        return 200, {'data': [
+            {'group': name, 'comment': group['comment'], 'digest': hashlib.sha1(name.encode()).hexdigest()}
+            for name, group in self.fleet.firewall_groups.items()
+        ]}
+
+    def _firewall_group_rules(self, params, data, group):
+        info = self.fleet.firewall_groups.get(group)
+        if info is None:
+            return 500, {'data': None, 'message': f"no such security group '{group}'"}
+        return 200, {'data': [dict(rule) for rule in info['rules']]}
+
+
+class FakeProxmoxAdapter(BaseAdapter):
+    """FakeProxmoxAPI로 요청을 전달하는 requests 전송 어댑터"""
+
+    def __init__(self, api: FakeProxmoxAPI):
+        super().__init__()
+        self.api = api
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parsed = urlparse(request.url)
+        params = dict(parse_qsl(parsed.query))
+        data = {}
+        if request.body:
+            body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
+            content_type = request.headers.get('Content-Type', '')
+            data = json.loads(body) if 'json' in content_type else dict(parse_qsl(body))
+
+        # 설정된 지연이 읽기 타임아웃보다 길면 실제 서버처럼 타임아웃 발생
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if read_timeout is not None and self.api.latency > read_timeout:
+            time.sleep(read_timeout)
+            raise requests.exceptions.ReadTimeout(f"fake pve read timeout ({read_timeout}s)", request=request)
+
+        status, payload = self.api.handle(request.method, parsed.path, params, data, dict(request.headers))
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status == 200 else 'Error'
+        response.headers['Content-Type'] = 'application/json;charset=UTF-8'
+        response._content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def serve_in_process(api: FakeProxmoxAPI, endpoint: str = DEFAULT_ENDPOINT):
+    """endpoint로 향하는 모든 requests 호출(Session, requests.post 등)을 가짜 API로 보낸다"""
+    adapter = FakeProxmoxAdapter(api)
+    original_get_adapter = requests.Session.get_adapter
+    prefix = endpoint.rstrip('/').lower()
+
+    def get_adapter(session, url):
+        if url.lower().startswith(prefix):
+            return adapter
+        return original_get_adapter(session, url)
+
+    requests.Session.get_adapter = get_adapter
+    try:
+        yield adapter
+    finally:
+        requests.Session.get_adapter = original_get_adapter
+
+
+def create_service_app(endpoint: str = DEFAULT_ENDPOINT, fleet: FakeFleet = None, **overrides):
+    """가짜 API를 바라보는 ProxmoxService용 최소 Flask 앱 (DB/블루프린트 없이 설정만 로드)"""
+    from flask import Flask
+    from config.config import Config
+
+    fleet = fleet or FakeFleet()
+    app = Flask('fake_proxmox_client')
+    app.config.from_object(Config)
+    app.config.update(
+        PROXMOX_ENDPOINT=endpoint,
+        PROXMOX_USERNAME=fleet.username,
+        PROXMOX_PASSWORD=fleet.password,
+        PROXMOX_NODE=next(iter(fleet.nodes)),
+        PROXMOX_SINGLEFLIGHT_REDIS=False
+    )
+    app.config.update(overrides)
+    return app
+
+
+def create_fake_app(api: FakeProxmoxAPI):
+    """실제 HTTP로 가짜 API를 제공하는 Flask 앱"""
+    from flask import Flask, request, Response
+
+    app = Flask('fake_proxmox_api')
+
+    @app.route('/api2/json/<path:path>', methods=['GET', 'POST', 'PUT', 'DELETE'])
+    def dispatch(path):
+        data = request.get_json(silent=True) or request.form.to_dict()
+        status, payload = api.handle(request.method, f"/{path}", request.args.to_dict(), data, dict(request.headers))
+        return Response(json.dumps(payload, ensure_ascii=False), status=status,
+                        content_type='application/json;charset=UTF-8')
+
+    @app.route('/_fake/stats')
+    def fake_stats():
+        payload = {'requests': dict(api.stats), 'injected_errors': api.injected_errors}
+        return Response(json.dumps(payload, ensure_ascii=False), content_type='application/json')
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가짜 Proxmox VE API 서버')
+    parser.add_argument('--nodes', type=int, default=3, help='노드 수')
+    parser.add_argument('--vms', type=int, default=10, help='노드당 VM 수')
+    parser.add_argument('--backups', type=int, default=1, help='VM당 백업 파일 수')
+    parser.add_argument('--latency', type=float, default=0.0, help='요청당 기본 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='추가 무작위 지연 상한 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='오류 응답 비율 (0~1)')
+    parser.add_argument('--error-status', type=int, default=503, help='주입할 오류 상태 코드')
+    parser.add_argument('--task-duration', type=float, default=0.5, help='비동기 작업 완료까지 걸리는 시간 (초)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=18006)
+    args = parser.parse_args()
+
+    fleet = FakeFleet(nodes=args.nodes, vms_per_node=args.vms, backups_per_vm=args.backups)
+    api = FakeProxmoxAPI(fleet, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                         error_status=args.error_status, task_duration=args.task_duration)
+    print(f"🧪 가짜 Proxmox API: http://{args.host}:{args.port} "
+          f"(노드 {args.nodes}개, VM {len(fleet.vms)}개, 계정 {fleet.username} / {fleet.password})")
+    create_fake_app(api).run(host=args.host, port=args.port, threaded=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+fakeredis 기반 Redis 대체 (테스트용)
+
+Redis 서버 없이 전역 redis_utils를 fakeredis 클라이언트로 바꿔 캐시/락/태그 동작을 확인한다.
+Lua 스크립트(락 해제)를 실행하려면 lupa가 필요하다: pip install "fakeredis[lua]"
+
+사용 방법:
+    with fake_redis() as server:
+        redis_utils.get_or_compute('key', compute, ttl=60)
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+import fakeredis
+
+
+@contextmanager
+def fake_redis():
+    """전역 redis_utils를 같은 FakeServer를 쓰는 문자열/바이너리 클라이언트로 교체
+
+    L1 캐시는 무효화 구독 스레드가 테스트 밖까지 남지 않도록 끈다.
+    """
+    from app.utils.redis_utils import redis_utils
+
+    server = fakeredis.FakeServer()
+    saved = {name: getattr(redis_utils, name) for name in (
+        'client', 'binary_client', 'enabled', 'local_enabled', '_healthy', '_health_pid', '_health_checked_at')}
+    saved_stats = dict(redis_utils.compute_stats)
+    redis_utils.client = fakeredis.FakeRedis(server=server, decode_responses=True)
+    redis_utils.binary_client = fakeredis.FakeRedis(server=server)
+    redis_utils.enabled = True
+    redis_utils.local_enabled = False
+    redis_utils._healthy = True
+    redis_utils._health_pid = os.getpid()
+    redis_utils._health_checked_at = time.time()
+    try:
+        yield server
+    finally:
+        for name, value in saved.items():
+            setattr(redis_utils, name, value)
+        redis_utils.compute_stats.update(saved_stats)
+        redis_utils.local.clear()
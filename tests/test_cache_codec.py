@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+캐시 값 코덱 테스트
+
+버전 헤더가 없는 이전 형식(JSON 문자열/일반 문자열) 값을 그대로 읽고, 헤더가 붙은 값은
+저장할 때의 직렬화/압축 방식과 관계없이 복원되는지 확인한다.
+
+실행:
+    python -m pytest tests/test_cache_codec.py -q
+    python tests/test_cache_codec.py
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils.cache_codec import HEADER_SIZE, MAGIC, CacheCodec
+
+
+def test_legacy_plain_json_entries_are_decoded():
+    """헤더 없는 JSON/일반 문자열 값은 이전 형식으로 읽는다"""
+    codec = CacheCodec()
+    servers = {'web-01': {'status': 'running', 'vmid': 101, 'tags': ['prod']}}
+
+    assert codec.decode(json.dumps(servers).encode('utf-8')) == servers
+    assert codec.decode(json.dumps(servers)) == servers
+    assert codec.decode(json.dumps([1, 2, 3]).encode('utf-8')) == [1, 2, 3]
+    assert codec.decode('한글 문자열'.encode('utf-8')) == '한글 문자열'
+    assert codec.decode(None) is None
+
+    value, size = codec.decode_sized(json.dumps(servers).encode('utf-8'))
+    assert value == servers and size == len(json.dumps(servers))
+
+
+def test_headered_entries_decode_across_codec_settings():
+    """저장 방식이 헤더에 기록되므로 설정이 다른 코덱으로도 읽을 수 있다"""
+    value = {'servers': [{'name': f'vm-{i}', 'status': 'running'} for i in range(500)]}
+    writer = CacheCodec(serializer='json', compression='zlib', compress_min_bytes=1024)
+    reader = CacheCodec(serializer='auto', compression='none')
+
+    encoded = writer.encode(value)
+    assert encoded.startswith(MAGIC)
+    # 기준 크기 이상이므로 zlib(ID 1)로 압축됨
+    assert encoded[HEADER_SIZE - 1] == 1
+    assert reader.decode(encoded) == value
+
+    small = writer.encode({'ok': True})
+    assert small[HEADER_SIZE - 1] == 0
+    assert reader.decode(small) == {'ok': True}
+
+
+def test_redis_utils_reads_legacy_entries():
+    """업그레이드 전에 저장된 JSON 캐시 값도 get_cache/get_many로 읽힌다"""
+    from fake_redis import fake_redis
+    from app.utils.redis_utils import redis_utils
+
+    with fake_redis():
+        legacy = {'success': True, 'data': {'nodes': ['pve1', 'pve2']}, 'cached_at': time.time()}
+        redis_utils.binary_client.setex(redis_utils.cache_key('legacy:capacity'), 60, json.dumps(legacy))
+        redis_utils.set_cache('current:capacity', {'success': True}, expire=60)
+
+        assert redis_utils.get_cache('legacy:capacity') == legacy
+        assert redis_utils.get_many(['legacy:capacity', 'current:capacity', 'missing']) == {
+            'legacy:capacity': legacy,
+            'current:capacity': {'success': True}
+        }
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")
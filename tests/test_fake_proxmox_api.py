@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+가짜 Proxmox API 기반 ProxmoxService 테스트
+
+실제 클러스터 없이 인증 티켓, 401 재인증, 클러스터 VM 조회, datastore/용량 집계,
+UPID 작업 추적, 오류 주입 시 재시도 경로를 확인한다.
+
+실행:
+    python -m pytest tests/test_fake_proxmox_api.py -q
+    python tests/test_fake_proxmox_api.py
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_proxmox_api import (DEFAULT_ENDPOINT, FakeFleet, FakeProxmoxAPI, create_service_app,
+                              serve_in_process)
+
+
+@contextmanager
+def fake_service(api, **overrides):
+    """가짜 API에 연결된 ProxmoxService (이전 테스트의 티켓은 폐기)"""
+    from app.services.proxmox_service import ProxmoxService
+    app = create_service_app(DEFAULT_ENDPOINT, api.fleet, **overrides)
+    with serve_in_process(api), app.app_context():
+        service = ProxmoxService()
+        service.ticket_manager.invalidate()
+        yield service
+
+
+def test_ticket_is_reused_and_renewed_after_401():
+    """티켓은 한 번만 발급받고, 401 이후에는 재인증하여 요청을 재시도한다"""
+    api = FakeProxmoxAPI(FakeFleet(nodes=2, vms_per_node=3))
+    with fake_service(api) as service:
+        headers, error = service.get_proxmox_auth()
+        assert error is None
+        for _ in range(3):
+            vms, error = service.get_proxmox_vms(headers)
+            assert error is None and len(vms) == 6
+        assert api.request_count('POST /access/ticket') == 1
+
+        api.expire_tickets()
+        vms, error = service.get_proxmox_vms(headers)
+        assert error is None and len(vms) == 6
+        assert api.request_count('POST /access/ticket') == 2
+
+
+def test_datastores_and_capacity_cover_every_node():
+    """datastore는 노드별 1회 조회로 병합되고, 용량 집계는 모든 노드를 포함한다"""
+    api = FakeProxmoxAPI(FakeFleet(nodes=3, vms_per_node=4))
+    with fake_service(api) as service:
+        datastores = {d['id']: d for d in service.get_datastores()}
+        assert set(datastores) == {'local', 'local-lvm', 'nfs-shared'}
+        assert len(datastores['local']['nodes']) == 3
+        # 공유 스토리지는 한 번만 집계
+        assert datastores['nfs-shared']['size'] == datastores['nfs-shared']['nodes']['pve1']['size']
+        assert api.request_count('GET /nodes/{node}/storage') == 3
+
+        result = service.get_cluster_capacity()
+        assert result['success']
+        capacity = result['data']
+        assert set(capacity['nodes']) == {'pve1', 'pve2', 'pve3'}
+        counted = capacity['cluster']['running_servers'] + capacity['cluster']['stopped_servers']
+        assert counted == len(api.fleet.vms)
+
+
+def test_vm_action_returns_upid_and_tracker_waits_for_completion():
+    """VM 시작은 UPID를 반환하고, 작업 추적기가 완료까지 대기한다"""
+    api = FakeProxmoxAPI(FakeFleet(nodes=2, vms_per_node=2, running_ratio=0), task_duration=0.3)
+    with fake_service(api) as service:
+        vm = next(iter(api.fleet.vms.values()))
+        upid = service.vm_action_task(vm['vmid'], 'start', node=vm['node'])
+        assert upid and upid.startswith(f"UPID:{vm['node']}:")
+
+        task = service.task_tracker.wait(upid, timeout=10)
+        assert task is not None and task['success']
+        assert vm['status'] == 'running'
+
+
+def test_injected_errors_are_retried_for_get():
+    """일시적 503 오류는 GET 재시도로 흡수된다"""
+    api = FakeProxmoxAPI(FakeFleet(nodes=1, vms_per_node=2), error_rate=0.3, seed=7)
+    with fake_service(api, PROXMOX_GET_MAX_RETRIES=5, PROXMOX_CIRCUIT_FAILURE_THRESHOLD=100) as service:
+        headers, error = service.get_proxmox_auth()
+        assert error is None
+        for _ in range(10):
+            vms, error = service.get_proxmox_vms(headers)
+            assert error is None and len(vms) == 2
+        assert api.injected_errors > 0
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+인벤토리 스냅샷 변경 조회 테스트
+
+세대별 변경 로그로 since 이후 세대를 모두 메울 수 있을 때만 바뀐 서버 이름을 반환하고,
+로그가 끊겨 있으면(누락 세대, 트리밍/만료, 잘못된 since) None을 반환해 전체 목록으로 재설정하는지 확인한다.
+
+실행:
+    python -m pytest tests/test_inventory_snapshot.py -q
+    python tests/test_inventory_snapshot.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import fake_redis
+
+
+def change_log(*generations):
+    return [{'generation': generation, 'names': [f'vm-{generation}']} for generation in generations]
+
+
+def memory_service(entries):
+    """Redis 없이 프로세스 메모리 변경 로그만 쓰는 스냅샷 서비스"""
+    from app.services.inventory_service import InventorySnapshotService
+    from app.utils.redis_utils import redis_utils
+
+    redis_utils.enabled = False
+    service = InventorySnapshotService()
+    service._changes.extend(entries)
+    return service
+
+
+def test_changed_since_returns_names_for_contiguous_log():
+    """since 다음 세대부터 현재 세대까지 로그가 모두 있으면 바뀐 서버 이름을 합쳐 반환"""
+    from app.utils.redis_utils import redis_utils
+
+    enabled = redis_utils.enabled
+    try:
+        service = memory_service(change_log(3, 4, 5) + [{'generation': 6, 'names': ['vm-3', 'vm-6']}])
+        assert service._changed_since(2, 5) == ['vm-3', 'vm-4', 'vm-5']
+        assert service._changed_since(4, 6) == ['vm-5', 'vm-3', 'vm-6']
+        assert service._changed_since(6, 6) == []
+    finally:
+        redis_utils.enabled = enabled
+
+
+def test_changed_since_returns_none_when_log_has_gaps():
+    """누락 세대, 로그보다 오래된 since, 잘못된 since는 None (전체 목록으로 재설정)"""
+    from app.utils.redis_utils import redis_utils
+
+    enabled = redis_utils.enabled
+    try:
+        service = memory_service(change_log(3, 5, 6))
+        # 세대 4 누락
+        assert service._changed_since(2, 6) is None
+        assert service._changed_since(3, 5) is None
+        # 누락 이후 구간은 메울 수 있음
+        assert service._changed_since(4, 6) == ['vm-5', 'vm-6']
+        # 트리밍/만료로 since 다음 세대가 로그에 없음
+        assert service._changed_since(1, 6) is None
+        # since 누락, 음수, 현재 세대보다 큼 (Redis 초기화로 세대가 되돌아간 경우)
+        assert service._changed_since(None, 6) is None
+        assert service._changed_since(-1, 6) is None
+        assert service._changed_since(7, 6) is None
+    finally:
+        redis_utils.enabled = enabled
+
+
+def test_changed_since_reads_redis_change_log_with_gaps():
+    """Redis를 사용할 수 있으면 프로세스 메모리 사본 대신 Redis 변경 로그로 판단"""
+    from app.services.inventory_service import CHANGES_KEY, InventorySnapshotService
+    from app.utils.redis_utils import redis_utils
+
+    with fake_redis():
+        service = InventorySnapshotService()
+        # 메모리 사본은 연속이지만 다른 프로세스가 게시한 Redis 로그에는 세대 8이 없음
+        service._changes.extend(change_log(7, 8, 9))
+        for entry in change_log(7, 9):
+            redis_utils.binary_client.rpush(CHANGES_KEY, redis_utils.codec.encode(entry))
+
+        assert service._changed_since(6, 9) is None
+        assert service._changed_since(8, 9) == ['vm-9']
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+알림 이벤트 전달 테스트
+
+DB 변경 수신(LISTEN/NOTIFY)을 켜면 ORM으로 INSERT한 알림이 커밋 훅의 게시와 변경 수신 양쪽으로
+들어오므로, 구독자에게는 한 번만 전달되는지 확인한다. (PostgreSQL 없이 SQLite와 변경 수신 핸들러로 재현)
+
+실행:
+    python -m pytest tests/test_notification_events.py -q
+    python tests/test_notification_events.py
+"""
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@contextmanager
+def notification_app():
+    """SQLite 메모리 DB와 변경 수신을 켠 최소 Flask 앱 (Redis 없이 현재 프로세스 구독자에게만 전달)"""
+    from flask import Flask
+    from config.config import Config
+    from app import db
+    from app.utils.redis_utils import redis_utils
+
+    app = Flask('notification_events_test')
+    app.config.from_object(Config)
+    app.config.update(SQLALCHEMY_DATABASE_URI='sqlite://', DB_CHANGE_FEED_ENABLED=True)
+    db.init_app(app)
+
+    enabled = redis_utils.enabled
+    redis_utils.enabled = False
+    try:
+        with app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.drop_all()
+    finally:
+        redis_utils.enabled = enabled
+
+
+def drain(subscription):
+    events = []
+    while True:
+        item = subscription.get(timeout=0.1)
+        if item is None:
+            return events
+        events.append(item[1])
+
+
+def test_notification_is_delivered_once_with_change_feed():
+    """커밋 훅 게시와 변경 수신이 같은 알림을 보내도 구독자는 한 번만 받는다"""
+    from app.models.notification import NOTIFICATION_TOPIC, Notification
+    from app.services.change_feed import ChangeFeedListener
+    from app.utils.event_bus import event_bus
+
+    with notification_app() as app:
+        listener = ChangeFeedListener()
+        # PostgreSQL이 아니므로 LISTEN 연결 없이 id 중복 제거 등록까지만 수행된다
+        listener.init_app(app)
+        listener.app = app
+
+        with event_bus.subscribe(NOTIFICATION_TOPIC) as subscription:
+            notification = Notification.create_notification('notification', 'once', 'message')
+            listener._handle([json.dumps({'table': 'notifications', 'op': 'INSERT', 'id': notification.id})])
+
+            events = drain(subscription)
+            assert [event['id'] for event in events] == [notification.id]
+
+            # 이후 알림도 그대로 전달된다
+            second = Notification.create_notification('notification', 'next', 'message')
+            listener._handle([json.dumps({'table': 'notifications', 'op': 'INSERT', 'id': second.id})])
+            assert [event['id'] for event in drain(subscription)] == [second.id]
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")
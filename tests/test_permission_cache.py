@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+권한 캐시 무효화 테스트
+
+권한을 회수하는 동안 회수 전 권한을 읽은 재계산이 진행 중이어도, 회수가 끝난 뒤의 권한 확인은
+회수한 권한을 돌려주지 않는지 확인한다. (Redis 없이 fakeredis와 SQLite로 재현)
+
+실행:
+    python -m pytest tests/test_permission_cache.py -q
+    python tests/test_permission_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import fake_redis
+
+
+@contextmanager
+def permission_app():
+    """SQLite 파일 DB를 쓰는 최소 Flask 앱 (재계산 스레드와 요청 스레드가 같은 DB를 보도록 파일 사용)"""
+    from flask import Flask
+    from config.config import Config
+    from app import db
+
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    app = Flask('permission_cache_test')
+    app.config.from_object(Config)
+    app.config.update(SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}')
+    db.init_app(app)
+    try:
+        with fake_redis(), app.app_context():
+            db.create_all()
+            yield app
+            db.session.remove()
+            db.drop_all()
+    finally:
+        os.remove(path)
+
+
+def test_revoked_permission_is_not_restored_by_running_recompute():
+    """재계산 도중 권한을 회수해도 회수 후 has_permission은 False"""
+    from app import db
+    from app.models.user import User
+
+    with permission_app() as app:
+        user = User(username='operator', role='developer')
+        user.set_password('password')
+        db.session.add(user)
+        db.session.commit()
+        user.add_permission('delete_server')
+        User.invalidate_permission_cache(user.id)
+        user_id = user.id
+
+        loaded = threading.Event()
+        release = threading.Event()
+        load_permissions = User.load_permissions
+
+        def slow_load(uid):
+            # 회수 전 권한을 읽은 뒤 회수가 시작될 때까지 저장을 늦춘다
+            permissions = load_permissions(uid)
+            if not loaded.is_set():
+                loaded.set()
+                release.wait(5)
+            return permissions
+
+        def recompute():
+            with app.app_context():
+                db.session.get(User, user_id).get_permission_set()
+                db.session.remove()
+
+        User.load_permissions = staticmethod(slow_load)
+        try:
+            worker = threading.Thread(target=recompute)
+            worker.start()
+            assert loaded.wait(5)
+
+            # 회수가 락 해제를 기다리는 동안 재계산이 회수 전 권한을 저장
+            threading.Timer(0.2, release.set).start()
+            user.remove_permission('delete_server')
+            worker.join(5)
+        finally:
+            User.load_permissions = staticmethod(load_permissions)
+
+        assert not db.session.get(User, user_id).has_permission('delete_server')
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Redis 캐시 유틸리티 테스트
+
+fakeredis로 get_or_compute의 stale 제공/백그라운드 재계산, 실패 결과 캐시,
+태그 무효화 도중 저장된 값의 처리를 확인한다.
+
+실행:
+    python -m pytest tests/test_redis_cache.py -q
+    python tests/test_redis_cache.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_redis import fake_redis
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_stale_value_is_served_while_one_background_recompute_runs():
+    """soft TTL이 지난 값은 바로 돌려주고, 동시 요청이 많아도 재계산은 한 번만 실행된다"""
+    from app.utils.redis_utils import redis_utils
+
+    with fake_redis():
+        key = redis_utils.cache_key('test:stale')
+        entry = {'value': 'old', 'expires_at': time.time() - 1, 'delta': 0}
+        redis_utils.binary_client.setex(key, 60, redis_utils.codec.encode(entry))
+
+        calls = []
+        release = threading.Event()
+
+        def compute():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return 'new'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            redis_utils.get_or_compute('test:stale', compute, ttl=30, stale_ttl=60))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        # 재계산이 끝나기 전에 모든 요청이 stale 값을 받음
+        assert results == ['old'] * 8
+        assert wait_until(lambda: len(calls) == 1)
+
+        release.set()
+        assert wait_until(lambda: redis_utils.get_or_compute('test:stale', compute, ttl=30) == 'new')
+        assert len(calls) == 1, calls
+        assert all(name.startswith('cache-refresh:') for name in calls)
+        assert not redis_utils.client.exists(f"{key}:lock")
+
+
+def test_failed_compute_is_negatively_cached():
+    """계산 실패(예외 또는 is_error)는 negative_ttl 동안 다시 계산하지 않고 같은 결과를 돌려준다"""
+    from app.utils.redis_utils import redis_utils
+
+    with fake_redis():
+        calls = []
+
+        def broken():
+            calls.append('broken')
+            raise RuntimeError('upstream down')
+
+        assert redis_utils.get_or_compute('test:broken', broken, ttl=30, negative_ttl=10) is None
+        assert redis_utils.get_or_compute('test:broken', broken, ttl=30, negative_ttl=10) is None
+        assert calls == ['broken']
+
+        def failing():
+            calls.append('failing')
+            return {'success': False, 'message': 'HTTP 503'}
+
+        is_error = lambda value: not value.get('success')
+        for _ in range(2):
+            result = redis_utils.get_or_compute('test:failing', failing, ttl=30, negative_ttl=10, is_error=is_error)
+            assert result == {'success': False, 'message': 'HTTP 503'}
+        assert calls == ['broken', 'failing']
+        # 실패 결과는 정상 값으로 저장하지 않음
+        assert not redis_utils.binary_client.exists(redis_utils.cache_key('test:failing'))
+
+        # 실패 결과를 지우면 다시 계산하고, 성공 값을 저장하면 실패 결과도 지운다
+        redis_utils.delete_many(['test:failing'])
+        assert redis_utils.get_or_compute('test:failing', lambda: {'success': True}, ttl=30,
+                                          negative_ttl=10, is_error=is_error) == {'success': True}
+        assert not redis_utils.binary_client.exists(redis_utils.cache_key('test:failing') + ':negative')
+
+
+def test_set_cache_during_tag_invalidation_survives_for_next_invalidation():
+    """무효화가 태그 집합을 떼어낸 뒤 저장된 값은 지우지 않고, 새 태그 집합에 등록되어 다음 무효화 대상이 된다"""
+    from app.utils.redis_utils import redis_utils
+
+    with fake_redis():
+        redis_utils.set_cache('test:old', 'before', expire=60, tags=['storage'])
+        redis_utils.set_cache('test:untagged', 'keep', expire=60)
+
+        # 태그 집합 RENAME 직후(SSCAN/UNLINK 전) 다른 요청이 같은 태그로 저장하는 경우
+        publish_invalidation = redis_utils.publish_invalidation
+        raced = []
+
+        def racing_publish(*args, **kwargs):
+            if kwargs.get('tags') and not raced:
+                raced.append(True)
+                redis_utils.set_cache('test:new', 'after', expire=60, tags=['storage'])
+            return publish_invalidation(*args, **kwargs)
+
+        redis_utils.publish_invalidation = racing_publish
+        try:
+            assert redis_utils.invalidate_tags('storage') == 1
+        finally:
+            del redis_utils.publish_invalidation
+
+        assert raced
+        assert redis_utils.get_cache('test:old') is None
+        assert redis_utils.get_cache('test:new') == 'after'
+        assert redis_utils.get_cache('test:untagged') == 'keep'
+        # 떼어낸 임시 집합은 남지 않음
+        assert list(redis_utils.client.scan_iter(match=redis_utils.tag_key('storage') + ':purge:*')) == []
+
+        assert redis_utils.invalidate_tags('storage') == 1
+        assert redis_utils.get_cache('test:new') is None
+        assert redis_utils.get_cache('test:untagged') == 'keep'
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            print(f"🧪 {name}")
+            test()
+            print(f"✅ {name} 통과")